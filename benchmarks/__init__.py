@@ -0,0 +1,13 @@
+"""
+Matching Benchmarks
+
+Measures TennisMatchingAlgorithm against deterministic synthetic guilds held
+in memory, so results do not depend on DynamoDB and can be compared across
+commits. Run with:
+
+    python -m benchmarks.run_matching --scales 100 1000 10000 --output results.json
+
+The schedule time parser is measured separately:
+
+    python -m benchmarks.run_parser --rounds 20 --output parser.json
+"""
@@ -0,0 +1,125 @@
+"""
+In-memory DAO Backend
+
+Implements the DAO methods the matching algorithm uses on top of plain
+lists and dictionaries, with the same filtering rules as the DynamoDB DAOs.
+Every call made through a CallCounter is counted, so benchmarks can report
+DAO calls per request.
+"""
+
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from src.database.models.dynamodb.court import Court
+from src.database.models.dynamodb.match import Match
+from src.database.models.dynamodb.player import Player
+from src.database.models.dynamodb.schedule import Schedule
+from src.utils.occurrences import expand_schedules
+
+
+class CallCounter:
+    """Wraps a DAO and counts calls per method."""
+
+    def __init__(self, name: str, dao: Any, counts: Counter):
+        self._name = name
+        self._dao = dao
+        self._counts = counts
+
+    def __getattr__(self, attr: str):
+        value = getattr(self._dao, attr)
+        if not callable(value):
+            return value
+
+        def counted(*args, **kwargs):
+            self._counts[f"{self._name}.{attr}"] += 1
+            return value(*args, **kwargs)
+
+        return counted
+
+
+class InMemoryPlayerDAO:
+    """Player lookups by user ID."""
+
+    def __init__(self, players: List[Player]):
+        self.players = {(p.guild_id, p.user_id): p for p in players}
+
+    def get_player(self, guild_id: str, user_id: str) -> Optional[Player]:
+        return self.players.get((str(guild_id), str(user_id)))
+
+
+class InMemoryScheduleDAO:
+    """Schedule lookups with ScheduleDAO's overlap and status rules."""
+
+    def __init__(self, schedules: List[Schedule]):
+        self.schedules = schedules
+        self.by_id = {s.schedule_id: s for s in schedules}
+        self.by_user: Dict[str, List[Schedule]] = {}
+        for schedule in schedules:
+            self.by_user.setdefault(schedule.user_id, []).append(schedule)
+
+    def get_schedule(self, guild_id: str, schedule_id: str) -> Optional[Schedule]:
+        return self.by_id.get(schedule_id)
+
+    def get_user_schedules(self, guild_id: str, user_id: str) -> List[Schedule]:
+        return list(self.by_user.get(str(user_id), []))
+
+    def get_overlapping_schedules(self, guild_id: str, start_time: int, end_time: int,
+                                  exclude_user_id: str = None) -> List[Schedule]:
+        schedules = expand_schedules((
+            s for s in self.schedules
+            if s.guild_id == str(guild_id) and s.start_time <= end_time
+            and (s.end_time >= start_time or s.recurrence) and s.user_id != exclude_user_id
+        ), start_time, end_time)
+        return [s for s in schedules if s.status != "cancelled"]
+
+
+class InMemoryCourtDAO:
+    """Court catalog."""
+
+    def __init__(self, courts: List[Court]):
+        self.courts = courts
+
+    def list_courts(self) -> List[Court]:
+        return list(self.courts)
+
+    def get_court(self, court_id: str) -> Optional[Court]:
+        return next((c for c in self.courts if c.court_id == court_id), None)
+
+
+class InMemoryMatchDAO:
+    """Match lookups by player, status and court."""
+
+    def __init__(self, matches: List[Match]):
+        self.matches = matches
+        self.by_player: Dict[str, List[Match]] = {}
+        self.by_players: Dict[frozenset, List[Match]] = {}
+        for match in matches:
+            for user_id in match.players:
+                self.by_player.setdefault(user_id, []).append(match)
+            self.by_players.setdefault(frozenset(match.players), []).append(match)
+
+    def get_player_matches(self, guild_id: str, user_id: str,
+                           status: Optional[str] = None) -> List[Match]:
+        return [
+            m for m in self.by_player.get(str(user_id), [])
+            if status is None or m.status == status
+        ]
+
+    def get_matches_by_status(self, guild_id: str, status: str, limit: int = 50) -> List[Match]:
+        return [m for m in self.matches if m.status == status][:limit]
+
+    def get_matches_by_court(self, court_id: str, start_time: Optional[int] = None,
+                             end_time: Optional[int] = None) -> List[Match]:
+        return [
+            m for m in self.matches
+            if m.court_id == court_id
+            and (start_time is None or m.start_time >= start_time)
+            and (end_time is None or m.start_time <= end_time)
+        ]
+
+    def get_existing_match_status(self, guild_id: str, player_ids: List[str],
+                                  start_time: int, end_time: int) -> Optional[str]:
+        for match in self.by_players.get(frozenset(player_ids), []):
+            if match.status in ("pending_confirmation", "scheduled"):
+                return match.status
+        return None
@@ -0,0 +1,244 @@
+"""
+Matching Benchmark Runner
+
+Runs the matcher's request paths against synthetic guilds of increasing size
+and reports latency percentiles, DAO calls per request and peak memory as
+JSON, so runs on different commits can be diffed.
+
+Scenarios:
+- find_matches_for_player: first request, with every matching cache empty
+- find_matches_for_player_warm: repeat request served by the suggestion store
+- find_matches_for_schedule: first request for a single schedule
+- doubles_search: doubles candidates for a schedule across its overlap groups
+
+Usage:
+    python -m benchmarks.run_matching --scales 100 1000 10000 --output results.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.memory_backend import (
+    CallCounter, InMemoryPlayerDAO, InMemoryScheduleDAO, InMemoryCourtDAO, InMemoryMatchDAO
+)
+from benchmarks.synthetic_guild import SyntheticGuild, generate_guild
+from src.utils import match_pool
+from src.utils import matching_algorithm
+from src.utils.candidate_index import CandidateIndex
+from src.utils.matching_algorithm import TennisMatchingAlgorithm
+from src.utils.suggestion_store import SuggestionStore
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+def reset_matching_state():
+    """Forget every shared matching cache, as after a restart."""
+    SuggestionStore._registry.clear()
+    CandidateIndex._registry.clear()
+    matching_algorithm._static_pair_factors.clear()
+    matching_algorithm._player_features.clear()
+
+
+def build_algorithm(guild: SyntheticGuild, counts: Counter) -> TennisMatchingAlgorithm:
+    """Create an algorithm over in-memory DAOs that count their calls."""
+    return TennisMatchingAlgorithm(
+        CallCounter("player", InMemoryPlayerDAO(guild.players), counts),
+        CallCounter("schedule", InMemoryScheduleDAO(guild.schedules), counts),
+        CallCounter("court", InMemoryCourtDAO(guild.courts), counts),
+        CallCounter("match", InMemoryMatchDAO(guild.matches), counts)
+    )
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def run_scenario(requests: List[Callable[[], object]], counts: Counter,
+                 prepare: Optional[Callable[[], None]] = None) -> Dict[str, object]:
+    """Time a list of requests and measure the peak memory of one more.
+
+    Args:
+        requests: Zero-argument callables, one per request
+        counts: DAO call counter shared with the algorithm
+        prepare: Optional reset run before every request, outside the timing
+
+    Returns:
+        Dict[str, object]: Latency, DAO call and memory figures
+    """
+    latencies = []
+    counts.clear()
+    results = 0
+    for request in requests:
+        if prepare:
+            prepare()
+        started = time.perf_counter()
+        result = request()
+        latencies.append((time.perf_counter() - started) * 1000)
+        results += len(result or ())
+    dao_calls = dict(counts)
+
+    # Tracing slows Python down, so memory is measured on a separate request
+    if prepare:
+        prepare()
+    tracemalloc.start()
+    requests[0]()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "requests": len(requests),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "max_ms": round(max(latencies), 3),
+        "results_per_request": round(results / len(requests), 2),
+        "dao_calls_per_request": {
+            "total": round(sum(dao_calls.values()) / len(requests), 2),
+            **{name: round(count / len(requests), 2) for name, count in sorted(dao_calls.items())}
+        },
+        "peak_memory_mb": round(peak / 1024 / 1024, 3),
+    }
+
+
+def doubles_search(algorithm: TennisMatchingAlgorithm, guild_id: str, schedule_id: str) -> list:
+    """Doubles candidates for one schedule, as the per-schedule matcher builds them."""
+    schedule = algorithm.schedule_dao.get_schedule(guild_id, schedule_id)
+    player = algorithm.player_dao.get_player(guild_id, schedule.user_id)
+    overlapping = algorithm.schedule_dao.get_overlapping_schedules(
+        guild_id, schedule.start_time, schedule.end_time, exclude_user_id=schedule.user_id
+    )
+    players = algorithm._get_players_for_schedules(guild_id, overlapping)
+    candidates = []
+    for group in algorithm._group_schedules_by_overlap(schedule, overlapping):
+        if len(group) >= 3:
+            candidates.extend(algorithm._find_doubles_matches(player, schedule, group, players))
+    return candidates
+
+
+def run_scale(num_players: int, seed: int, num_requests: int, weeks: int) -> Dict[str, object]:
+    """Run every scenario against one synthetic guild size."""
+    started = time.perf_counter()
+    guild = generate_guild(num_players, seed=seed, weeks=weeks)
+    generated_in = time.perf_counter() - started
+
+    counts: Counter = Counter()
+    algorithm = build_algorithm(guild, counts)
+    guild_id = guild.guild_id
+
+    rng = random.Random(seed)
+    with_schedules = sorted({s.user_id for s in guild.schedules})
+    user_ids = rng.sample(with_schedules, min(num_requests, len(with_schedules)))
+    schedule_ids = [s.schedule_id for s in rng.sample(guild.schedules, min(num_requests, len(guild.schedules)))]
+
+    def seed_users():
+        reset_matching_state()
+        for user_id in user_ids:
+            algorithm.find_matches_for_player(guild_id, user_id)
+
+    scenarios = {
+        "find_matches_for_player": run_scenario(
+            [lambda u=u: algorithm.find_matches_for_player(guild_id, u) for u in user_ids],
+            counts, prepare=reset_matching_state
+        ),
+    }
+    seed_users()
+    scenarios["find_matches_for_player_warm"] = run_scenario(
+        [lambda u=u: algorithm.find_matches_for_player(guild_id, u) for u in user_ids], counts
+    )
+    scenarios["find_matches_for_schedule"] = run_scenario(
+        [lambda s=s: algorithm.find_matches_for_schedule(guild_id, s) for s in schedule_ids],
+        counts, prepare=reset_matching_state
+    )
+    scenarios["doubles_search"] = run_scenario(
+        [lambda s=s: doubles_search(algorithm, guild_id, s) for s in schedule_ids],
+        counts, prepare=reset_matching_state
+    )
+
+    return {
+        "scale": num_players,
+        "guild": guild.summary(),
+        "generated_in_s": round(generated_in, 3),
+        "scenarios": scenarios,
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmark the tennis matching algorithm")
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 1000, 10000],
+                        help="Guild sizes in players (default: 100 1000 10000)")
+    parser.add_argument("--requests", type=int, default=20,
+                        help="Requests per scenario (default: 20)")
+    parser.add_argument("--seed", type=int, default=42, help="Generator seed (default: 42)")
+    parser.add_argument("--weeks", type=int, default=1,
+                        help="Weeks of recurring availability per player (default: 1)")
+    parser.add_argument("--no-pool", action="store_true",
+                        help="Score inline even when a request is large enough for the process pool")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.no_pool:
+        match_pool.POOL_MIN_PAIRS = sys.maxsize
+    else:
+        match_pool.warm_up_pool()
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "requests": args.requests,
+        "pool": not args.no_pool,
+        "results": [],
+    }
+    try:
+        for scale in args.scales:
+            logger.warning(f"Benchmarking {scale} players")
+            report["results"].append(run_scale(scale, args.seed, args.requests, args.weeks))
+    finally:
+        match_pool.shutdown_pool()
+
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS bytes
+        report["max_rss_mb"] = round(max_rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
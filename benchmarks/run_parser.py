@@ -0,0 +1,188 @@
+"""
+Time Parser Benchmark Runner
+
+Parses the phrases used by the tests in tests/parser with TimeParser and
+reports per-parse latency percentiles as JSON, so runs on different commits
+can be diffed. Parses are timed cold (parse cache cleared before each one),
+split by whether the dateparser-free fast path served them, and warm
+(phrases repeated, as members do), with the cache hit rate of the warm run.
+The tokenizer and the typo correction are timed on their own as well.
+
+Usage:
+    python -m benchmarks.run_parser --rounds 20 --output parser.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.run_matching import git_revision, percentile
+from src.cogs.user.commands.schedule.parser import nlp_parser
+from src.cogs.user.commands.schedule.parser.nlp_parser import (
+    TimeParser, get_parse_cache, get_parse_path_counts, tokenize
+)
+
+logger = logging.getLogger(__name__)
+
+# Phrases from tests/parser, valid and invalid
+PARSER_CORPUS = [
+    "today 4-6pm",
+    "tomorrow 3-5pm",
+    "next monday 2-4pm",
+    "next week tuesday 3-5pm",
+    "every monday 4-6pm",
+    "next two weeks 3pm to 5pm",
+    "next two weeks 3-5pm",
+    "next 2 weeks 3-5pm",
+    "next 2 weeks 3pm to 5pm",
+    "rest of the week 4-5 pm",
+    "rest of the week 11-11:30pm",
+    "rest of the week 11pm to 11:30pm",
+    "this week 11-11:30pm",
+    "tomorrow afternoon",
+    "next friday evening",
+    "tomorow 3-5pm",
+    "nxt monday 2-4pm",
+    "evry day 9-10am",
+    "invalid time",
+    "3-5",
+    "4pm-6",
+    "nextmonday",
+    "1030-1130",
+    "tommorow",
+    "nexxt week",
+    "every tuseday",
+    "3pm",
+    "afternoon",
+    "nxt wk tue 3-5",
+    "tmrw aftrn",
+] + [
+    f"next week {day} 4-5pm"
+    for day in ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+]
+
+
+def time_calls(calls: List[Callable[[], object]],
+               prepare: Optional[Callable[[], None]] = None) -> Dict[str, float]:
+    """Time a list of calls and summarize their latencies.
+
+    Args:
+        calls: Zero-argument callables
+        prepare: Optional reset run before every call, outside the timing
+    """
+    latencies = []
+    for call in calls:
+        if prepare:
+            prepare()
+        started = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return summarize(latencies)
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Latency percentiles of a list of call durations in milliseconds."""
+    if not latencies:
+        return {"calls": 0}
+    return {
+        "calls": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 4),
+        "p95_ms": round(percentile(latencies, 0.95), 4),
+        "mean_ms": round(statistics.fmean(latencies), 4),
+        "max_ms": round(max(latencies), 4),
+        "total_ms": round(sum(latencies), 3),
+    }
+
+
+def time_cold_parses(parser: TimeParser, phrases: List[str]) -> Dict[str, List[float]]:
+    """Time uncached parses, grouped by the path that served them."""
+    cache = get_parse_cache()
+    latencies = {"fast": [], "layered": []}
+    for phrase in phrases:
+        cache.clear()
+        fast_before = get_parse_path_counts()["fast"]
+        started = time.perf_counter()
+        parser.parse_time_description(phrase)
+        elapsed = (time.perf_counter() - started) * 1000
+        latencies["fast" if get_parse_path_counts()["fast"] > fast_before else "layered"].append(elapsed)
+    return latencies
+
+
+def run(rounds: int, corpus: Optional[List[str]] = None) -> Dict[str, object]:
+    """Parse the corpus several times over.
+
+    Args:
+        rounds: How many times each phrase is parsed
+        corpus: Phrases to parse (default: PARSER_CORPUS)
+
+    Returns:
+        Dict[str, object]: Latency figures and parse outcomes
+    """
+    corpus = corpus or PARSER_CORPUS
+    parser = TimeParser()
+    cache = get_parse_cache()
+    cache.clear()
+
+    # The first parse loads dateparser's language data; keep it out of the figures
+    started = time.perf_counter()
+    outcomes = [parser.parse_time_description(phrase) for phrase in corpus]
+    first_pass = (time.perf_counter() - started) * 1000
+
+    phrases = corpus * rounds
+    cold = time_cold_parses(parser, phrases)
+    cache.clear()
+    warm = time_calls([lambda p=p: parser.parse_time_description(p) for p in phrases])
+    cache_stats = cache.stats()
+    return {
+        "phrases": len(corpus),
+        "parsed": sum(1 for _, _, error in outcomes if not error),
+        "first_pass_ms": round(first_pass, 3),
+        "parse_cold": summarize(cold["fast"] + cold["layered"]),
+        "parse_fast_path": summarize(cold["fast"]),
+        "parse_layered": summarize(cold["layered"]),
+        "fast_path_fraction": round(len(cold["fast"]) / len(phrases), 4),
+        "parse_warm": warm,
+        "cache": {**cache_stats, "hit_rate": round(cache_stats["hit_rate"], 4)},
+        "tokenize": time_calls([lambda p=p: tokenize(p) for p in phrases]),
+        "fuzzy_correction_cold": time_calls(
+            [lambda p=p: parser._apply_fuzzy_correction(p) for p in phrases],
+            prepare=nlp_parser._word_corrections.clear
+        ),
+        "fuzzy_correction": time_calls([lambda p=p: parser._apply_fuzzy_correction(p) for p in phrases]),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmark the schedule time parser")
+    parser.add_argument("--rounds", type=int, default=20,
+                        help="Times each phrase is parsed (default: 20)")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    # The parser logs every step at INFO, and garbage input at ERROR
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger("src.cogs.user.commands.schedule.parser").setLevel(logging.CRITICAL)
+
+    report = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "rounds": args.rounds,
+        **run(args.rounds),
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
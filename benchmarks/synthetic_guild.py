@@ -0,0 +1,218 @@
+"""
+Synthetic Guild Generator
+
+Builds a deterministic guild for benchmarks: the same seed, size and base
+time always produce the same players, schedules and match history.
+
+- NTRP ratings follow a normal distribution around 3.5, in 0.5 steps
+- Genders, gender preferences and skill preferences use fixed weights
+- Each player prefers 1-3 courts, with popular courts chosen more often
+- Each player has 1-3 weekly availability slots (weekday evenings or weekend
+  mornings) which repeat every week of the window, as recurring schedules do
+- Completed matches between players of similar level form the match history
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List, Optional
+
+from src.database.models.dynamodb.court import Court
+from src.database.models.dynamodb.match import Match
+from src.database.models.dynamodb.player import Player
+from src.database.models.dynamodb.schedule import Schedule
+
+GUILD_ID = "1234567890123456789"
+
+# Fixed so generated objects hash and cache identically between runs
+GENERATED_AT = "2025-01-01T00:00:00+00:00"
+
+TIMEZONE = "America/Vancouver"
+
+# (court_id, name, number_of_courts, popularity weight)
+COURTS = [
+    ("kits-beach", "Kitsilano Beach Tennis Courts", 6, 10),
+    ("qe-park", "Queen Elizabeth Tennis Courts", 8, 8),
+    ("stanley-park", "Stanley Park Tennis Courts", 15, 9),
+    ("ubc-tennis-centre", "UBC Tennis Centre", 12, 5),
+    ("jericho-beach", "Jericho Beach Tennis Courts", 4, 4),
+    ("hillcrest-park", "Hillcrest Park Tennis Courts", 6, 3),
+    ("trout-lake", "Trout Lake Tennis Courts", 4, 3),
+    ("david-lam-park", "David Lam Park Tennis Courts", 2, 2),
+]
+
+GENDERS = (["male", "female", "non_binary"], [58, 40, 2])
+
+SKILL_PREFERENCES = (
+    [["similar"], ["similar", "above"], ["any"], ["similar", "below"], ["above"]],
+    [45, 25, 15, 10, 5]
+)
+
+# (weekday, start hour, duration hours); weekday 0 is Monday
+SLOTS = (
+    [(day, hour, 2) for day in range(5) for hour in (17, 18, 19)] +
+    [(day, hour, 2) for day in (5, 6) for hour in (8, 9, 10, 11)]
+)
+
+
+@dataclass
+class SyntheticGuild:
+    """Generated guild data."""
+    guild_id: str
+    players: List[Player] = field(default_factory=list)
+    schedules: List[Schedule] = field(default_factory=list)
+    courts: List[Court] = field(default_factory=list)
+    matches: List[Match] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        return {
+            "players": len(self.players),
+            "schedules": len(self.schedules),
+            "courts": len(self.courts),
+            "matches": len(self.matches),
+        }
+
+
+def _ntrp(rng: random.Random) -> Decimal:
+    rating = min(max(rng.gauss(3.5, 0.7), 1.5), 6.0)
+    return Decimal(str(round(rating * 2) / 2))
+
+
+def _gender_preference(rng: random.Random, gender: str):
+    roll = rng.random()
+    if roll < 0.7:
+        return "none"
+    if roll < 0.9:
+        return [gender]
+    return ["male", "female"]
+
+
+def _make_players(rng: random.Random, guild_id: str, count: int) -> List[Player]:
+    court_ids = [c[0] for c in COURTS]
+    court_weights = [c[3] for c in COURTS]
+    players = []
+    for i in range(count):
+        gender = rng.choices(*GENDERS)[0]
+        locations = []
+        for _ in range(rng.randint(1, 3)):
+            court_id = rng.choices(court_ids, court_weights)[0]
+            if court_id not in locations:
+                locations.append(court_id)
+        players.append(Player(
+            guild_id=guild_id,
+            user_id=str(100000000000000000 + i),
+            username=f"player{i}",
+            dob="01/01/1990",
+            gender=gender,
+            ntrp_rating=_ntrp(rng),
+            knows_ntrp=rng.random() < 0.8,
+            interests=["matches"],
+            preferences={
+                "locations": locations,
+                "skill_levels": list(rng.choices(*SKILL_PREFERENCES)[0]),
+                "gender": _gender_preference(rng, gender)
+            },
+            engagement_score=Decimal(rng.randint(0, 120)),
+            last_active=GENERATED_AT,
+            created_at=GENERATED_AT,
+            updated_at=GENERATED_AT
+        ))
+    return players
+
+
+def _make_schedules(rng: random.Random, players: List[Player], base_time: datetime,
+                    weeks: int) -> List[Schedule]:
+    # Slots are laid out from the Monday on or before the base time
+    monday = (base_time - timedelta(days=base_time.weekday())).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    window_start = int(base_time.timestamp())
+    schedules = []
+    for player in players:
+        for day, hour, duration in rng.sample(SLOTS, rng.randint(1, 3)):
+            parent_id = None
+            for week in range(weeks + 1):
+                start = monday + timedelta(weeks=week, days=day, hours=hour)
+                start_time = int(start.timestamp())
+                if start_time < window_start:
+                    continue
+                schedule = Schedule(
+                    guild_id=player.guild_id,
+                    user_id=player.user_id,
+                    start_time=start_time,
+                    end_time=start_time + duration * 3600,
+                    schedule_id=f"{player.user_id}-{day}-{hour}-{week}",
+                    parent_schedule_id=parent_id,
+                    created_at=GENERATED_AT,
+                    updated_at=GENERATED_AT,
+                    timezone_str=TIMEZONE
+                )
+                parent_id = parent_id or schedule.schedule_id
+                schedules.append(schedule)
+    return schedules
+
+
+def _make_matches(rng: random.Random, players: List[Player], count: int,
+                  base_time: datetime) -> List[Match]:
+    by_level = {}
+    for player in players:
+        by_level.setdefault(player.ntrp_rating, []).append(player)
+    levels = [level for level, group in by_level.items() if len(group) >= 2]
+    if not levels:
+        return []
+
+    court_ids = [c[0] for c in COURTS]
+    matches = []
+    for i in range(count):
+        first, second = rng.sample(by_level[rng.choice(levels)], 2)
+        start_time = int((base_time - timedelta(days=rng.randint(1, 180), hours=rng.randint(0, 12))).timestamp())
+        matches.append(Match(
+            guild_id=first.guild_id,
+            match_id=f"match-{i}",
+            court_id=rng.choice(court_ids),
+            start_time=start_time,
+            end_time=start_time + 7200,
+            players=[first.user_id, second.user_id],
+            status="completed",
+            match_quality_score=Decimal(rng.randint(3, 10)),
+            created_at=GENERATED_AT,
+            updated_at=GENERATED_AT
+        ))
+    return matches
+
+
+def generate_guild(num_players: int, seed: int = 42, weeks: int = 1,
+                   matches_per_player: float = 2.0,
+                   base_time: Optional[datetime] = None,
+                   guild_id: str = GUILD_ID) -> SyntheticGuild:
+    """Generate a synthetic guild.
+
+    Args:
+        num_players: Number of players (N)
+        seed: Random seed
+        weeks: Number of weeks each weekly slot repeats for (M grows with it)
+        matches_per_player: Completed matches per player in the history (K / N)
+        base_time: Start of the schedule window (default: the next full hour)
+        guild_id: Discord server ID to use
+
+    Returns:
+        SyntheticGuild: The generated data
+    """
+    rng = random.Random(seed)
+    if base_time is None:
+        base_time = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+
+    guild = SyntheticGuild(guild_id=guild_id)
+    guild.courts = [
+        Court(
+            name=name, location=name, surface_type="hard", number_of_courts=number,
+            is_indoor=court_id == "ubc-tennis-centre", amenities=[], google_maps_link="",
+            court_id=court_id
+        )
+        for court_id, name, number, _ in COURTS
+    ]
+    guild.players = _make_players(rng, guild_id, num_players)
+    guild.schedules = _make_schedules(rng, guild.players, base_time, weeks)
+    guild.matches = _make_matches(rng, guild.players, int(num_players * matches_per_player), base_time)
+    return guild
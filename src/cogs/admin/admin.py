@@ -1,4 +1,5 @@
 # src/cogs/admin/admin.py
+import asyncio
 import logging
 import traceback
 
@@ -8,7 +9,13 @@ from nextcord.ext import commands
 
 from src.config.constants import TEST_GUILD_ID
 from src.utils.config_loader import ConfigLoader
-from src.utils.responses import Responses
+from src.utils.responses import Responses, ResponseType
+from src.utils.batch_matching import run_batch_matchmaking
+from src.utils.scoring_profile import ScoringProfile
+from src.utils.loop_monitor import get_loop_monitor
+from src.utils.job_scheduler import get_job_scheduler
+from src.utils.offload import run_blocking
+from src.cogs.user.commands.schedule.parser.nlp_parser import get_parse_cache, get_parse_path_counts
 from .setup.channels import ChannelSetup
 from .setup.roles import RoleSetup
 from .dashboard.command import DashboardCommands
@@ -290,6 +297,277 @@ class Admin(commands.Cog):
                 str(e)
             )
 
+    @admin.subcommand(
+        name="matchmaking",
+        description="Guild-wide matchmaking commands"
+    )
+    async def matchmaking(self, interaction: Interaction):
+        """Base matchmaking command group."""
+        pass
+
+    @matchmaking.subcommand(
+        name="run",
+        description="Build a guild-wide pairing plan for open schedules"
+    )
+    async def run_matchmaking(
+        self,
+        interaction: Interaction,
+        hours_ahead: int = nextcord.SlashOption(
+            description="How many hours ahead to match (default: 168)",
+            required=False,
+            default=168,
+            min_value=1,
+            max_value=336
+        )
+    ):
+        """Build a guild-wide pairing plan for all open schedules.
+
+        Args:
+            interaction (Interaction): The slash command interaction
+            hours_ahead (int): Size of the matching window in hours
+        """
+        try:
+            # Validate command usage
+            if not await self.validate_command_usage(interaction):
+                return
+
+            logger.info(f"Batch matchmaking initiated by admin in {interaction.guild.name}")
+            await interaction.response.defer(ephemeral=True)
+
+            # Plan building is CPU bound, keep it off the event loop
+            plans = await run_blocking(
+                interaction, run_batch_matchmaking, [str(interaction.guild.id)], hours_ahead
+            )
+            plan = plans[0]
+            stats = plan["stats"]
+
+            fields = [
+                ("Open Schedules", str(stats.get("schedules", 0)), True),
+                ("Singles", str(stats.get("singles", 0)), True),
+                ("Doubles", str(stats.get("doubles", 0)), True),
+                ("Unmatched", str(stats.get("unmatched", len(plan["unmatched_schedule_ids"]))), True)
+            ]
+            for pairing in plan["pairings"][:10]:
+                players = ", ".join(f"<@{user_id}>" for user_id in pairing["players"])
+                fields.append((
+                    f"{pairing['match_type'].title()} ({pairing['score']:.0%})",
+                    f"{players}\n<t:{pairing['start_time']}:f>",
+                    False
+                ))
+
+            embed = Responses.create_embed(
+                "Matchmaking Plan",
+                f"Pairing plan for the next {hours_ahead} hours "
+                f"(built in {stats.get('seconds', 0)}s).",
+                ResponseType.INFO,
+                fields
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            logger.error(f"Error in run_matchmaking: {e}", exc_info=True)
+            await Responses.send_error(
+                interaction,
+                "Matchmaking Failed",
+                str(e)
+            )
+
+    @matchmaking.subcommand(
+        name="reload",
+        description="Reload matching weights and thresholds from the guild config"
+    )
+    async def reload_matchmaking(self, interaction: Interaction):
+        """Reload the matching section of guild_config.yaml without a restart.
+
+        Args:
+            interaction (Interaction): The slash command interaction
+        """
+        try:
+            # Validate command usage
+            if not await self.validate_command_usage(interaction):
+                return
+
+            ScoringProfile.reload()
+            profile = ScoringProfile.for_guild(str(interaction.guild.id))
+            logger.info(f"Matching config reloaded by admin in {interaction.guild.name}")
+
+            fields = [
+                (factor.replace('_', ' ').title(), f"{weight:.2f}", True)
+                for factor, weight in profile.weights.items()
+            ]
+            fields.append((
+                "Minimum Scores",
+                f"Singles {profile.min_singles_score:.2f}, doubles {profile.min_doubles_score:.2f}",
+                False
+            ))
+            embed = Responses.create_embed(
+                "Matching Config Reloaded",
+                "New weights and thresholds apply to the next match search.",
+                ResponseType.INFO,
+                fields
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            logger.error(f"Error in reload_matchmaking: {e}", exc_info=True)
+            await Responses.send_error(
+                interaction,
+                "Reload Failed",
+                str(e)
+            )
+
+
+    @admin.subcommand(
+        name="loop-blockers",
+        description="Show the commands that blocked the bot's event loop the longest"
+    )
+    async def loop_blockers(self, interaction: Interaction):
+        """Show the top event loop blockers recorded since startup.
+
+        Args:
+            interaction (Interaction): The slash command interaction
+        """
+        try:
+            # Validate command usage
+            if not await self.validate_command_usage(interaction):
+                return
+
+            monitor = get_loop_monitor()
+            blockers = monitor.report(limit=5) if monitor else []
+            if not blockers:
+                await Responses.send_info(
+                    interaction,
+                    "Loop Blockers",
+                    "No event loop stalls recorded since startup."
+                )
+                return
+
+            fields = []
+            for blocker in blockers:
+                # Innermost frames say what was blocking
+                frames = "".join(blocker['stack'].format()[-3:]) if blocker['stack'] else ""
+                fields.append((
+                    blocker['label'][:256],
+                    (
+                        f"{blocker['count']} stall(s), {blocker['total']:.2f}s total, "
+                        f"longest {blocker['max'] * 1000:.0f}ms\n```{frames[-900:]}```"
+                    ),
+                    False
+                ))
+            embed = Responses.create_embed(
+                "Loop Blockers",
+                f"Handlers that held the event loop for more than "
+                f"{monitor.threshold * 1000:.0f}ms, worst first.",
+                ResponseType.WARNING,
+                fields
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            logger.error(f"Error in loop_blockers: {e}", exc_info=True)
+            await Responses.send_error(
+                interaction,
+                "Loop Blockers Failed",
+                str(e)
+            )
+
+    @admin.subcommand(
+        name="jobs",
+        description="Show background job metrics"
+    )
+    async def jobs(self, interaction: Interaction):
+        """Show pending, completed and failed background jobs per job type.
+
+        Args:
+            interaction (Interaction): The slash command interaction
+        """
+        try:
+            # Validate command usage
+            if not await self.validate_command_usage(interaction):
+                return
+
+            scheduler = get_job_scheduler()
+            if not scheduler:
+                await Responses.send_info(
+                    interaction,
+                    "Background Jobs",
+                    "The job scheduler has not started yet."
+                )
+                return
+
+            fields = [
+                (
+                    job_type,
+                    (
+                        f"{stats['pending']} pending, {stats['succeeded']} succeeded, "
+                        f"{stats['retried']} retried, {stats['failed']} failed\n"
+                        f"Concurrency {stats['concurrency']}, worst lag {stats['max_lag']:.0f}s, "
+                        f"longest run {stats['max_duration']:.1f}s"
+                    ),
+                    False
+                )
+                for job_type, stats in sorted(scheduler.stats().items())
+            ]
+            embed = Responses.create_embed(
+                "Background Jobs",
+                "Job metrics since startup.",
+                ResponseType.INFO,
+                fields
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            logger.error(f"Error in jobs: {e}", exc_info=True)
+            await Responses.send_error(
+                interaction,
+                "Background Jobs Failed",
+                str(e)
+            )
+
+    @admin.subcommand(
+        name="parser-cache",
+        description="Show how often schedule time descriptions are served from cache"
+    )
+    async def parser_cache(self, interaction: Interaction):
+        """Show hit-rate metrics of the time description parse cache.
+
+        Args:
+            interaction (Interaction): The slash command interaction
+        """
+        try:
+            # Validate command usage
+            if not await self.validate_command_usage(interaction):
+                return
+
+            stats = get_parse_cache().stats()
+            paths = get_parse_path_counts()
+            parsed = paths['fast'] + paths['layered']
+            fields = [
+                ("Hit Rate", f"{stats['hit_rate']:.0%} of {stats['hits'] + stats['misses']} parses", False),
+                ("Entries", f"{stats['size']} of {stats['maxsize']}, {stats['expired']} expired at midnight", False),
+                (
+                    "Fast Path",
+                    f"{paths['fast'] / parsed if parsed else 0:.0%} of {parsed} uncached parses "
+                    f"skipped dateparser",
+                    False
+                ),
+            ]
+            embed = Responses.create_embed(
+                "Parser Cache",
+                "Time descriptions parsed today are reused until local midnight.",
+                ResponseType.INFO,
+                fields
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+
+        except Exception as e:
+            logger.error(f"Error in parser_cache: {e}", exc_info=True)
+            await Responses.send_error(
+                interaction,
+                "Parser Cache Failed",
+                str(e)
+            )
+
 
 def setup(bot):
     bot.add_cog(Admin(bot))
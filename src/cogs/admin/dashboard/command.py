@@ -1,6 +1,7 @@
 """Dashboard command implementation."""
 
 import logging
+import time
 import nextcord
 from datetime import datetime
 from typing import Optional, Set, Dict, List
@@ -11,6 +12,8 @@ from src.database.dao.dynamodb.schedule_dao import ScheduleDAO
 from src.database.dao.dynamodb.player_dao import PlayerDAO
 from src.database.dao.dynamodb.court_dao import CourtDAO
 from src.utils.responses import Responses
+from src.utils.offload import get_offloader, run_blocking, InteractionExpired
+from src.utils.job_scheduler import get_job_scheduler
 from src.utils.config_loader import ConfigLoader
 from .aggregator import ScheduleAggregator
 from .constants import EMBEDS, SUCCESS, ERRORS
@@ -19,6 +22,15 @@ from .views.playing_view import CurrentlyPlayingView
 
 logger = logging.getLogger(__name__)
 
+DASHBOARD_REFRESH_JOB = "dashboard_refresh"
+
+# Seconds between automatic refreshes of a posted dashboard
+DASHBOARD_REFRESH_INTERVAL = 15 * 60
+
+# Dashboards refreshed at the same time, and jitter in seconds
+DASHBOARD_REFRESH_CONCURRENCY = 2
+DASHBOARD_REFRESH_JITTER = 60
+
 class DashboardCommands:
     """Handler for dashboard commands."""
 
@@ -33,6 +45,16 @@ class DashboardCommands:
         self.timezone = config_loader.get_timezone()
         self.last_channel_id = None  # Track last channel where dashboard was posted
 
+    async def _schedule_refresh(self, guild_id: int, message: nextcord.Message):
+        """Refresh a posted dashboard periodically, replacing the guild's previous one."""
+        scheduler = get_job_scheduler()
+        if scheduler:
+            await scheduler.schedule(
+                DASHBOARD_REFRESH_JOB, str(guild_id),
+                int(time.time()) + DASHBOARD_REFRESH_INTERVAL,
+                payload={'channel_id': str(message.channel.id), 'message_id': str(message.id)}
+            )
+
     async def view_dashboard(
         self,
         interaction: nextcord.Interaction,
@@ -57,7 +79,8 @@ class DashboardCommands:
             start_date = datetime.now(self.timezone).replace(
                 hour=0, minute=0, second=0, microsecond=0
             )
-            location_data = await self.aggregator.get_availability_by_location(
+            location_data = await run_blocking(
+                interaction, self.aggregator.get_availability_by_location,
                 start_date=start_date,
                 location=location
             )
@@ -77,7 +100,7 @@ class DashboardCommands:
                         user_ids.update(slot_data)
             
             # Get user information
-            user_dict = await self.aggregator.get_user_dict(user_ids)
+            user_dict = await run_blocking(interaction, self.aggregator.get_user_dict, user_ids)
             
             # Get locations
             locations = list(location_data.keys())
@@ -95,6 +118,8 @@ class DashboardCommands:
                 ephemeral=True
             )
 
+        except InteractionExpired:
+            logger.warning("Viewing dashboard outlived its interaction")
         except Exception as e:
             logger.error(f"Error viewing dashboard: {e}", exc_info=True)
             await Responses.send_error(
@@ -117,7 +142,7 @@ class DashboardCommands:
             await interaction.response.defer(ephemeral=True)
             
             # Get currently playing data
-            playing_data = await self.aggregator.get_currently_playing()
+            playing_data = await run_blocking(interaction, self.aggregator.get_currently_playing)
             
             # Get all user IDs from the data
             user_ids = set()
@@ -126,7 +151,7 @@ class DashboardCommands:
                     user_ids.add(user_id)
             
             # Get user information
-            user_dict = await self.aggregator.get_user_dict(user_ids)
+            user_dict = await run_blocking(interaction, self.aggregator.get_user_dict, user_ids)
             
             # Create and send view
             view = CurrentlyPlayingView(
@@ -140,6 +165,8 @@ class DashboardCommands:
                 ephemeral=True
             )
 
+        except InteractionExpired:
+            logger.warning("Viewing currently playing outlived its interaction")
         except Exception as e:
             logger.error(f"Error viewing currently playing: {e}", exc_info=True)
             await Responses.send_error(
@@ -181,7 +208,8 @@ class DashboardCommands:
             start_date = datetime.now(self.timezone).replace(
                 hour=0, minute=0, second=0, microsecond=0
             )
-            location_data = await self.aggregator.get_availability_by_location(
+            location_data = await run_blocking(
+                interaction, self.aggregator.get_availability_by_location,
                 start_date=start_date
             )
             
@@ -200,7 +228,7 @@ class DashboardCommands:
                         user_ids.update(slot_data)
             
             # Get user information
-            user_dict = await self.aggregator.get_user_dict(user_ids)
+            user_dict = await run_blocking(interaction, self.aggregator.get_user_dict, user_ids)
             
             # Get locations
             locations = list(location_data.keys())
@@ -213,7 +241,7 @@ class DashboardCommands:
             )
             
             # Post to channel
-            await channel.send(
+            message = await channel.send(
                 embed=await view.get_embed(),
                 view=view
             )
@@ -221,12 +249,17 @@ class DashboardCommands:
             # Store channel ID for refresh command
             self.last_channel_id = channel.id
             
+            # Keep the posted dashboard up to date
+            await self._schedule_refresh(interaction.guild.id, message)
+            
             # Send success message
             await interaction.followup.send(
                 SUCCESS["DASHBOARD_POSTED"].format(channel=channel.mention),
                 ephemeral=True
             )
 
+        except InteractionExpired:
+            logger.warning("Posting dashboard outlived its interaction")
         except Exception as e:
             logger.error(f"Error posting dashboard: {e}", exc_info=True)
             await Responses.send_error(
@@ -277,7 +310,8 @@ class DashboardCommands:
             start_date = datetime.now(self.timezone).replace(
                 hour=0, minute=0, second=0, microsecond=0
             )
-            location_data = await self.aggregator.get_availability_by_location(
+            location_data = await run_blocking(
+                interaction, self.aggregator.get_availability_by_location,
                 start_date=start_date
             )
             
@@ -296,7 +330,7 @@ class DashboardCommands:
                         user_ids.update(slot_data)
             
             # Get user information
-            user_dict = await self.aggregator.get_user_dict(user_ids)
+            user_dict = await run_blocking(interaction, self.aggregator.get_user_dict, user_ids)
             
             # Get locations
             locations = list(location_data.keys())
@@ -309,17 +343,22 @@ class DashboardCommands:
             )
             
             # Post to channel
-            await channel.send(
+            message = await channel.send(
                 embed=await view.get_embed(),
                 view=view
             )
             
+            # Refresh the new post from now on
+            await self._schedule_refresh(interaction.guild.id, message)
+            
             # Send success message
             await interaction.followup.send(
                 SUCCESS["DASHBOARD_REFRESHED"],
                 ephemeral=True
             )
 
+        except InteractionExpired:
+            logger.warning("Refreshing dashboard outlived its interaction")
         except Exception as e:
             logger.error(f"Error refreshing dashboard: {e}", exc_info=True)
             await Responses.send_error(
@@ -328,3 +367,50 @@ class DashboardCommands:
                 ERRORS["GENERAL_ERROR"],
                 ephemeral=True
             )
+
+
+async def refresh_posted_dashboard(client: nextcord.Client, job) -> Optional[int]:
+    """Edit a posted dashboard with current availability.
+
+    Runs as a background job (see src.utils.background_jobs) and repeats
+    until the dashboard message is deleted.
+
+    Args:
+        client (nextcord.Client): The bot
+        job (ScheduledJob): Job with the dashboard's channel_id and message_id
+
+    Returns:
+        Optional[int]: When to refresh next, or None to stop
+    """
+    channel = client.get_channel(int(job.payload['channel_id']))
+    if channel is None:
+        logger.info(f"Dashboard channel {job.payload['channel_id']} is gone; stopping refreshes")
+        return None
+    try:
+        message = await channel.fetch_message(int(job.payload['message_id']))
+    except nextcord.NotFound:
+        logger.info(f"Dashboard message {job.payload['message_id']} is gone; stopping refreshes")
+        return None
+
+    aggregator = DashboardCommands().aggregator
+    start_date = datetime.now(aggregator.timezone).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    location_data = await get_offloader().run(
+        job.guild_id, None, aggregator.get_availability_by_location, start_date=start_date
+    )
+    if location_data:
+        user_ids = set()
+        for loc_data in location_data.values():
+            for date_data in loc_data.values():
+                for slot_data in date_data.values():
+                    user_ids.update(slot_data)
+        user_dict = await get_offloader().run(job.guild_id, None, aggregator.get_user_dict, user_ids)
+        view = LocationAvailabilityView(
+            location_data=location_data,
+            user_dict=user_dict,
+            locations=list(location_data.keys())
+        )
+        await message.edit(embed=await view.get_embed(), view=view)
+
+    return int(time.time()) + DASHBOARD_REFRESH_INTERVAL
@@ -2,167 +2,158 @@
 import nextcord
 from nextcord import Interaction
 import logging
-from src.utils.responses import Responses, ResponseType
+from typing import Dict, Union
+from src.utils.responses import Responses
 from src.utils.config_loader import ConfigLoader
 from src.config.permissions import RolePermissions
+from .plan import SetupOperation, SetupPlan, SetupProgress, apply_plan, send_up_to_date
 
 
 logger = logging.getLogger(__name__)
 
 
+def _same_overwrites(current: dict, desired: dict) -> bool:
+    """Compare overwrites by their allow/deny bits, ignoring permission aliases"""
+    return (
+        {target.id for target in current} == {target.id for target in desired}
+        and all(current[target].pair() == overwrite.pair() for target, overwrite in desired.items())
+    )
+
+
 class ChannelSetup:
     def __init__(self, bot):
         self.bot = bot
         self.config_loader = ConfigLoader()  # Create instance to use throughout the class
 
-    async def get_or_create_category(self, guild: nextcord.Guild, category_name: str) -> nextcord.CategoryChannel:
-        """Get existing category or create new one"""
-        category = nextcord.utils.get(guild.categories, name=category_name)
-        if not category:
-            logger.info(f"Creating category: {category_name}")
-            category = await guild.create_category(category_name)
-
-        return category
-
-    async def setup_channel_permissions(
+    def _channel_overwrites(
             self,
-            channel: nextcord.TextChannel,
             guild: nextcord.Guild,
             access_roles: list
-    ) -> None:
-        """Set up channel permissions for roles"""
-        try:
-            # Default permissions (no access)
-            overwrites = {
-                guild.default_role: nextcord.PermissionOverwrite(
-                    read_messages=False,
-                    send_messages=False
-                )
-            }
-
-            # Add permissions for specified roles
-            for role_name in access_roles:
-                role = nextcord.utils.get(guild.roles, name=role_name)
-                if role:
-                    role_id = self.config_loader.get_role_id(role_name)
-                    permission_method = getattr(RolePermissions, f"get_{role_id}_permissions")
-                    overwrites[role] = permission_method()
-                else:
-                    logger.warning(f"Role not found: {role_name}")
-
-            await channel.edit(overwrites=overwrites)
-            logger.info(f"Updated permissions for channel: {channel.name}")
+    ) -> Dict[Union[nextcord.Role, nextcord.Member], nextcord.PermissionOverwrite]:
+        """Build channel permission overwrites for roles"""
+        # Default permissions (no access)
+        overwrites = {
+            guild.default_role: nextcord.PermissionOverwrite(
+                read_messages=False,
+                send_messages=False
+            )
+        }
+
+        # Add permissions for specified roles
+        for role_name in access_roles:
+            role = nextcord.utils.get(guild.roles, name=role_name)
+            if role:
+                role_id = self.config_loader.get_role_id(role_name)
+                permission_method = getattr(RolePermissions, f"get_{role_id}_permissions")
+                overwrites[role] = permission_method()
+            else:
+                logger.warning(f"Role not found: {role_name}")
+        return overwrites
+
+    def plan_channels(self, guild: nextcord.Guild) -> SetupPlan:
+        """
+        Compare the channel configuration with the guild's channels.
+
+        Missing categories are created first; channels are then created or
+        edited concurrently, each with a single API call that sets only the
+        topic and overwrites that differ.
+
+        Args:
+            guild (nextcord.Guild): The Discord guild
+
+        Returns:
+            SetupPlan: Only the changes that are needed
+        """
+        plan = SetupPlan()
+        channels_config = self.config_loader.config.get('channels', {})
+
+        categories: Dict[str, nextcord.CategoryChannel] = {}
+        new_categories = []
+        for channel_config in channels_config.values():
+            category_name = channel_config.get('category', 'General')
+            if category_name in categories or category_name in new_categories:
+                continue
+            category = nextcord.utils.get(guild.categories, name=category_name)
+            if category:
+                categories[category_name] = category
+            else:
+                new_categories.append(category_name)
+
+        async def create_category(name):
+            logger.info(f"Creating category: {name}")
+            categories[name] = await guild.create_category(name)
+
+        plan.add_phase([
+            SetupOperation(f"Created {name} category", lambda name=name: create_category(name))
+            for name in new_categories
+        ])
+
+        channel_operations = []
+        for channel_id, channel_config in channels_config.items():
+            # Check if channel exists
+            channel_name = channel_config.get('name')
+            if not channel_name:
+                plan.errors.append(f"No name specified for channel {channel_id}")
+                continue
+            category_name = channel_config.get('category', 'General')
+            topic = channel_config.get('topic', '')
+            try:
+                overwrites = self._channel_overwrites(guild, channel_config.get('access_roles', []))
+            except AttributeError as e:
+                plan.errors.append(f"Error setting up {channel_name}: {e}")
+                continue
+
+            category = categories.get(category_name)
+            channel = nextcord.utils.get(category.channels, name=channel_name) if category else None
+
+            if channel is None:
+                channel_operations.append(SetupOperation(
+                    f"Created {channel_name} channel in {category_name}",
+                    lambda name=channel_name, category_name=category_name, topic=topic, overwrites=overwrites:
+                        categories[category_name].create_text_channel(
+                            name=name,
+                            topic=topic,
+                            overwrites=overwrites
+                        )
+                ))
+                continue
+
+            # Update existing channel
+            changes = {}
+            if (channel.topic or '') != topic:
+                changes['topic'] = topic
+            if not _same_overwrites(channel.overwrites, overwrites):
+                changes['overwrites'] = overwrites
+            if changes:
+                channel_operations.append(SetupOperation(
+                    f"Updated {channel_name} channel settings",
+                    lambda channel=channel, changes=changes: channel.edit(
+                        **changes,
+                        reason="Updating channel settings"
+                    )
+                ))
 
-        except Exception as e:
-            logger.error(f"Error setting channel permissions: {e}")
-            raise
+        plan.add_phase(channel_operations)
+        return plan
 
     async def setup_channels(self, interaction: Interaction) -> None:
-        """Set up server channels"""
+        """Set up server channels, applying only the changes the guild needs"""
         try:
             await interaction.response.defer()
             guild = interaction.guild
 
             # Get channels configuration using property
-            channels_config = self.config_loader.config.get('channels', {})
-            if not channels_config:
+            if not self.config_loader.config.get('channels', {}):
                 raise ValueError("No channels configuration found")
 
-            for channel_id, channel_config in channels_config.items():
-                try:
-                    # Log channel configuration for debugging
-                    logger.debug(f"Setting up channel: {channel_id}")
-                    logger.debug(f"Channel config: {channel_config}")
-
-                    # Get or create category
-                    category = await self.get_or_create_category(
-                        guild,
-                        channel_config.get('category', 'General')
-                    )
-
-                    # Check if channel exists
-                    channel_name = channel_config.get('name')
-                    if not channel_name:
-                        raise ValueError(f"No name specified for channel {channel_id}")
+            plan = self.plan_channels(guild)
+            if not plan.operations:
+                await send_up_to_date(interaction, "Channels Setup", plan.errors)
+                logger.info("Channels already match configuration")
+                return
 
-                    channel = nextcord.utils.get(
-                        category.channels,
-                        name=channel_name
-                    )
-
-                    if channel:
-                        # Update existing channel
-                        await channel.edit(
-                            name=channel_name,
-                            topic=channel_config.get('topic', ''),
-                            category=category,
-                            reason="Updating channel settings"
-                        )
-                        await self.setup_channel_permissions(
-                            channel,
-                            guild,
-                            channel_config.get('access_roles', [])
-                        )
-
-                        await interaction.followup.send(
-                            embed=Responses.create_embed(
-                                "Channel Updated",
-                                f"Updated {channel_name} channel settings",
-                                ResponseType.SUCCESS
-                            )
-                        )
-                        logger.info(f"Updated channel: {channel_name}")
-
-                    else:
-                        # Create new channel
-                        channel = await category.create_text_channel(
-                            name=channel_name,
-                            topic=channel_config.get('topic', '')
-                        )
-                        await self.setup_channel_permissions(
-                            channel,
-                            guild,
-                            channel_config.get('access_roles', [])
-                        )
-
-                        await interaction.followup.send(
-                            embed=Responses.create_embed(
-                                "Channel Created",
-                                f"Created {channel_name} channel in {category.name}",
-                                ResponseType.SUCCESS
-                            )
-                        )
-                        logger.info(f"Created channel: {channel_name}")
-
-                except nextcord.Forbidden as e:
-                    error_msg = f"Bot doesn't have permission to manage channel: {channel_config.get('name', 'unknown')}"
-                    logger.error(f"{error_msg}: {str(e)}")
-                    await interaction.followup.send(
-                        embed=Responses.create_embed(
-                            "Permission Error",
-                            error_msg,
-                            ResponseType.ERROR
-                        )
-                    )
-                except Exception as e:
-                    logger.error(f"Error setting up channel {channel_config.get('name', 'unknown')}: {e}",
-                                 exc_info=True)
-                    await interaction.followup.send(
-                        embed=Responses.create_embed(
-                            "Channel Setup Error",
-                            f"Error setting up {channel_config.get('name', 'unknown')}: {str(e)}",
-                            ResponseType.ERROR
-                        )
-                    )
-
-            await interaction.followup.send(
-                embed=Responses.create_embed(
-                    "Channels Setup Complete",
-                    "All channels have been set up successfully!",
-                    ResponseType.SUCCESS
-                )
-            )
-            logger.info("Channel setup completed successfully")
+            await apply_plan(plan, SetupProgress(interaction, "Channels Setup"))
+            logger.info("Channel setup completed")
 
         except Exception as e:
             logger.error(f"Error in setup_channels: {e}", exc_info=True)
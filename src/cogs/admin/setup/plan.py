@@ -0,0 +1,160 @@
+# src/cogs/admin/setup/plan.py
+"""
+Plan and apply support for server setup.
+
+Setup first compares guild_config.yaml with the live guild and builds a
+SetupPlan holding only the operations that would change something. The
+plan is then applied phase by phase: operations within a phase don't depend
+on each other and run concurrently under a limiter, while later phases may
+use what earlier ones created (e.g. channels in a new category). Progress
+is reported in a single message that is edited in place.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, List, Optional
+
+import nextcord
+from nextcord import Interaction
+
+from src.utils.responses import Responses, ResponseType
+
+logger = logging.getLogger(__name__)
+
+# Guild edits run at the same time
+SETUP_CONCURRENCY = 4
+
+# Minimum seconds between progress message edits
+PROGRESS_EDIT_INTERVAL = 1.0
+
+
+@dataclass
+class SetupOperation:
+    """One change to the guild."""
+    description: str
+    apply: Callable[[], Awaitable[None]]
+
+
+@dataclass
+class SetupPlan:
+    """Changes needed to bring a guild in line with the configuration."""
+    phases: List[List[SetupOperation]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    def add_phase(self, operations: List[SetupOperation]):
+        if operations:
+            self.phases.append(operations)
+
+    @property
+    def operations(self) -> List[SetupOperation]:
+        return [operation for phase in self.phases for operation in phase]
+
+
+class SetupProgress:
+    """A single progress message, edited in place as operations finish."""
+
+    def __init__(self, interaction: Interaction, title: str):
+        """
+        Initialize progress reporting.
+
+        Args:
+            interaction (Interaction): The deferred setup interaction
+            title (str): Title of the progress message
+        """
+        self.interaction = interaction
+        self.title = title
+        self.total = 0
+        self.done: List[str] = []
+        self.errors: List[str] = []
+        self._message: Optional[nextcord.Message] = None
+        self._edited_at = 0.0
+
+    def _embed(self, finished: bool) -> nextcord.Embed:
+        lines = [f"{len(self.done) + len(self.errors)}/{self.total} changes applied"]
+        lines += [f"• {description}" for description in self.done[-15:]]
+        if self.errors:
+            lines.append("\n**Errors:**")
+            lines += [f"• {error}" for error in self.errors]
+        if not finished:
+            response_type = ResponseType.INFO
+        elif self.errors:
+            response_type = ResponseType.WARNING
+        else:
+            response_type = ResponseType.SUCCESS
+        title = self.title if not finished else (
+            f"{self.title} Completed with Errors" if self.errors else f"{self.title} Complete"
+        )
+        return Responses.create_embed(title, "\n".join(lines)[:4000], response_type)
+
+    async def start(self, total: int):
+        self.total = total
+        self._message = await self.interaction.followup.send(embed=self._embed(False), wait=True)
+        self._edited_at = time.monotonic()
+
+    async def advance(self, description: Optional[str] = None, error: Optional[str] = None):
+        if error:
+            self.errors.append(error)
+        else:
+            self.done.append(description)
+        # Bursts of finished operations share one edit
+        if time.monotonic() - self._edited_at >= PROGRESS_EDIT_INTERVAL:
+            self._edited_at = time.monotonic()
+            await self._message.edit(embed=self._embed(False))
+
+    async def finish(self):
+        await self._message.edit(embed=self._embed(True))
+
+
+async def apply_plan(plan: SetupPlan, progress: SetupProgress,
+                     concurrency: int = SETUP_CONCURRENCY) -> List[str]:
+    """
+    Apply a plan phase by phase, running each phase's operations concurrently.
+
+    Args:
+        plan (SetupPlan): The plan to apply
+        progress (SetupProgress): Progress message to update
+        concurrency (int): Operations run at the same time
+
+    Returns:
+        List[str]: Errors from planning and applying
+    """
+    limiter = asyncio.Semaphore(concurrency)
+    progress.errors.extend(plan.errors)
+
+    async def run(operation: SetupOperation):
+        async with limiter:
+            try:
+                await operation.apply()
+                logger.info(f"Setup: {operation.description}")
+                await progress.advance(operation.description)
+            except nextcord.Forbidden as e:
+                logger.error(f"Permission denied: {operation.description}: {e}")
+                await progress.advance(error=f"Missing permission: {operation.description}")
+            except Exception as e:
+                logger.error(f"Setup operation failed: {operation.description}: {e}", exc_info=True)
+                await progress.advance(error=f"{operation.description}: {e}")
+
+    await progress.start(len(plan.operations))
+    for phase in plan.phases:
+        await asyncio.gather(*(run(operation) for operation in phase))
+    await progress.finish()
+    return progress.errors
+
+
+async def send_up_to_date(interaction: Interaction, title: str, errors: List[str]):
+    """Report a plan with nothing to apply."""
+    if errors:
+        error_list = "\n• ".join(errors)
+        await interaction.followup.send(embed=Responses.create_embed(
+            f"{title} Completed with Errors",
+            f"Nothing to change, but encountered the following errors:\n• {error_list}",
+            ResponseType.WARNING
+        ))
+    else:
+        await interaction.followup.send(embed=Responses.create_embed(
+            f"{title} Complete",
+            "Everything already matches the configuration; no changes were needed.",
+            ResponseType.SUCCESS
+        ))
@@ -15,6 +15,7 @@ from nextcord import Interaction, Permissions, Colour, Role, Guild
 from src.config.permissions import RolePermissions
 from src.utils.config_loader import ConfigLoader
 from src.utils.responses import Responses, ResponseType
+from .plan import SetupOperation, SetupPlan, SetupProgress, apply_plan, send_up_to_date
 
 logger = logging.getLogger(__name__)
 
@@ -71,135 +72,129 @@ class RoleSetup:
             logger.error(f"Error checking bot role: {e}", exc_info=True)
             return None
 
-    async def _process_role(
-            self,
-            guild: Guild,
-            role_id: str,
-            role_config: Dict,
-            bot_role: Role
-    ) -> Tuple[bool, str]:
+    def _role_permissions(self, role_id: str) -> Permissions:
         """
-        Process a single role configuration.
+        Get the guild-wide permissions for a configured role.
 
         Args:
-            guild (Guild): The Discord guild
             role_id (str): The role identifier from configuration
-            role_config (Dict): The role configuration dictionary
-            bot_role (Role): The bot's role for hierarchy management
 
         Returns:
-            Tuple[bool, str]: Success status and error message if any
+            Permissions: Permissions granted by the role's overwrite
+
+        Raises:
+            AttributeError: If no permissions are defined for the role
         """
-        try:
-            # Skip if this is the bot's own role
-            if role_id == 'bot' and any(r.name == role_config['name'] for r in guild.me.roles):
-                return True, f"Skipped bot role {role_config['name']} as it already exists"
-
-            # Get permission overwrite based on role dynamically
-            permission_method = getattr(RolePermissions, f"get_{role_id}_permissions")
-            permissions = permission_method()
-            logger.info(f"Found permissions for role: {role_id}")
-
-            # Convert PermissionOverwrite to Permissions
-            role_permissions = Permissions()
-            for perm, value in permissions._values.items():
-                if value and hasattr(role_permissions, perm):
-                    setattr(role_permissions, perm, True)
-
-            # Check if role exists
-            existing_role = nextcord.utils.get(
-                guild.roles,
-                name=role_config['name']
-            )
+        # Get permission overwrite based on role dynamically
+        permissions = getattr(RolePermissions, f"get_{role_id}_permissions")()
 
-            return await self._update_or_create_role(
-                guild,
-                existing_role,
-                role_config,
-                role_permissions,
-                bot_role
-            )
+        # Convert PermissionOverwrite to Permissions
+        role_permissions = Permissions()
+        for perm, value in permissions._values.items():
+            if value and hasattr(role_permissions, perm):
+                setattr(role_permissions, perm, True)
+        return role_permissions
 
-        except AttributeError:
-            error_msg = f"No permissions defined for role: {role_config['name']}"
-            logger.warning(error_msg)
-            return False, error_msg
-        except Exception as e:
-            error_msg = f"Error processing role {role_config['name']}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return False, error_msg
-
-    async def _update_or_create_role(
-            self,
-            guild: Guild,
-            existing_role: Optional[Role],
-            role_config: Dict,
-            role_permissions: Permissions,
-            bot_role: Role
-    ) -> Tuple[bool, str]:
+    def plan_roles(self, guild: Guild, bot_role: Role) -> SetupPlan:
         """
-        Update existing role or create new one.
+        Compare the role configuration with the guild's roles.
+
+        The plan has two phases: role creation and settings edits, which
+        run concurrently, then one bulk position update for new roles and
+        for roles the bot could not manage because they sit above it.
 
         Args:
             guild (Guild): The Discord guild
-            existing_role (Optional[Role]): Existing role if found
-            role_config (Dict): Role configuration
-            role_permissions (Permissions): Role permissions
             bot_role (Role): The bot's role for hierarchy management
 
         Returns:
-            Tuple[bool, str]: Success status and message
+            SetupPlan: Only the changes that are needed
         """
-        try:
-            if existing_role:
-                # Ensure role is below bot's role
-                if existing_role.position >= bot_role.position:
-                    await existing_role.edit(
-                        position=bot_role.position - 1,
-                        reason="Adjusting role hierarchy"
-                    )
-                    logger.info(f"Adjusted position for role: {existing_role.name}")
-
-                # Update role
-                await existing_role.edit(
-                    name=role_config['name'],
-                    colour=Colour(role_config['color']),
-                    permissions=role_permissions,
-                    reason="Updating role settings"
-                )
-                logger.info(f"Updated role: {role_config['name']}")
-                return True, f"Updated {role_config['name']} role settings"
-            else:
-                # Create new role
-                new_role = await guild.create_role(
-                    name=role_config['name'],
-                    colour=Colour(role_config['color']),
-                    permissions=role_permissions,
-                    reason="Creating new role"
-                )
+        plan = SetupPlan()
+        edits: List[SetupOperation] = []
+        positions: Dict[str, Tuple[Optional[Role], int]] = {}
+        created: Dict[str, Role] = {}
+
+        # Process roles in order
+        sorted_roles = sorted(
+            self.config_loader.config.get('roles', {}).items(),
+            key=lambda x: x[1]['position'],
+            reverse=True
+        )
+        for role_id, role_config in sorted_roles:
+            name = role_config['name']
 
+            # Skip if this is the bot's own role
+            if role_id == 'bot' and any(r.name == name for r in guild.me.roles):
+                continue
+
+            try:
+                role_permissions = self._role_permissions(role_id)
+            except AttributeError:
+                error_msg = f"No permissions defined for role: {name}"
+                logger.warning(error_msg)
+                plan.errors.append(error_msg)
+                continue
+
+            colour = Colour(role_config['color'])
+            existing_role = nextcord.utils.get(guild.roles, name=name)
+
+            if existing_role is None:
+                async def create(name=name, colour=colour, permissions=role_permissions):
+                    created[name] = await guild.create_role(
+                        name=name,
+                        colour=colour,
+                        permissions=permissions,
+                        reason="Creating new role"
+                    )
+                edits.append(SetupOperation(f"Created {name} role", create))
                 # Set position (ensure it's below bot's role)
-                target_position = min(role_config['position'], bot_role.position - 1)
-                await new_role.edit(position=target_position)
-
-                logger.info(f"Created role: {role_config['name']} at position {target_position}")
-                return True, f"Created {role_config['name']} role"
+                positions[name] = (None, max(1, min(role_config['position'], bot_role.position - 1)))
+                continue
+
+            if existing_role.colour != colour or existing_role.permissions != role_permissions:
+                edits.append(SetupOperation(
+                    f"Updated {name} role settings",
+                    lambda role=existing_role, colour=colour, permissions=role_permissions: role.edit(
+                        colour=colour,
+                        permissions=permissions,
+                        reason="Updating role settings"
+                    )
+                ))
+
+            # Ensure role is below bot's role
+            if existing_role.position >= bot_role.position:
+                positions[name] = (existing_role, bot_role.position - 1)
+
+        plan.add_phase(edits)
+
+        if positions:
+            async def move_roles():
+                await guild.edit_role_positions(
+                    positions={
+                        role or created[name]: position
+                        for name, (role, position) in positions.items()
+                        if role or name in created
+                    },
+                    reason="Adjusting role hierarchy"
+                )
+            plan.add_phase([SetupOperation(
+                f"Positioned {', '.join(positions)} below the bot's role", move_roles
+            )])
 
-        except Exception as e:
-            error_msg = f"Error with role {role_config['name']}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return False, error_msg
+        return plan
 
     async def setup_roles(self, interaction: Interaction) -> None:
         """
         Set up server roles based on configuration.
 
         This method:
-        1. Positions bot's role correctly in hierarchy
-        2. Loads and validates role configuration
-        3. Processes roles in order of position
-        4. Creates or updates roles as needed
-        5. Reports success or failure
+        1. Checks the bot's role position in the hierarchy
+        2. Plans the role changes against the live guild
+        3. Applies only those changes, concurrently where possible
+        4. Reports progress and errors in one message
+
+        Running it again on a configured guild makes no guild changes.
 
         Args:
             interaction (Interaction): The Discord interaction
@@ -235,8 +230,7 @@ class RoleSetup:
                 return
 
             # Get role configuration
-            roles_config = self.config_loader.config.get('roles', {})
-            if not roles_config:
+            if not self.config_loader.config.get('roles', {}):
                 await Responses.send_error(
                     interaction,
                     "Setup Failed",
@@ -244,35 +238,17 @@ class RoleSetup:
                 )
                 return
 
-            setup_errors: List[str] = []
-
-            # Process roles in order
-            sorted_roles = sorted(
-                roles_config.items(),
-                key=lambda x: x[1]['position'],
-                reverse=True
-            )
-
-            for role_id, role_config in sorted_roles:
-                success, message = await self._process_role(
-                    guild,
-                    role_id,
-                    role_config,
-                    bot_role
-                )
-                if success:
-                    await interaction.followup.send(
-                        embed=Responses.create_embed(
-                            "Role Updated" if "Updated" in message else "Role Created",
-                            message,
-                            ResponseType.SUCCESS
-                        )
-                    )
-                else:
-                    setup_errors.append(message)
+            plan = self.plan_roles(guild, bot_role)
+            if not plan.operations:
+                await send_up_to_date(interaction, "Roles Setup", plan.errors)
+                logger.info("Roles already match configuration")
+                return
 
-            # Send final status
-            await self._send_final_status(interaction, setup_errors)
+            errors = await apply_plan(plan, SetupProgress(interaction, "Roles Setup"))
+            if errors:
+                logger.warning("Role setup completed with errors")
+            else:
+                logger.info("Role setup completed successfully")
 
         except Exception as e:
             logger.error(f"Error in setup_roles: {e}", exc_info=True)
@@ -281,35 +257,3 @@ class RoleSetup:
                 "Role Setup Failed",
                 f"An error occurred during role setup: {str(e)}"
             )
-
-    async def _send_final_status(
-            self,
-            interaction: Interaction,
-            setup_errors: List[str]
-    ) -> None:
-        """
-        Send final status message for role setup.
-
-        Args:
-            interaction (Interaction): The Discord interaction
-            setup_errors (List[str]): List of errors encountered during setup
-        """
-        if setup_errors:
-            error_list = "\n• ".join(setup_errors)
-            await interaction.followup.send(
-                embed=Responses.create_embed(
-                    "Roles Setup Completed with Errors",
-                    f"Setup completed but encountered the following errors:\n• {error_list}",
-                    ResponseType.WARNING
-                )
-            )
-            logger.warning("Role setup completed with errors")
-        else:
-            await interaction.followup.send(
-                embed=Responses.create_embed(
-                    "Roles Setup Complete",
-                    "All roles have been set up successfully!",
-                    ResponseType.SUCCESS
-                )
-            )
-            logger.info("Role setup completed successfully")
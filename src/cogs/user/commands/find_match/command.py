@@ -1,7 +1,8 @@
 """Implementation of the /find-matches command."""
 
 import logging
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from typing import Optional
 import nextcord
 from nextcord import Interaction, Embed, Color
@@ -14,6 +15,8 @@ from src.database.dao.dynamodb.match_dao import MatchDAO
 from src.config.dynamodb_config import get_db
 from src.utils.responses import Responses
 from src.utils.matching_algorithm import TennisMatchingAlgorithm, MatchSuggestion
+from src.utils.offload import run_blocking, InteractionExpired
+from .constants import SEARCH_BUDGET_SECONDS, MIN_SEARCH_SECONDS
 from .views import MatchSuggestionView
 
 logger = logging.getLogger(__name__)
@@ -55,7 +58,9 @@ class FindMatchesCommand:
                 return
             
             # Check if user has a complete profile
-            player = self.player_dao.get_player(str(interaction.guild.id), str(interaction.user.id))
+            player = await run_blocking(
+                interaction, self.player_dao.get_player, str(interaction.guild.id), str(interaction.user.id)
+            )
             if not player:
                 await Responses.send_error(
                     interaction,
@@ -75,7 +80,8 @@ class FindMatchesCommand:
                 return
             
             # Check if user has any schedules
-            user_schedules = self.schedule_dao.get_user_schedules(
+            user_schedules = await run_blocking(
+                interaction, self.schedule_dao.get_user_schedules,
                 str(interaction.guild.id), str(interaction.user.id)
             )
             if not user_schedules:
@@ -96,11 +102,27 @@ class FindMatchesCommand:
                 ephemeral=True
             )
             
-            # Find matches
-            suggestions = self.matching_algorithm.find_matches_for_player(
-                str(interaction.guild.id), str(interaction.user.id), hours_ahead
+            # Find matches, returning what was found in time if the search is slow
+            suggestions = await run_blocking(
+                interaction, self.matching_algorithm.find_matches_for_player,
+                str(interaction.guild.id), str(interaction.user.id), hours_ahead,
+                deadline=self._search_deadline(interaction)
             )
             
+            if not suggestions and suggestions.more_available:
+                await interaction.edit_original_message(
+                    embed=Embed(
+                        title="⏳ Still Searching",
+                        description=(
+                            f"No suitable matches found yet in the next {hours_ahead} hours.\n\n"
+                            "Only your soonest schedules could be searched in time. "
+                            "Run `/find-matches` again to search the rest."
+                        ),
+                        color=Color.orange()
+                    )
+                )
+                return
+            
             if not suggestions:
                 await interaction.edit_original_message(
                     embed=Embed(
@@ -125,13 +147,24 @@ class FindMatchesCommand:
             view = MatchSuggestionView(suggestions, self.match_dao, self.schedule_dao)
             
             # Create embed with match suggestions
-            embed = self._create_matches_embed(suggestions, hours_ahead)
+            embed = await run_blocking(interaction, self._create_matches_embed, suggestions, hours_ahead)
+            if suggestions.more_available:
+                embed.add_field(
+                    name="🔄 More Matches Available",
+                    value=(
+                        "Only your soonest schedules were searched in time. "
+                        "Run `/find-matches` again to search the rest."
+                    ),
+                    inline=False
+                )
             
             await interaction.edit_original_message(
                 embed=embed,
                 view=view
             )
             
+        except InteractionExpired:
+            logger.warning(f"Match search for user {interaction.user.id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error finding matches: {e}", exc_info=True)
             await Responses.send_error(
@@ -149,7 +182,9 @@ class FindMatchesCommand:
         """
         try:
             # Check if user has a complete profile
-            player = self.player_dao.get_player(str(interaction.guild.id), str(interaction.user.id))
+            player = await run_blocking(
+                interaction, self.player_dao.get_player, str(interaction.guild.id), str(interaction.user.id)
+            )
             if not player:
                 await Responses.send_error(
                     interaction,
@@ -159,7 +194,9 @@ class FindMatchesCommand:
                 return
             
             # Check if the schedule belongs to the user
-            schedule = self.schedule_dao.get_schedule(str(interaction.guild.id), schedule_id)
+            schedule = await run_blocking(
+                interaction, self.schedule_dao.get_schedule, str(interaction.guild.id), schedule_id
+            )
             if not schedule:
                 await Responses.send_error(
                     interaction,
@@ -187,7 +224,8 @@ class FindMatchesCommand:
             )
             
             # Find matches for the specific schedule
-            suggestions = self.matching_algorithm.find_matches_for_schedule(
+            suggestions = await run_blocking(
+                interaction, self.matching_algorithm.find_matches_for_schedule,
                 str(interaction.guild.id), schedule_id
             )
             
@@ -212,13 +250,15 @@ class FindMatchesCommand:
             view = MatchSuggestionView(suggestions, self.match_dao, self.schedule_dao)
             
             # Create embed with match suggestions
-            embed = self._create_matches_embed(suggestions, None, schedule)
+            embed = await run_blocking(interaction, self._create_matches_embed, suggestions, None, schedule)
             
             await interaction.edit_original_message(
                 embed=embed,
                 view=view
             )
             
+        except InteractionExpired:
+            logger.warning(f"Match search for schedule {schedule_id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error finding matches for schedule: {e}", exc_info=True)
             await Responses.send_error(
@@ -227,6 +267,15 @@ class FindMatchesCommand:
                 "An error occurred while finding matches. Please try again."
             )
     
+    def _search_deadline(self, interaction: Interaction) -> float:
+        """Get a time.monotonic() deadline for a search from the interaction's age.
+        
+        The budget runs from when the user ran the command, so time already
+        spent on validation and the initial response comes out of it.
+        """
+        age = (datetime.now(timezone.utc) - interaction.created_at).total_seconds()
+        return time.monotonic() + max(MIN_SEARCH_SECONDS, SEARCH_BUDGET_SECONDS - age)
+    
     def _create_matches_embed(self, suggestions: list[MatchSuggestion], 
                             hours_ahead: Optional[int], 
                             specific_schedule=None) -> Embed:
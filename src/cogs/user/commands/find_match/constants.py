@@ -55,6 +55,12 @@ TIME_RANGES = {
     "MAX": 720       # 30 days
 }
 
+# Search time budget, counted from when the command was run (seconds)
+SEARCH_BUDGET_SECONDS = 8
+
+# Scoring time a search gets however late it starts (seconds)
+MIN_SEARCH_SECONDS = 1
+
 # Match types
 MATCH_TYPES = {
     "SINGLES": "singles",
@@ -7,10 +7,15 @@ import nextcord
 from nextcord import Interaction, Embed, Color, ButtonStyle
 from nextcord.ui import View, Button
 
+from src.config.dynamodb_config import get_db
 from src.database.dao.dynamodb.match_dao import MatchDAO
+from src.database.models.dynamodb.match import Match
 from src.database.dao.dynamodb.schedule_dao import ScheduleDAO
 from src.utils.matching_algorithm import MatchSuggestion
 from src.utils.responses import Responses
+from src.utils.dm_dispatcher import get_dispatcher
+from src.utils.background_jobs import cancel_match_expiry, schedule_match_expiry, schedule_match_reminder
+from src.utils.component_router import ComponentRoute, StatelessView, component_handler, custom_id
 
 logger = logging.getLogger(__name__)
 
@@ -181,28 +186,22 @@ class MatchSuggestionView(View):
                 inline=False
             )
             
-            # Send DM to each other player
-            for player in other_players:
-                try:
-                    # Get Discord user object
-                    discord_user = interaction.client.get_user(int(player.user_id))
-                    if discord_user:
-                        # Create confirmation view
-                        confirmation_view = MatchConfirmationView(match.match_id, self.match_dao)
-                        
-                        # Send DM
-                        await discord_user.send(embed=confirmation_embed, view=confirmation_view)
-                        logger.info(f"Sent confirmation request to {player.username} ({player.user_id})")
-                    else:
-                        logger.warning(f"Could not find Discord user for {player.username} ({player.user_id})")
-                except Exception as e:
-                    logger.error(f"Failed to send DM to {player.username} ({player.user_id}): {e}")
+            # Send DMs to all other players at once, each with its own confirmation view
+            results = await get_dispatcher(interaction.client).send_many(
+                [p.user_id for p in other_players],
+                embed=confirmation_embed,
+                view_factory=lambda: MatchConfirmationView(match.guild_id, match.match_id)
+            )
+            unreachable = [p.username for p, result in zip(other_players, results) if not result.sent]
             
             # Notify the current user
-            await interaction.followup.send(
-                f"✅ Match request sent! Waiting for confirmation from {len(other_players)} other player(s).",
-                ephemeral=True
-            )
+            message = f"✅ Match request sent! Waiting for confirmation from {len(other_players)} other player(s)."
+            if unreachable:
+                message += (
+                    f"\n⚠️ Couldn't send a DM to {', '.join(unreachable)}. "
+                    "They may have DMs disabled; please contact them directly."
+                )
+            await interaction.followup.send(message, ephemeral=True)
             
         except Exception as e:
             logger.error(f"Error sending confirmation requests: {e}", exc_info=True)
@@ -268,21 +267,10 @@ class MatchSuggestionView(View):
             
             # Send notification to all players except the cancelling user
             cancelling_user_id = str(interaction.user.id)
-            for player in suggestion.players:
-                # Skip the cancelling user
-                if player.user_id == cancelling_user_id:
-                    continue
-                try:
-                    # Get Discord user object
-                    discord_user = interaction.client.get_user(int(player.user_id))
-                    if discord_user:
-                        # Send DM
-                        await discord_user.send(embed=cancellation_embed)
-                        logger.info(f"Sent cancellation notification to {player.username} ({player.user_id})")
-                    else:
-                        logger.warning(f"Could not find Discord user for {player.username} ({player.user_id})")
-                except Exception as e:
-                    logger.error(f"Failed to send cancellation DM to {player.username} ({player.user_id}): {e}")
+            await get_dispatcher(interaction.client).send_many(
+                [p.user_id for p in suggestion.players if p.user_id != cancelling_user_id],
+                embed=cancellation_embed
+            )
         except Exception as e:
             logger.error(f"Error sending cancellation notifications: {e}", exc_info=True)
 
@@ -390,6 +378,9 @@ class AcceptMatchButton(Button):
                 player_ratings={p.user_id: p.ntrp_rating for p in suggestion.players}
             )
             
+            # Cancel the request if nobody answers in time
+            await schedule_match_expiry(match)
+            
             # Update schedule statuses to indicate they're part of a match
             for schedule in suggestion.schedules:
                 view.schedule_dao.update_schedule(
@@ -503,28 +494,22 @@ class AcceptMatchButton(Button):
                 inline=False
             )
             
-            # Send DM to each other player
-            for player in other_players:
-                try:
-                    # Get Discord user object
-                    discord_user = interaction.client.get_user(int(player.user_id))
-                    if discord_user:
-                        # Create confirmation view
-                        confirmation_view = MatchConfirmationView(match.match_id, self.match_dao)
-                        
-                        # Send DM
-                        await discord_user.send(embed=confirmation_embed, view=confirmation_view)
-                        logger.info(f"Sent confirmation request to {player.username} ({player.user_id})")
-                    else:
-                        logger.warning(f"Could not find Discord user for {player.username} ({player.user_id})")
-                except Exception as e:
-                    logger.error(f"Failed to send DM to {player.username} ({player.user_id}): {e}")
+            # Send DMs to all other players at once, each with its own confirmation view
+            results = await get_dispatcher(interaction.client).send_many(
+                [p.user_id for p in other_players],
+                embed=confirmation_embed,
+                view_factory=lambda: MatchConfirmationView(match.guild_id, match.match_id)
+            )
+            unreachable = [p.username for p, result in zip(other_players, results) if not result.sent]
             
             # Notify the current user
-            await interaction.followup.send(
-                f"✅ Match request sent! Waiting for confirmation from {len(other_players)} other player(s).",
-                ephemeral=True
-            )
+            message = f"✅ Match request sent! Waiting for confirmation from {len(other_players)} other player(s)."
+            if unreachable:
+                message += (
+                    f"\n⚠️ Couldn't send a DM to {', '.join(unreachable)}. "
+                    "They may have DMs disabled; please contact them directly."
+                )
+            await interaction.followup.send(message, ephemeral=True)
             
         except Exception as e:
             logger.error(f"Error sending confirmation requests: {e}", exc_info=True)
@@ -1006,233 +991,245 @@ def create_detailed_suggestion_embed(suggestion: MatchSuggestion, current: int,
     return embed
 
 
-class MatchConfirmationView(View):
-    """View for confirming or declining a match request sent via DM."""
+class MatchConfirmationView(StatelessView):
+    """Confirm / Not Interested buttons for a match request sent via DM.
     
-    def __init__(self, match_id: str, match_dao: MatchDAO):
+    The buttons carry the match in their custom_ids and are handled by
+    confirm_match and decline_match below, so no state is kept per DM and
+    the buttons keep working after a restart.
+    """
+    
+    def __init__(self, guild_id: str, match_id: str, disabled: bool = False):
         """Initialize the confirmation view.
         
         Args:
+            guild_id: Discord server ID of the match
             match_id: ID of the match to confirm/decline
-            match_dao: Match data access object
+            disabled: Show the buttons disabled, once the request is answered
         """
-        super().__init__(timeout=86400)  # 24 hour timeout
-        self.match_id = match_id
-        self.match_dao = match_dao
-    
-    @nextcord.ui.button(label="✅ Confirm Match", style=ButtonStyle.success, custom_id="confirm_match")
-    async def confirm_match(self, button: Button, interaction: Interaction):
-        """Handle match confirmation."""
-        try:
-            # Get the match
-            match = self.match_dao.get_match_by_id(self.match_id)
-            if not match:
-                await interaction.response.send_message("❌ Match not found or already processed.", ephemeral=True)
-                return
-            
-            if match.status != "pending_confirmation":
-                if match.status == "cancelled":
-                    await interaction.response.send_message("❌ This match invitation has been cancelled and is no longer valid.", ephemeral=True)
-                    # Disable all buttons
-                    for child in self.children:
-                        child.disabled = True
-                    await interaction.message.edit(view=self)
-                else:
-                    await interaction.response.send_message("❌ This match is no longer pending confirmation.", ephemeral=True)
-                return
-            
-            # Update match status to scheduled
-            updated_match = self.match_dao.update_match(
-                str(match.guild_id),
-                match.match_id,
-                status="scheduled"
-            )
-            
-            if not updated_match:
-                await interaction.response.send_message("❌ Failed to confirm match. Please try again.", ephemeral=True)
-                return
-            
-            # Create confirmation embed
-            embed = Embed(
-                title="✅ Match Confirmed!",
-                description="The match has been confirmed and is now scheduled.",
-                color=Color.green()
-            )
-            
-            # Add match details
-            start_time = datetime.fromtimestamp(match.start_time)
-            end_time = datetime.fromtimestamp(match.end_time)
-            time_text = f"{start_time.strftime('%A, %B %d at %I:%M %p')} - {end_time.strftime('%I:%M %p')}"
-            
-            embed.add_field(
-                name="Match Details",
-                value=(
-                    f"**Match ID:** {match.match_id}\n"
-                    f"**Type:** {match.match_type.title()}\n"
-                    f"**Time:** {time_text}\n"
-                    f"**Players:** {len(match.players)} players"
-                ),
-                inline=False
-            )
-            
-            embed.add_field(
-                name="Next Steps",
-                value=(
-                    "• All players have been notified\n"
-                    "• View your matches with `/matches-view type:upcoming` or `/matches-view type:completed`\n"
-                    "• Update results after playing with `/complete-match`"
-                ),
-                inline=False
-            )
-            
-            # Disable all buttons
-            for child in self.children:
-                child.disabled = True
-            
-            await interaction.response.edit_message(embed=embed, view=self)
-            
-            # Notify all players about the confirmation
-            await self._notify_all_players(interaction, match)
-            
-        except Exception as e:
-            logger.error(f"Error confirming match: {e}", exc_info=True)
-            await interaction.response.send_message("❌ An error occurred while confirming the match.", ephemeral=True)
-    
-    @nextcord.ui.button(label="😐 Not Interested", style=ButtonStyle.secondary, custom_id="not_interested")
-    async def not_interested(self, button: Button, interaction: Interaction):
-        """Handle match decline."""
-        try:
-            # Get the match
-            match = self.match_dao.get_match_by_id(self.match_id)
-            if not match:
-                await interaction.response.send_message("❌ Match not found or already processed.", ephemeral=True)
-                return
-            
-            if match.status != "pending_confirmation":
-                if match.status == "cancelled":
-                    await interaction.response.send_message("❌ This match invitation has been cancelled and is no longer valid.", ephemeral=True)
-                    # Disable all buttons
-                    for child in self.children:
-                        child.disabled = True
-                    await interaction.message.edit(view=self)
-                else:
-                    await interaction.response.send_message("❌ This match is no longer pending confirmation.", ephemeral=True)
-                return
-            
-            # Update match status to cancelled
-            updated_match = self.match_dao.update_match(
-                str(match.guild_id),
-                match.match_id,
-                status="cancelled",
-                cancelled_reason=f"Not interested - declined by {interaction.user.display_name or interaction.user.name}"
-            )
-            
-            if not updated_match:
-                await interaction.response.send_message("❌ Failed to decline match. Please try again.", ephemeral=True)
-                return
-            
-            # Create decline embed
-            embed = Embed(
-                title="😐 Not Interested",
-                description="You have indicated you're not interested in this match request.",
-                color=Color.orange()
-            )
-            
-            # Disable all buttons
-            for child in self.children:
-                child.disabled = True
-            
-            await interaction.response.edit_message(embed=embed, view=self)
-            
-            # Notify other players about the decline
-            await self._notify_decline(interaction, match)
-            
-        except Exception as e:
-            logger.error(f"Error declining match: {e}", exc_info=True)
-            await interaction.response.send_message("❌ An error occurred while declining the match.", ephemeral=True)
-    
-    async def _notify_all_players(self, interaction: Interaction, match):
-        """Notify all players that the match has been confirmed."""
-        try:
-            # Create confirmation notification embed
-            start_time = datetime.fromtimestamp(match.start_time)
-            end_time = datetime.fromtimestamp(match.end_time)
-            time_text = f"{start_time.strftime('%A, %B %d at %I:%M %p')} - {end_time.strftime('%I:%M %p')}"
-            
-            notification_embed = Embed(
-                title="🎾 Match Confirmed!",
-                description="Your match has been confirmed and is now scheduled!",
-                color=Color.green()
-            )
-            
-            notification_embed.add_field(
-                name="Match Details",
-                value=(
-                    f"**Match ID:** {match.match_id}\n"
-                    f"**Type:** {match.match_type.title()}\n"
-                    f"**Time:** {time_text}\n"
-                    f"**Players:** {len(match.players)} players"
-                ),
-                inline=False
-            )
-            
-            notification_embed.add_field(
-                name="Next Steps",
-                value=(
-                    "• View your matches with `/matches-view type:upcoming` or `/matches-view type:completed`\n"
-                    "• Update results after playing with `/complete-match`"
-                ),
-                inline=False
-            )
-            
-            # Send DM to all players
-            for player_id in match.players:
-                try:
-                    discord_user = interaction.client.get_user(int(player_id))
-                    if discord_user:
-                        await discord_user.send(embed=notification_embed)
-                        logger.info(f"Sent confirmation notification to player {player_id}")
-                except Exception as e:
-                    logger.error(f"Failed to send confirmation notification to player {player_id}: {e}")
-            
-        except Exception as e:
-            logger.error(f"Error notifying players about confirmation: {e}", exc_info=True)
+        super().__init__()
+        self.add_item(Button(
+            label="✅ Confirm Match",
+            style=ButtonStyle.success,
+            custom_id=custom_id("confirm_match", guild_id, match_id),
+            disabled=disabled
+        ))
+        self.add_item(Button(
+            label="😐 Not Interested",
+            style=ButtonStyle.secondary,
+            custom_id=custom_id("decline_match", guild_id, match_id),
+            disabled=disabled
+        ))
+
+
+_match_dao: Optional[MatchDAO] = None
+
+
+def _get_match_dao() -> MatchDAO:
+    """Match DAO shared by the routed button handlers."""
+    global _match_dao
+    if _match_dao is None:
+        _match_dao = MatchDAO(get_db())
+    return _match_dao
+
+
+async def _load_pending_match(interaction: Interaction, route: ComponentRoute) -> Optional[Match]:
+    """Load the match a confirmation button acts on, telling the user if it can't be answered."""
+    match = _get_match_dao().get_match(route.guild_id, route.match_id)
+    if not match:
+        await interaction.response.send_message("❌ Match not found or already processed.", ephemeral=True)
+        return None
     
-    async def _notify_decline(self, interaction: Interaction, match):
-        """Notify other players that the match has been declined."""
-        try:
-            # Create decline notification embed
-            decliner_name = interaction.user.display_name or interaction.user.name
-            
-            notification_embed = Embed(
-                title="❌ Match Declined",
-                description=f"**{decliner_name}** has declined the match request.",
-                color=Color.red()
+    if match.status != "pending_confirmation":
+        if match.status == "cancelled":
+            await interaction.response.send_message("❌ This match invitation has been cancelled and is no longer valid.", ephemeral=True)
+            await interaction.message.edit(
+                view=MatchConfirmationView(route.guild_id, route.match_id, disabled=True)
             )
-            
-            notification_embed.add_field(
-                name="Match ID",
-                value=match.match_id,
-                inline=False
-            )
-            
-            notification_embed.add_field(
-                name="Next Steps",
-                value="The match has been cancelled. You can find new matches using `/find-matches`.",
-                inline=False
-            )
-            
-            # Send DM to other players (excluding the one who declined)
-            current_user_id = str(interaction.user.id)
-            for player_id in match.players:
-                if player_id != current_user_id:
-                    try:
-                        discord_user = interaction.client.get_user(int(player_id))
-                        if discord_user:
-                            await discord_user.send(embed=notification_embed)
-                            logger.info(f"Sent decline notification to player {player_id}")
-                    except Exception as e:
-                        logger.error(f"Failed to send decline notification to player {player_id}: {e}")
-            
-        except Exception as e:
-            logger.error(f"Error notifying players about decline: {e}", exc_info=True) 
\ No newline at end of file
+        else:
+            await interaction.response.send_message("❌ This match is no longer pending confirmation.", ephemeral=True)
+        return None
+    return match
+
+
+@component_handler("confirm_match")
+async def confirm_match(interaction: Interaction, route: ComponentRoute):
+    """Handle match confirmation."""
+    try:
+        match = await _load_pending_match(interaction, route)
+        if not match:
+            return
+        
+        # Update match status to scheduled
+        updated_match = _get_match_dao().update_match(
+            str(match.guild_id),
+            match.match_id,
+            status="scheduled"
+        )
+        
+        if not updated_match:
+            await interaction.response.send_message("❌ Failed to confirm match. Please try again.", ephemeral=True)
+            return
+        
+        await cancel_match_expiry(updated_match)
+        await schedule_match_reminder(updated_match)
+        
+        # Create confirmation embed
+        embed = Embed(
+            title="✅ Match Confirmed!",
+            description="The match has been confirmed and is now scheduled.",
+            color=Color.green()
+        )
+        
+        # Add match details
+        start_time = datetime.fromtimestamp(match.start_time)
+        end_time = datetime.fromtimestamp(match.end_time)
+        time_text = f"{start_time.strftime('%A, %B %d at %I:%M %p')} - {end_time.strftime('%I:%M %p')}"
+        
+        embed.add_field(
+            name="Match Details",
+            value=(
+                f"**Match ID:** {match.match_id}\n"
+                f"**Type:** {match.match_type.title()}\n"
+                f"**Time:** {time_text}\n"
+                f"**Players:** {len(match.players)} players"
+            ),
+            inline=False
+        )
+        
+        embed.add_field(
+            name="Next Steps",
+            value=(
+                "• All players have been notified\n"
+                "• View your matches with `/matches-view type:upcoming` or `/matches-view type:completed`\n"
+                "• Update results after playing with `/complete-match`"
+            ),
+            inline=False
+        )
+        
+        # Disable the buttons now the request is answered
+        await interaction.response.edit_message(
+            embed=embed, view=MatchConfirmationView(route.guild_id, route.match_id, disabled=True)
+        )
+        
+        # Notify all players about the confirmation
+        await _notify_all_players(interaction, match)
+        
+    except Exception as e:
+        logger.error(f"Error confirming match: {e}", exc_info=True)
+        await interaction.response.send_message("❌ An error occurred while confirming the match.", ephemeral=True)
+
+@component_handler("decline_match")
+async def decline_match(interaction: Interaction, route: ComponentRoute):
+    """Handle match decline."""
+    try:
+        match = await _load_pending_match(interaction, route)
+        if not match:
+            return
+        
+        # Update match status to cancelled
+        updated_match = _get_match_dao().update_match(
+            str(match.guild_id),
+            match.match_id,
+            status="cancelled",
+            cancelled_reason=f"Not interested - declined by {interaction.user.display_name or interaction.user.name}"
+        )
+        
+        if not updated_match:
+            await interaction.response.send_message("❌ Failed to decline match. Please try again.", ephemeral=True)
+            return
+        
+        await cancel_match_expiry(updated_match)
+        
+        # Create decline embed
+        embed = Embed(
+            title="😐 Not Interested",
+            description="You have indicated you're not interested in this match request.",
+            color=Color.orange()
+        )
+        
+        # Disable the buttons now the request is answered
+        await interaction.response.edit_message(
+            embed=embed, view=MatchConfirmationView(route.guild_id, route.match_id, disabled=True)
+        )
+        
+        # Notify other players about the decline
+        await _notify_decline(interaction, match)
+        
+    except Exception as e:
+        logger.error(f"Error declining match: {e}", exc_info=True)
+        await interaction.response.send_message("❌ An error occurred while declining the match.", ephemeral=True)
+
+async def _notify_all_players(interaction: Interaction, match):
+    """Notify all players that the match has been confirmed."""
+    try:
+        # Create confirmation notification embed
+        start_time = datetime.fromtimestamp(match.start_time)
+        end_time = datetime.fromtimestamp(match.end_time)
+        time_text = f"{start_time.strftime('%A, %B %d at %I:%M %p')} - {end_time.strftime('%I:%M %p')}"
+        
+        notification_embed = Embed(
+            title="🎾 Match Confirmed!",
+            description="Your match has been confirmed and is now scheduled!",
+            color=Color.green()
+        )
+        
+        notification_embed.add_field(
+            name="Match Details",
+            value=(
+                f"**Match ID:** {match.match_id}\n"
+                f"**Type:** {match.match_type.title()}\n"
+                f"**Time:** {time_text}\n"
+                f"**Players:** {len(match.players)} players"
+            ),
+            inline=False
+        )
+        
+        notification_embed.add_field(
+            name="Next Steps",
+            value=(
+                "• View your matches with `/matches-view type:upcoming` or `/matches-view type:completed`\n"
+                "• Update results after playing with `/complete-match`"
+            ),
+            inline=False
+        )
+        
+        # Send DM to all players
+        await get_dispatcher(interaction.client).send_many(match.players, embed=notification_embed)
+        
+    except Exception as e:
+        logger.error(f"Error notifying players about confirmation: {e}", exc_info=True)
+
+async def _notify_decline(interaction: Interaction, match):
+    """Notify other players that the match has been declined."""
+    try:
+        # Create decline notification embed
+        decliner_name = interaction.user.display_name or interaction.user.name
+        
+        notification_embed = Embed(
+            title="❌ Match Declined",
+            description=f"**{decliner_name}** has declined the match request.",
+            color=Color.red()
+        )
+        
+        notification_embed.add_field(
+            name="Match ID",
+            value=match.match_id,
+            inline=False
+        )
+        
+        notification_embed.add_field(
+            name="Next Steps",
+            value="The match has been cancelled. You can find new matches using `/find-matches`.",
+            inline=False
+        )
+        
+        # Send DM to other players (excluding the one who declined)
+        current_user_id = str(interaction.user.id)
+        await get_dispatcher(interaction.client).send_many(
+            [player_id for player_id in match.players if player_id != current_user_id],
+            embed=notification_embed
+        )
+        
+    except Exception as e:
+        logger.error(f"Error notifying players about decline: {e}", exc_info=True) 
\ No newline at end of file
@@ -287,15 +287,8 @@ class ProfileSetup:
             )
             success = True
 
-            # Update role from visitor to member
-            role_success = await self.role_manager.update_member_role(
-                interaction.user,
-                'visitor',
-                'member'
-            )
-            
-            # Assign skill level role based on NTRP rating
-            skill_role_success = await self.role_manager.assign_skill_role(
+            # Promote visitor to member and assign the skill level role
+            role_success, skill_role_success = await self.role_manager.promote_to_member(
                 interaction.user,
                 float(self.ntrp_rating)  # Convert Decimal back to float for role manager
             )
@@ -11,6 +11,7 @@ from src.database.dao.dynamodb.player_dao import PlayerDAO
 from src.database.dao.dynamodb.court_dao import CourtDAO
 from src.database.models.dynamodb.match import Match
 from src.utils.responses import Responses
+from src.utils.offload import run_blocking, InteractionExpired
 from src.config.dynamodb_config import get_db
 from .views import CompleteMatchView, CompleteMatchSelectionView, create_match_embed
 from .constants import *
@@ -39,12 +40,16 @@ class MatchesCommand:
             user_id = str(interaction.user.id)
             guild_id = str(interaction.guild.id)
             if view_type == "completed":
-                matches = self.match_dao.get_player_matches(guild_id, user_id, status="completed")
+                matches = await run_blocking(
+                    interaction, self.match_dao.get_player_matches, guild_id, user_id, status="completed"
+                )
                 title = "Completed Matches"
                 empty_msg = "You don't have any completed matches yet."
                 matches.sort(key=lambda m: m.start_time, reverse=True)
             else:
-                matches = self.match_dao.get_player_matches(guild_id, user_id, status="scheduled")
+                matches = await run_blocking(
+                    interaction, self.match_dao.get_player_matches, guild_id, user_id, status="scheduled"
+                )
                 title = "Upcoming Matches"
                 empty_msg = "You don't have any upcoming matches scheduled."
                 matches.sort(key=lambda m: m.start_time)
@@ -55,11 +60,13 @@ class MatchesCommand:
                     empty_msg
                 )
                 return
-            embed = self._create_matches_list_embed(matches, title)
+            embed = await run_blocking(interaction, self._create_matches_list_embed, matches, title)
             await interaction.response.send_message(
                 embed=embed,
                 ephemeral=True
             )
+        except InteractionExpired:
+            logger.warning(f"Viewing {view_type} matches for user {interaction.user.id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error viewing {view_type} matches: {e}", exc_info=True)
             await Responses.send_error(
@@ -79,7 +86,9 @@ class MatchesCommand:
             guild_id = str(interaction.guild.id)
             
             # Get scheduled matches for the user
-            scheduled_matches = self.match_dao.get_player_matches(guild_id, user_id, status="scheduled")
+            scheduled_matches = await run_blocking(
+                interaction, self.match_dao.get_player_matches, guild_id, user_id, status="scheduled"
+            )
             
             if not scheduled_matches:
                 await Responses.send_error(
@@ -93,7 +102,7 @@ class MatchesCommand:
             scheduled_matches.sort(key=lambda m: m.start_time)
             
             # Create view with match selection
-            view = CompleteMatchSelectionView(scheduled_matches, self.match_dao, self.player_dao)
+            view = CompleteMatchSelectionView(scheduled_matches, self.player_dao)
             
             embed = Embed(
                 title="🎾 Complete Match",
@@ -107,6 +116,8 @@ class MatchesCommand:
                 ephemeral=True
             )
             
+        except InteractionExpired:
+            logger.warning(f"Match selection for user {interaction.user.id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error showing match selection: {e}", exc_info=True)
             await Responses.send_error(
@@ -124,7 +135,7 @@ class MatchesCommand:
         """
         try:
             # Get the match
-            match = self.match_dao.get_match(str(interaction.guild.id), match_id)
+            match = await run_blocking(interaction, self.match_dao.get_match, str(interaction.guild.id), match_id)
             
             if not match:
                 await Responses.send_error(
@@ -163,13 +174,15 @@ class MatchesCommand:
                 return
             
             # Show completion view
-            view = CompleteMatchView(match, self.match_dao)
+            view = CompleteMatchView(match, self.player_dao)
             await interaction.response.send_message(
-                "🎾 Complete Match\n\n1. Select the winner from the dropdown below\n2. Click 'Enter Match Details' to fill in the score and other details",
+                f"🎾 Complete Match\n\n{COMPLETE_MATCH_INSTRUCTIONS}",
                 view=view,
                 ephemeral=True
             )
             
+        except InteractionExpired:
+            logger.warning(f"Completing match {match_id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error completing match: {e}", exc_info=True)
             await Responses.send_error(
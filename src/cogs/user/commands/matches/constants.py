@@ -14,6 +14,9 @@ PLAYER_NOT_IN_MATCH = "You are not a player in this match."
 INVALID_SCORE_FORMAT = "Invalid score format. Please use format like '6-4, 6-2' for singles or '6-4, 6-2, 6-4' for doubles."
 INVALID_QUALITY_SCORE = "Match quality score must be between 1 and 10."
 
+# Instructions
+COMPLETE_MATCH_INSTRUCTIONS = "Select the winner from the dropdown below to fill in the score and other details."
+
 # Success messages
 MATCH_COMPLETED_SUCCESS = "Match completed successfully! Results have been recorded."
 
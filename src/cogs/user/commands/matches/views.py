@@ -14,86 +14,85 @@ from src.database.models.dynamodb.match import Match
 from src.database.dao.dynamodb.match_dao import MatchDAO
 from src.database.dao.dynamodb.player_dao import PlayerDAO
 from src.database.dao.dynamodb.court_dao import CourtDAO
+from src.config.dynamodb_config import get_db
 from src.utils.responses import Responses
+from src.utils.component_router import ComponentRoute, StatelessView, component_handler, custom_id
 from .constants import *
 
 logger = logging.getLogger(__name__)
 
 
-class CompleteMatchView(View):
-    """View for completing a match with results."""
+class CompleteMatchView(StatelessView):
+    """Winner dropdown for completing a match; picking a winner opens the score form.
     
-    def __init__(self, match: Match, match_dao: MatchDAO):
+    The dropdown carries the match in its custom_id and is handled by
+    choose_winner, so no state is kept while the message is open.
+    """
+    
+    def __init__(self, match: Match, player_dao: PlayerDAO):
         """Initialize the completion view.
         
         Args:
             match: The match to complete
-            match_dao: Match data access object
+            player_dao: Player data access object, for player names
         """
-        super().__init__(timeout=300)
-        self.match = match
-        self.match_dao = match_dao
+        super().__init__()
         
         # Create winner select dropdown
-        from src.database.dao.dynamodb.player_dao import PlayerDAO
-        from src.config.dynamodb_config import get_db
-        player_dao = PlayerDAO(get_db())
         options = []
-        for player_id in self.match.players:
-            player = player_dao.get_player(str(self.match.guild_id), player_id)
+        for player_id in match.players:
+            player = player_dao.get_player(str(match.guild_id), player_id)
             if player:
                 options.append(nextcord.SelectOption(label=player.username, value=player_id))
             else:
                 options.append(nextcord.SelectOption(label=f"Unknown Player ({player_id})", value=player_id))
         
-        self.winner_select = Select(
+        self.add_item(Select(
             placeholder="Select the winner",
             min_values=1,
             max_values=1,
             options=options,
-            custom_id="winner_select"
-        )
-        self.add_item(self.winner_select)
-        
-        # Add button to open score modal
-        self.add_item(CompleteMatchButton())
-    
-    async def interaction_check(self, interaction: Interaction) -> bool:
-        """Handle select interaction."""
-        if interaction.data.get("custom_id") == "winner_select":
-            # Store the selected winner
-            self.selected_winner = interaction.data["values"][0]
-            await interaction.response.send_message(
-                f"✅ Winner selected! Now click 'Enter Match Details' to complete the form.",
-                ephemeral=True
-            )
-            return False
-        return True
+            custom_id=custom_id("match_winner", match.guild_id, match.match_id)
+        ))
 
 
-class CompleteMatchButton(Button):
-    """Button to open the match completion modal."""
-    
-    def __init__(self):
-        super().__init__(
-            label="Enter Match Details",
-            style=ButtonStyle.primary,
-            custom_id="complete_match_button"
+async def _load_completable_match(interaction: Interaction, guild_id: str,
+                                  match_id: str) -> Optional[Match]:
+    """Load a match the user may complete, telling them if they can't."""
+    match = MatchDAO(get_db()).get_match(guild_id, match_id)
+    if not match:
+        await interaction.response.send_message(
+            "❌ Selected match not found. Please try again.",
+            ephemeral=True
         )
+        return None
     
-    async def callback(self, interaction: Interaction):
-        """Open the completion modal."""
-        view = self.view
-        if not hasattr(view, 'selected_winner'):
-            await interaction.response.send_message(
-                "❌ Please select a winner first!",
-                ephemeral=True
-            )
-            return
-        
-        # Create and show the modal
-        modal = CompleteMatchModal(view.match, view.match_dao, view.selected_winner)
-        await interaction.response.send_modal(modal)
+    # Check if user is a player in the match
+    if str(interaction.user.id) not in match.players:
+        await interaction.response.send_message(
+            "❌ You are not a player in this match.",
+            ephemeral=True
+        )
+        return None
+    
+    if match.status not in ["scheduled", "in_progress"]:
+        await interaction.response.send_message(
+            f"❌ {MATCH_ALREADY_COMPLETED if match.status == 'completed' else MATCH_NOT_SCHEDULED}",
+            ephemeral=True
+        )
+        return None
+    return match
+
+
+@component_handler("match_winner")
+async def choose_winner(interaction: Interaction, route: ComponentRoute):
+    """Open the completion form for the chosen winner."""
+    match = await _load_completable_match(interaction, route.guild_id, route.match_id)
+    if not match:
+        return
+    
+    modal = CompleteMatchModal(match, MatchDAO(get_db()), interaction.data["values"][0])
+    await interaction.response.send_modal(modal)
 
 
 class CompleteMatchModal(Modal):
@@ -289,21 +288,17 @@ class CompleteMatchModal(Modal):
         return None
 
 
-class CompleteMatchSelectionView(View):
-    """View for selecting a match to complete."""
+class CompleteMatchSelectionView(StatelessView):
+    """Dropdown for selecting a match to complete, handled by select_match_to_complete."""
     
-    def __init__(self, matches: List[Match], match_dao: MatchDAO, player_dao: PlayerDAO):
+    def __init__(self, matches: List[Match], player_dao: PlayerDAO):
         """Initialize the selection view.
         
         Args:
             matches: List of scheduled matches
-            match_dao: Match data access object
             player_dao: Player data access object
         """
-        super().__init__(timeout=300)
-        self.matches = matches
-        self.match_dao = match_dao
-        self.player_dao = player_dao
+        super().__init__()
         
         # Create match selection dropdown
         options = []
@@ -338,53 +333,31 @@ class CompleteMatchSelectionView(View):
                 description=f"Match ID: {match.match_id[:8]}..."
             ))
         
-        self.match_select = Select(
+        self.add_item(Select(
             placeholder="Select a match to complete",
             min_values=1,
             max_values=1,
             options=options,
-            custom_id="match_select"
-        )
-        self.add_item(self.match_select)
-    
-    async def interaction_check(self, interaction: Interaction) -> bool:
-        """Handle select interaction."""
-        if interaction.data.get("custom_id") == "match_select":
-            selected_match_id = interaction.data["values"][0]
-            
-            # Find the selected match
-            selected_match = None
-            for match in self.matches:
-                if match.match_id == selected_match_id:
-                    selected_match = match
-                    break
-            
-            if not selected_match:
-                await interaction.response.send_message(
-                    "❌ Selected match not found. Please try again.",
-                    ephemeral=True
-                )
-                return False
-            
-            # Check if user is a player in the match
-            user_id = str(interaction.user.id)
-            if user_id not in selected_match.players:
-                await interaction.response.send_message(
-                    "❌ You are not a player in this match.",
-                    ephemeral=True
-                )
-                return False
-            
-            # Show completion view for the selected match
-            completion_view = CompleteMatchView(selected_match, self.match_dao)
-            await interaction.response.send_message(
-                f"🎾 Complete Match\n\n**Selected:** {selected_match.match_id[:8]}...\n\n1. Select the winner from the dropdown below\n2. Click 'Enter Match Details' to fill in the score and other details",
-                view=completion_view,
-                ephemeral=True
-            )
-            return False
-        
-        return True
+            custom_id=custom_id("select_match", matches[0].guild_id)
+        ))
+
+
+@component_handler("select_match")
+async def select_match_to_complete(interaction: Interaction, route: ComponentRoute):
+    """Show the winner dropdown for the selected match."""
+    selected_match = await _load_completable_match(
+        interaction, route.guild_id, interaction.data["values"][0]
+    )
+    if not selected_match:
+        return
+    
+    # Show completion view for the selected match
+    completion_view = CompleteMatchView(selected_match, PlayerDAO(get_db()))
+    await interaction.response.send_message(
+        f"🎾 Complete Match\n\n**Selected:** {selected_match.match_id[:8]}...\n\n{COMPLETE_MATCH_INSTRUCTIONS}",
+        view=completion_view,
+        ephemeral=True
+    )
 
 
 def create_match_embed(match: Match, player_dao: PlayerDAO, court_dao: CourtDAO) -> Embed:
@@ -11,6 +11,7 @@ from src.database.dao.dynamodb.player_dao import PlayerDAO
 from src.database.models.dynamodb.schedule import Schedule
 from src.utils.responses import Responses
 from src.utils.matching_algorithm import TennisMatchingAlgorithm
+from src.utils.offload import run_blocking, get_offloader, InteractionExpired
 from src.utils.config_loader import ConfigLoader
 from .constants import (
     ERRORS,
@@ -67,7 +68,11 @@ class ScheduleCommands:
         guild_id = str(interaction.guild_id)
         user_id = str(interaction.user.id)
         
-        player = self.player_dao.get_player(guild_id, user_id)
+        try:
+            player = await run_blocking(interaction, self.player_dao.get_player, guild_id, user_id)
+        except InteractionExpired:
+            logger.warning(f"Profile check for user {user_id} outlived its interaction")
+            return False
         if not player:
             await Responses.send_error(
                 interaction,
@@ -142,7 +147,8 @@ class ScheduleCommands:
             logger.info(f"Triggering automatic matchmaking for schedule {schedule.schedule_id}")
             
             # Find matches for this specific schedule
-            suggestions = self.matching_algorithm.find_matches_for_schedule(
+            suggestions = await run_blocking(
+                interaction, self.matching_algorithm.find_matches_for_schedule,
                 str(interaction.guild.id), schedule.schedule_id
             )
             
@@ -167,19 +173,7 @@ class ScheduleCommands:
                 return
             
             # Filter out suggestions that already have matches and meet minimum score
-            valid_suggestions = []
-            for suggestion in suggestions:
-                # Check if there's already a match for this suggestion
-                existing_matches = self.match_dao.get_matches_by_players_and_time(
-                    str(suggestion.guild_id),
-                    [p.user_id for p in suggestion.players],
-                    suggestion.suggested_time[0],
-                    suggestion.suggested_time[1]
-                )
-                
-                # Only include if no existing match and meets minimum score
-                if not existing_matches and suggestion.overall_score >= AUTOMATIC_MATCHMAKING["MIN_SCORE"]:
-                    valid_suggestions.append(suggestion)
+            valid_suggestions = await run_blocking(interaction, self._filter_new_suggestions, suggestions)
             
             if not valid_suggestions:
                 logger.info(f"No valid match suggestions found for schedule {schedule.schedule_id}")
@@ -221,11 +215,30 @@ class ScheduleCommands:
             
             logger.info(f"Sent {len(best_suggestions)} automatic match suggestions for schedule {schedule.schedule_id}")
             
+        except InteractionExpired:
+            logger.warning(f"Automatic matchmaking for schedule {schedule.schedule_id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error in automatic matchmaking: {e}", exc_info=True)
             # Don't fail the schedule creation if matchmaking fails
             pass
     
+    def _filter_new_suggestions(self, suggestions):
+        """Keep suggestions with no existing match that meet the minimum score."""
+        valid_suggestions = []
+        for suggestion in suggestions:
+            # Check if there's already a match for this suggestion
+            existing_matches = self.match_dao.get_matches_by_players_and_time(
+                str(suggestion.guild_id),
+                [p.user_id for p in suggestion.players],
+                suggestion.suggested_time[0],
+                suggestion.suggested_time[1]
+            )
+            
+            # Only include if no existing match and meets minimum score
+            if not existing_matches and suggestion.overall_score >= AUTOMATIC_MATCHMAKING["MIN_SCORE"]:
+                valid_suggestions.append(suggestion)
+        return valid_suggestions
+    
     def _create_automatic_matches_embed(self, suggestions, schedule):
         """Create an embed for automatic match suggestions."""
         import nextcord
@@ -308,8 +321,8 @@ class ScheduleCommands:
             )
 
             # Parse time description
-            start_time, end_time, error = self.time_parser.parse_time_description(
-                time_description
+            start_time, end_time, error = await run_blocking(
+                interaction, self.time_parser.parse_time_description, time_description
             )
             if error:
                 logger.warning(
@@ -352,7 +365,8 @@ class ScheduleCommands:
                 return
 
             # Check for overlaps with the user's own schedules first
-            user_overlapping_schedules = self.schedule_dao.get_overlapping_schedules(
+            user_overlapping_schedules = await run_blocking(
+                interaction, self.schedule_dao.get_overlapping_schedules,
                 guild_id,
                 start_timestamp, 
                 end_timestamp,
@@ -373,7 +387,8 @@ class ScheduleCommands:
 
             # Create and save schedule
             logger.info(f"Creating schedule - Guild: {guild_id}, User: {user_id}, Start: {start_timestamp}, End: {end_timestamp}, Interaction ID: {interaction_id}")
-            schedule = self.schedule_dao.create_schedule(
+            schedule = await run_blocking(
+                interaction, self.schedule_dao.create_schedule,
                 guild_id=guild_id,
                 user_id=user_id,
                 start_time=start_timestamp,
@@ -437,12 +452,20 @@ class ScheduleCommands:
                     ephemeral=True
                 )
                 
+                # Score the new schedule into the guild's suggestion store, even
+                # if the preferences took long enough for the interaction to expire
+                await get_offloader().run(
+                    guild_id, None, self.matching_algorithm.on_schedule_created, guild_id, updated_schedule
+                )
+                
                 # Trigger automatic matchmaking
                 await self._trigger_automatic_matchmaking(interaction, updated_schedule)
 
             # Show preferences view using followup
             await show_schedule_preferences(interaction, schedule, after_preferences)
 
+        except InteractionExpired:
+            logger.warning(f"Adding schedule {interaction_id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error adding schedule: {e}", exc_info=True)
             await Responses.send_error(
@@ -509,12 +532,15 @@ class ScheduleCommands:
             end_timestamp = int(end_before.timestamp()) if end_before else None
 
             # Get schedules (only for the current user)
-            schedules = self.schedule_dao.get_user_schedules_in_time_range(
+            schedules = await run_blocking(
+                interaction, self.schedule_dao.get_user_schedules_in_time_range,
                 guild_id,
                 user_id=user_id,
                 start_time=start_timestamp,
                 end_time=end_timestamp
-            ) if start_timestamp and end_timestamp else self.schedule_dao.get_user_schedules(guild_id, user_id=user_id)
+            ) if start_timestamp and end_timestamp else await run_blocking(
+                interaction, self.schedule_dao.get_user_schedules, guild_id, user_id=user_id
+            )
 
             # Filter out cancelled schedules
             schedules = [s for s in schedules if s.status != "cancelled"]
@@ -546,6 +572,8 @@ class ScheduleCommands:
                 ephemeral=True
             )
 
+        except InteractionExpired:
+            logger.warning(f"Viewing schedules for user {interaction.user.id} outlived its interaction")
         except Exception as e:
             logger.error(f"Error viewing schedules: {e}", exc_info=True)
             await Responses.send_error(
@@ -611,7 +639,8 @@ class ScheduleCommands:
             # Create confirmation view
             async def confirm_callback(confirm_interaction: nextcord.Interaction):
                 # Cancel schedules in the time range
-                count = self.schedule_dao.cancel_user_schedules_in_time_range(
+                count = await run_blocking(
+                    confirm_interaction, self.schedule_dao.cancel_user_schedules_in_time_range,
                     guild_id,
                     user_id=user_id,
                     start_time=start_timestamp,
@@ -619,6 +648,9 @@ class ScheduleCommands:
                 )
                 
                 if count > 0:
+                    self.matching_algorithm.on_schedules_cancelled(
+                        guild_id, user_id, start_timestamp, end_timestamp
+                    )
                     logger.info(
                         f"Successfully cancelled {count} schedules for {interaction.user.name} "
                         f"({start_after} - {end_before})"
@@ -1,9 +1,11 @@
 """Enhanced natural language parser for schedule time descriptions."""
 
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from typing import Optional, Tuple, Dict, Any, List
-import dateparser
 import logging
+import time
 from zoneinfo import ZoneInfo
 import re
 from dateutil import rrule
@@ -13,6 +15,360 @@ from src.utils.config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
+WEEKDAY_NUMBERS = {
+    "monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3,
+    "friday": 4, "saturday": 5, "sunday": 6
+}
+_WEEKDAY = '|'.join(WEEKDAY_NUMBERS)
+
+DAY_ABBREVIATIONS = {
+    'mon': 'monday', 'tue': 'tuesday', 'tues': 'tuesday',
+    'wed': 'wednesday', 'weds': 'wednesday',
+    'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday',
+    'fri': 'friday', 'sat': 'saturday', 'sun': 'sunday'
+}
+
+# (start hour, end hour) of each part of the day
+PART_OF_DAY_HOURS = {
+    'morning': (8, 11),
+    'afternoon': (12, 16),
+    'evening': (17, 20),
+    'night': (19, 22),
+}
+DEFAULT_HOURS = (9, 11)
+
+_NUMBER_WORDS = {'two': 2, 'three': 3, 'four': 4}
+
+# Parse results kept for the current local day (see ParseCache)
+PARSE_CACHE_SIZE = 2048
+
+# Languages dateparser tries; detecting any others costs time and never helps
+DATEPARSER_LANGUAGES = ['en']
+
+# Parsed by warm_up_dateparser to load dateparser's data before the first request
+WARM_UP_PHRASES = ("tomorrow 4pm", "friday evening", "in 3 days")
+
+# Common time expressions for fuzzy matching
+COMMON_EXPRESSIONS = [
+    "today", "tomorrow", "next week", "this week", "next month",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "every monday", "every tuesday", "every wednesday", "every thursday",
+    "every friday", "every saturday", "every sunday",
+    "next monday", "next tuesday", "next wednesday", "next thursday",
+    "next friday", "next saturday", "next sunday",
+    "morning", "afternoon", "evening", "night",
+    "next two weeks", "rest of the week", "weekend"
+]
+
+# Words that are already correct; only single words are ever substituted
+VOCABULARY = frozenset(expression for expression in COMMON_EXPRESSIONS if ' ' not in expression)
+
+# Similarity a word needs to be corrected to a common expression
+FUZZY_THRESHOLD = 80
+
+# Corrections remembered per word (see correct_word)
+WORD_CORRECTIONS_SIZE = 4096
+
+# Token kinds produced by tokenize()
+RANGE = 'range'
+RECURRENCE = 'recurrence'
+RELATIVE = 'relative'
+WEEKDAY = 'weekday'
+PART_OF_DAY = 'part_of_day'
+TIME = 'time'
+WORD = 'word'
+
+# One alternation classifies every token of a description in a single pass.
+# Alternatives are tried in order at each position, so longer phrases
+# ("next week tuesday") win over their prefixes ("next week"). Anything else
+# is a word; non-letters are taken one character at a time so a time range
+# is found wherever it starts, as with an unanchored search.
+_TOKEN_PATTERN = re.compile(rf"""
+    (?P<space>\s*)
+    (?:
+        (?P<range>
+            (?P<start_hour>\d{{1,2}})(?::(?P<start_min>\d{{1,2}}))?\s*(?P<start_meridiem>[ap]m)?
+            \s*(?:to|-)\s*
+            (?P<end_hour>\d{{1,2}})(?::(?P<end_min>\d{{1,2}}))?\s*(?P<end_meridiem>[ap]m)?
+        )
+      | (?P<recurrence>every\s+(?P<every>days?|week|month|{_WEEKDAY})\b)
+      | (?P<relative>
+            next\s+(?P<weeks>\d+|two|three|four)\s+weeks?
+          | next\s+(?P<days>\d+)\s+days?
+          | (?P<rest_of_week>rest\s+of\s+(?:the\s+)?week)\b
+          | next\s+week\s+(?P<week_day>{_WEEKDAY})
+          | next\s+(?P<next_day>{_WEEKDAY})
+          | (?P<this_week>this\s+week)\b
+          | (?P<next_week>next\s+week)\b
+          | (?P<weekend>(?:this\s+)?weekends?)
+          | (?P<today>today)\b
+          | (?P<tomorrow>tomorrow)\b
+        )
+      | (?P<weekday>{_WEEKDAY})\b
+      | (?P<part_of_day>morning|afternoon|evening|night)\b
+      | (?P<time>\d{{1,2}}(?::\d{{2}})?\s*[ap]m)\b
+      | (?P<word>[a-z]+|\S)
+    )
+""", re.IGNORECASE | re.VERBOSE)
+
+_TOKEN_KINDS = (RANGE, RECURRENCE, RELATIVE, WEEKDAY, PART_OF_DAY, TIME, WORD)
+_RELATIVE_KINDS = ('weeks', 'days', 'rest_of_week', 'week_day', 'next_day',
+                   'this_week', 'next_week', 'weekend', 'today', 'tomorrow')
+
+_TIME_ONLY_PATTERN = re.compile(r'(\d{1,2})(?::(\d{1,2}))?\s*([ap]m)?', re.IGNORECASE)
+_BARE_RANGE_PATTERN = re.compile(r'(\d{1,2})-(\d{1,2})')
+_END_MERIDIEM_PATTERN = re.compile(r'(\d{1,2}[ap]m)-(\d{1,2})')
+
+# Rewrites tried in sequence by suggest_correction
+_CORRECTIONS = [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in [
+    # Time format corrections
+    (r'(\d{1,2})\s*-\s*(\d{1,2})$', r'\1-\2pm'),  # Add pm to bare times
+    (r'(\d{1,2})(\d{2})-(\d{1,2})(\d{2})', r'\1:\2-\3:\4'),  # Fix military time format
+    (r'(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})', r'\1:\2-\3:\4pm'),  # Add pm to time range with colons
+    (r'(\d{1,2})([ap]m)-(\d{1,2})$', r'\1-\3\2'),  # Add missing meridiem to end time
+
+    # Spacing corrections
+    (r'next(\w+day)', r'next \1'),  # Fix spacing in next weekday
+    (r'every(\w+day)', r'every \1'),  # Fix spacing in every weekday
+    (r'next(\w+)', r'next \1'),  # Fix spacing in next X
+    (r'this(\w+)', r'this \1'),  # Fix spacing in this X
+
+    # Abbreviation expansions
+    (r'\btmrw\b', r'tomorrow'),  # Expand common abbreviations
+    (r'\btmr\b', r'tomorrow'),
+    (r'\baft\b', r'afternoon'),
+    (r'\baftrn\b', r'afternoon'),
+    (r'\beve\b', r'evening'),
+    (r'\bmorn\b', r'morning'),
+
+    # Day name corrections
+    (r'\bmon\b', r'monday'),
+    (r'\btue\b', r'tuesday'),
+    (r'\btues\b', r'tuesday'),
+    (r'\bwed\b', r'wednesday'),
+    (r'\bweds\b', r'wednesday'),
+    (r'\bthu\b', r'thursday'),
+    (r'\bthur\b', r'thursday'),
+    (r'\bthurs\b', r'thursday'),
+    (r'\bfri\b', r'friday'),
+    (r'\bsat\b', r'saturday'),
+    (r'\bsun\b', r'sunday'),
+
+    # Complex corrections
+    (r'nxt\s+wk', r'next week'),
+    (r'nxt\s+week', r'next week'),
+    (r'nxt', r'next'),
+    (r'wk', r'week'),
+
+    # Common typos
+    (r'nexxt', r'next'),
+    (r'evry', r'every'),
+
+    # Time of day without context
+    (r'^(morning|afternoon|evening|night)$', r'today \1'),
+]]
+
+
+@dataclass
+class Token:
+    """A classified piece of a time description."""
+    kind: str
+    text: str
+    # What the token means: the weekday, part of day or recurrence unit,
+    # (phrase, argument) for relative dates, e.g. ("next_day", "friday"),
+    # and the regex match for ranges
+    value: Any = None
+    # Whitespace before the token, so the text around tokens can be rebuilt
+    space: str = ""
+
+
+def tokenize(text: str) -> List[Token]:
+    """Split a time description into classified tokens in one pass.
+
+    Args:
+        text (str): Time description
+
+    Returns:
+        List[Token]: Tokens in order
+    """
+    tokens = []
+    for match in _TOKEN_PATTERN.finditer(text):
+        kind = next(kind for kind in _TOKEN_KINDS if match.group(kind) is not None)
+        token_text = match.group(kind)
+        if kind == RANGE:
+            value = match
+        elif kind == RECURRENCE:
+            value = match.group('every').lower()
+        elif kind == RELATIVE:
+            name = next(name for name in _RELATIVE_KINDS if match.group(name) is not None)
+            argument = match.group(name).lower() if name in ('weeks', 'days', 'week_day', 'next_day') else None
+            value = (name, argument)
+        elif kind == WORD:
+            value = None
+        else:
+            value = token_text.lower()
+        tokens.append(Token(kind, token_text, value, match.group('space')))
+    return tokens
+
+
+def join_tokens(tokens: List[Token]) -> str:
+    """Rebuild the text of a list of tokens."""
+    return ''.join(token.space + token.text for token in tokens).strip()
+
+
+_word_corrections: Dict[str, str] = {}
+
+
+def correct_word(word: str) -> str:
+    """Correct a typo in one lower-cased word of a time description.
+    
+    Known words are returned as they are. Other words are compared with every
+    common expression, multi-word ones included, so a run-together phrase like
+    "nextwednesday" is left for suggest_correction to split rather than being
+    cut down to "wednesday". Corrections are remembered per word.
+    
+    Args:
+        word (str): Word to correct
+        
+    Returns:
+        str: Corrected word, or the word itself
+    """
+    # Skip short words, numbers and time ranges
+    if len(word) <= 2 or word.isdigit() or '-' in word or word in VOCABULARY:
+        return word
+    corrected = _word_corrections.get(word)
+    if corrected is None:
+        match = process.extractOne(word, COMMON_EXPRESSIONS, scorer=fuzz.ratio, score_cutoff=FUZZY_THRESHOLD)
+        if match and match[1] > FUZZY_THRESHOLD and ' ' not in match[0]:
+            corrected = match[0]
+        else:
+            corrected = word
+        if len(_word_corrections) >= WORD_CORRECTIONS_SIZE:
+            _word_corrections.clear()
+        _word_corrections[word] = corrected
+    return corrected
+
+
+def normalize_description(description: str) -> str:
+    """Lower-case a time description and collapse its whitespace."""
+    return ' '.join(description.lower().split())
+
+
+class ParseCache:
+    """LRU cache of parse results for the current local day.
+
+    Results depend on "now" ("tomorrow", "next monday"), so keys include the
+    local date and entries expire at the following local midnight. Individual
+    OrderedDict operations are atomic under the GIL, which is all a memo
+    needs: a lost race only costs a recomputation.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Any, now: float) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if now >= expires_at:
+            self._data.pop(key, None)
+            self.expired += 1
+            self.misses += 1
+            return None
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: Any, value: Any, expires_at: float):
+        self._data[key] = (value, expires_at)
+        if len(self._data) > self.maxsize:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:
+                pass
+
+    def purge_expired(self, now: float) -> int:
+        """Drop every entry past its expiry; returns how many were dropped."""
+        stale = [key for key, (_, expires_at) in list(self._data.items()) if now >= expires_at]
+        for key in stale:
+            self._data.pop(key, None)
+        self.expired += len(stale)
+        return len(stale)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'expired': self.expired,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared by every TimeParser; keys include the timezone
+_parse_cache = ParseCache(PARSE_CACHE_SIZE)
+
+
+def get_parse_cache() -> ParseCache:
+    """Return the cache of parsed time descriptions."""
+    return _parse_cache
+
+
+# How many parsed descriptions the dateparser-free fast path served, and how
+# many fell through to the layered path
+_parse_paths = {'fast': 0, 'layered': 0}
+
+
+def get_parse_path_counts() -> Dict[str, int]:
+    """Return how many parses each path served since startup."""
+    return dict(_parse_paths)
+
+
+def _date_data_parser(settings: Dict[str, Any]):
+    """Create a dateparser DateDataParser for English.
+
+    dateparser is slow to import and loads its language data on first use,
+    so it is imported here rather than at module load (see warm_up_dateparser).
+    """
+    from dateparser.date import DateDataParser
+    return DateDataParser(languages=DATEPARSER_LANGUAGES, settings=settings)
+
+
+def warm_up_dateparser():
+    """Import dateparser and load its data before the first parse that needs it.
+
+    Blocks for a second or more, so run it in a background thread after startup.
+    """
+    started = time.perf_counter()
+    try:
+        parser = TimeParser()
+        for phrase in WARM_UP_PHRASES:
+            parser._parse_date(phrase)
+        logger.info(f"dateparser warmed up in {time.perf_counter() - started:.2f}s")
+    except Exception as e:
+        logger.error(f"Error warming up dateparser: {e}", exc_info=True)
+
+
 class TimeParser:
     """Enhanced parser for natural language time descriptions."""
 
@@ -24,56 +380,22 @@ class TimeParser:
             'TIMEZONE': str(self.timezone),
             'RETURN_AS_TIMEZONE_AWARE': True,
             'PREFER_DATES_FROM': 'future',
-            'RELATIVE_BASE': datetime.now(self.timezone),
             'STRICT_PARSING': False,  # More forgiving parsing
             'PREFER_DAY_OF_MONTH': 'current',
         }
-        
-        # Common time expressions for fuzzy matching
-        self.common_expressions = [
-            "today", "tomorrow", "next week", "this week", "next month",
-            "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
-            "every monday", "every tuesday", "every wednesday", "every thursday", 
-            "every friday", "every saturday", "every sunday",
-            "next monday", "next tuesday", "next wednesday", "next thursday",
-            "next friday", "next saturday", "next sunday",
-            "morning", "afternoon", "evening", "night",
-            "next two weeks", "rest of the week", "weekend"
-        ]
-        
-        # Regex patterns for time formats
-        self.time_patterns = {
-            # Time range patterns
-            'time_range': r'(\d{1,2})(?::(\d{1,2}))?\s*([ap]m)?\s*(?:to|-)\s*(\d{1,2})(?::(\d{1,2}))?\s*([ap]m)?',
-            
-            # Recurrence patterns
-            'every_day': r'every\s+day(?:s)?',
-            'every_weekday': r'every\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            'every_week': r'every\s+week',
-            'every_month': r'every\s+month',
-            
-            # Date range patterns
-            'next_n_weeks': r'next\s+(?:(\d+)|two|three|four)\s+weeks?',
-            'next_n_days': r'next\s+(\d+)\s+days?',
-            'rest_of_week': r'rest\s+of\s+(?:the\s+)?week',
-            'this_week': r'this\s+week',
-            'next_week': r'next\s+week',
-            'weekend': r'(?:this\s+)?weekend',
-            
-            # Complex date patterns
-            'next_week_day': r'next\s+week\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            'day_of_week': r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-            
-            # Time of day patterns
-            'morning': r'morning',
-            'afternoon': r'afternoon',
-            'evening': r'evening',
-            'night': r'night',
-        }
+        self._day: Optional[date] = None
+        self._day_ends_at = 0.0
+        # (settings, DateDataParser) reused until the settings change
+        self._date_parser = None
+        self._start_day(datetime.now(self.timezone))
+
 
     def parse_time_description(self, description: str) -> Tuple[Optional[datetime], Optional[datetime], str]:
         """Parse a natural language time description with multi-layered approach.
         
+        Parse results are cached for the rest of the local day, keyed on the
+        normalized description; validation runs on every call.
+        
         Args:
             description (str): Time description (e.g., "today 4-6pm", "next week tuesday 3pm")
 
@@ -85,71 +407,28 @@ class TimeParser:
         """
         try:
             logger.info(f"Parsing time description: '{description}'")
-            original_description = description
-            
-            # Step 1: Try fuzzy matching to correct potential typos
-            description = self._apply_fuzzy_correction(description)
-            if description != original_description:
-                logger.info(f"Fuzzy corrected: '{original_description}' -> '{description}'")
-            
-            # Step 2: Check for recurrence patterns
-            recurrence_info = self._extract_recurrence_pattern(description)
-            if recurrence_info:
-                recurrence_type, recurrence_value = recurrence_info
-                
-                # Store recurrence info for later use
-                logger.info(f"Detected recurrence: {recurrence_type} {recurrence_value}")
-                
-                # For weekly recurrence on specific day, add the day name to the description
-                if recurrence_type == 'weekly' and recurrence_value not in ['week']:
-                    # Add the day name to the description for better parsing
-                    day_name = recurrence_value
-                    description = re.sub(
-                        r'every\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-                        f"next {day_name}", description, flags=re.IGNORECASE
-                    )
-                else:
-                    # Remove recurrence pattern for date parsing
-                    description = re.sub(
-                        r'every\s+(day|week|month|monday|tuesday|wednesday|thursday|friday|saturday|sunday)',
-                        '', description, flags=re.IGNORECASE
-                    ).strip()
-                    
-                    # If the description is now empty, add a default date (tomorrow)
-                    if not description:
-                        description = "tomorrow"
-            
-            # Step 3: Extract time range if present
-            time_range_match = re.search(self.time_patterns['time_range'], description, re.IGNORECASE)
-            if time_range_match:
-                # Process time range
-                start_time, end_time, error = self._process_time_range(description, time_range_match)
-                if error:
-                    # Try to suggest a correction instead of alternative parsing
-                    suggestion = self.suggest_correction(original_description)
-                    if suggestion and suggestion != original_description:
-                        logger.info(f"Suggesting correction: '{original_description}' -> '{suggestion}'")
-                        return None, None, f"{error} Did you mean '{suggestion}'?"
-                    return None, None, error
-                
+            now = datetime.now(self.timezone)
+            self._start_day(now)
+            
+            description = normalize_description(description)
+            key = (description, str(self.timezone), self._day)
+            result = _parse_cache.get(key, now.timestamp())
+            if result is None:
+                result = self._parse_times(description)
+                _parse_cache.put(key, result, self._day_ends_at)
             else:
-                # Try parsing as a single datetime or using special patterns
-                start_time, end_time, error = self._process_special_patterns(description)
-                if error:
-                    # Try to suggest a correction instead of alternative parsing
-                    suggestion = self.suggest_correction(original_description)
-                    if suggestion and suggestion != original_description:
-                        logger.info(f"Suggesting correction: '{original_description}' -> '{suggestion}'")
-                        return None, None, f"{error} Did you mean '{suggestion}'?"
-                    return None, None, error
-            
-            # Validate times
+                logger.info(f"Parse cache hit for '{description}'")
+            start_time, end_time, error = result
+            if error:
+                return None, None, error
+            
+            # Validate times, which depends on the time of day
             if start_time >= end_time:
                 logger.warning(f"Invalid time range: end ({end_time}) not after start ({start_time})")
                 return None, None, "End time must be after start time"
             
             # Debug logging for time comparison
-            now_in_tz = datetime.now(self.timezone)
+            now_in_tz = now
             logger.info(f"DEBUG: Comparing start_time={start_time} to now_in_tz={now_in_tz} (timezone={self.timezone})")
             
             if start_time < now_in_tz:
@@ -172,6 +451,114 @@ class TimeParser:
             logger.error(f"Error parsing time description: {e}", exc_info=True)
             return None, None, f"Error parsing time description: {str(e)}"
 
+    def _start_day(self, now: datetime):
+        """Start a new day bucket at local midnight.
+        
+        Relative dates are resolved against the start of the bucket, and
+        cached results from earlier days are dropped.
+        
+        Args:
+            now (datetime): Current time in the parser's timezone
+        """
+        today = now.date()
+        if today == self._day:
+            return
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), tzinfo=self.timezone)
+        self.settings = {**self.settings, 'RELATIVE_BASE': now}
+        self._day = today
+        self._day_ends_at = midnight.timestamp()
+        _parse_cache.purge_expired(now.timestamp())
+
+    def _parse_date(self, text: str) -> Optional[datetime]:
+        """Parse a date with dateparser using the current day's settings.
+        
+        Args:
+            text (str): Date description
+            
+        Returns:
+            Optional[datetime]: Parsed date or None if dateparser did not understand it
+        """
+        settings = self.settings
+        if self._date_parser is None or self._date_parser[0] is not settings:
+            self._date_parser = (settings, _date_data_parser(settings))
+        return self._date_parser[1].get_date_data(text).date_obj
+
+    def _parse_times(self, description: str) -> Tuple[Optional[datetime], Optional[datetime], str]:
+        """Parse a normalized time description without validating the result.
+        
+        Args:
+            description (str): Normalized time description
+            
+        Returns:
+            Tuple[Optional[datetime], Optional[datetime], str]:
+                - Start time or None if invalid
+                - End time or None if invalid
+                - Error message if any, empty string if successful
+        """
+        original_description = description
+        
+        # Step 1: Try fuzzy matching to correct potential typos
+        description = self._apply_fuzzy_correction(description)
+        if description != original_description:
+            logger.info(f"Fuzzy corrected: '{original_description}' -> '{description}'")
+        tokens = tokenize(description)
+        
+        # Step 2: Check for recurrence patterns
+        recurrence_info = self._recurrence_from_tokens(tokens)
+        if recurrence_info:
+            recurrence_type, recurrence_value = recurrence_info
+            
+            # Store recurrence info for later use
+            logger.info(f"Detected recurrence: {recurrence_type} {recurrence_value}")
+            
+            # For weekly recurrence on specific day, parse the first occurrence
+            if recurrence_type == 'weekly' and recurrence_value not in ['week']:
+                tokens = [
+                    Token(RELATIVE, f"next {recurrence_value}", ('next_day', recurrence_value), token.space)
+                    if token.kind == RECURRENCE and token.value in WEEKDAY_NUMBERS else token
+                    for token in tokens
+                ]
+            else:
+                # Remove recurrence pattern for date parsing
+                tokens = [token for token in tokens if token.kind != RECURRENCE]
+                
+                # If the description is now empty, add a default date (tomorrow)
+                if not tokens:
+                    tokens = tokenize("tomorrow")
+        
+        # Step 3: Parse the common descriptions without dateparser
+        fast_path = self._parse_fast_path(tokens)
+        if fast_path:
+            _parse_paths['fast'] += 1
+            return fast_path[0], fast_path[1], ""
+        _parse_paths['layered'] += 1
+        
+        # Step 4: Extract time range if present
+        time_range = next((token for token in tokens if token.kind == RANGE), None)
+        if time_range:
+            # Process time range
+            start_time, end_time, error = self._process_time_range(tokens, time_range)
+            if error:
+                # Try to suggest a correction instead of alternative parsing
+                suggestion = self.suggest_correction(original_description)
+                if suggestion and suggestion != original_description:
+                    logger.info(f"Suggesting correction: '{original_description}' -> '{suggestion}'")
+                    return None, None, f"{error} Did you mean '{suggestion}'?"
+                return None, None, error
+            
+        else:
+            # Try parsing as a single datetime or using special patterns
+            start_time, end_time, error = self._process_special_patterns(tokens)
+            if error:
+                # Try to suggest a correction instead of alternative parsing
+                suggestion = self.suggest_correction(original_description)
+                if suggestion and suggestion != original_description:
+                    logger.info(f"Suggesting correction: '{original_description}' -> '{suggestion}'")
+                    return None, None, f"{error} Did you mean '{suggestion}'?"
+                return None, None, error
+        
+        return start_time, end_time, ""
+
     def _apply_fuzzy_correction(self, text: str) -> str:
         """Apply fuzzy matching to correct common typos in time expressions.
         
@@ -181,29 +568,7 @@ class TimeParser:
         Returns:
             str: Corrected text
         """
-        # Split the input into words
-        words = text.lower().split()
-        corrected_words = []
-        
-        for word in words:
-            # Skip short words and numbers
-            if len(word) <= 2 or word.isdigit() or '-' in word:
-                corrected_words.append(word)
-                continue
-                
-            # Check if this word needs correction
-            matches = process.extract(word, self.common_expressions, scorer=fuzz.ratio, limit=1)
-            if matches and matches[0][1] > 80:  # 80% similarity threshold
-                best_match = matches[0][0]
-                # Only replace if it's a single word in our common expressions
-                if ' ' not in best_match:
-                    corrected_words.append(best_match)
-                else:
-                    corrected_words.append(word)
-            else:
-                corrected_words.append(word)
-                
-        return ' '.join(corrected_words)
+        return ' '.join(correct_word(word) for word in text.lower().split())
 
     def _extract_recurrence_pattern(self, text: str) -> Optional[Tuple[str, str]]:
         """Extract recurrence pattern from text.
@@ -214,31 +579,77 @@ class TimeParser:
         Returns:
             Optional[Tuple[str, str]]: (recurrence_type, value) or None if no pattern found
         """
+        return self._recurrence_from_tokens(tokenize(text))
+
+    def _recurrence_from_tokens(self, tokens: List[Token]) -> Optional[Tuple[str, str]]:
+        """Extract recurrence pattern from the tokens of a description.
+        
+        Args:
+            tokens (List[Token]): Tokens of the description
+            
+        Returns:
+            Optional[Tuple[str, str]]: (recurrence_type, value) or None if no pattern found
+        """
+        units = [token.value for token in tokens if token.kind == RECURRENCE]
+        if not units:
+            return None
+
         # Check for daily recurrence
-        if re.search(self.time_patterns['every_day'], text, re.IGNORECASE):
+        if 'day' in units or 'days' in units:
             return ('daily', 'day')
             
         # Check for weekly recurrence on specific day
-        weekday_match = re.search(self.time_patterns['every_weekday'], text, re.IGNORECASE)
-        if weekday_match:
-            return ('weekly', weekday_match.group(1).lower())
+        weekday = next((unit for unit in units if unit in WEEKDAY_NUMBERS), None)
+        if weekday:
+            return ('weekly', weekday)
             
         # Check for weekly recurrence
-        if re.search(self.time_patterns['every_week'], text, re.IGNORECASE):
+        if 'week' in units:
             return ('weekly', 'week')
             
         # Check for monthly recurrence
-        if re.search(self.time_patterns['every_month'], text, re.IGNORECASE):
-            return ('monthly', 'month')
+        return ('monthly', 'month')
+
+    def _parse_fast_path(self, tokens: List[Token]) -> Optional[Tuple[datetime, datetime]]:
+        """Parse the common "<day> <times>" descriptions without dateparser.
+        
+        The day is today, tomorrow, a weekday, "next <weekday>" or "next week
+        <weekday>" ("every <weekday>" has already become "next <weekday>"),
+        and the times are a time range or a part of the day.
+        
+        Args:
+            tokens (List[Token]): Tokens of the time description
             
-        return None
+        Returns:
+            Optional[Tuple[datetime, datetime]]: Start and end time, or None if
+                the description does not fit
+        """
+        if len(tokens) != 2 or tokens[1].kind not in (RANGE, PART_OF_DAY):
+            return None
+        day, times = tokens
+        
+        today = datetime.now(self.timezone).replace(hour=0, minute=0, second=0, microsecond=0)
+        if day.kind == WEEKDAY:
+            # A bare weekday is its next occurrence, a week away if it is today
+            days_until = (WEEKDAY_NUMBERS[day.value] - today.weekday()) % 7 or 7
+            base_date = today + timedelta(days=days_until)
+        elif day.kind == RELATIVE and day.value[0] in ('today', 'tomorrow'):
+            base_date = today + timedelta(days=1 if day.value[0] == 'tomorrow' else 0)
+        elif day.kind == RELATIVE and day.value[0] in ('next_day', 'week_day'):
+            base_date = self._parse_special_date_patterns([day])
+        else:
+            return None
+        
+        if times.kind == RANGE:
+            return self._apply_time_range(base_date, times)
+        return self._apply_part_of_day(base_date, [times])
 
-    def _process_time_range(self, description: str, time_range_match) -> Tuple[Optional[datetime], Optional[datetime], str]:
-        """Process a time range match.
+    def _process_time_range(self, tokens: List[Token], time_range: Token) -> Tuple[Optional[datetime], Optional[datetime], str]:
+        """Process a time range token.
         
         Args:
-            description (str): Full time description
-            time_range_match: Regex match object for time range
+            tokens (List[Token]): Tokens of the full time description
+            time_range (Token): The first range token
             
         Returns:
             Tuple[Optional[datetime], Optional[datetime], str]:
@@ -247,40 +658,48 @@ class TimeParser:
                 - Error message if any, empty string if successful
         """
         # Remove the time range for initial date parsing
-        date_part = re.sub(self.time_patterns['time_range'], '', description, flags=re.IGNORECASE).strip()
+        date_tokens = [token for token in tokens if token.kind != RANGE]
+        date_part = join_tokens(date_tokens)
         
         # Handle special date patterns
-        base_date = self._parse_special_date_patterns(date_part)
+        base_date = self._parse_special_date_patterns(date_tokens)
         
         # If no special pattern matched, use dateparser
         if not base_date:
-            base_date = dateparser.parse(date_part, settings=self.settings)
+            base_date = self._parse_date(date_part)
             
         if not base_date:
             # Try to provide a helpful suggestion for day abbreviations
-            day_abbrevs = {
-                'mon': 'monday', 'tue': 'tuesday', 'tues': 'tuesday',
-                'wed': 'wednesday', 'weds': 'wednesday', 
-                'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday',
-                'fri': 'friday', 'sat': 'saturday', 'sun': 'sunday'
-            }
-            
             words = date_part.lower().split()
-            if words and words[0] in day_abbrevs:
-                suggestion = f"Did you mean '{day_abbrevs[words[0]]}'? Try using '{day_abbrevs[words[0]]}' instead."
+            if words and words[0] in DAY_ABBREVIATIONS:
+                suggestion = f"Did you mean '{DAY_ABBREVIATIONS[words[0]]}'? Try using '{DAY_ABBREVIATIONS[words[0]]}' instead."
                 logger.warning(f"Could not parse date part: '{date_part}'. Suggesting: {suggestion}")
                 return None, None, f"Could not understand date: '{date_part}'. {suggestion}"
             else:
                 logger.warning(f"Could not parse date part: '{date_part}'")
                 return None, None, f"Could not understand date: '{date_part}'. Please use a format like 'monday 4-5pm' or 'tomorrow 3-4pm'."
 
+        start_time, end_time = self._apply_time_range(base_date, time_range)
+        return start_time, end_time, ""
+
+    def _apply_time_range(self, base_date: datetime, time_range: Token) -> Tuple[datetime, datetime]:
+        """Set the start and end times of a range token on a date.
+        
+        Args:
+            base_date (datetime): Date of the range
+            time_range (Token): Range token
+            
+        Returns:
+            Tuple[datetime, datetime]: Start and end time
+        """
         # Extract time components
-        start_hour = int(time_range_match.group(1))
-        start_min = int(time_range_match.group(2) or 0)
-        start_meridiem = time_range_match.group(3)
-        end_hour = int(time_range_match.group(4))
-        end_min = int(time_range_match.group(5) or 0)
-        end_meridiem = time_range_match.group(6)
+        time_range_match = time_range.value
+        start_hour = int(time_range_match.group('start_hour'))
+        start_min = int(time_range_match.group('start_min') or 0)
+        start_meridiem = time_range_match.group('start_meridiem')
+        end_hour = int(time_range_match.group('end_hour'))
+        end_min = int(time_range_match.group('end_min') or 0)
+        end_meridiem = time_range_match.group('end_meridiem')
 
         # Handle meridiem (AM/PM)
         if start_meridiem:
@@ -318,58 +737,45 @@ class TimeParser:
             microsecond=0
         )
         
-        return start_time, end_time, ""
+        return start_time, end_time
 
-    def _parse_special_date_patterns(self, date_part: str) -> Optional[datetime]:
+    def _parse_special_date_patterns(self, tokens: List[Token]) -> Optional[datetime]:
         """Parse special date patterns that dateparser might struggle with.
         
         Args:
-            date_part (str): Date part of the description
+            tokens (List[Token]): Tokens of the date part of the description
             
         Returns:
             Optional[datetime]: Parsed date or None if no pattern matched
         """
-        date_part = date_part.lower().strip()
+        # First occurrence of each relative phrase
+        relative = {}
+        for token in tokens:
+            if token.kind == RELATIVE:
+                relative.setdefault(*token.value)
+        if not relative:
+            return None
+
         now = datetime.now(self.timezone)
         today = now.replace(hour=0, minute=0, second=0, microsecond=0)
         
         # Handle "next X weeks"
-        next_weeks_match = re.search(self.time_patterns['next_n_weeks'], date_part)
-        if next_weeks_match:
-            if next_weeks_match.group(1):
-                weeks = int(next_weeks_match.group(1))
-            else:
-                # Handle text numbers
-                if 'two' in date_part:
-                    weeks = 2
-                elif 'three' in date_part:
-                    weeks = 3
-                elif 'four' in date_part:
-                    weeks = 4
-                else:
-                    weeks = 1
+        if 'weeks' in relative:
+            weeks = relative['weeks']
+            weeks = int(weeks) if weeks.isdigit() else _NUMBER_WORDS[weeks]
             return today + timedelta(days=weeks*7)
             
         # Handle "next X days"
-        next_days_match = re.search(self.time_patterns['next_n_days'], date_part)
-        if next_days_match:
-            days = int(next_days_match.group(1))
-            return today + timedelta(days=days)
+        if 'days' in relative:
+            return today + timedelta(days=int(relative['days']))
             
-        # Handle "rest of the week"
-        if re.search(self.time_patterns['rest_of_week'], date_part):
-            return today
-            
-        # Handle "this week"
-        if re.search(self.time_patterns['this_week'], date_part):
+        # Handle "rest of the week" and "this week"
+        if 'rest_of_week' in relative or 'this_week' in relative:
             return today
             
         # Handle "next week day" (e.g., "next week tuesday")
-        next_week_day_match = re.search(self.time_patterns['next_week_day'], date_part)
-        if next_week_day_match:
-            day_name = next_week_day_match.group(1).lower()
-            day_num = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, 
-                      "friday": 4, "saturday": 5, "sunday": 6}[day_name]
+        if 'week_day' in relative:
+            day_num = WEEKDAY_NUMBERS[relative['week_day']]
             
             # Calculate days until target day in next week
             current_weekday = today.weekday()  # 0-6 (Monday-Sunday)
@@ -383,12 +789,12 @@ class TimeParser:
             # Return the date
             return today + timedelta(days=total_days)
 
-        # Handle "next week" (must come after "next week day" to avoid premature matching)
-        if re.search(self.time_patterns['next_week'], date_part):
+        # Handle "next week" ("next week day" was handled above)
+        if 'next_week' in relative:
             return today + timedelta(days=7)
             
         # Handle "weekend"
-        if re.search(self.time_patterns['weekend'], date_part):
+        if 'weekend' in relative:
             # Find the next Saturday
             days_until_saturday = (5 - now.weekday()) % 7
             if days_until_saturday == 0:  # Today is Saturday
@@ -396,11 +802,8 @@ class TimeParser:
             return today + timedelta(days=days_until_saturday)
             
         # Handle "next day" (e.g., "next monday")
-        next_day_match = re.search(r'next\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)', date_part, re.IGNORECASE)
-        if next_day_match:
-            day_name = next_day_match.group(1).lower()
-            day_num = {"monday": 0, "tuesday": 1, "wednesday": 2, "thursday": 3, 
-                      "friday": 4, "saturday": 5, "sunday": 6}[day_name]
+        if 'next_day' in relative:
+            day_num = WEEKDAY_NUMBERS[relative['next_day']]
             
             # Calculate days until the next occurrence of this day
             days_until = (day_num - today.weekday()) % 7
@@ -411,11 +814,11 @@ class TimeParser:
             
         return None
 
-    def _process_special_patterns(self, description: str) -> Tuple[Optional[datetime], Optional[datetime], str]:
+    def _process_special_patterns(self, tokens: List[Token]) -> Tuple[Optional[datetime], Optional[datetime], str]:
         """Process special time patterns like morning, afternoon, etc.
         
         Args:
-            description (str): Time description
+            tokens (List[Token]): Tokens of the time description
             
         Returns:
             Tuple[Optional[datetime], Optional[datetime], str]:
@@ -424,37 +827,28 @@ class TimeParser:
                 - Error message if any, empty string if successful
         """
         # Try parsing as a single datetime
-        parsed_time = dateparser.parse(description, settings=self.settings)
+        description = join_tokens(tokens)
+        parsed_time = self._parse_date(description)
         
         if not parsed_time:
             # Check for time of day patterns
             base_date = None
-            start_hour = 0
-            end_hour = 0
             
             # Extract date part (remove time of day references)
-            date_part = description
-            for pattern in ['morning', 'afternoon', 'evening', 'night']:
-                date_part = re.sub(self.time_patterns[pattern], '', date_part, flags=re.IGNORECASE).strip()
+            date_tokens = [token for token in tokens if token.kind != PART_OF_DAY]
+            date_part = join_tokens(date_tokens)
             
             # Parse the date part
             if date_part:
-                base_date = self._parse_special_date_patterns(date_part)
+                base_date = self._parse_special_date_patterns(date_tokens)
                 if not base_date:
-                    base_date = dateparser.parse(date_part, settings=self.settings)
+                    base_date = self._parse_date(date_part)
             
             if not base_date:
                 # Try to provide a helpful suggestion for day abbreviations
-                day_abbrevs = {
-                    'mon': 'monday', 'tue': 'tuesday', 'tues': 'tuesday',
-                    'wed': 'wednesday', 'weds': 'wednesday', 
-                    'thu': 'thursday', 'thur': 'thursday', 'thurs': 'thursday',
-                    'fri': 'friday', 'sat': 'saturday', 'sun': 'sunday'
-                }
-                
                 words = date_part.lower().split()
-                if words and words[0] in day_abbrevs:
-                    suggestion = f"Did you mean '{day_abbrevs[words[0]]}'? Try using '{day_abbrevs[words[0]]}' instead."
+                if words and words[0] in DAY_ABBREVIATIONS:
+                    suggestion = f"Did you mean '{DAY_ABBREVIATIONS[words[0]]}'? Try using '{DAY_ABBREVIATIONS[words[0]]}' instead."
                     logger.warning(f"Could not parse date part in special pattern: '{date_part}'. Suggesting: {suggestion}")
                     return None, None, f"Could not understand time format: '{description}'. {suggestion}"
                 else:
@@ -462,26 +856,7 @@ class TimeParser:
                     return None, None, f"Could not understand time format: '{description}'. Please use a format like 'monday 4-5pm' or 'tomorrow afternoon'."
                 
             # Determine time range based on time of day
-            if re.search(self.time_patterns['morning'], description, re.IGNORECASE):
-                start_hour = 8
-                end_hour = 11
-            elif re.search(self.time_patterns['afternoon'], description, re.IGNORECASE):
-                start_hour = 12
-                end_hour = 16
-            elif re.search(self.time_patterns['evening'], description, re.IGNORECASE):
-                start_hour = 17
-                end_hour = 20
-            elif re.search(self.time_patterns['night'], description, re.IGNORECASE):
-                start_hour = 19
-                end_hour = 22
-            else:
-                # Default to a reasonable time range
-                start_hour = 9
-                end_hour = 11
-                
-            # Create start and end times
-            start_time = base_date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
-            end_time = base_date.replace(hour=end_hour, minute=0, second=0, microsecond=0)
+            start_time, end_time = self._apply_part_of_day(base_date, tokens)
             
         else:
             # Default to 2-hour duration with clean seconds/microseconds
@@ -490,6 +865,26 @@ class TimeParser:
             
         return start_time, end_time, ""
 
+    def _apply_part_of_day(self, base_date: datetime, tokens: List[Token]) -> Tuple[datetime, datetime]:
+        """Set the start and end times of the part of the day named in the tokens on a date.
+        
+        Args:
+            base_date (datetime): Date of the range
+            tokens (List[Token]): Tokens of the time description
+            
+        Returns:
+            Tuple[datetime, datetime]: Start and end time, a reasonable default
+                range if no part of the day is named
+        """
+        parts_of_day = {token.value for token in tokens if token.kind == PART_OF_DAY}
+        part_of_day = next((part for part in PART_OF_DAY_HOURS if part in parts_of_day), None)
+        start_hour, end_hour = PART_OF_DAY_HOURS.get(part_of_day, DEFAULT_HOURS)
+            
+        # Create start and end times
+        start_time = base_date.replace(hour=start_hour, minute=0, second=0, microsecond=0)
+        end_time = base_date.replace(hour=end_hour, minute=0, second=0, microsecond=0)
+        return start_time, end_time
+
     def _try_alternative_parsing(self, description: str) -> Tuple[Optional[datetime], Optional[datetime], str]:
         """Try alternative parsing methods when standard parsing fails.
         
@@ -508,14 +903,14 @@ class TimeParser:
         
         try:
             # Try parsing with alternative settings
-            parsed_time = dateparser.parse(description, settings=alternative_settings)
+            parsed_time = _date_data_parser(alternative_settings).get_date_data(description).date_obj
             if parsed_time:
                 start_time = parsed_time.replace(second=0, microsecond=0)
                 end_time = (start_time + timedelta(hours=2)).replace(second=0, microsecond=0)
                 return start_time, end_time, ""
                 
             # Try extracting just numbers for time
-            time_only_match = re.search(r'(\d{1,2})(?::(\d{1,2}))?\s*([ap]m)?', description, re.IGNORECASE)
+            time_only_match = _TIME_ONLY_PATTERN.search(description)
             if time_only_match:
                 hour = int(time_only_match.group(1))
                 minute = int(time_only_match.group(2) or 0)
@@ -560,60 +955,10 @@ class TimeParser:
             if corrected_text != text:
                 return corrected_text
                 
-            # Common patterns to check
-            patterns = [
-                # Time format corrections
-                (r'(\d{1,2})\s*-\s*(\d{1,2})$', r'\1-\2pm'),  # Add pm to bare times
-                (r'(\d{1,2})(\d{2})-(\d{1,2})(\d{2})', r'\1:\2-\3:\4'),  # Fix military time format
-                (r'(\d{1,2}):(\d{2})-(\d{1,2}):(\d{2})', r'\1:\2-\3:\4pm'),  # Add pm to time range with colons
-                (r'(\d{1,2})([ap]m)-(\d{1,2})$', r'\1-\3\2'),  # Add missing meridiem to end time
-                
-                # Spacing corrections
-                (r'next(\w+day)', r'next \1'),  # Fix spacing in next weekday
-                (r'every(\w+day)', r'every \1'),  # Fix spacing in every weekday
-                (r'next(\w+)', r'next \1'),  # Fix spacing in next X
-                (r'this(\w+)', r'this \1'),  # Fix spacing in this X
-                
-                # Abbreviation expansions
-                (r'\btmrw\b', r'tomorrow'),  # Expand common abbreviations
-                (r'\btmr\b', r'tomorrow'),
-                (r'\baft\b', r'afternoon'),
-                (r'\baftrn\b', r'afternoon'),
-                (r'\beve\b', r'evening'),
-                (r'\bmorn\b', r'morning'),
-                
-                # Day name corrections
-                (r'\bmon\b', r'monday'),
-                (r'\btue\b', r'tuesday'),
-                (r'\btues\b', r'tuesday'),
-                (r'\bwed\b', r'wednesday'),
-                (r'\bweds\b', r'wednesday'),
-                (r'\bthu\b', r'thursday'),
-                (r'\bthur\b', r'thursday'),
-                (r'\bthurs\b', r'thursday'),
-                (r'\bfri\b', r'friday'),
-                (r'\bsat\b', r'saturday'),
-                (r'\bsun\b', r'sunday'),
-                
-                # Complex corrections
-                (r'nxt\s+wk', r'next week'),
-                (r'nxt\s+week', r'next week'),
-                (r'nxt', r'next'),
-                (r'wk', r'week'),
-                
-                # Common typos
-                (r'nexxt', r'next'),
-                (r'evry', r'every'),
-                
-                # Time of day without context
-                (r'^(morning|afternoon|evening|night)$', r'today \1'),
-            ]
-
             # Apply patterns in sequence to allow for multiple corrections
             current_text = text
-            for pattern, replacement in patterns:
-                if re.search(pattern, current_text, re.IGNORECASE):
-                    current_text = re.sub(pattern, replacement, current_text, flags=re.IGNORECASE)
+            for pattern, replacement in _CORRECTIONS:
+                current_text = pattern.sub(replacement, current_text)
             
             # If changes were made, return the corrected text
             if current_text != text:
@@ -623,18 +968,18 @@ class TimeParser:
             prefixes = ["today ", "tomorrow ", "next week "]
             for prefix in prefixes:
                 suggestion = prefix + text
-                if dateparser.parse(suggestion, settings=self.settings):
+                if self._parse_date(suggestion):
                     return suggestion
                     
             # Try adding meridiem to times
-            if re.search(r'\d{1,2}-\d{1,2}', text):
-                suggestion = re.sub(r'(\d{1,2})-(\d{1,2})', r'\1-\2pm', text)
+            if _BARE_RANGE_PATTERN.search(text):
+                suggestion = _BARE_RANGE_PATTERN.sub(r'\1-\2pm', text)
                 return suggestion
                 
             # Try adding meridiem to end times
-            if re.search(r'\d{1,2}[ap]m-\d{1,2}', text):
+            if _END_MERIDIEM_PATTERN.search(text):
                 meridiem = 'am' if 'am' in text.lower() else 'pm'
-                suggestion = re.sub(r'(\d{1,2}[ap]m)-(\d{1,2})', fr'\1-\2{meridiem}', text)
+                suggestion = _END_MERIDIEM_PATTERN.sub(fr'\1-\2{meridiem}', text)
                 return suggestion
 
             return None
@@ -9,6 +9,7 @@ from src.database.dao.dynamodb.court_dao import CourtDAO
 from src.config.dynamodb_config import get_db
 from src.utils.responses import Responses
 from src.utils.role_manager import RoleManager
+from src.utils.suggestion_store import SuggestionStore
 from datetime import datetime, timezone
 from .views import UpdateOptionsView
 from src.cogs.user.commands.get_started.constants import (
@@ -39,6 +40,17 @@ class ProfileUpdate:
         self.role_manager = RoleManager()
         self.current_player = None
 
+    def _save_player(self, **updates):
+        """Save profile changes and flag the player for match re-scoring."""
+        self.player_dao.update_player(
+            self.interaction.guild.id,
+            self.interaction.user.id,
+            **updates
+        )
+        SuggestionStore.for_guild(self.interaction.guild.id).mark_player_dirty(
+            self.interaction.user.id
+        )
+
     async def start(self):
         """Start the profile update process."""
         try:
@@ -140,9 +152,7 @@ class ProfileUpdate:
                 **self.current_player.preferences,
                 "skill_levels": new_preferences
             }
-            self.player_dao.update_player(
-                self.interaction.guild.id,
-                self.interaction.user.id,
+            self._save_player(
                 preferences=updated_preferences
             )
             success = True
@@ -255,9 +265,7 @@ class ProfileUpdate:
                 **self.current_player.preferences,
                 "gender": new_preferences
             }
-            self.player_dao.update_player(
-                self.interaction.guild.id,
-                self.interaction.user.id,
+            self._save_player(
                 preferences=updated_preferences
             )
             success = True
@@ -348,9 +356,7 @@ class ProfileUpdate:
             decimal_rating = Decimal(str(rating))
             
             # Update player's NTRP rating
-            self.player_dao.update_player(
-                self.interaction.guild.id,
-                self.interaction.user.id,
+            self._save_player(
                 ntrp_rating=decimal_rating,
                 knows_ntrp=True,
                 last_rating_update=datetime.now(timezone.utc).isoformat()
@@ -410,9 +416,7 @@ class ProfileUpdate:
             decimal_rating = Decimal(str(confirmed_rating))
             
             # Update player's NTRP rating and responses
-            self.player_dao.update_player(
-                self.interaction.guild.id,
-                self.interaction.user.id,
+            self._save_player(
                 ntrp_rating=decimal_rating,
                 rating_responses=getattr(self, '_temp_responses', None),
                 knows_ntrp=False,
@@ -519,9 +523,7 @@ class ProfileUpdate:
                 **self.current_player.preferences,
                 "locations": locations
             }
-            self.player_dao.update_player(
-                self.interaction.guild.id,
-                self.interaction.user.id,
+            self._save_player(
                 preferences=updated_preferences
             )
             success = True
@@ -618,9 +620,7 @@ class ProfileUpdate:
                 return
 
             # Update player's interests
-            self.player_dao.update_player(
-                self.interaction.guild.id,
-                self.interaction.user.id,
+            self._save_player(
                 interests=valid_interests
             )
             success = True
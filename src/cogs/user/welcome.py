@@ -154,6 +154,21 @@ class Welcome(commands.Cog):
         except Exception as e:
             logger.error(f"Error in on_member_join: {e}", exc_info=True)
 
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: nextcord.Role, after: nextcord.Role) -> None:
+        """Drop cached roles when a role changes, e.g. is renamed."""
+        RoleManager.invalidate_role_cache(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: nextcord.Role) -> None:
+        """Drop cached roles when a role is created."""
+        RoleManager.invalidate_role_cache(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: nextcord.Role) -> None:
+        """Drop cached roles when a role is deleted."""
+        RoleManager.invalidate_role_cache(role.guild.id)
+
 
 def setup(bot: commands.Bot) -> None:
     """
@@ -2,5 +2,6 @@ from src.database.dao.dynamodb.player_dao import PlayerDAO
 from src.database.dao.dynamodb.schedule_dao import ScheduleDAO
 from src.database.dao.dynamodb.court_dao import CourtDAO
 from src.database.dao.dynamodb.user_engagement_dao import UserEngagementDAO
+from src.database.dao.dynamodb.scheduled_job_dao import ScheduledJobDAO
 
-__all__ = ['PlayerDAO', 'ScheduleDAO', 'CourtDAO', 'UserEngagementDAO']
+__all__ = ['PlayerDAO', 'ScheduleDAO', 'CourtDAO', 'UserEngagementDAO', 'ScheduledJobDAO']
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 
 from src.database.models.dynamodb.schedule import Schedule
+from src.utils.occurrences import expand_schedules, make_occurrence, occurrence_times, parse_occurrence_id
 
 
 class ScheduleDAO:
@@ -54,6 +55,9 @@ class ScheduleDAO:
     def get_schedule(self, guild_id: str, schedule_id: str) -> Optional[Schedule]:
         """Get a schedule by Guild ID and schedule ID.
         
+        Occurrence IDs of recurring schedules (see src.utils.occurrences)
+        resolve to the occurrence even before it has a row of its own.
+        
         Args:
             guild_id: Discord server ID
             schedule_id: Schedule ID
@@ -61,6 +65,13 @@ class ScheduleDAO:
         Returns:
             Optional[Schedule]: The schedule object if found, None otherwise
         """
+        return (
+            self._get_stored_schedule(guild_id, schedule_id)
+            or self._get_unstored_occurrence(guild_id, schedule_id)
+        )
+    
+    def _get_stored_schedule(self, guild_id: str, schedule_id: str) -> Optional[Schedule]:
+        """Get a schedule's own row."""
         response = self.table.get_item(
             Key={
                 'guild_id': str(guild_id),
@@ -74,6 +85,20 @@ class ScheduleDAO:
             
         return Schedule.from_dict(item)
     
+    def _get_unstored_occurrence(self, guild_id: str, schedule_id: str) -> Optional[Schedule]:
+        """Build an occurrence of a recurring schedule that has no row of its own yet."""
+        parsed = parse_occurrence_id(schedule_id)
+        if not parsed:
+            return None
+        parent_id, start_time = parsed
+        parent = self._get_stored_schedule(guild_id, parent_id)
+        if not parent or not parent.is_recurring_parent():
+            return None
+        for occurrence_start, occurrence_end in occurrence_times(parent, start_time, start_time):
+            if occurrence_start == start_time:
+                return make_occurrence(parent, occurrence_start, occurrence_end)
+        return None
+    
     def update_schedule(self, guild_id: str, schedule_id: str, 
                        **update_data) -> Schedule:
         """Update a schedule's attributes.
@@ -87,7 +112,12 @@ class ScheduleDAO:
             Schedule: The updated schedule object
         """
         # Get current schedule data
-        schedule = self.get_schedule(guild_id, schedule_id)
+        schedule = self._get_stored_schedule(guild_id, schedule_id)
+        if not schedule:
+            # Occurrences of recurring schedules get their own row on first update
+            schedule = self._get_unstored_occurrence(guild_id, schedule_id)
+            if schedule:
+                self.table.put_item(Item=schedule.to_dict())
         if not schedule:
             raise ValueError(f"Schedule with ID {schedule_id} not found for guild {guild_id}")
         
@@ -193,6 +223,9 @@ class ScheduleDAO:
                                 exclude_user_id: str = None) -> List[Schedule]:
         """Get all schedules that overlap with the given time range.
         
+        Recurring schedules are returned as one occurrence per overlapping
+        window instead of as the parent.
+        
         Args:
             guild_id: Discord server ID
             start_time: Start time as Unix timestamp
@@ -202,8 +235,12 @@ class ScheduleDAO:
         Returns:
             List[Schedule]: List of overlapping schedules
         """
-        # Build filter expression
-        filter_expression = "guild_id = :guild_id AND start_time <= :end_time AND end_time >= :start_time"
+        # Build filter expression. Recurring parents that started before the
+        # range can still have occurrences inside it.
+        filter_expression = (
+            "guild_id = :guild_id AND start_time <= :end_time "
+            "AND (end_time >= :start_time OR attribute_exists(recurrence))"
+        )
         expression_values = {
             ":guild_id": str(guild_id),
             ":start_time": start_time,
@@ -215,21 +252,58 @@ class ScheduleDAO:
             filter_expression += " AND user_id <> :exclude_user_id"
             expression_values[":exclude_user_id"] = str(exclude_user_id)
         
-        # Add status filter to exclude cancelled schedules
-        filter_expression += " AND #status <> :cancelled_status"
-        expression_values[":cancelled_status"] = "cancelled"
-        
-        # Scan the table with filters
+        # Scan the table with filters. Cancelled schedules are filtered after
+        # expansion, so a cancelled occurrence hides the parent's pattern.
         response = self.table.scan(
             FilterExpression=filter_expression,
-            ExpressionAttributeValues=expression_values,
-            ExpressionAttributeNames={"#status": "status"}
+            ExpressionAttributeValues=expression_values
         )
         
         items = response.get('Items', [])
-        schedules = [Schedule.from_dict(item) for item in items]
-        return schedules
+        schedules = expand_schedules(
+            (Schedule.from_dict(item) for item in items), start_time, end_time
+        )
+        return [s for s in schedules if s.status != "cancelled"]
     
+    def materialize_occurrences(self, guild_id: str, start_time: int, end_time: int) -> int:
+        """Store a row for every recurring occurrence in a time range that has none yet.
+
+        Stored occurrences show up in plain start_time queries and index
+        lookups, which don't expand recurring parents.
+
+        Args:
+            guild_id: Discord server ID
+            start_time: Start time as Unix timestamp
+            end_time: End time as Unix timestamp
+
+        Returns:
+            int: Number of occurrence rows created
+        """
+        # Recurring parents and the occurrences already stored in the range
+        response = self.table.scan(
+            FilterExpression=(
+                "guild_id = :guild_id AND start_time <= :end_time "
+                "AND (attribute_exists(recurrence) OR attribute_exists(parent_schedule_id))"
+            ),
+            ExpressionAttributeValues={
+                ":guild_id": str(guild_id),
+                ":end_time": end_time
+            }
+        )
+
+        items = response.get('Items', [])
+        schedules = [Schedule.from_dict(item) for item in items]
+        stored_ids = {s.schedule_id for s in schedules}
+        parents = [s for s in schedules if s.is_recurring_parent() and s.status != "cancelled"]
+
+        created = 0
+        with self.table.batch_writer() as batch:
+            for occurrence in expand_schedules(parents, start_time, end_time):
+                if occurrence.schedule_id not in stored_ids and occurrence.is_recurring_instance():
+                    batch.put_item(Item=occurrence.to_dict())
+                    created += 1
+        return created
+
     def get_schedules_in_time_range(self, guild_id: str, start_time: int, end_time: int) -> List[Schedule]:
         """Get all schedules within a time range for a guild.
         
@@ -0,0 +1,59 @@
+from typing import List
+
+from src.database.models.dynamodb.scheduled_job import ScheduledJob
+
+
+class ScheduledJobDAO:
+    """Data Access Object for ScheduledJob model in DynamoDB."""
+
+    def __init__(self, dynamodb):
+        """Initialize ScheduledJobDAO with DynamoDB resource."""
+        self.table = dynamodb.Table(ScheduledJob.TABLE_NAME)
+
+    def save_job(self, job: ScheduledJob) -> ScheduledJob:
+        """Create or replace a job.
+
+        Args:
+            job: The job to store
+
+        Returns:
+            ScheduledJob: The stored job
+        """
+        self.table.put_item(Item=job.to_dict())
+        return job
+
+    def delete_job(self, guild_id: str, job_id: str) -> bool:
+        """Delete a job.
+
+        Args:
+            guild_id: Discord server ID
+            job_id: Job ID
+
+        Returns:
+            bool: True if deleted successfully, False otherwise
+        """
+        try:
+            self.table.delete_item(
+                Key={
+                    'guild_id': str(guild_id),
+                    'job_id': job_id
+                }
+            )
+            return True
+        except Exception as e:
+            print(f"Error deleting job: {e}")
+            return False
+
+    def get_all_jobs(self) -> List[ScheduledJob]:
+        """Get every pending job across all guilds.
+
+        Returns:
+            List[ScheduledJob]: List of jobs
+        """
+        response = self.table.scan()
+        items = response.get('Items', [])
+        while 'LastEvaluatedKey' in response:
+            response = self.table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
+            items.extend(response.get('Items', []))
+
+        return [ScheduledJob.from_dict(item) for item in items]
@@ -1,5 +1,5 @@
 from src.config.dynamodb_config import get_db
-from src.database.models.dynamodb import Player, Schedule, Court, UserEngagement, Match
+from src.database.models.dynamodb import Player, Schedule, Court, UserEngagement, Match, ScheduledJob
 
 
 def init_database():
@@ -29,6 +29,10 @@ def init_database():
         print(f"Creating {Match.TABLE_NAME} table...")
         Match.create_table(dynamodb)
     
+    if ScheduledJob.TABLE_NAME not in existing_tables:
+        print(f"Creating {ScheduledJob.TABLE_NAME} table...")
+        ScheduledJob.create_table(dynamodb)
+    
     print("Database initialization complete!")
 
 
@@ -3,5 +3,6 @@ from src.database.models.dynamodb.schedule import Schedule
 from src.database.models.dynamodb.court import Court
 from src.database.models.dynamodb.user_engagement import UserEngagement
 from src.database.models.dynamodb.match import Match
+from src.database.models.dynamodb.scheduled_job import ScheduledJob
 
-__all__ = ['Player', 'Schedule', 'Court', 'UserEngagement', 'Match']
+__all__ = ['Player', 'Schedule', 'Court', 'UserEngagement', 'Match', 'ScheduledJob']
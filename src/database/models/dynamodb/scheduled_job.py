@@ -0,0 +1,78 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+
+class ScheduledJob:
+    """Scheduled job model for DynamoDB: one pending background job run."""
+
+    TABLE_NAME = "ScheduledJobs"
+
+    @staticmethod
+    def create_table(dynamodb):
+        """Create the ScheduledJobs table in DynamoDB if it doesn't exist."""
+        table = dynamodb.create_table(
+            TableName=ScheduledJob.TABLE_NAME,
+            KeySchema=[
+                {'AttributeName': 'guild_id', 'KeyType': 'HASH'},  # Partition key
+                {'AttributeName': 'job_id', 'KeyType': 'RANGE'}    # Sort key
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'guild_id', 'AttributeType': 'S'},
+                {'AttributeName': 'job_id', 'AttributeType': 'S'}
+            ],
+            ProvisionedThroughput={'ReadCapacityUnits': 5, 'WriteCapacityUnits': 5}
+        )
+        return table
+
+    def __init__(self,
+                 guild_id: str,
+                 job_type: str,  # e.g., "match_reminder", "match_expiry"
+                 run_at: int,    # Unix timestamp
+                 job_id: Optional[str] = None,
+                 payload: Optional[Dict[str, Any]] = None,
+                 attempts: int = 0,
+                 created_at: Optional[str] = None):  # ISO format with UTC timezone
+        """Initialize a ScheduledJob instance.
+
+        Jobs are keyed by job_id, which defaults to "<job_type>:<guild_id>" so
+        a guild has at most one job of each periodic type. One-off jobs pass
+        a job_id naming what they act on (see job_id_for), so scheduling the
+        same job again replaces it instead of adding a duplicate.
+        """
+        self.guild_id = str(guild_id)
+        self.job_type = job_type
+        self.run_at = int(run_at)
+        self.job_id = job_id or ScheduledJob.job_id_for(job_type, self.guild_id)
+        self.payload = payload or {}
+        self.attempts = int(attempts)
+        self.created_at = created_at or datetime.now(timezone.utc).isoformat()
+
+    @staticmethod
+    def job_id_for(job_type: str, subject_id: str) -> str:
+        """Build the job ID of a job of job_type acting on subject_id."""
+        return f"{job_type}:{subject_id}"
+
+    def to_dict(self) -> dict:
+        """Convert job to dictionary for DynamoDB storage."""
+        return {
+            "guild_id": self.guild_id,
+            "job_id": self.job_id,
+            "job_type": self.job_type,
+            "run_at": self.run_at,
+            "payload": self.payload,
+            "attempts": self.attempts,
+            "created_at": self.created_at
+        }
+
+    @staticmethod
+    def from_dict(data: dict) -> 'ScheduledJob':
+        """Create job instance from dictionary."""
+        return ScheduledJob(
+            guild_id=data.get('guild_id'),
+            job_id=data.get('job_id'),
+            job_type=data.get('job_type'),
+            run_at=int(data.get('run_at', 0)),
+            payload=data.get('payload', {}),
+            attempts=int(data.get('attempts', 0)),
+            created_at=data.get('created_at')
+        )
@@ -0,0 +1,231 @@
+"""
+Background Jobs
+
+The job types run by the JobScheduler, and helpers that schedule them:
+
+- match_reminder: DMs the players of a scheduled match shortly before it
+  starts
+- match_expiry: cancels a match request nobody answered in time
+- materialize_recurring: periodically stores the coming occurrences of
+  every recurring schedule in a guild
+- dashboard_refresh: periodically edits a posted availability dashboard
+  (handled in the dashboard package)
+
+Each type has its own concurrency limit and jitter. One-off jobs are keyed
+by the match they act on, so scheduling one again replaces it.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Iterable, Optional
+
+import nextcord
+from nextcord import Color, Embed
+
+from src.cogs.admin.dashboard.command import (
+    DASHBOARD_REFRESH_JOB, DASHBOARD_REFRESH_CONCURRENCY, DASHBOARD_REFRESH_JITTER,
+    refresh_posted_dashboard
+)
+from src.config.dynamodb_config import get_db
+from src.database.dao.dynamodb.match_dao import MatchDAO
+from src.database.dao.dynamodb.schedule_dao import ScheduleDAO
+from src.database.models.dynamodb.match import Match
+from src.database.models.dynamodb.scheduled_job import ScheduledJob
+from src.utils.dm_dispatcher import get_dispatcher
+from src.utils.job_scheduler import JobScheduler, get_job_scheduler
+from src.utils.offload import get_offloader
+
+logger = logging.getLogger(__name__)
+
+MATCH_REMINDER_JOB = "match_reminder"
+MATCH_EXPIRY_JOB = "match_expiry"
+MATERIALIZE_JOB = "materialize_recurring"
+
+# Seconds before the start of a match that players are reminded
+REMINDER_LEAD = 3600
+
+# Seconds a match request waits for confirmation (as long as the DM view lives)
+CONFIRMATION_TTL = 86400
+
+# Seconds between materialization runs, and how far ahead they store occurrences
+MATERIALIZE_INTERVAL = 6 * 3600
+MATERIALIZE_HORIZON = 14 * 24 * 3600
+
+# Hours of upcoming matches checked for missing reminders at startup
+REMINDER_SEED_HOURS = 48
+
+# Most match requests awaiting confirmation checked for missing expiries at
+# startup; the DAO default of 50 would leave the rest without one
+PENDING_SEED_LIMIT = 10000
+
+# (concurrency, jitter in seconds) per job type
+MATCH_REMINDER_LIMITS = (4, 30)
+MATCH_EXPIRY_LIMITS = (4, 60)
+MATERIALIZE_LIMITS = (1, 300)
+
+
+def _match_time_text(match: Match) -> str:
+    start_time = datetime.fromtimestamp(match.start_time)
+    end_time = datetime.fromtimestamp(match.end_time)
+    return f"{start_time.strftime('%A, %B %d at %I:%M %p')} - {end_time.strftime('%I:%M %p')}"
+
+
+async def _get_match(job: ScheduledJob) -> Optional[Match]:
+    match_dao = MatchDAO(get_db())
+    return await get_offloader().run(job.guild_id, None, match_dao.get_match,
+                                     job.guild_id, job.payload['match_id'])
+
+
+async def send_match_reminder(client: nextcord.Client, job: ScheduledJob) -> None:
+    """DM the players of a match that is about to start."""
+    match = await _get_match(job)
+    if not match or match.status != "scheduled":
+        return
+
+    embed = Embed(
+        title="⏰ Match Reminder",
+        description=f"Your match starts <t:{match.start_time}:R>.",
+        color=Color.blue()
+    )
+    embed.add_field(
+        name="Match Details",
+        value=(
+            f"**Match ID:** {match.match_id}\n"
+            f"**Type:** {match.match_type.title()}\n"
+            f"**Time:** {_match_time_text(match)}"
+        ),
+        inline=False
+    )
+    await get_dispatcher(client).send_many(match.players, embed=embed)
+    logger.info(f"Sent reminders for match {match.match_id}")
+
+
+async def expire_match_request(client: nextcord.Client, job: ScheduledJob) -> None:
+    """Cancel a match request that was not confirmed in time."""
+    match = await _get_match(job)
+    if not match or match.status != "pending_confirmation":
+        return
+
+    match_dao = MatchDAO(get_db())
+    updated_match = await get_offloader().run(
+        job.guild_id, None, match_dao.update_match, job.guild_id, match.match_id,
+        status="cancelled", cancelled_reason="Confirmation request expired"
+    )
+    if not updated_match:
+        raise RuntimeError(f"Failed to expire match {match.match_id}")
+
+    embed = Embed(
+        title="⌛ Match Request Expired",
+        description="The match request was not confirmed in time and has been cancelled.",
+        color=Color.orange()
+    )
+    embed.add_field(name="Match ID", value=match.match_id, inline=False)
+    embed.add_field(
+        name="Next Steps",
+        value="You can find new matches using `/find-matches`.",
+        inline=False
+    )
+    await get_dispatcher(client).send_many(match.players, embed=embed)
+    logger.info(f"Expired match request {match.match_id}")
+
+
+async def materialize_recurring(client: nextcord.Client, job: ScheduledJob) -> int:
+    """Store the coming occurrences of a guild's recurring schedules."""
+    now = int(time.time())
+    schedule_dao = ScheduleDAO(get_db())
+    created = await get_offloader().run(
+        job.guild_id, None, schedule_dao.materialize_occurrences,
+        job.guild_id, now, now + MATERIALIZE_HORIZON
+    )
+    if created:
+        logger.info(f"Stored {created} recurring occurrence(s) for guild {job.guild_id}")
+    return now + MATERIALIZE_INTERVAL
+
+
+def register_jobs(scheduler: JobScheduler):
+    """Register every background job type with the scheduler."""
+    scheduler.register(MATCH_REMINDER_JOB, send_match_reminder, *MATCH_REMINDER_LIMITS)
+    scheduler.register(MATCH_EXPIRY_JOB, expire_match_request, *MATCH_EXPIRY_LIMITS)
+    scheduler.register(MATERIALIZE_JOB, materialize_recurring, *MATERIALIZE_LIMITS)
+    scheduler.register(DASHBOARD_REFRESH_JOB, refresh_posted_dashboard,
+                       DASHBOARD_REFRESH_CONCURRENCY, DASHBOARD_REFRESH_JITTER)
+
+
+async def schedule_match_reminder(match: Match):
+    """Schedule the reminder for a scheduled match, unless it starts too soon."""
+    scheduler = get_job_scheduler()
+    run_at = match.start_time - REMINDER_LEAD
+    if scheduler is None or run_at <= time.time():
+        return
+    try:
+        await scheduler.schedule(
+            MATCH_REMINDER_JOB, match.guild_id, run_at,
+            job_id=ScheduledJob.job_id_for(MATCH_REMINDER_JOB, match.match_id),
+            payload={'match_id': match.match_id}
+        )
+    except Exception as e:
+        logger.error(f"Error scheduling reminder for match {match.match_id}: {e}", exc_info=True)
+
+
+async def schedule_match_expiry(match: Match):
+    """Schedule the expiry of a match request; it never outlives the match start."""
+    scheduler = get_job_scheduler()
+    if scheduler is None:
+        return
+    created_at = datetime.fromisoformat(match.created_at.replace('Z', '+00:00'))
+    run_at = int(created_at.timestamp()) + CONFIRMATION_TTL
+    if match.start_time:
+        run_at = min(run_at, match.start_time)
+    try:
+        await scheduler.schedule(
+            MATCH_EXPIRY_JOB, match.guild_id, run_at,
+            job_id=ScheduledJob.job_id_for(MATCH_EXPIRY_JOB, match.match_id),
+            payload={'match_id': match.match_id}
+        )
+    except Exception as e:
+        logger.error(f"Error scheduling expiry for match {match.match_id}: {e}", exc_info=True)
+
+
+async def cancel_match_expiry(match: Match):
+    """Cancel the expiry of a match request that was answered."""
+    scheduler = get_job_scheduler()
+    if scheduler is None:
+        return
+    try:
+        await scheduler.cancel(match.guild_id, ScheduledJob.job_id_for(MATCH_EXPIRY_JOB, match.match_id))
+    except Exception as e:
+        logger.error(f"Error cancelling expiry for match {match.match_id}: {e}", exc_info=True)
+
+
+def _pending_and_upcoming(guild_id: str):
+    match_dao = MatchDAO(get_db())
+    return (
+        match_dao.get_matches_by_status(guild_id, "pending_confirmation", limit=PENDING_SEED_LIMIT),
+        match_dao.get_upcoming_matches(guild_id, hours_ahead=REMINDER_SEED_HOURS)
+    )
+
+
+async def seed_guild_jobs(guild_ids: Iterable[str]):
+    """Schedule jobs missing for matches and recurring schedules made before startup.
+
+    Args:
+        guild_ids: Discord server IDs the bot is in
+    """
+    scheduler = get_job_scheduler()
+    if scheduler is None:
+        return
+    for guild_id in map(str, guild_ids):
+        try:
+            if not scheduler.has_job(guild_id, ScheduledJob.job_id_for(MATERIALIZE_JOB, guild_id)):
+                await scheduler.schedule(MATERIALIZE_JOB, guild_id, int(time.time()))
+
+            pending, upcoming = await get_offloader().run(guild_id, None, _pending_and_upcoming, guild_id)
+            for match in pending:
+                if not scheduler.has_job(guild_id, ScheduledJob.job_id_for(MATCH_EXPIRY_JOB, match.match_id)):
+                    await schedule_match_expiry(match)
+            for match in upcoming:
+                if not scheduler.has_job(guild_id, ScheduledJob.job_id_for(MATCH_REMINDER_JOB, match.match_id)):
+                    await schedule_match_reminder(match)
+        except Exception as e:
+            logger.error(f"Error seeding jobs for guild {guild_id}: {e}", exc_info=True)
@@ -0,0 +1,364 @@
+"""
+Guild-wide Batch Matchmaking
+
+Per-player matching is greedy: every requester is shown their own best
+candidates, so the same strong player ends up suggested to everybody. This
+module instead takes all open schedules of a guild in a time window, builds
+the compatibility graph once with the existing scoring factors and pairs
+singles with an approximate maximum-weight matching (greedy, then improved
+with augmenting paths of length three), followed by a doubles pass over the
+players that were left unpaired. The result is a globally consistent plan in
+which every schedule appears in at most one pairing. It is not guaranteed to
+be the optimal plan, but it is never worse than half of it.
+"""
+
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import combinations
+from typing import List, Dict, Any, Optional, Tuple
+
+from src.database.models.dynamodb.player import Player
+from src.database.models.dynamodb.schedule import Schedule
+from src.utils.matching_algorithm import TennisMatchingAlgorithm, MatchSuggestion
+from src.utils.candidate_index import CandidateIndex
+from src.utils.court_assignment import CourtSession
+from src.utils.match_pool import worker_context
+from src.utils.scoring_profile import (
+    ScoringProfile, DEFAULT_MIN_SINGLES_SCORE, DEFAULT_MIN_DOUBLES_SCORE
+)
+
+logger = logging.getLogger(__name__)
+
+# Residual neighbours considered when forming a doubles group (C(6, 3) = 20 groups)
+DOUBLES_NEIGHBOURS = 6
+
+
+@dataclass
+class BatchMatchPlan:
+    """A globally consistent pairing plan for one guild and time window."""
+    guild_id: str
+    window_start: int
+    window_end: int
+    suggestions: List[MatchSuggestion] = field(default_factory=list)
+    unmatched_schedule_ids: List[str] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def singles(self) -> List[MatchSuggestion]:
+        return [s for s in self.suggestions if s.match_type == "singles"]
+
+    @property
+    def doubles(self) -> List[MatchSuggestion]:
+        return [s for s in self.suggestions if s.match_type == "doubles"]
+
+    def to_dict(self) -> dict:
+        """Convert the plan to a plain dictionary of IDs and scores.
+
+        Used to hand results back from worker processes and to log plans.
+        """
+        return {
+            "guild_id": self.guild_id,
+            "window_start": self.window_start,
+            "window_end": self.window_end,
+            "pairings": [
+                {
+                    "match_type": s.match_type,
+                    "players": [p.user_id for p in s.players],
+                    "schedule_ids": [sch.schedule_id for sch in s.schedules],
+                    "court_id": s.suggested_court.court_id if s.suggested_court else None,
+                    "start_time": s.suggested_time[0],
+                    "end_time": s.suggested_time[1],
+                    "score": round(s.overall_score, 4)
+                }
+                for s in self.suggestions
+            ],
+            "unmatched_schedule_ids": self.unmatched_schedule_ids,
+            "stats": self.stats
+        }
+
+
+class BatchMatchmaker:
+    """Builds guild-wide pairing plans on top of TennisMatchingAlgorithm."""
+
+    def __init__(self, algorithm: TennisMatchingAlgorithm):
+        """Initialize the batch matchmaker.
+
+        Args:
+            algorithm: Matching algorithm whose scoring factors and DAOs are used
+        """
+        self.algorithm = algorithm
+
+    def build_plan(self, guild_id: str, start_time: int, end_time: int) -> BatchMatchPlan:
+        """Build a pairing plan for all open schedules in a time window.
+
+        Args:
+            guild_id: Discord server ID
+            start_time: Window start as Unix timestamp
+            end_time: Window end as Unix timestamp
+
+        Returns:
+            BatchMatchPlan: Singles and doubles pairings plus unmatched schedules
+        """
+        started = time.perf_counter()
+        plan = BatchMatchPlan(guild_id=str(guild_id), window_start=start_time, window_end=end_time)
+
+        schedules = [
+            s for s in self.algorithm.schedule_dao.get_overlapping_schedules(
+                guild_id, start_time, end_time
+            )
+            if s.status == "open"
+        ]
+        if len(schedules) < 2:
+            plan.unmatched_schedule_ids = [s.schedule_id for s in schedules]
+            plan.stats = {"schedules": len(schedules), "edges": 0, "seconds": 0.0}
+            return plan
+
+        players = self.algorithm._get_players_for_schedules(guild_id, schedules)
+        schedules = [s for s in schedules if s.user_id in players]
+        history = self.algorithm._build_match_history_lookup(guild_id)
+
+        # Minimum scores are the guild's, as in the per-player matcher
+        profile = ScoringProfile.for_guild(guild_id)
+        index = CandidateIndex.for_guild(guild_id)
+        index.max_ntrp_diff = profile.ntrp_thresholds['poor']
+        index.upsert_many(players.values())
+
+        weights = self._build_graph(schedules, players, history, index)
+        mate = self._approximate_max_weight_matching(len(schedules), weights, profile.min_singles_score)
+
+        pairings = [
+            ("singles", (u, v), weights[u][v])
+            for u, v in enumerate(mate) if v is not None and u < v
+        ]
+
+        residual = [u for u, v in enumerate(mate) if v is None]
+        for group, score in self._form_doubles(
+            residual, schedules, weights, profile.min_doubles_score
+        ):
+            pairings.append(("doubles", group, score))
+            residual = [u for u in residual if u not in group]
+
+        # All pairings are played, so courts are reserved best score first
+        pairings.sort(key=lambda pairing: pairing[2], reverse=True)
+        courts = self.algorithm.court_assigner.session(start_time, end_time)
+        for match_type, group, score in pairings:
+            plan.suggestions.append(self._make_suggestion(
+                match_type, [schedules[u] for u in group], players, courts, score
+            ))
+
+        plan.unmatched_schedule_ids = [schedules[u].schedule_id for u in residual]
+        plan.stats = {
+            "schedules": len(schedules),
+            "edges": sum(len(w) for w in weights) // 2,
+            "singles": len(plan.singles),
+            "doubles": len(plan.doubles),
+            "unmatched": len(residual),
+            "seconds": round(time.perf_counter() - started, 3)
+        }
+        logger.info(f"Batch plan for guild {guild_id}: {plan.stats}")
+        return plan
+
+    def _build_graph(self, schedules: List[Schedule], players: Dict[str, Player],
+                     history: Dict[frozenset, float],
+                     index: CandidateIndex) -> List[Dict[int, float]]:
+        """Score every pair of time-overlapping schedules from different users.
+
+        A sweep over schedules sorted by start time only visits pairs that
+        actually overlap, so the cost grows with the number of overlaps rather
+        than with the square of the number of schedules. Pairs the candidate
+        index rules out are never scored.
+
+        Returns:
+            List[Dict[int, float]]: Adjacency map of pair scores, indexed like schedules
+        """
+        order = sorted(range(len(schedules)), key=lambda i: schedules[i].start_time)
+        weights: List[Dict[int, float]] = [{} for _ in schedules]
+        active: List[int] = []
+
+        for u in order:
+            schedule_u = schedules[u]
+            active = [v for v in active if schedules[v].end_time > schedule_u.start_time]
+            player_u = players[schedule_u.user_id]
+            for v in active:
+                schedule_v = schedules[v]
+                if schedule_v.user_id == schedule_u.user_id:
+                    continue
+                if not index.is_compatible(schedule_u.user_id, schedule_v.user_id):
+                    continue
+                player_v = players[schedule_v.user_id]
+                compatibility = self.algorithm._score_pair(
+                    player_u, player_v, schedule_u, schedule_v,
+                    match_history=history.get(frozenset((player_u.user_id, player_v.user_id)), 0.0)
+                )
+                score = compatibility.overall_score
+                if score > 0:
+                    weights[u][v] = score
+                    weights[v][u] = score
+            active.append(u)
+
+        return weights
+
+    def _approximate_max_weight_matching(self, n: int, weights: List[Dict[int, float]],
+                                         min_score: float = DEFAULT_MIN_SINGLES_SCORE) -> List[Optional[int]]:
+        """Approximate a maximum-weight matching over singles-eligible edges.
+
+        Starts from the greedy matching (heaviest edges first, a 1/2
+        approximation) and then applies weight-augmenting paths of length
+        three until none improve the total: a matched edge (u, v) is replaced
+        by (x, u) and (v, y) when x and y are free and the swap gains weight.
+        Longer augmenting paths are not searched, so the result can fall
+        short of the true maximum.
+
+        Returns:
+            List[Optional[int]]: Mate of each vertex, or None if unmatched
+        """
+        edges = sorted(
+            ((w, u, v) for u in range(n) for v, w in weights[u].items()
+             if u < v and w > min_score),
+            reverse=True
+        )
+        mate: List[Optional[int]] = [None] * n
+        for w, u, v in edges:
+            if mate[u] is None and mate[v] is None:
+                mate[u] = v
+                mate[v] = u
+
+        def best_free_neighbour(u: int, exclude: int) -> Tuple[Optional[int], float]:
+            best, best_w = None, min_score
+            for x, w in weights[u].items():
+                if x != exclude and mate[x] is None and w > best_w:
+                    best, best_w = x, w
+            return best, best_w
+
+        improved = True
+        while improved:
+            improved = False
+            for u in range(n):
+                v = mate[u]
+                if v is None or v < u:
+                    continue
+                x, w_ux = best_free_neighbour(u, v)
+                if x is None:
+                    continue
+                y, w_vy = best_free_neighbour(v, x)
+                if y is None:
+                    continue
+                if w_ux + w_vy > weights[u][v]:
+                    mate[u], mate[x] = x, u
+                    mate[v], mate[y] = y, v
+                    improved = True
+
+        return mate
+
+    def _form_doubles(self, residual: List[int], schedules: List[Schedule],
+                      weights: List[Dict[int, float]],
+                      min_score: float = DEFAULT_MIN_DOUBLES_SCORE) -> List[Tuple[Tuple[int, ...], float]]:
+        """Greedily group unpaired schedules into doubles.
+
+        A group needs all four schedules to overlap pairwise (so they share a
+        common window) and distinct players. Its score is the average of the
+        six pair scores, as in TennisMatchingAlgorithm._calculate_group_compatibility.
+
+        Returns:
+            List[Tuple[Tuple[int, ...], float]]: Groups of schedule indexes with scores
+        """
+        free = set(residual)
+        groups = []
+        for u in sorted(residual, key=lambda i: schedules[i].start_time):
+            if u not in free:
+                continue
+            neighbours = sorted(
+                (v for v in weights[u] if v in free),
+                key=lambda v: weights[u][v], reverse=True
+            )[:DOUBLES_NEIGHBOURS]
+
+            best_group, best_score = None, min_score
+            for trio in combinations(neighbours, 3):
+                group = (u,) + trio
+                if len({schedules[i].user_id for i in group}) < 4:
+                    continue
+                pair_scores = [weights[a].get(b) for a, b in combinations(group, 2)]
+                if None in pair_scores:
+                    continue
+                score = sum(pair_scores) / len(pair_scores)
+                if score > best_score:
+                    best_group, best_score = group, score
+
+            if best_group:
+                free.difference_update(best_group)
+                groups.append((best_group, best_score))
+        return groups
+
+    def _make_suggestion(self, match_type: str, schedules: List[Schedule],
+                         players: Dict[str, Player], courts: CourtSession,
+                         score: float) -> MatchSuggestion:
+        """Turn a pairing into a MatchSuggestion without further DAO calls."""
+        group = [players[s.user_id] for s in schedules]
+        if match_type == "singles":
+            suggested_time = self.algorithm._find_optimal_match_time(schedules[0], schedules[1])
+        else:
+            suggested_time = self.algorithm._find_optimal_group_match_time(schedules)
+
+        return MatchSuggestion(
+            players=group,
+            schedules=schedules,
+            suggested_court=courts.assign(group, *suggested_time, reserve=True),
+            suggested_time=suggested_time,
+            overall_score=score,
+            match_type=match_type,
+            guild_id=group[0].guild_id,
+            extra_reasons=["Selected by guild-wide matchmaking"]
+        )
+
+
+def _build_guild_plan(guild_id: str, start_time: int, end_time: int) -> dict:
+    """Build one guild's plan in a worker process.
+
+    DAOs hold boto3 resources that cannot be pickled, so each worker creates
+    its own and only the plain dictionary form of the plan is sent back.
+    """
+    from src.config.dynamodb_config import get_db
+    from src.database.dao.dynamodb.player_dao import PlayerDAO
+    from src.database.dao.dynamodb.schedule_dao import ScheduleDAO
+    from src.database.dao.dynamodb.court_dao import CourtDAO
+    from src.database.dao.dynamodb.match_dao import MatchDAO
+
+    db = get_db()
+    algorithm = TennisMatchingAlgorithm(
+        PlayerDAO(db), ScheduleDAO(db), CourtDAO(db), MatchDAO(db)
+    )
+    return BatchMatchmaker(algorithm).build_plan(guild_id, start_time, end_time).to_dict()
+
+
+def run_batch_matchmaking(guild_ids: List[str], hours_ahead: int = 168,
+                          max_workers: Optional[int] = None) -> List[dict]:
+    """Build pairing plans for several guilds.
+
+    This is the entry point for the admin matchmaking command. A single
+    guild (or max_workers=1) runs inline; several guilds are spread across a
+    process pool started from the forkserver (see match_pool.worker_context),
+    one guild per task.
+
+    Args:
+        guild_ids: Discord server IDs
+        hours_ahead: Size of the matching window from now, in hours
+        max_workers: Process pool size (default: one per CPU)
+
+    Returns:
+        List[dict]: Plan dictionaries in the same order as guild_ids
+    """
+    start_time = int(datetime.now().timestamp())
+    end_time = start_time + hours_ahead * 3600
+
+    if len(guild_ids) <= 1 or max_workers == 1:
+        return [_build_guild_plan(guild_id, start_time, end_time) for guild_id in guild_ids]
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=worker_context()) as executor:
+        futures = [
+            executor.submit(_build_guild_plan, guild_id, start_time, end_time)
+            for guild_id in guild_ids
+        ]
+        return [future.result() for future in futures]
@@ -0,0 +1,211 @@
+"""
+Candidate Pre-filter Index
+
+Keeps a per-guild, in-memory index of active players so the matcher can drop
+hard-incompatible candidates before paying for a full compatibility score.
+Players are bucketed by NTRP rating (0.5 steps), gender and gender
+preference, and each player's preferred courts are stored as a bitset.
+
+A candidate is hard-incompatible when the NTRP difference is above the
+guild's 'poor' threshold (2.0 by default), where the NTRP score is 0, or when
+the gender preferences fail both ways, where _calculate_gender_compatibility
+returns 0. Both checks are decided once per bucket instead of once per player.
+"""
+
+import logging
+import math
+import threading
+from typing import Dict, Set, Tuple, Optional, Union, Iterable
+
+from src.database.models.dynamodb.player import Player
+
+logger = logging.getLogger(__name__)
+
+# Width of an NTRP bucket
+NTRP_BUCKET_SIZE = 0.5
+
+# Largest NTRP difference that still scores above zero, unless the guild's
+# scoring profile sets another 'poor' threshold
+MAX_NTRP_DIFF = 2.0
+
+# Gender preferences are stored either as a string ("none") or a list
+GenderPrefs = Union[str, Tuple[str, ...]]
+BucketKey = Tuple[int, str, GenderPrefs]
+
+
+def _ntrp_bucket(rating: float) -> int:
+    return int(rating // NTRP_BUCKET_SIZE)
+
+
+def _gender_prefs(player: Player) -> GenderPrefs:
+    prefs = player.preferences.get('gender', [])
+    return prefs if isinstance(prefs, str) else tuple(prefs or ())
+
+
+def gender_compatible(gender1: str, prefs1: GenderPrefs,
+                      gender2: str, prefs2: GenderPrefs) -> bool:
+    """Whether _calculate_gender_compatibility would score the pair above zero."""
+    if 'none' in prefs1 or 'none' in prefs2:
+        return True
+    return gender1 in prefs2 or gender2 in prefs1
+
+
+class CandidateIndex:
+    """In-memory candidate index for a single guild."""
+
+    _registry: Dict[str, 'CandidateIndex'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, guild_id: str):
+        """Initialize an empty index.
+
+        Args:
+            guild_id: Discord server ID
+        """
+        self.guild_id = str(guild_id)
+        self._lock = threading.Lock()
+        self._buckets: Dict[BucketKey, Set[str]] = {}
+        self._entries: Dict[str, Tuple[BucketKey, float, Optional[str]]] = {}
+        self._location_masks: Dict[str, int] = {}
+        self._court_bits: Dict[str, int] = {}
+        self.max_ntrp_diff = MAX_NTRP_DIFF
+
+    @classmethod
+    def for_guild(cls, guild_id: str) -> 'CandidateIndex':
+        """Get the shared index for a guild, creating it on first use."""
+        guild_id = str(guild_id)
+        with cls._registry_lock:
+            index = cls._registry.get(guild_id)
+            if index is None:
+                index = cls._registry[guild_id] = cls(guild_id)
+            return index
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._entries
+
+    def upsert(self, player: Player):
+        """Add a player or refresh their entry after a profile change.
+
+        Entries are keyed on updated_at, so re-adding an unchanged player is
+        a dictionary lookup.
+
+        Args:
+            player: Player to index
+        """
+        if player.ntrp_rating is None:
+            self.remove(player.user_id)
+            return
+
+        with self._lock:
+            current = self._entries.get(player.user_id)
+            if current and current[2] == player.updated_at and player.updated_at is not None:
+                return
+
+            rating = float(player.ntrp_rating)
+            key = (_ntrp_bucket(rating), player.gender, _gender_prefs(player))
+            self._discard(player.user_id)
+            self._buckets.setdefault(key, set()).add(player.user_id)
+            self._entries[player.user_id] = (key, rating, player.updated_at)
+            self._location_masks[player.user_id] = self._mask(
+                player.preferences.get('locations', [])
+            )
+
+    def upsert_many(self, players: Iterable[Player]):
+        """Add or refresh several players."""
+        for player in players:
+            self.upsert(player)
+
+    def remove(self, user_id: str):
+        """Drop a player from the index.
+
+        Args:
+            user_id: Discord user ID
+        """
+        with self._lock:
+            self._discard(user_id)
+
+    def eligible_user_ids(self, player: Player) -> Set[str]:
+        """Get indexed players that are not hard-incompatible with a player.
+
+        Buckets whose every rating is within max_ntrp_diff are taken whole,
+        buckets on the edge are checked per rating, and buckets further away
+        are never visited.
+
+        Args:
+            player: The searching player
+
+        Returns:
+            Set[str]: User IDs of eligible candidates (excluding the player)
+        """
+        if player.ntrp_rating is None:
+            return set()
+
+        rating = float(player.ntrp_rating)
+        own_bucket = _ntrp_bucket(rating)
+        own_prefs = _gender_prefs(player)
+        max_diff = self.max_ntrp_diff
+        reach = math.ceil(max_diff / NTRP_BUCKET_SIZE)
+
+        eligible: Set[str] = set()
+        with self._lock:
+            for (bucket, gender, prefs), user_ids in self._buckets.items():
+                distance = abs(bucket - own_bucket)
+                if distance > reach:
+                    continue
+                if not gender_compatible(player.gender, own_prefs, gender, prefs):
+                    continue
+                # Ratings in buckets `distance` apart differ by less than
+                # (distance + 1) bucket widths
+                if (distance + 1) * NTRP_BUCKET_SIZE <= max_diff:
+                    eligible.update(user_ids)
+                else:
+                    eligible.update(
+                        user_id for user_id in user_ids
+                        if abs(self._entries[user_id][1] - rating) <= max_diff
+                    )
+
+        eligible.discard(player.user_id)
+        return eligible
+
+    def is_compatible(self, user_a: str, user_b: str) -> bool:
+        """Check two indexed players against the hard constraints.
+
+        Unknown players are treated as compatible so callers fall back to
+        full scoring.
+        """
+        entry_a = self._entries.get(user_a)
+        entry_b = self._entries.get(user_b)
+        if entry_a is None or entry_b is None:
+            return True
+        (_, gender_a, prefs_a), rating_a, _ = entry_a
+        (_, gender_b, prefs_b), rating_b, _ = entry_b
+        if abs(rating_a - rating_b) > self.max_ntrp_diff:
+            return False
+        return gender_compatible(gender_a, prefs_a, gender_b, prefs_b)
+
+    def shares_location(self, user_a: str, user_b: str) -> bool:
+        """Check whether two indexed players share a preferred court."""
+        return bool(self._location_masks.get(user_a, 0) & self._location_masks.get(user_b, 0))
+
+    def _mask(self, court_ids: Iterable[str]) -> int:
+        mask = 0
+        for court_id in court_ids:
+            bit = self._court_bits.get(court_id)
+            if bit is None:
+                bit = self._court_bits[court_id] = len(self._court_bits)
+            mask |= 1 << bit
+        return mask
+
+    def _discard(self, user_id: str):
+        entry = self._entries.pop(user_id, None)
+        self._location_masks.pop(user_id, None)
+        if entry is None:
+            return
+        bucket = self._buckets.get(entry[0])
+        if bucket is not None:
+            bucket.discard(user_id)
+            if not bucket:
+                del self._buckets[entry[0]]
@@ -0,0 +1,126 @@
+"""
+Stateless Component Routing
+
+Buttons and selects that act on a match carry their state in the custom_id,
+e.g. "tm:confirm_match:<guild_id>:<match_id>", instead of in a View object
+kept in memory until it times out. Such views are sent without being stored
+(see StatelessView), so an open DM costs no memory, and their components keep
+working after a restart: on_interaction passes component interactions to
+dispatch_component, which parses the custom_id and calls the handler
+registered for its action. Handlers re-load whatever they need (usually the
+match) from the database.
+
+nextcord's ViewStore only matches custom_ids exactly, so views registered
+with bot.add_view can't carry per-message state; routing by prefix here
+takes their place.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import nextcord
+from nextcord.ui import View
+
+logger = logging.getLogger(__name__)
+
+# First part of every routed custom_id
+CUSTOM_ID_PREFIX = "tm"
+
+# Separates the parts of a routed custom_id
+CUSTOM_ID_SEPARATOR = ":"
+
+# Discord's limit on custom_id length
+MAX_CUSTOM_ID_LENGTH = 100
+
+
+@dataclass(frozen=True)
+class ComponentRoute:
+    """State decoded from a routed custom_id."""
+    action: str
+    guild_id: str
+    match_id: str
+    extra: Tuple[str, ...] = ()
+
+
+ComponentHandler = Callable[[nextcord.Interaction, ComponentRoute], Awaitable[None]]
+
+_handlers: Dict[str, ComponentHandler] = {}
+
+
+def custom_id(action: str, guild_id, match_id: str = "", *extra: str) -> str:
+    """Build a routed custom_id.
+
+    Args:
+        action: Registered handler name
+        guild_id: Discord server ID the component acts in
+        match_id: Match the component acts on, if any
+        *extra: Further state, e.g. the chosen winner
+
+    Returns:
+        str: The custom_id
+    """
+    parts = (CUSTOM_ID_PREFIX, action, str(guild_id), match_id, *map(str, extra))
+    value = CUSTOM_ID_SEPARATOR.join(parts)
+    if len(value) > MAX_CUSTOM_ID_LENGTH:
+        raise ValueError(f"custom_id too long: {value}")
+    return value
+
+
+def parse_custom_id(value: Optional[str]) -> Optional[ComponentRoute]:
+    """Decode a routed custom_id.
+
+    Returns:
+        Optional[ComponentRoute]: None if the custom_id is not a routed one
+    """
+    parts = (value or "").split(CUSTOM_ID_SEPARATOR)
+    if len(parts) < 4 or parts[0] != CUSTOM_ID_PREFIX:
+        return None
+    _, action, guild_id, match_id, *extra = parts
+    return ComponentRoute(action, guild_id, match_id, tuple(extra))
+
+
+def component_handler(action: str):
+    """Register a coroutine function as the handler of a custom_id action."""
+    def decorator(handler: ComponentHandler) -> ComponentHandler:
+        if action in _handlers and _handlers[action] is not handler:
+            logger.warning(f"Replacing component handler for {action}")
+        _handlers[action] = handler
+        return handler
+    return decorator
+
+
+def describe_component(interaction: nextcord.Interaction) -> Optional[str]:
+    """Label a routed component interaction for logs, e.g. "component:confirm_match"."""
+    route = parse_custom_id((interaction.data or {}).get('custom_id'))
+    return f"component:{route.action}" if route else None
+
+
+async def dispatch_component(interaction: nextcord.Interaction) -> bool:
+    """Run the handler for a routed component interaction.
+
+    Args:
+        interaction: A component interaction
+
+    Returns:
+        bool: True if the custom_id was routed to a handler
+    """
+    route = parse_custom_id((interaction.data or {}).get('custom_id'))
+    if route is None:
+        return False
+    handler = _handlers.get(route.action)
+    if handler is None:
+        logger.warning(f"No component handler for {route.action}")
+        return False
+    try:
+        await handler(interaction, route)
+    except Exception as e:
+        logger.error(f"Error handling component {route.action}: {e}", exc_info=True)
+    return True
+
+
+class StatelessView(View):
+    """A view whose components are all routed; it is never stored by the client."""
+
+    def __init__(self):
+        super().__init__(timeout=None, prevent_update=False)
@@ -76,6 +76,47 @@ class ConfigLoader:
             logger.warning(f"Failed to load configured timezone, using default: {e}")
             return ZoneInfo("America/New_York")
 
+    def reload(self) -> dict:
+        """Re-read the guild configuration file.
+
+        Returns:
+            dict: The reloaded configuration
+        """
+        self._config = self._load_guild_config()
+        return self._config
+
+    def get_matching_config(self, guild_id: Optional[str] = None) -> dict:
+        """Get matching settings, with a guild's overrides applied.
+
+        Overrides live under matching.guild_overrides, keyed by guild ID, and
+        are merged one level deep, so a guild can change a single weight.
+
+        Args:
+            guild_id (Optional[str]): Discord server ID
+
+        Returns:
+            dict: Matching settings (empty if the section is missing)
+        """
+        matching = self._config.get('matching') or {}
+        settings = {
+            key: dict(value) if isinstance(value, dict) else value
+            for key, value in matching.items() if key != 'guild_overrides'
+        }
+        if guild_id is None:
+            return settings
+
+        # YAML reads unquoted IDs as integers
+        overrides = matching.get('guild_overrides') or {}
+        guild_settings = overrides.get(str(guild_id)) or overrides.get(
+            int(guild_id) if str(guild_id).isdigit() else None
+        ) or {}
+        for key, value in guild_settings.items():
+            if isinstance(value, dict) and isinstance(settings.get(key), dict):
+                settings[key].update(value)
+            else:
+                settings[key] = value
+        return settings
+
     def get_channel_name(self, channel_key: str) -> Optional[str]:
         """Get channel name from config.
 
@@ -0,0 +1,157 @@
+"""
+Court Assignment
+
+Assigns courts to match suggestions in memory. The court catalog is cached,
+and the matches already booked in a time window are loaded once per
+assignment session through the CourtIndex, one query per court. Occupancy is
+then tracked per court in fixed time buckets against Court.number_of_courts,
+so assigning a court never costs a DAO call per suggestion.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.database.dao.dynamodb.court_dao import CourtDAO
+from src.database.dao.dynamodb.match_dao import MatchDAO
+from src.database.models.dynamodb.court import Court
+from src.database.models.dynamodb.player import Player
+
+logger = logging.getLogger(__name__)
+
+# Occupancy is tracked in buckets of this many seconds
+BUCKET_SECONDS = 30 * 60
+
+# How long the court catalog is reused before it is reloaded
+CATALOG_TTL_SECONDS = 60 * 60
+
+# Longest match that can spill into a window from before it starts
+MAX_MATCH_SECONDS = 4 * 60 * 60
+
+# Match statuses that hold a court
+BOOKED_STATUSES = {"scheduled", "pending_confirmation", "in_progress"}
+
+
+def _buckets(start_time: int, end_time: int) -> range:
+    """Buckets covered by [start_time, end_time)."""
+    return range(start_time // BUCKET_SECONDS, (max(end_time, start_time + 1) - 1) // BUCKET_SECONDS + 1)
+
+
+class CourtSession:
+    """Court occupancy for one time window, used to assign a batch of suggestions."""
+
+    def __init__(self, courts: List[Court], occupancy: Dict[str, Dict[int, int]]):
+        self.courts = {court.court_id: court for court in courts}
+        self._order = sorted(self.courts)
+        self._occupancy = occupancy
+
+    def has_capacity(self, court: Court, start_time: int, end_time: int) -> bool:
+        """Check whether a court has a free court for a whole time range."""
+        capacity = court.number_of_courts or 1
+        used = self._occupancy.get(court.court_id, {})
+        return all(used.get(bucket, 0) < capacity for bucket in _buckets(start_time, end_time))
+
+    def reserve(self, court: Court, start_time: int, end_time: int):
+        """Hold one court for a time range so later suggestions see it as taken."""
+        used = self._occupancy.setdefault(court.court_id, {})
+        for bucket in _buckets(start_time, end_time):
+            used[bucket] = used.get(bucket, 0) + 1
+
+    def ranked_courts(self, players: List[Player]) -> List[Court]:
+        """Order courts by how many players prefer them.
+
+        Ties keep the order in which the players listed their preferences, and
+        courts nobody prefers follow in court ID order, so the result is
+        deterministic.
+        """
+        votes: Dict[str, Tuple[int, int]] = {}
+        position = 0
+        for player in players:
+            for court_id in player.preferences.get('locations', []):
+                if court_id not in self.courts:
+                    continue
+                count, first_seen = votes.get(court_id, (0, position))
+                votes[court_id] = (count + 1, first_seen)
+                position += 1
+
+        preferred = sorted(votes, key=lambda court_id: (-votes[court_id][0], votes[court_id][1]))
+        others = [court_id for court_id in self._order if court_id not in votes]
+        return [self.courts[court_id] for court_id in preferred + others]
+
+    def assign(self, players: List[Player], start_time: int, end_time: int,
+               reserve: bool = False) -> Optional[Court]:
+        """Assign the most preferred court with free capacity.
+
+        Args:
+            players: Players in the suggested match
+            start_time: Match start (Unix timestamp)
+            end_time: Match end (Unix timestamp)
+            reserve: Hold the court for later assignments in this session.
+                Use it when the suggestions are played together (a batch
+                plan), not when they are alternatives for one player.
+
+        Returns:
+            Optional[Court]: The assigned court, or None if every court is full
+        """
+        for court in self.ranked_courts(players):
+            if self.has_capacity(court, start_time, end_time):
+                if reserve:
+                    self.reserve(court, start_time, end_time)
+                return court
+        logger.debug(f"No court capacity for {start_time}-{end_time}")
+        return None
+
+
+class CourtAssigner:
+    """Creates court sessions from a cached catalog and the CourtIndex."""
+
+    def __init__(self, court_dao: CourtDAO, match_dao: MatchDAO):
+        """Initialize the court assigner.
+
+        Args:
+            court_dao: Court data access object
+            match_dao: Match data access object
+        """
+        self.court_dao = court_dao
+        self.match_dao = match_dao
+        self._lock = threading.Lock()
+        self._catalog: Optional[List[Court]] = None
+        self._catalog_loaded_at = 0.0
+
+    def get_courts(self) -> List[Court]:
+        """Get the court catalog, reloading it once it is older than the TTL."""
+        with self._lock:
+            if self._catalog is None or time.time() - self._catalog_loaded_at > CATALOG_TTL_SECONDS:
+                self._catalog = self.court_dao.list_courts()
+                self._catalog_loaded_at = time.time()
+            return self._catalog
+
+    def invalidate(self):
+        """Forget the cached catalog, e.g. after courts were added or edited."""
+        with self._lock:
+            self._catalog = None
+
+    def session(self, window_start: int, window_end: int) -> CourtSession:
+        """Load court occupancy for a time window.
+
+        Args:
+            window_start: Window start (Unix timestamp)
+            window_end: Window end (Unix timestamp)
+
+        Returns:
+            CourtSession: Occupancy of every court in the window
+        """
+        courts = self.get_courts()
+        occupancy: Dict[str, Dict[int, int]] = {}
+        for court in courts:
+            used: Dict[int, int] = {}
+            for match in self.match_dao.get_matches_by_court(
+                court.court_id, window_start - MAX_MATCH_SECONDS, window_end
+            ):
+                if match.status not in BOOKED_STATUSES or match.end_time <= window_start:
+                    continue
+                for bucket in _buckets(match.start_time, match.end_time):
+                    used[bucket] = used.get(bucket, 0) + 1
+            occupancy[court.court_id] = used
+        return CourtSession(courts, occupancy)
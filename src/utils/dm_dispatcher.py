@@ -0,0 +1,189 @@
+"""
+Direct Message Dispatcher
+
+Match notifications go to two to four players at once. Sending them one
+after another costs one round trip per player, and get_user misses anyone
+who is not in the local user cache. DMDispatcher sends to every recipient
+concurrently:
+
+- a token bucket keeps the bot under Discord's DM rate limits, with a burst
+  large enough for a doubles match to go out at once
+- users missing from the client cache are fetched once and kept in a small
+  LRU cache
+- server errors, rate limits and timeouts are retried with backoff; closed
+  DMs and unknown users are not
+- every recipient gets a DMResult, so callers can tell the user who could
+  not be reached
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+
+import aiohttp
+import nextcord
+
+logger = logging.getLogger(__name__)
+
+# Sustained DMs per second and burst size
+DM_RATE = 5.0
+DM_BURST = 10
+
+# Attempts per recipient, and the first retry delay (doubled each retry)
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+
+# Users fetched from the API that are remembered
+USER_CACHE_SIZE = 512
+
+
+class TokenBucket:
+    """Async token bucket rate limiter."""
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum tokens held
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class DMResult:
+    """Outcome of one direct message."""
+    user_id: str
+    sent: bool
+    attempts: int = 0
+    error: Optional[str] = None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed send is worth retrying."""
+    if isinstance(error, nextcord.HTTPException):
+        return error.status == 429 or error.status >= 500
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError))
+
+
+class DMDispatcher:
+    """Sends direct messages to several users concurrently."""
+
+    def __init__(self, client: nextcord.Client, rate: float = DM_RATE, burst: int = DM_BURST):
+        """Initialize the dispatcher.
+
+        Args:
+            client: Bot client used to look up and fetch users
+            rate: Sustained DMs per second
+            burst: DMs that may be sent at once
+        """
+        self.client = client
+        self.bucket = TokenBucket(rate, burst)
+        self._users: "OrderedDict[int, nextcord.User]" = OrderedDict()
+
+    async def _resolve_user(self, user_id: int) -> nextcord.User:
+        user = self.client.get_user(user_id)
+        if user is not None:
+            return user
+        user = self._users.get(user_id)
+        if user is not None:
+            self._users.move_to_end(user_id)
+            return user
+        user = await self.client.fetch_user(user_id)
+        self._users[user_id] = user
+        if len(self._users) > USER_CACHE_SIZE:
+            self._users.popitem(last=False)
+        return user
+
+    async def send(self, user_id: str, embed: Optional[nextcord.Embed] = None,
+                   view_factory: Optional[Callable[[], nextcord.ui.View]] = None,
+                   content: Optional[str] = None) -> DMResult:
+        """Send one direct message, retrying transient failures.
+
+        Args:
+            user_id: Discord user ID
+            embed: Embed to send
+            view_factory: Builds the message's view; called per attempt since
+                a view can only be attached to one message
+            content: Message text
+
+        Returns:
+            DMResult: Whether the message was sent, and why not
+        """
+        result = DMResult(user_id=str(user_id), sent=False)
+        while result.attempts < MAX_ATTEMPTS:
+            result.attempts += 1
+            try:
+                user = await self._resolve_user(int(user_id))
+                await self.bucket.acquire()
+                kwargs = {'embed': embed}
+                if view_factory is not None:
+                    kwargs['view'] = view_factory()
+                await user.send(content, **kwargs)
+                result.sent = True
+                result.error = None
+                return result
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
+                if not _is_transient(e) or result.attempts >= MAX_ATTEMPTS:
+                    break
+                delay = RETRY_BASE_DELAY * 2 ** (result.attempts - 1)
+                retry_after = getattr(e, 'retry_after', None)
+                await asyncio.sleep(retry_after or delay * (1 + random.random() / 2))
+
+        logger.warning(f"Could not DM user {user_id} after {result.attempts} attempt(s): {result.error}")
+        return result
+
+    async def send_many(self, user_ids: Iterable[str], embed: Optional[nextcord.Embed] = None,
+                        view_factory: Optional[Callable[[], nextcord.ui.View]] = None,
+                        content: Optional[str] = None) -> List[DMResult]:
+        """Send the same message to several users concurrently.
+
+        Args:
+            user_ids: Discord user IDs; duplicates are messaged once
+            embed: Embed to send
+            view_factory: Builds each message's view
+            content: Message text
+
+        Returns:
+            List[DMResult]: One result per recipient, in input order
+        """
+        recipients = list(dict.fromkeys(str(user_id) for user_id in user_ids))
+        results = await asyncio.gather(*(
+            self.send(user_id, embed=embed, view_factory=view_factory, content=content)
+            for user_id in recipients
+        ))
+        sent = sum(1 for r in results if r.sent)
+        logger.info(f"Sent {sent}/{len(results)} direct messages")
+        return list(results)
+
+
+_dispatchers = {}
+
+
+def get_dispatcher(client: nextcord.Client) -> DMDispatcher:
+    """Get the dispatcher for a client, creating it on first use."""
+    dispatcher = _dispatchers.get(id(client))
+    if dispatcher is None or dispatcher.client is not client:
+        dispatcher = _dispatchers[id(client)] = DMDispatcher(client)
+    return dispatcher
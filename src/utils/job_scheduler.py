@@ -0,0 +1,286 @@
+"""
+Background Job Scheduler
+
+Runs work that no interaction triggers, such as match reminders and
+expiring unanswered match requests. Every pending job is a row in the
+ScheduledJobs table, so jobs survive restarts; in memory the scheduler keeps
+them in a heap ordered by due time and sleeps until the earliest one.
+
+- job types are registered with a handler, a concurrency limit and a jitter;
+  the jitter spreads jobs due at the same moment (e.g. after a restart)
+- a handler returns the next run time to repeat its job, or None when done
+- a failing job is retried with backoff, then dropped
+- scheduling a job under an existing job ID replaces it, so callers never
+  need to check before scheduling
+- per job type metrics (runs, failures, lag behind the due time, duration)
+  are kept for the admin jobs report
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.config.dynamodb_config import get_db
+from src.database.dao.dynamodb.scheduled_job_dao import ScheduledJobDAO
+from src.database.models.dynamodb.scheduled_job import ScheduledJob
+from src.utils.offload import get_offloader
+
+logger = logging.getLogger(__name__)
+
+# Attempts before a failing job is dropped
+MAX_ATTEMPTS = 3
+
+# Seconds before the first retry; doubles with every attempt
+RETRY_BASE_DELAY = 30
+
+# Longest sleep between checks, so clock adjustments are picked up
+MAX_SLEEP = 60.0
+
+JobHandler = Callable[[Any, ScheduledJob], Awaitable[Optional[int]]]
+
+
+@dataclass
+class JobType:
+    """A registered kind of job."""
+    handler: JobHandler
+    concurrency: int
+    jitter: float
+    limiter: asyncio.Semaphore
+
+
+class JobScheduler:
+    """Persistent heap of due jobs run by per-type handlers."""
+
+    def __init__(self, client: Any, job_dao: Optional[ScheduledJobDAO] = None):
+        """Initialize the scheduler.
+
+        Args:
+            client: Bot passed to every handler
+            job_dao: Job storage; defaults to the ScheduledJobs table
+        """
+        self.client = client
+        self.job_dao = job_dao or ScheduledJobDAO(get_db())
+        self._types: Dict[str, JobType] = {}
+        self._jobs: Dict[Tuple[str, str], ScheduledJob] = {}
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._runner: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._running: set = set()
+        self._metrics: Dict[str, Counter] = {}
+        self._lag: Dict[str, float] = {}
+        self._duration: Dict[str, float] = {}
+
+    def register(self, job_type: str, handler: JobHandler,
+                 concurrency: int = 1, jitter: float = 0.0):
+        """Register the handler of a job type.
+
+        Args:
+            job_type: Name stored with each job
+            handler: Coroutine function called with (client, job)
+            concurrency: Jobs of this type run at the same time
+            jitter: Up to this many seconds are added to each due time
+        """
+        self._types[job_type] = JobType(handler, concurrency, jitter, asyncio.Semaphore(concurrency))
+        self._metrics[job_type] = Counter()
+        self._lag[job_type] = 0.0
+        self._duration[job_type] = 0.0
+
+    async def _store(self, job: ScheduledJob):
+        await get_offloader().run(job.guild_id, None, self.job_dao.save_job, job)
+
+    async def _unstore(self, job: ScheduledJob):
+        await get_offloader().run(job.guild_id, None, self.job_dao.delete_job, job.guild_id, job.job_id)
+
+    def _push(self, job: ScheduledJob):
+        """Add a job to the heap, replacing any job with the same key."""
+        job_type = self._types.get(job.job_type)
+        jitter = random.uniform(0, job_type.jitter) if job_type and job_type.jitter else 0.0
+        self._jobs[(job.guild_id, job.job_id)] = job
+        heapq.heappush(self._heap, (job.run_at + jitter, next(self._sequence), job))
+        self._wakeup.set()
+
+    async def schedule(self, job_type: str, guild_id: str, run_at: int,
+                       job_id: Optional[str] = None, payload: Optional[Dict[str, Any]] = None
+                       ) -> ScheduledJob:
+        """Schedule a job, replacing any pending job with the same ID.
+
+        Args:
+            job_type: A registered job type
+            guild_id: Discord server ID
+            run_at: When to run (Unix timestamp); past times run right away
+            job_id: Job ID; defaults to one job of this type per guild
+            payload: Handler arguments, stored with the job
+
+        Returns:
+            ScheduledJob: The scheduled job
+        """
+        job = ScheduledJob(guild_id=guild_id, job_type=job_type, run_at=run_at,
+                           job_id=job_id, payload=payload)
+        await self._store(job)
+        self._push(job)
+        self._metrics.setdefault(job_type, Counter())['scheduled'] += 1
+        logger.debug(f"Scheduled {job.job_id} for {run_at}")
+        return job
+
+    async def cancel(self, guild_id: str, job_id: str) -> bool:
+        """Cancel a pending job.
+
+        Returns:
+            bool: True if the job was pending
+        """
+        job = self._jobs.pop((str(guild_id), job_id), None)
+        if job is None:
+            return False
+        # The heap entry is skipped when it comes due
+        await self._unstore(job)
+        return True
+
+    def has_job(self, guild_id: str, job_id: str) -> bool:
+        """Check whether a job is pending."""
+        return (str(guild_id), job_id) in self._jobs
+
+    async def start(self):
+        """Load stored jobs and start running them."""
+        if self._runner is not None:
+            return
+        jobs = await get_offloader().run(None, None, self.job_dao.get_all_jobs)
+        for job in jobs:
+            self._push(job)
+        self._stopping = False
+        self._runner = asyncio.create_task(self._run(), name="job-scheduler")
+        logger.info(f"Job scheduler started with {len(jobs)} stored job(s)")
+
+    async def stop(self):
+        """Stop running jobs; pending jobs stay stored for the next start."""
+        if self._runner is None:
+            return
+        # The runner checks the flag whenever it wakes up, so shutdown does not
+        # rely on cancelling a wait (wait_for could swallow that before 3.12)
+        self._stopping = True
+        self._wakeup.set()
+        for task in list(self._running):
+            task.cancel()
+        await asyncio.gather(self._runner, *self._running, return_exceptions=True)
+        self._runner = None
+
+    async def _run(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            now = time.time()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, job = heapq.heappop(self._heap)
+                key = (job.guild_id, job.job_id)
+                if self._jobs.get(key) is not job:
+                    continue  # Cancelled or replaced
+                # The job stays registered, and so cancellable, until it
+                # gets a slot of its type (see _execute)
+                task = asyncio.create_task(self._execute(job), name=f"job:{job.job_id}")
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+            delay = min(self._heap[0][0] - now, MAX_SLEEP) if self._heap else MAX_SLEEP
+            wakeup = asyncio.ensure_future(self._wakeup.wait())
+            try:
+                await asyncio.wait({wakeup}, timeout=max(delay, 0))
+            finally:
+                wakeup.cancel()
+
+    async def _execute(self, job: ScheduledJob):
+        """Run one due job and store its outcome."""
+        key = (job.guild_id, job.job_id)
+        job_type = self._types.get(job.job_type)
+        if job_type is None:
+            if self._jobs.get(key) is job:
+                del self._jobs[key]
+            logger.warning(f"Dropping job {job.job_id} of unknown type {job.job_type}")
+            await self._unstore(job)
+            return
+
+        metrics = self._metrics[job.job_type]
+        async with job_type.limiter:
+            if self._jobs.get(key) is not job:
+                return  # Cancelled or replaced while waiting for a slot
+            del self._jobs[key]
+            started = time.time()
+            self._lag[job.job_type] = max(self._lag[job.job_type], started - job.run_at)
+            try:
+                next_run = await job_type.handler(self.client, job)
+                metrics['succeeded'] += 1
+            except Exception as e:
+                job.attempts += 1
+                if job.attempts < MAX_ATTEMPTS:
+                    metrics['retried'] += 1
+                    next_run = int(time.time()) + RETRY_BASE_DELAY * 2 ** (job.attempts - 1)
+                    logger.warning(f"Job {job.job_id} failed (attempt {job.attempts}), retrying: {e}")
+                else:
+                    metrics['failed'] += 1
+                    next_run = None
+                    logger.error(f"Job {job.job_id} failed {job.attempts} times, dropping: {e}",
+                                 exc_info=True)
+            else:
+                job.attempts = 0
+            finally:
+                self._duration[job.job_type] = max(
+                    self._duration[job.job_type], time.time() - started
+                )
+
+        try:
+            if self.has_job(job.guild_id, job.job_id):
+                return  # Rescheduled while running; the new job is already stored
+            if next_run is None:
+                await self._unstore(job)
+            else:
+                job.run_at = int(next_run)
+                await self._store(job)
+                self._push(job)
+        except Exception as e:
+            logger.error(f"Error storing job {job.job_id}: {e}", exc_info=True)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per job type counters, pending jobs, worst lag and longest run."""
+        pending = Counter(job.job_type for job in self._jobs.values())
+        return {
+            job_type: {
+                'pending': pending[job_type],
+                'concurrency': self._types[job_type].concurrency if job_type in self._types else 0,
+                'scheduled': metrics['scheduled'],
+                'succeeded': metrics['succeeded'],
+                'retried': metrics['retried'],
+                'failed': metrics['failed'],
+                'max_lag': self._lag.get(job_type, 0.0),
+                'max_duration': self._duration.get(job_type, 0.0),
+            }
+            for job_type, metrics in self._metrics.items()
+        }
+
+
+_scheduler: Optional[JobScheduler] = None
+
+
+def get_job_scheduler() -> Optional[JobScheduler]:
+    """Get the shared scheduler, or None if it was never started."""
+    return _scheduler
+
+
+async def start_job_scheduler(client: Any,
+                              register: Callable[[JobScheduler], None]) -> JobScheduler:
+    """Start the shared scheduler once; later calls return it.
+
+    Args:
+        client: Bot passed to every handler
+        register: Registers the job types before stored jobs are loaded
+    """
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = JobScheduler(client)
+        register(_scheduler)
+        await _scheduler.start()
+    return _scheduler
@@ -0,0 +1,199 @@
+"""
+Event Loop Lag Monitor
+
+When a handler blocks the event loop, every other interaction waits with it
+and may miss Discord's 3 second response window. LoopMonitor finds out
+which handler did it:
+
+- a heartbeat callback on the loop measures how late it runs (scheduling lag)
+- a watchdog thread notices a late heartbeat while the loop is still
+  blocked and samples the loop thread's stack and the running task
+- the stall is attributed to the handler label in the running task's
+  context (see current_handler), or failing that to the outermost cog
+  frame on the sampled stack
+- stalls are aggregated per handler into a top blockers report
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from weakref import WeakKeyDictionary
+
+logger = logging.getLogger(__name__)
+
+# Seconds between heartbeats
+HEARTBEAT_INTERVAL = 0.1
+
+# Lag in seconds above which a heartbeat counts as a stall
+LAG_THRESHOLD = 0.25
+
+# Innermost stack frames kept per stall
+STACK_DEPTH = 12
+
+# Handler running in the current task, e.g. "/find-matches"
+current_handler: ContextVar[Optional[str]] = ContextVar("current_handler", default=None)
+
+# Handler label per task, for Pythons before 3.12 where another thread
+# cannot read a task's context (Task.get_context)
+_task_labels: 'WeakKeyDictionary[asyncio.Task, str]' = WeakKeyDictionary()
+
+_COGS_DIR = f"{os.sep}cogs{os.sep}"
+
+
+def set_current_handler(label: str):
+    """Label the current task, and the tasks it starts, with a handler name."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        _task_labels[task] = label
+    return current_handler.set(label)
+
+
+class LoopMonitor:
+    """Measures event loop lag and attributes stalls to handlers."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop,
+                 interval: float = HEARTBEAT_INTERVAL, threshold: float = LAG_THRESHOLD):
+        """Initialize the monitor.
+
+        Args:
+            loop: Event loop to watch
+            interval: Seconds between heartbeats
+            threshold: Lag in seconds above which a stall is recorded
+        """
+        self.loop = loop
+        self.interval = interval
+        self.threshold = threshold
+        self._expected = 0.0
+        self._loop_thread_id: Optional[int] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._sample: Optional[tuple] = None
+        self._sampled_for = 0.0
+        self.blockers: Dict[str, Dict] = {}
+
+    def start(self):
+        """Start the heartbeat and the watchdog thread; call from the loop."""
+        self._loop_thread_id = threading.get_ident()
+        self._expected = time.monotonic() + self.interval
+        self._handle = self.loop.call_later(self.interval, self._beat)
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+        logger.info(f"Loop monitor started (threshold {self.threshold * 1000:.0f}ms)")
+
+    def stop(self):
+        """Stop monitoring."""
+        self._stop.set()
+        if self._handle:
+            self._handle.cancel()
+
+    def _beat(self):
+        now = time.monotonic()
+        lag = now - self._expected
+        if lag >= self.threshold:
+            try:
+                self._record(lag)
+            except Exception as e:
+                # The heartbeat must be rescheduled whatever happens here
+                logger.error(f"Error recording event loop stall: {e}", exc_info=True)
+        self._expected = now + self.interval
+        if not self._stop.is_set():
+            self._handle = self.loop.call_later(self.interval, self._beat)
+
+    def _watch(self):
+        while not self._stop.wait(self.interval / 2):
+            expected = self._expected
+            if time.monotonic() - expected >= self.threshold and self._sampled_for != expected:
+                sample = self._take_sample()
+                with self._lock:
+                    self._sampled_for = expected
+                    self._sample = sample
+
+    def _take_sample(self) -> tuple:
+        """Capture the blocked loop thread's stack and running handler."""
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = traceback.extract_stack(frame) if frame else traceback.StackSummary()
+
+        label = None
+        try:
+            task = asyncio.current_task(self.loop)
+        except RuntimeError:
+            task = None
+        if task is not None:
+            if hasattr(task, 'get_context'):
+                label = task.get_context().get(current_handler)
+            else:
+                # Only tasks that set the label themselves, not their children
+                label = _task_labels.get(task)
+        if label is None:
+            # Component callbacks run in their own tasks; name them after
+            # the outermost cog function on the stack
+            cog_frame = next((f for f in stack if _COGS_DIR in f.filename), None)
+            if cog_frame is not None:
+                module = os.path.splitext(cog_frame.filename.split(_COGS_DIR, 1)[1])[0]
+                label = f"{module.replace(os.sep, '.')}:{cog_frame.name}"
+            elif task is not None:
+                label = task.get_name()
+        return label or "unknown", traceback.StackSummary.from_list(stack[-STACK_DEPTH:])
+
+    def _record(self, lag: float):
+        with self._lock:
+            sample, self._sample = self._sample, None
+            label, stack = sample if sample else ("unattributed", traceback.StackSummary())
+            entry = self.blockers.setdefault(label, {'count': 0, 'total': 0.0, 'max': 0.0, 'stack': None})
+            entry['count'] += 1
+            entry['total'] += lag
+            if lag >= entry['max']:
+                entry['max'] = lag
+                entry['stack'] = stack
+        logger.warning(
+            f"Event loop blocked for {lag * 1000:.0f}ms by {label}\n"
+            f"{''.join(stack.format()) if stack else ''}"
+        )
+
+    def report(self, limit: int = 10) -> List[Dict]:
+        """Get the handlers that blocked the loop longest in total.
+
+        Args:
+            limit: Maximum number of handlers
+
+        Returns:
+            List[Dict]: Per handler: label, stall count, total and max lag
+                in seconds, and the stack of the longest stall
+        """
+        with self._lock:
+            entries = [dict(entry, label=label) for label, entry in self.blockers.items()]
+        entries.sort(key=lambda e: e['total'], reverse=True)
+        return entries[:limit]
+
+    def reset(self):
+        """Forget recorded stalls."""
+        with self._lock:
+            self.blockers.clear()
+
+
+_monitor: Optional[LoopMonitor] = None
+
+
+def start_loop_monitor(loop: asyncio.AbstractEventLoop) -> LoopMonitor:
+    """Start the shared monitor once; later calls return it."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LoopMonitor(loop)
+        _monitor.start()
+    return _monitor
+
+
+def get_loop_monitor() -> Optional[LoopMonitor]:
+    """Get the shared monitor, or None if it was never started."""
+    return _monitor
@@ -0,0 +1,124 @@
+"""
+Matching Process Pool
+
+Runs pair scoring for large guilds in a shared ProcessPoolExecutor, so the
+CPU-bound loop does not hold the calling thread's GIL. Only MatchFeatures and
+schedule tuples from match_scoring are sent to workers; Player and Schedule
+objects are not, because unpickling them builds a ZoneInfo and a ConfigLoader
+per object.
+
+Small jobs stay inline: below POOL_MIN_PAIRS the pickling and IPC cost more
+than the scoring itself.
+
+Workers are started by a forkserver rather than forked from the bot: the bot
+runs threads (the asyncio executor, boto3, the offload and monitor threads),
+and a child forked while another thread holds a lock, such as the logging
+lock, can deadlock.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.utils.match_scoring import MatchFeatures, ScheduleRecord, score_records, warm_up
+
+logger = logging.getLogger(__name__)
+
+# Seeker schedules x candidate schedules at which scoring moves to the pool
+POOL_MIN_PAIRS = 20000
+
+# Candidate schedules sent to one worker task
+CHUNK_SIZE = 5000
+
+# Modules the forkserver imports once, so workers forked from it start warm
+WORKER_PRELOAD = ['src.utils.match_scoring']
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def default_workers() -> int:
+    """Leave one CPU for the bot's event loop."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def worker_context() -> multiprocessing.context.BaseContext:
+    """Multiprocessing context for worker processes started from the bot.
+
+    Any process pool created in the bot process should use it instead of
+    the platform default, which forks on Linux.
+    """
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(WORKER_PRELOAD)
+    return context
+
+
+def get_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Get the shared scoring pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=max_workers or default_workers(),
+                                        mp_context=worker_context())
+        return _pool
+
+
+def warm_up_pool(max_workers: Optional[int] = None) -> int:
+    """Start every worker and import the scoring code before the first request.
+
+    Args:
+        max_workers: Pool size (default: one less than the CPU count)
+
+    Returns:
+        int: Number of workers started
+    """
+    workers = max_workers or default_workers()
+    pool = get_pool(workers)
+    # One task per worker forces the executor to spawn all of them
+    for future in [pool.submit(warm_up) for _ in range(workers)]:
+        future.result()
+    logger.info(f"Matching process pool warmed up with {workers} workers")
+    return workers
+
+
+def shutdown_pool():
+    """Stop the shared pool, e.g. when the bot shuts down."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def should_use_pool(seeker_schedules: int, candidate_schedules: int) -> bool:
+    """Decide between inline and pooled scoring for a job size."""
+    return seeker_schedules * candidate_schedules >= POOL_MIN_PAIRS
+
+
+def score_in_pool(seeker: MatchFeatures, seeker_schedules: List[ScheduleRecord],
+                  candidates: Dict[str, MatchFeatures], candidate_schedules: List[ScheduleRecord],
+                  weights: Sequence[float], thresholds: Dict[str, float],
+                  history: Dict[str, float], min_score: float,
+                  limit: Optional[int] = None) -> List[Tuple[float, str, str, Tuple[float, ...]]]:
+    """Score records across the pool, one chunk of candidate schedules per task.
+
+    Takes the same arguments as match_scoring.score_records and returns the
+    merged result, best first.
+    """
+    pool = get_pool()
+    futures = []
+    for offset in range(0, len(candidate_schedules), CHUNK_SIZE):
+        chunk = candidate_schedules[offset:offset + CHUNK_SIZE]
+        # Each task only needs the players that appear in its chunk
+        chunk_candidates = {s[1]: candidates[s[1]] for s in chunk if s[1] in candidates}
+        futures.append(pool.submit(
+            score_records, seeker, seeker_schedules, chunk_candidates, chunk,
+            weights, thresholds, history, min_score, limit
+        ))
+
+    results = [result for future in futures for result in future.result()]
+    results.sort(key=lambda result: result[0], reverse=True)
+    return results[:limit] if limit else results
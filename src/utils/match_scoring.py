@@ -0,0 +1,453 @@
+"""
+Match Scoring Primitives
+
+Pure functions behind TennisMatchingAlgorithm's compatibility factors. They
+work on compact records instead of Player/Schedule objects, so the same code
+runs in-process and in pool workers: records pickle cheaply, while unpickling
+a Schedule builds a ZoneInfo and a ConfigLoader.
+
+A player is reduced once to a MatchFeatures record: float NTRP, and gender,
+gender preference, skill preference and location preference as bitmasks, so
+scoring a pair is float and integer arithmetic only.
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from src.database.models.dynamodb.player import Player
+from src.database.models.dynamodb.schedule import Schedule
+
+# Gender bits; genders outside this map get no bit and only match "none"
+GENDER_BITS = {
+    'male': 1,
+    'female': 2,
+    'non_binary': 4,
+    'prefer_not_to_say': 8,
+}
+
+# Set in accepted_genders when the player has no gender preference
+NO_GENDER_PREFERENCE = 16
+
+# Skill level preference bits
+SKILL_ANY = 1
+SKILL_SIMILAR = 2
+SKILL_ABOVE = 4
+SKILL_BELOW = 8
+SKILL_BITS = {
+    'any': SKILL_ANY,
+    'similar': SKILL_SIMILAR,
+    'above': SKILL_ABOVE,
+    'below': SKILL_BELOW,
+}
+
+# Court ID -> bit in MatchFeatures.locations, shared by every guild
+_location_bits: Dict[str, int] = {}
+_location_bits_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class MatchFeatures:
+    """Everything pair scoring needs to know about a player."""
+    user_id: str
+    ntrp: float
+    gender: int
+    accepted_genders: int
+    skill_prefs: int
+    locations: int
+    engagement: float
+
+
+# (schedule_id, user_id, start_time, end_time)
+ScheduleRecord = Tuple[str, str, int, int]
+
+# Order of the factors in factor tuples and weight vectors
+FACTORS = (
+    'ntrp_compatibility',
+    'skill_preference',
+    'gender_compatibility',
+    'location_compatibility',
+    'time_overlap',
+    'engagement_bonus',
+    'match_history',
+)
+
+# Keys used for each factor in compatibility details
+DETAIL_KEYS = (
+    'ntrp_compatibility',
+    'skill_compatibility',
+    'gender_compatibility',
+    'location_compatibility',
+    'time_overlap',
+    'engagement_bonus',
+    'match_history',
+)
+
+
+def location_mask(court_ids: Iterable[str]) -> int:
+    """Bitmask of court IDs, assigning bits to new courts as they appear."""
+    mask = 0
+    for court_id in court_ids:
+        bit = _location_bits.get(court_id)
+        if bit is None:
+            with _location_bits_lock:
+                bit = _location_bits.setdefault(court_id, len(_location_bits))
+        mask |= 1 << bit
+    return mask
+
+
+def features_for(player: Player) -> MatchFeatures:
+    """Reduce a Player to its MatchFeatures.
+
+    Preferences are tested with `in` exactly as the Player-based scoring did,
+    so a string preference such as "none" behaves the same as before.
+    """
+    gender_prefs = player.preferences.get('gender', []) or []
+    accepted = NO_GENDER_PREFERENCE if 'none' in gender_prefs else 0
+    for gender, bit in GENDER_BITS.items():
+        if gender in gender_prefs:
+            accepted |= bit
+
+    skill_levels = player.preferences.get('skill_levels', []) or []
+    skill_prefs = 0
+    for level, bit in SKILL_BITS.items():
+        if level in skill_levels:
+            skill_prefs |= bit
+
+    return MatchFeatures(
+        user_id=player.user_id,
+        ntrp=float(player.ntrp_rating),
+        gender=GENDER_BITS.get(player.gender, 0),
+        accepted_genders=accepted,
+        skill_prefs=skill_prefs,
+        locations=location_mask(player.preferences.get('locations', []) or []),
+        engagement=normalized_engagement(player.engagement_score),
+    )
+
+
+def schedule_record(schedule: Schedule) -> ScheduleRecord:
+    """Flatten the fields scoring needs from a Schedule."""
+    return (schedule.schedule_id, schedule.user_id, schedule.start_time, schedule.end_time)
+
+
+def normalized_engagement(engagement_score: Any) -> float:
+    """Normalize an engagement score to 0-1 (assuming max is around 100)."""
+    return min(float(engagement_score or 0) / 100.0, 1.0)
+
+
+def ntrp_score(ntrp_diff: float, thresholds: Dict[str, float]) -> float:
+    """Calculate NTRP compatibility score."""
+    if ntrp_diff <= thresholds['excellent']:
+        return 1.0
+    elif ntrp_diff <= thresholds['good']:
+        return 0.8
+    elif ntrp_diff <= thresholds['acceptable']:
+        return 0.6
+    elif ntrp_diff <= thresholds['poor']:
+        return 0.3
+    return 0.0
+
+
+def _one_sided_skill_score(prefs: int, own: float, other: float, ntrp_diff: float) -> float:
+    if prefs & SKILL_ANY:
+        return 0.5
+    elif prefs & SKILL_SIMILAR and ntrp_diff <= 0.5:
+        return 1.0
+    elif prefs & SKILL_ABOVE and other > own:
+        return 1.0
+    elif prefs & SKILL_BELOW and other < own:
+        return 1.0
+    return 0.0
+
+
+def skill_preference_score(features1: MatchFeatures, features2: MatchFeatures) -> float:
+    """Calculate skill preference compatibility, averaged over both players."""
+    ntrp1, ntrp2 = features1.ntrp, features2.ntrp
+    ntrp_diff = abs(ntrp1 - ntrp2)
+    return (
+        _one_sided_skill_score(features1.skill_prefs, ntrp1, ntrp2, ntrp_diff) +
+        _one_sided_skill_score(features2.skill_prefs, ntrp2, ntrp1, ntrp_diff)
+    ) / 2.0
+
+
+def gender_score(features1: MatchFeatures, features2: MatchFeatures) -> float:
+    """Calculate gender compatibility."""
+    # If either player has no preference, it's compatible
+    if (features1.accepted_genders | features2.accepted_genders) & NO_GENDER_PREFERENCE:
+        return 1.0
+    first_accepted = features1.gender & features2.accepted_genders
+    second_accepted = features2.gender & features1.accepted_genders
+    # Check if preferences match
+    if first_accepted and second_accepted:
+        return 1.0
+    # Partial match
+    if first_accepted or second_accepted:
+        return 0.5
+    return 0.0
+
+
+def location_score(features1: MatchFeatures, features2: MatchFeatures) -> float:
+    """Calculate location compatibility."""
+    if features1.locations & features2.locations:
+        return 1.0
+    # Either player has no location preference
+    if not features1.locations or not features2.locations:
+        return 0.5
+    return 0.0
+
+
+def static_factors(features1: MatchFeatures, features2: MatchFeatures,
+                   thresholds: Dict[str, float]) -> Tuple[float, float, float, float, float]:
+    """Factors that depend on the two profiles only.
+
+    Returns:
+        Tuple[float, float, float, float, float]: NTRP, skill preference,
+            gender and location compatibility, and the engagement bonus
+    """
+    return (
+        ntrp_score(abs(features1.ntrp - features2.ntrp), thresholds),
+        skill_preference_score(features1, features2),
+        gender_score(features1, features2),
+        location_score(features1, features2),
+        (features1.engagement + features2.engagement) / 2.0,
+    )
+
+
+def time_overlap_score(start1: int, end1: int, start2: int, end2: int) -> float:
+    """Overlap as a fraction of the shorter schedule."""
+    overlap_start = max(start1, start2)
+    overlap_end = min(end1, end2)
+    if overlap_start >= overlap_end:
+        return 0.0
+    min_duration = min(end1 - start1, end2 - start2)
+    return (overlap_end - overlap_start) / min_duration if min_duration > 0 else 0.0
+
+
+def compile_weighted_score(weights: Sequence[float]) -> Callable[..., float]:
+    """Bind a weight vector into a function of the seven factors.
+
+    Args:
+        weights: Factor weights in FACTORS order
+
+    Returns:
+        Callable[..., float]: Function taking the factors in FACTORS order
+    """
+    w_ntrp, w_skill, w_gender, w_location, w_time, w_engagement, w_history = weights
+
+    def weighted_score(ntrp, skill, gender, location, time_overlap, engagement, history):
+        return (
+            w_ntrp * ntrp + w_skill * skill + w_gender * gender + w_location * location +
+            w_time * time_overlap + w_engagement * engagement + w_history * history
+        )
+
+    return weighted_score
+
+
+def compile_scorer(weights: Sequence[float], thresholds: Dict[str, float]) -> Callable[..., Optional[Tuple[float, Tuple[float, ...]]]]:
+    """Bind weights and NTRP thresholds into a flat pair scoring function.
+
+    This is the only pair scoring rule: pool workers call it through
+    score_records, and TennisMatchingAlgorithm._score_pair through the
+    guild's ScoringProfile.
+
+    The returned function takes (features1, features2, start1, end1, start2,
+    end2, match_history, min_score, static=None). It computes the factors
+    cheapest first and returns None as soon as the score collected so far
+    plus the most the remaining factors could add cannot beat min_score.
+    Otherwise it returns (score, factors in FACTORS order). match_history is
+    either the factor itself or a function returning it, which is only called
+    once the pair can still beat min_score, so an expensive lookup is skipped
+    for hopeless pairs. static optionally passes the pair's static_factors,
+    as memoized by the caller, instead of computing them again.
+
+    Args:
+        weights: Factor weights in FACTORS order
+        thresholds: NTRP thresholds
+
+    Returns:
+        Callable: The scoring function
+    """
+    w_ntrp, w_skill, w_gender, w_location, w_time, w_engagement, w_history = weights
+    weighted_score = compile_weighted_score(weights)
+    excellent = thresholds['excellent']
+    good = thresholds['good']
+    acceptable = thresholds['acceptable']
+    poor = thresholds['poor']
+    # Most each stage can still add, in evaluation order, history aside
+    after_ntrp = w_gender + w_location + w_engagement + w_time + w_skill
+    after_gender = after_ntrp - w_gender
+    after_location = after_gender - w_location
+    after_time = after_location - w_engagement - w_time
+
+    def score_pair(features1: MatchFeatures, features2: MatchFeatures,
+                   start1: int, end1: int, start2: int, end2: int,
+                   match_history: Union[float, Callable[[], float]],
+                   min_score: float,
+                   static: Optional[Tuple[float, ...]] = None) -> Optional[Tuple[float, Tuple[float, ...]]]:
+        if static is not None:
+            ntrp, skill, gender, location, engagement = static
+        else:
+            ntrp_diff = abs(features1.ntrp - features2.ntrp)
+            if ntrp_diff <= excellent:
+                ntrp = 1.0
+            elif ntrp_diff <= good:
+                ntrp = 0.8
+            elif ntrp_diff <= acceptable:
+                ntrp = 0.6
+            elif ntrp_diff <= poor:
+                ntrp = 0.3
+            else:
+                ntrp = 0.0
+        if callable(match_history):
+            partial, history_left = w_ntrp * ntrp, w_history
+        else:
+            partial, history_left = w_ntrp * ntrp + w_history * match_history, 0.0
+        if partial + after_ntrp + history_left <= min_score:
+            return None
+
+        if static is None:
+            gender = gender_score(features1, features2)
+        partial += w_gender * gender
+        if partial + after_gender + history_left <= min_score:
+            return None
+
+        if static is None:
+            location = location_score(features1, features2)
+        partial += w_location * location
+        if partial + after_location + history_left <= min_score:
+            return None
+
+        if static is None:
+            engagement = (features1.engagement + features2.engagement) / 2.0
+        time_overlap = time_overlap_score(start1, end1, start2, end2)
+        partial += w_engagement * engagement + w_time * time_overlap
+        if partial + after_time + history_left <= min_score:
+            return None
+
+        if static is None:
+            skill = skill_preference_score(features1, features2)
+        if callable(match_history):
+            if partial + w_skill * skill + history_left <= min_score:
+                return None
+            match_history = match_history()
+        factors = (ntrp, skill, gender, location, time_overlap, engagement, match_history)
+        # Summed in FACTORS order so every code path yields identical scores
+        score = weighted_score(*factors)
+        return (score, factors) if score > min_score else None
+
+    return score_pair
+
+
+def compatibility_details(factors: Sequence[float], overall_score: float) -> Dict[str, Any]:
+    """Build the compatibility details dict (factor scores and reasons)."""
+    (ntrp_compatibility, skill_compatibility, gender_compatibility,
+     location_compatibility, time_overlap, engagement_bonus, match_history) = factors
+    reasons: List[str] = []
+
+    if ntrp_compatibility > 0.8:
+        reasons.append("Excellent skill level match")
+    elif ntrp_compatibility > 0.6:
+        reasons.append("Good skill level match")
+
+    if skill_compatibility > 0.8:
+        reasons.append("Matches skill preferences")
+
+    if gender_compatibility > 0.8:
+        reasons.append("Matches gender preferences")
+
+    if location_compatibility > 0.8:
+        reasons.append("Same preferred location")
+
+    if time_overlap > 0.9:
+        reasons.append("Perfect time overlap")
+
+    if engagement_bonus > 0.5:
+        reasons.append("High engagement players")
+
+    if match_history > 0.5:
+        reasons.append("Previous match history")
+
+    details: Dict[str, Any] = {'overall_score': overall_score}
+    details.update(zip(DETAIL_KEYS, factors))
+    details['reasons'] = reasons
+    return details
+
+
+def group_details(overall_score: float, best_ntrp_compatibility: float) -> Dict[str, Any]:
+    """Build the compatibility details dict of a doubles group."""
+    reasons: List[str] = []
+    if overall_score > 0.6:
+        reasons.append("Good overall group compatibility")
+    if best_ntrp_compatibility > 0.8:
+        reasons.append("Balanced skill levels")
+    return {'overall_score': overall_score, 'reasons': reasons}
+
+
+class PairScore(NamedTuple):
+    """Score of a singles pair, with the factors to explain it later."""
+    overall_score: float
+    factors: Tuple[float, ...]  # In FACTORS order
+
+    def details(self) -> Dict[str, Any]:
+        return compatibility_details(self.factors, self.overall_score)
+
+
+class GroupScore(NamedTuple):
+    """Score of a doubles group, with what is needed to explain it later."""
+    overall_score: float
+    best_ntrp_compatibility: float  # Highest NTRP factor among the six pairs
+
+    def details(self) -> Dict[str, Any]:
+        return group_details(self.overall_score, self.best_ntrp_compatibility)
+
+
+def score_records(seeker: MatchFeatures, seeker_schedules: List[ScheduleRecord],
+                  candidates: Dict[str, MatchFeatures], candidate_schedules: List[ScheduleRecord],
+                  weights: Sequence[float], thresholds: Dict[str, float],
+                  history: Dict[str, float], min_score: float,
+                  limit: Optional[int] = None) -> List[Tuple[float, str, str, Tuple[float, ...]]]:
+    """Score every overlapping seeker/candidate schedule pair.
+
+    This is the pool worker entry point, so it only takes feature records
+    and plain tuples, dicts and strings.
+
+    Args:
+        seeker: The searching player's features
+        seeker_schedules: The searching player's schedules
+        candidates: Candidate features keyed by user ID
+        candidate_schedules: Candidate schedules
+        weights: Factor weights in FACTORS order
+        thresholds: NTRP thresholds
+        history: Match history factor per candidate user ID
+        min_score: Pairs must score above this
+        limit: Optional number of best pairs to return
+
+    Returns:
+        List[Tuple[float, str, str, Tuple[float, ...]]]: (score, seeker schedule
+            ID, candidate schedule ID, factors), best first
+    """
+    score_pair = compile_scorer(weights, thresholds)
+    results = []
+    for seeker_schedule in seeker_schedules:
+        start, end = seeker_schedule[2], seeker_schedule[3]
+        for other_schedule in candidate_schedules:
+            # Same overlap rule as Schedule.overlaps_with
+            if not (start <= other_schedule[2] < end or other_schedule[2] <= start < other_schedule[3]):
+                continue
+            other = candidates.get(other_schedule[1])
+            if other is None:
+                continue
+            scored = score_pair(
+                seeker, other, start, end, other_schedule[2], other_schedule[3],
+                history.get(other.user_id, 0.0), min_score
+            )
+            if scored is not None:
+                results.append((scored[0], seeker_schedule[0], other_schedule[0], scored[1]))
+
+    results.sort(key=lambda result: result[0], reverse=True)
+    return results[:limit] if limit else results
+
+
+def warm_up() -> bool:
+    """No-op task run once per pool worker so imports happen before real work."""
+    return True
@@ -10,11 +10,16 @@ This module implements a sophisticated matching algorithm that considers:
 - Match history and engagement
 """
 
+import heapq
+import itertools
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterator, Iterable
 from decimal import Decimal
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from zoneinfo import ZoneInfo
 
 from src.database.dao.dynamodb.player_dao import PlayerDAO
@@ -26,6 +31,14 @@ from src.database.models.dynamodb.schedule import Schedule
 from src.database.models.dynamodb.court import Court
 from src.database.models.dynamodb.match import Match
 from src.utils.config_loader import ConfigLoader
+from src.utils.candidate_index import CandidateIndex
+from src.utils.suggestion_store import SuggestionStore
+from src.utils.court_assignment import CourtAssigner, CourtSession
+from src.utils import match_pool
+from src.utils import match_scoring
+from src.utils.match_scoring import PairScore, GroupScore
+from src.utils.occurrences import expand_schedules, next_occurrence
+from src.utils.scoring_profile import ScoringProfile
 
 logger = logging.getLogger(__name__)
 
@@ -48,16 +61,147 @@ class MatchCandidate:
 
 @dataclass
 class MatchSuggestion:
-    """Represents a suggested match between players."""
+    """Represents a suggested match between players.
+    
+    Factor scores and reasons are built from `score` the first time
+    compatibility_details or reasons is read, i.e. when the suggestion is
+    rendered, so suggestions that are never shown cost no strings or dicts.
+    """
     players: List[Player]
     schedules: List[Schedule]
     suggested_court: Optional[Court]
     suggested_time: Tuple[int, int]  # (start_time, end_time)
     overall_score: float
     match_type: str  # "singles" or "doubles"
-    compatibility_details: Dict[str, float]
-    reasons: List[str]
     guild_id: str  # Discord server ID
+    score: Optional[Any] = None  # PairScore or GroupScore the suggestion was ranked by
+    extra_reasons: List[str] = field(default_factory=list)  # Shown after the factor reasons
+    
+    @cached_property
+    def compatibility_details(self) -> Dict[str, Any]:
+        """Factor scores, overall score and reasons."""
+        details = self.score.details() if self.score is not None else {'reasons': []}
+        details['overall_score'] = self.overall_score
+        details['reasons'] = details['reasons'] + self.extra_reasons
+        return details
+    
+    @property
+    def reasons(self) -> List[str]:
+        return self.compatibility_details['reasons']
+
+
+class MatchSearchResult(list):
+    """Match suggestions, best first, from a search that may have been cut short.
+    
+    Attributes:
+        more_available: True when the search ran out of time before scoring
+            every schedule, so repeating it can find further matches
+    """
+    
+    def __init__(self, suggestions: Iterable[MatchSuggestion] = (), more_available: bool = False):
+        super().__init__(suggestions)
+        self.more_available = more_available
+
+
+@dataclass
+class _RankedCandidate:
+    """A scored match candidate that has not been enriched yet."""
+    score: float
+    match_type: str  # "singles" or "doubles"
+    players: List[Player]
+    schedules: List[Schedule]
+    compatibility: Any  # PairScore or GroupScore
+
+
+class _TopK:
+    """Bounded min-heap keeping the k highest scoring items.
+    
+    Ties keep the item that was pushed first, matching the order a stable
+    sort over the full candidate list would produce.
+    """
+    
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+    
+    def __len__(self) -> int:
+        return len(self._heap)
+    
+    @property
+    def floor(self) -> float:
+        """Score a new item has to beat to enter the heap."""
+        if len(self._heap) < self.k:
+            return float('-inf')
+        return self._heap[0][0]
+    
+    def push(self, score: float, item: Any) -> bool:
+        """Offer an item to the heap.
+        
+        Returns:
+            bool: True if the item was kept
+        """
+        entry = (score, -next(self._counter), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if score > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+    
+    def ranked(self) -> List[Any]:
+        """Return the kept items, best first."""
+        return [entry[2] for entry in sorted(self._heap, reverse=True)]
+
+
+class _LRUCache:
+    """Mapping that evicts the least recently used entry when full.
+    
+    Individual OrderedDict operations are atomic under the GIL, which is all
+    a memo needs: a lost race only costs a recomputation.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key: Any) -> Optional[Any]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass
+        self.hits += 1
+        return value
+    
+    def put(self, key: Any, value: Any):
+        self._data[key] = value
+        if len(self._data) > self.maxsize:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:
+                pass
+    
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Static pair factors shared by all algorithm instances (see _get_static_pair_factors)
+_static_pair_factors = _LRUCache(maxsize=50000)
+
+# MatchFeatures per player profile version (see _get_features)
+_player_features = _LRUCache(maxsize=50000)
 
 
 class TennisMatchingAlgorithm:
@@ -77,92 +221,108 @@ class TennisMatchingAlgorithm:
         self.schedule_dao = schedule_dao
         self.court_dao = court_dao
         self.match_dao = match_dao
+        self.court_assigner = CourtAssigner(court_dao, match_dao)
         config_loader = ConfigLoader()
         self.timezone = config_loader.get_timezone()
         
-        # Configuration weights for different factors
-        self.weights = {
-            'ntrp_compatibility': 0.25,
-            'skill_preference': 0.20,
-            'gender_compatibility': 0.15,
-            'location_compatibility': 0.15,
-            'time_overlap': 0.15,
-            'engagement_bonus': 0.05,
-            'match_history': 0.05
-        }
-        
-        # NTRP compatibility thresholds
-        self.ntrp_thresholds = {
-            'excellent': 0.5,  # Within 0.5 rating
-            'good': 1.0,       # Within 1.0 rating
-            'acceptable': 1.5,  # Within 1.5 rating
-            'poor': 2.0        # Within 2.0 rating
-        }
+        # Weights, NTRP thresholds and score cut-offs are per guild, see
+        # _scoring_profile
         
-        # Skill level preference mappings
-        self.skill_level_ranges = {
-            'similar': 0.5,    # ±0.5 NTRP
-            'above': 1.0,      # +1.0 NTRP
-            'below': 1.0,      # -1.0 NTRP
-            'any': 2.0         # Any level
-        }
+        # Number of suggestions returned by the public find_* methods
+        self.max_suggestions = 10
     
     def find_matches_for_player(self, guild_id: str, user_id: str, 
-                               hours_ahead: int = 168) -> List[MatchSuggestion]:
+                               hours_ahead: int = 168,
+                               deadline: Optional[float] = None) -> MatchSearchResult:
         """Find potential matches for a specific player.
         
+        Pair scores come from the guild's SuggestionStore. They are only
+        computed here when the player's entry is missing or stale; otherwise
+        this is a read of precomputed candidates. Court lookup, match time and
+        existing match status are resolved for the final top-k only.
+        
+        With a deadline the search is anytime: the player's schedules are
+        scored soonest first, and once the deadline passes the best matches
+        found so far are returned with more_available set. Schedules scored
+        before the cut-off are kept, so a repeated search picks up where the
+        previous one stopped.
+        
         Args:
             guild_id: Discord server ID
             user_id: Discord user ID
             hours_ahead: Number of hours to look ahead (default: 1 week)
+            deadline: Optional time.monotonic() value to stop scoring at. At
+                least one schedule is scored however early it is.
             
         Returns:
-            List[MatchSuggestion]: List of potential matches
+            MatchSearchResult: List of potential matches
         """
         try:
             # Get the player
             player = self.player_dao.get_player(guild_id, user_id)
             if not player:
                 logger.warning(f"Player {user_id} not found in guild {guild_id}")
-                return []
+                return MatchSearchResult()
             
-            # Get player's schedules
-            player_schedules = self.schedule_dao.get_user_schedules(guild_id, user_id)
-            if not player_schedules:
-                logger.info(f"No schedules found for player {user_id}")
-                return []
-            
-            # Get all available schedules in the time range
             now = int(datetime.now(self.timezone).timestamp())
             end_time = now + (hours_ahead * 3600)
             
-            available_schedules = self.schedule_dao.get_overlapping_schedules(
-                guild_id, now, end_time, exclude_user_id=user_id
+            # Get player's schedules, with recurring ones expanded into their
+            # occurrences in the time range
+            player_schedules = expand_schedules(
+                self.schedule_dao.get_user_schedules(guild_id, user_id), now, end_time
             )
+            if not player_schedules:
+                logger.info(f"No schedules found for player {user_id}")
+                return MatchSearchResult()
             
-            if not available_schedules:
-                logger.info("No other players available in the time range")
-                return []
-            
-            # Get all players for the available schedules
-            all_players = self._get_players_for_schedules(guild_id, available_schedules)
-            
-            # Find matches for each of the player's schedules
-            all_suggestions = []
+            store = self._open_store(guild_id)
+            self._refresh_dirty_players(guild_id, store)
             
-            for player_schedule in player_schedules:
-                suggestions = self._find_matches_for_schedule(
-                    player, player_schedule, available_schedules, all_players
+            scored_schedules = player_schedules
+            more_available = False
+            if not store.is_user_fresh(user_id, player_schedules, hours_ahead):
+                # Get all available schedules in the time range
+                available_schedules = self.schedule_dao.get_overlapping_schedules(
+                    guild_id, now, end_time, exclude_user_id=user_id
                 )
-                all_suggestions.extend(suggestions)
+                
+                if not available_schedules:
+                    logger.info("No other players available in the time range")
+                    return MatchSearchResult()
+                
+                # Get all players for the available schedules
+                all_players = self._get_players_for_schedules(guild_id, available_schedules)
+                eligible = self._get_eligible_candidates(guild_id, player, all_players)
+                store.add_players(all_players.values())
+                
+                if deadline is not None:
+                    scored_schedules = self._score_schedules_until(
+                        guild_id, store, player, player_schedules, available_schedules,
+                        all_players, eligible, hours_ahead, deadline
+                    )
+                    more_available = len(scored_schedules) < len(player_schedules)
+                elif match_pool.should_use_pool(len(player_schedules), len(available_schedules)):
+                    self._score_schedules_pooled(
+                        guild_id, store, player, player_schedules, available_schedules,
+                        all_players, eligible
+                    )
+                else:
+                    for player_schedule in player_schedules:
+                        self._score_schedule(
+                            store, player, player_schedule, available_schedules,
+                            all_players, eligible
+                        )
+                if not more_available:
+                    store.mark_user_seeded(user_id, player_schedules, hours_ahead)
             
-            # Sort by overall score and return top suggestions
-            all_suggestions.sort(key=lambda x: x.overall_score, reverse=True)
-            return all_suggestions[:10]  # Return top 10 suggestions
+            store.add_players([player])
+            candidates = self._read_candidates(store, player, scored_schedules, now, end_time)
+            return MatchSearchResult(self._build_suggestions(candidates), more_available)
             
         except Exception as e:
             logger.error(f"Error finding matches for player {user_id}: {e}")
-            return []
+            return MatchSearchResult()
     
     def find_matches_for_schedule(self, guild_id: str, schedule_id: str) -> List[MatchSuggestion]:
         """Find potential matches for a specific schedule.
@@ -175,8 +335,10 @@ class TennisMatchingAlgorithm:
             List[MatchSuggestion]: List of potential matches
         """
         try:
-            # Get the schedule
+            # Get the schedule, or the next occurrence of a recurring one
             schedule = self.schedule_dao.get_schedule(guild_id, schedule_id)
+            if schedule:
+                schedule = next_occurrence(schedule, int(datetime.now(self.timezone).timestamp()))
             if not schedule:
                 logger.warning(f"Schedule {schedule_id} not found")
                 return []
@@ -187,134 +349,344 @@ class TennisMatchingAlgorithm:
                 logger.warning(f"Player {schedule.user_id} not found")
                 return []
             
-            # Get overlapping schedules
-            overlapping_schedules = self.schedule_dao.get_overlapping_schedules(
-                guild_id, schedule.start_time, schedule.end_time, 
-                exclude_user_id=schedule.user_id
-            )
-            
-            if not overlapping_schedules:
-                logger.info("No overlapping schedules found")
-                return []
+            store = self._open_store(guild_id)
+            self._refresh_dirty_players(guild_id, store)
             
-            # Get all players for the overlapping schedules
-            all_players = self._get_players_for_schedules(guild_id, overlapping_schedules)
+            if not store.is_schedule_fresh(schedule.schedule_id):
+                if not self._seed_schedule(guild_id, store, player, schedule):
+                    logger.info("No overlapping schedules found")
+                    return []
             
-            # Find matches
-            suggestions = self._find_matches_for_schedule(
-                player, schedule, overlapping_schedules, all_players
+            store.add_players([player])
+            candidates = self._read_candidates(
+                store, player, [schedule], schedule.start_time, schedule.end_time
             )
-            
-            # Sort by overall score
-            suggestions.sort(key=lambda x: x.overall_score, reverse=True)
-            return suggestions[:10]
+            return self._build_suggestions(candidates)
             
         except Exception as e:
             logger.error(f"Error finding matches for schedule {schedule_id}: {e}")
             return []
     
+    def on_schedule_created(self, guild_id: str, schedule: Schedule):
+        """Score the pairs touching a new schedule into the suggestion store.
+        
+        A recurring schedule is scored for each of its occurrences in the
+        next week.
+        
+        Args:
+            guild_id: Discord server ID
+            schedule: The newly created schedule
+        """
+        try:
+            player = self.player_dao.get_player(guild_id, schedule.user_id)
+            if not player:
+                return
+            store = self._open_store(guild_id)
+            store.add_players([player])
+            now = int(datetime.now(self.timezone).timestamp())
+            for occurrence in expand_schedules([schedule], now, now + 168 * 3600):
+                self._seed_schedule(guild_id, store, player, occurrence)
+        except Exception as e:
+            logger.error(f"Error updating suggestions for schedule {schedule.schedule_id}: {e}",
+                         exc_info=True)
+    
+    def on_schedules_cancelled(self, guild_id: str, user_id: str, start_time: int, end_time: int):
+        """Drop a user's cancelled schedules from the suggestion store.
+        
+        Args:
+            guild_id: Discord server ID
+            user_id: Discord user ID
+            start_time: Start of the cancelled range (Unix timestamp)
+            end_time: End of the cancelled range (Unix timestamp)
+        """
+        SuggestionStore.for_guild(guild_id).remove_user_schedules_in_range(
+            str(user_id), start_time, end_time
+        )
+    
+    def _open_store(self, guild_id: str) -> SuggestionStore:
+        """Get the guild's suggestion store, without ended schedules or stale scores."""
+        store = SuggestionStore.for_guild(guild_id)
+        store.sync_profile_version(self._scoring_profile(guild_id).version)
+        store.drop_ended(time.time())
+        return store
+    
+    def _seed_schedule(self, guild_id: str, store: SuggestionStore,
+                       player: Player, schedule: Schedule) -> bool:
+        """Score a single schedule against everything overlapping it.
+        
+        Returns:
+            bool: False if nothing overlaps the schedule
+        """
+        overlapping_schedules = self.schedule_dao.get_overlapping_schedules(
+            guild_id, schedule.start_time, schedule.end_time,
+            exclude_user_id=schedule.user_id
+        )
+        if not overlapping_schedules:
+            store.begin_schedule(schedule, [])
+            return False
+        
+        # Players already in the store do not need another lookup
+        all_players = {
+            s.user_id: store.players[s.user_id]
+            for s in overlapping_schedules if s.user_id in store.players
+        }
+        missing = [s for s in overlapping_schedules if s.user_id not in all_players]
+        all_players.update(self._get_players_for_schedules(guild_id, missing))
+        store.add_players(all_players.values())
+        
+        eligible = self._get_eligible_candidates(guild_id, player, all_players)
+        self._score_schedule(store, player, schedule, overlapping_schedules, all_players, eligible)
+        return True
+    
+    def _score_schedule(self, store: SuggestionStore, player: Player, player_schedule: Schedule,
+                        available_schedules: List[Schedule], all_players: Dict[str, Player],
+                        eligible: Optional[Set[str]]):
+        """Replace a schedule's stored candidates with freshly scored ones."""
+        neighbours = [
+            s for s in available_schedules
+            if s.user_id != player.user_id and s.overlaps_with(player_schedule)
+        ]
+        store.begin_schedule(player_schedule, neighbours)
+        
+        for candidate in self._find_matches_for_schedule(
+            player, player_schedule, available_schedules, all_players, eligible
+        ):
+            if candidate.match_type == "singles":
+                store.set_pair(
+                    player_schedule.schedule_id, candidate.schedules[1].schedule_id,
+                    candidate.compatibility
+                )
+            else:
+                store.add_doubles(player_schedule.schedule_id, candidate)
+    
+    def _score_schedules_until(self, guild_id: str, store: SuggestionStore, player: Player,
+                               player_schedules: List[Schedule],
+                               available_schedules: List[Schedule],
+                               all_players: Dict[str, Player], eligible: Optional[Set[str]],
+                               hours_ahead: int, deadline: float) -> List[Schedule]:
+        """Score a player's schedules soonest first until a deadline passes.
+        
+        Schedules already scored by an earlier search that ran out of time
+        are not scored again.
+        
+        Returns:
+            List[Schedule]: The schedules whose pairs are now in the store
+        """
+        searched = store.searched_schedules(player.user_id, hours_ahead)
+        scored = [s for s in player_schedules if s.schedule_id in searched]
+        remaining = sorted(
+            (s for s in player_schedules if s.schedule_id not in searched),
+            key=lambda s: s.start_time
+        )
+        use_pool = match_pool.should_use_pool(1, len(available_schedules))
+        history_lookup = self._build_match_history_lookup(guild_id) if use_pool else None
+        
+        # Every call scores at least one schedule, so repeated searches always progress
+        for i, player_schedule in enumerate(remaining):
+            if i and time.monotonic() >= deadline:
+                logger.info(
+                    f"Match search for {player.user_id} stopped at its deadline with "
+                    f"{len(player_schedules) - len(scored)} schedules left"
+                )
+                break
+            if use_pool:
+                self._score_schedules_pooled(
+                    guild_id, store, player, [player_schedule], available_schedules,
+                    all_players, eligible, history_lookup
+                )
+            else:
+                self._score_schedule(
+                    store, player, player_schedule, available_schedules, all_players, eligible
+                )
+            store.mark_schedule_searched(player.user_id, hours_ahead, player_schedule.schedule_id)
+            scored.append(player_schedule)
+        return scored
+    
+    def _score_schedules_pooled(self, guild_id: str, store: SuggestionStore, player: Player,
+                                player_schedules: List[Schedule],
+                                available_schedules: List[Schedule],
+                                all_players: Dict[str, Player], eligible: Optional[Set[str]],
+                                history_lookup: Optional[Dict[frozenset, float]] = None):
+        """Score all of a player's schedules in the matching process pool.
+        
+        Singles are scored by the workers from compact records, with match
+        history taken from a single guild-wide lookup as batch matchmaking
+        does. Doubles need only a few candidates per schedule and stay inline.
+        """
+        for player_schedule in player_schedules:
+            store.begin_schedule(player_schedule, [
+                s for s in available_schedules
+                if s.user_id != player.user_id and s.overlaps_with(player_schedule)
+            ])
+        
+        candidates = {
+            user_id: self._get_features(other)
+            for user_id, other in all_players.items()
+            if user_id != player.user_id and (eligible is None or user_id in eligible)
+        }
+        profile = self._scoring_profile(guild_id)
+        if history_lookup is None:
+            history_lookup = self._build_match_history_lookup(guild_id)
+        history = {
+            user_id: history_lookup.get(frozenset((player.user_id, user_id)), 0.0)
+            for user_id in candidates
+        }
+        results = match_pool.score_in_pool(
+            self._get_features(player),
+            [match_scoring.schedule_record(s) for s in player_schedules],
+            candidates,
+            [match_scoring.schedule_record(s) for s in available_schedules if s.user_id in candidates],
+            profile.weight_vector, profile.ntrp_thresholds, history,
+            min_score=profile.min_singles_score
+        )
+        for score, schedule_id, other_id, factors in results:
+            store.set_pair(schedule_id, other_id, PairScore(score, factors))
+        
+        for player_schedule in player_schedules:
+            for group in self._group_schedules_by_overlap(player_schedule, available_schedules):
+                if len(group) >= 3:
+                    for candidate in self._find_doubles_matches(
+                        player, player_schedule, group, all_players
+                    ):
+                        store.add_doubles(player_schedule.schedule_id, candidate)
+        
+        logger.info(f"Scored {len(results)} pairs for {player.user_id} in the matching pool")
+    
+    def _refresh_dirty_players(self, guild_id: str, store: SuggestionStore):
+        """Re-score only the stored pairs touching players whose profile changed."""
+        dirty = store.pop_dirty_players()
+        if not dirty:
+            return
+        
+        index = CandidateIndex.for_guild(guild_id)
+        min_score = self._scoring_profile(guild_id).min_singles_score
+        for user_id in dirty:
+            player = self.player_dao.get_player(guild_id, user_id)
+            if not player:
+                continue
+            store.add_players([player])
+            index.upsert(player)
+            store.drop_doubles_with_player(user_id)
+            
+            for schedule in store.schedules_for_user(user_id):
+                neighbours = store.neighbours_of(schedule.schedule_id)
+                for other in neighbours:
+                    other_player = store.players.get(other.user_id)
+                    if not other_player:
+                        continue
+                    compatibility = None
+                    if index.is_compatible(user_id, other.user_id):
+                        compatibility = self._score_pair(
+                            player, other_player, schedule, other, min_score=min_score
+                        )
+                    if compatibility and compatibility.overall_score <= min_score:
+                        compatibility = None
+                    store.set_pair(schedule.schedule_id, other.schedule_id, compatibility)
+                
+                for group in self._group_schedules_by_overlap(schedule, neighbours):
+                    if len(group) >= 3:
+                        for candidate in self._find_doubles_matches(
+                            player, schedule, group, store.players
+                        ):
+                            store.add_doubles(schedule.schedule_id, candidate)
+            
+            logger.info(f"Re-scored stored suggestions for updated player {user_id}")
+    
+    def _read_candidates(self, store: SuggestionStore, player: Player,
+                         player_schedules: List[Schedule], window_start: int,
+                         window_end: int) -> List['_RankedCandidate']:
+        """Select the top-k stored candidates for some of a player's schedules."""
+        top_candidates = _TopK(self.max_suggestions)
+        
+        def in_window(schedule: Schedule) -> bool:
+            return schedule.start_time <= window_end and schedule.end_time >= window_start
+        
+        for player_schedule in player_schedules:
+            for other, compatibility in store.pairs_for(player_schedule.schedule_id):
+                other_player = store.players.get(other.user_id)
+                if not other_player or not in_window(other):
+                    continue
+                top_candidates.push(compatibility.overall_score, _RankedCandidate(
+                    score=compatibility.overall_score,
+                    match_type="singles",
+                    players=[player, other_player],
+                    schedules=[player_schedule, other],
+                    compatibility=compatibility
+                ))
+            
+            for candidate in store.doubles_for(player_schedule.schedule_id):
+                if all(in_window(s) for s in candidate.schedules[1:]):
+                    top_candidates.push(candidate.score, candidate)
+        
+        return top_candidates.ranked()
+    
     def _find_matches_for_schedule(self, player: Player, player_schedule: Schedule,
                                   available_schedules: List[Schedule], 
-                                  all_players: Dict[str, Player]) -> List[MatchSuggestion]:
-        """Find matches for a specific schedule."""
-        suggestions = []
+                                  all_players: Dict[str, Player],
+                                  eligible: Optional[Set[str]] = None) -> Iterator['_RankedCandidate']:
+        """Yield every scored match candidate above the threshold for a schedule.
         
+        All of them are kept in the suggestion store, which serves later
+        searches over other windows, so candidates are not pruned against
+        the current top-k.
+        """
         # Group schedules by time overlap
         overlapping_groups = self._group_schedules_by_overlap(player_schedule, available_schedules)
         
         for group in overlapping_groups:
             # Find singles matches (2 players)
-            singles_suggestions = self._find_singles_matches(
-                player, player_schedule, group, all_players
+            yield from self._find_singles_matches(
+                player, player_schedule, group, all_players, eligible
             )
-            suggestions.extend(singles_suggestions)
             
             # Find doubles matches (4 players) if we have enough players
             if len(group) >= 3:  # Need at least 3 other players
-                doubles_suggestions = self._find_doubles_matches(
+                yield from self._find_doubles_matches(
                     player, player_schedule, group, all_players
                 )
-                suggestions.extend(doubles_suggestions)
-        
-        return suggestions
     
     def _find_singles_matches(self, player: Player, player_schedule: Schedule,
                              schedules: List[Schedule], 
-                             all_players: Dict[str, Player]) -> List[MatchSuggestion]:
-        """Find singles matches (2 players)."""
-        suggestions = []
-        
+                             all_players: Dict[str, Player],
+                             eligible: Optional[Set[str]] = None) -> Iterator['_RankedCandidate']:
+        """Yield singles candidates (2 players) that clear the minimum threshold."""
+        min_score = self._scoring_profile(player.guild_id).min_singles_score
         for schedule in schedules:
             if schedule.user_id == player.user_id:
                 continue
             
+            # Hard-incompatible candidates were pruned by the candidate index
+            if eligible is not None and schedule.user_id not in eligible:
+                continue
+            
             other_player = all_players.get(schedule.user_id)
             if not other_player:
                 continue
             
-            # Calculate compatibility
-            compatibility = self._calculate_compatibility(player, other_player, 
-                                                        player_schedule, schedule)
+            # Candidates below the threshold are rejected before the match
+            # history lookup
+            compatibility = self._score_pair(
+                player, other_player, player_schedule, schedule, min_score=min_score
+            )
             
-            if compatibility['overall_score'] > 0.3:  # Minimum threshold
-                # Find best court
-                suggested_court = self._find_best_court(player, other_player, 
-                                                      player_schedule, schedule)
-                
-                # Determine match time
-                match_start, match_end = self._find_optimal_match_time(
-                    player_schedule, schedule
-                )
-                
-                # Check if there's already a match request between these players
-                player_ids = [player.user_id, other_player.user_id]
-                existing_status = self.match_dao.get_existing_match_status(
-                    player.guild_id, player_ids, match_start, match_end
-                )
-                
-                if existing_status:
-                    if existing_status == "scheduled":
-                        # Match has been accepted
-                        compatibility['reasons'].append("✅ Match already accepted and scheduled")
-                        # Keep the score but mark as accepted
-                        compatibility['overall_score'] *= 0.8
-                    elif existing_status == "pending_confirmation":
-                        # Match request is pending
-                        compatibility['reasons'].append("⏳ Match request pending confirmation")
-                        # Reduce the score to make it less attractive
-                        compatibility['overall_score'] *= 0.5
-                    elif existing_status == "recently_cancelled":
-                        # Match was recently declined
-                        compatibility['reasons'].append("❌ Match request recently declined")
-                        # Reduce the score significantly
-                        compatibility['overall_score'] *= 0.3
-                
-                suggestion = MatchSuggestion(
+            if compatibility and compatibility.overall_score > min_score:
+                yield _RankedCandidate(
+                    score=compatibility.overall_score,
+                    match_type="singles",
                     players=[player, other_player],
                     schedules=[player_schedule, schedule],
-                    suggested_court=suggested_court,
-                    suggested_time=(match_start, match_end),
-                    overall_score=compatibility['overall_score'],
-                    match_type="singles",
-                    compatibility_details=compatibility,
-                    reasons=compatibility['reasons'],
-                    guild_id=player.guild_id
+                    compatibility=compatibility
                 )
-                suggestions.append(suggestion)
-        
-        return suggestions
     
     def _find_doubles_matches(self, player: Player, player_schedule: Schedule,
                              schedules: List[Schedule], 
-                             all_players: Dict[str, Player]) -> List[MatchSuggestion]:
-        """Find doubles matches (4 players)."""
-        suggestions = []
-        
+                             all_players: Dict[str, Player]) -> Iterator['_RankedCandidate']:
+        """Yield doubles candidates (4 players) that clear the minimum threshold."""
         # Get all possible combinations of 3 other players
         other_schedules = [s for s in schedules if s.user_id != player.user_id]
         
         if len(other_schedules) < 3:
-            return suggestions
+            return
         
         # Simple approach: take the first 3 compatible players
         # In a production system, you might want to try different combinations
@@ -327,225 +699,236 @@ class TennisMatchingAlgorithm:
                 selected_players.append(other_player)
         
         if len(selected_players) < 3:
-            return suggestions
+            return
         
         # Calculate overall compatibility for the group
         compatibility = self._calculate_group_compatibility(
             [player] + selected_players, [player_schedule] + selected_schedules
         )
         
-        if compatibility['overall_score'] > 0.25:  # Lower threshold for doubles
-            # Find best court
-            suggested_court = self._find_best_court_for_group(
-                [player] + selected_players, [player_schedule] + selected_schedules
-            )
-            
-            # Determine match time
-            all_schedules = [player_schedule] + selected_schedules
-            match_start, match_end = self._find_optimal_group_match_time(all_schedules)
-            
-            suggestion = MatchSuggestion(
+        if compatibility.overall_score > self._scoring_profile(player.guild_id).min_doubles_score:
+            yield _RankedCandidate(
+                score=compatibility.overall_score,
+                match_type="doubles",
                 players=[player] + selected_players,
                 schedules=[player_schedule] + selected_schedules,
-                suggested_court=suggested_court,
-                suggested_time=(match_start, match_end),
-                overall_score=compatibility['overall_score'],
-                match_type="doubles",
-                compatibility_details=compatibility,
-                reasons=compatibility['reasons'],
-                guild_id=player.guild_id
+                compatibility=compatibility
             )
-            suggestions.append(suggestion)
-        
-        return suggestions
     
-    def _calculate_compatibility(self, player1: Player, player2: Player,
-                               schedule1: Schedule, schedule2: Schedule) -> Dict[str, Any]:
-        """Calculate compatibility between two players."""
-        reasons = []
+    def _build_suggestions(self, candidates: List['_RankedCandidate']) -> List[MatchSuggestion]:
+        """Enrich the selected candidates into ranked match suggestions.
         
-        # NTRP compatibility
-        ntrp_diff = abs(float(player1.ntrp_rating) - float(player2.ntrp_rating))
-        ntrp_compatibility = self._calculate_ntrp_compatibility(ntrp_diff)
+        This is the only place courts, match times and existing match status
+        are resolved, so the DAO cost is proportional to the number of
+        suggestions returned rather than the number of candidates scored.
+        """
+        if not candidates:
+            return []
         
-        # Skill preference compatibility
-        skill_compatibility = self._calculate_skill_preference_compatibility(
-            player1, player2
+        # Court occupancy for every candidate is loaded in one go
+        courts = self.court_assigner.session(
+            min(s.start_time for c in candidates for s in c.schedules),
+            max(s.end_time for c in candidates for s in c.schedules)
         )
-        
-        # Gender compatibility
-        gender_compatibility = self._calculate_gender_compatibility(player1, player2)
-        
-        # Location compatibility
-        location_compatibility = self._calculate_location_compatibility(
-            player1, player2, schedule1, schedule2
+        suggestions = [self._build_suggestion(candidate, courts) for candidate in candidates]
+        # Existing match status can lower a score, so re-rank after enrichment
+        suggestions.sort(key=lambda x: x.overall_score, reverse=True)
+        return suggestions
+    
+    def _build_suggestion(self, candidate: '_RankedCandidate',
+                          courts: CourtSession) -> MatchSuggestion:
+        """Resolve court, time and match status for a single candidate."""
+        overall_score = candidate.compatibility.overall_score
+        extra_reasons = []
+        players = candidate.players
+        schedules = candidate.schedules
+        
+        if candidate.match_type == "doubles":
+            match_start, match_end = self._find_optimal_group_match_time(schedules)
+            suggested_court = courts.assign(players, match_start, match_end)
+        else:
+            player, other_player = players
+            player_schedule, schedule = schedules
+            
+            # Determine match time
+            match_start, match_end = self._find_optimal_match_time(
+                player_schedule, schedule
+            )
+            
+            # Find the preferred court with free capacity at that time
+            suggested_court = courts.assign(players, match_start, match_end)
+            
+            # Check if there's already a match request between these players
+            player_ids = [player.user_id, other_player.user_id]
+            existing_status = self.match_dao.get_existing_match_status(
+                player.guild_id, player_ids, match_start, match_end
+            )
+            
+            if existing_status:
+                if existing_status == "scheduled":
+                    # Match has been accepted
+                    extra_reasons.append("✅ Match already accepted and scheduled")
+                    # Keep the score but mark as accepted
+                    overall_score *= 0.8
+                elif existing_status == "pending_confirmation":
+                    # Match request is pending
+                    extra_reasons.append("⏳ Match request pending confirmation")
+                    # Reduce the score to make it less attractive
+                    overall_score *= 0.5
+                elif existing_status == "recently_cancelled":
+                    # Match was recently declined
+                    extra_reasons.append("❌ Match request recently declined")
+                    # Reduce the score significantly
+                    overall_score *= 0.3
+        
+        return MatchSuggestion(
+            players=players,
+            schedules=schedules,
+            suggested_court=suggested_court,
+            suggested_time=(match_start, match_end),
+            overall_score=overall_score,
+            match_type=candidate.match_type,
+            guild_id=players[0].guild_id,
+            score=candidate.compatibility,
+            extra_reasons=extra_reasons
         )
+    
+    def _calculate_compatibility(self, player1: Player, player2: Player,
+                               schedule1: Schedule, schedule2: Schedule,
+                               min_score: Optional[float] = None,
+                               match_history: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Calculate compatibility between two players, with reasons.
         
-        # Time overlap
-        time_overlap = self._calculate_time_overlap(schedule1, schedule2)
+        Takes the same arguments as _score_pair.
         
-        # Engagement bonus
-        engagement_bonus = self._calculate_engagement_bonus(player1, player2)
+        Returns:
+            Optional[Dict[str, Any]]: Factor scores, overall score and reasons
+        """
+        scored = self._score_pair(player1, player2, schedule1, schedule2, min_score, match_history)
+        return scored.details() if scored else None
+    
+    def _score_pair(self, player1: Player, player2: Player,
+                    schedule1: Schedule, schedule2: Schedule,
+                    min_score: Optional[float] = None,
+                    match_history: Optional[float] = None) -> Optional[PairScore]:
+        """Score two players' compatibility without building reasons.
         
-        # Match history factor
-        match_history = self._calculate_match_history_factor(player1, player2)
+        Uses the guild profile's compiled scorer, the same rule the pool
+        workers run, so inline and pooled scores are identical. The factors
+        that only depend on the two profiles come from a memo shared by every
+        schedule pair of these players.
         
-        # Calculate overall score
-        overall_score = (
-            self.weights['ntrp_compatibility'] * ntrp_compatibility +
-            self.weights['skill_preference'] * skill_compatibility +
-            self.weights['gender_compatibility'] * gender_compatibility +
-            self.weights['location_compatibility'] * location_compatibility +
-            self.weights['time_overlap'] * time_overlap +
-            self.weights['engagement_bonus'] * engagement_bonus +
-            self.weights['match_history'] * match_history
+        Args:
+            player1: First player
+            player2: Second player
+            schedule1: First player's schedule
+            schedule2: Second player's schedule
+            min_score: Optional score the pair has to beat. Factors are added
+                cheapest first, and once the remaining ones cannot lift the
+                pair above it, None is returned without computing them (in
+                particular without the match history lookup).
+            match_history: Optional precomputed match history factor, used by
+                batch callers that load the guild's match history up front
+            
+        Returns:
+            Optional[PairScore]: Overall score and factors, or None if the
+                pair does not beat min_score
+        """
+        profile = self._scoring_profile(player1.guild_id)
+        if match_history is None:
+            def match_history() -> float:
+                return self._calculate_match_history_factor(player1, player2)
+        
+        scored = profile.score_pair(
+            self._get_features(player1), self._get_features(player2),
+            schedule1.start_time, schedule1.end_time,
+            schedule2.start_time, schedule2.end_time,
+            match_history, float('-inf') if min_score is None else min_score,
+            self._get_static_pair_factors(player1, player2)
         )
+        return PairScore(*scored) if scored else None
+    
+    def _scoring_profile(self, guild_id: str) -> ScoringProfile:
+        """Get the compiled weights, thresholds and cut-offs for a guild."""
+        return ScoringProfile.for_guild(guild_id)
+    
+    def _get_static_pair_factors(self, player1: Player, player2: Player) -> Tuple[float, ...]:
+        """Get the profile-only factors for a pair, memoized per profile version.
         
-        # Add reasons
-        if ntrp_compatibility > 0.8:
-            reasons.append("Excellent skill level match")
-        elif ntrp_compatibility > 0.6:
-            reasons.append("Good skill level match")
-        
-        if skill_compatibility > 0.8:
-            reasons.append("Matches skill preferences")
-        
-        if gender_compatibility > 0.8:
-            reasons.append("Matches gender preferences")
-        
-        if location_compatibility > 0.8:
-            reasons.append("Same preferred location")
-        
-        if time_overlap > 0.9:
-            reasons.append("Perfect time overlap")
-        
-        if engagement_bonus > 0.5:
-            reasons.append("High engagement players")
+        The cache key includes both players' updated_at and the scoring
+        profile version, so any profile update or config reload naturally
+        misses and recomputes. All five factors are symmetric, so the pair is
+        keyed in user ID order.
         
-        if match_history > 0.5:
-            reasons.append("Previous match history")
+        Returns:
+            Tuple[float, ...]: NTRP, skill preference, gender and location
+                compatibility, and the engagement bonus
+        """
+        profile = self._scoring_profile(player1.guild_id)
+        if player1.user_id <= player2.user_id:
+            key = (player1.guild_id, player1.user_id, player2.user_id,
+                   player1.updated_at, player2.updated_at, profile.version)
+        else:
+            key = (player1.guild_id, player2.user_id, player1.user_id,
+                   player2.updated_at, player1.updated_at, profile.version)
+        
+        factors = _static_pair_factors.get(key)
+        if factors is None:
+            factors = match_scoring.static_factors(
+                self._get_features(player1), self._get_features(player2),
+                profile.ntrp_thresholds
+            )
+            _static_pair_factors.put(key, factors)
+        return factors
+    
+    def _get_features(self, player: Player) -> match_scoring.MatchFeatures:
+        """Get a player's MatchFeatures, built once per profile version.
         
-        return {
-            'overall_score': overall_score,
-            'ntrp_compatibility': ntrp_compatibility,
-            'skill_compatibility': skill_compatibility,
-            'gender_compatibility': gender_compatibility,
-            'location_compatibility': location_compatibility,
-            'time_overlap': time_overlap,
-            'engagement_bonus': engagement_bonus,
-            'match_history': match_history,
-            'reasons': reasons
-        }
+        Scoring reads only these records; the Player itself is carried along
+        for the suggestions shown to the user.
+        """
+        key = (player.guild_id, player.user_id, player.updated_at)
+        features = _player_features.get(key)
+        if features is None:
+            features = match_scoring.features_for(player)
+            _player_features.put(key, features)
+        return features
     
-    def _calculate_ntrp_compatibility(self, ntrp_diff: float) -> float:
+    def _calculate_ntrp_compatibility(self, ntrp_diff: float, guild_id: Optional[str] = None) -> float:
         """Calculate NTRP compatibility score."""
-        if ntrp_diff <= self.ntrp_thresholds['excellent']:
-            return 1.0
-        elif ntrp_diff <= self.ntrp_thresholds['good']:
-            return 0.8
-        elif ntrp_diff <= self.ntrp_thresholds['acceptable']:
-            return 0.6
-        elif ntrp_diff <= self.ntrp_thresholds['poor']:
-            return 0.3
-        else:
-            return 0.0
+        return match_scoring.ntrp_score(ntrp_diff, self._scoring_profile(guild_id).ntrp_thresholds)
     
     def _calculate_skill_preference_compatibility(self, player1: Player, player2: Player) -> float:
         """Calculate skill preference compatibility."""
-        score = 0.0
-        ntrp_diff = abs(float(player1.ntrp_rating) - float(player2.ntrp_rating))
-        
-        # Check player1's preferences
-        player1_prefs = player1.preferences.get('skill_levels', [])
-        if 'any' in player1_prefs:
-            score += 0.5
-        elif 'similar' in player1_prefs and ntrp_diff <= 0.5:
-            score += 1.0
-        elif 'above' in player1_prefs and float(player2.ntrp_rating) > float(player1.ntrp_rating):
-            score += 1.0
-        elif 'below' in player1_prefs and float(player2.ntrp_rating) < float(player1.ntrp_rating):
-            score += 1.0
-        
-        # Check player2's preferences
-        player2_prefs = player2.preferences.get('skill_levels', [])
-        if 'any' in player2_prefs:
-            score += 0.5
-        elif 'similar' in player2_prefs and ntrp_diff <= 0.5:
-            score += 1.0
-        elif 'above' in player2_prefs and float(player1.ntrp_rating) > float(player2.ntrp_rating):
-            score += 1.0
-        elif 'below' in player2_prefs and float(player1.ntrp_rating) < float(player2.ntrp_rating):
-            score += 1.0
-        
-        return score / 2.0  # Average of both players' preferences
+        return match_scoring.skill_preference_score(
+            self._get_features(player1), self._get_features(player2)
+        )
     
     def _calculate_gender_compatibility(self, player1: Player, player2: Player) -> float:
         """Calculate gender compatibility."""
-        player1_gender = player1.gender
-        player2_gender = player2.gender
-        
-        # Get gender preferences
-        player1_prefs = player1.preferences.get('gender', [])
-        player2_prefs = player2.preferences.get('gender', [])
-        
-        # If either player has no preference, it's compatible
-        if 'none' in player1_prefs or 'none' in player2_prefs:
-            return 1.0
-        
-        # Check if preferences match
-        if player1_gender in player2_prefs and player2_gender in player1_prefs:
-            return 1.0
-        
-        # Partial match
-        if player1_gender in player2_prefs or player2_gender in player1_prefs:
-            return 0.5
-        
-        return 0.0
+        return match_scoring.gender_score(
+            self._get_features(player1), self._get_features(player2)
+        )
     
     def _calculate_location_compatibility(self, player1: Player, player2: Player,
                                         schedule1: Schedule, schedule2: Schedule) -> float:
         """Calculate location compatibility."""
-        # Get preferred locations
-        player1_locations = player1.preferences.get('locations', [])
-        player2_locations = player2.preferences.get('locations', [])
-        
-        # Check for overlap
-        common_locations = set(player1_locations) & set(player2_locations)
-        if common_locations:
-            return 1.0
-        
-        # Check if either player has no location preference
-        if not player1_locations or not player2_locations:
-            return 0.5
-        
-        return 0.0
+        return match_scoring.location_score(
+            self._get_features(player1), self._get_features(player2)
+        )
     
     def _calculate_time_overlap(self, schedule1: Schedule, schedule2: Schedule) -> float:
         """Calculate time overlap between schedules."""
-        overlap_start = max(schedule1.start_time, schedule2.start_time)
-        overlap_end = min(schedule1.end_time, schedule2.end_time)
-        
-        if overlap_start >= overlap_end:
-            return 0.0
-        
-        overlap_duration = overlap_end - overlap_start
-        schedule1_duration = schedule1.end_time - schedule1.start_time
-        schedule2_duration = schedule2.end_time - schedule2.start_time
-        
-        # Return the percentage of overlap relative to the shorter schedule
-        min_duration = min(schedule1_duration, schedule2_duration)
-        return overlap_duration / min_duration if min_duration > 0 else 0.0
+        return match_scoring.time_overlap_score(
+            schedule1.start_time, schedule1.end_time,
+            schedule2.start_time, schedule2.end_time
+        )
     
     def _calculate_engagement_bonus(self, player1: Player, player2: Player) -> float:
         """Calculate engagement bonus based on player activity."""
-        engagement1 = float(player1.engagement_score or 0)
-        engagement2 = float(player2.engagement_score or 0)
-        
-        # Normalize engagement scores (assuming max is around 100)
-        normalized1 = min(engagement1 / 100.0, 1.0)
-        normalized2 = min(engagement2 / 100.0, 1.0)
-        
-        return (normalized1 + normalized2) / 2.0
+        return (
+            self._get_features(player1).engagement + self._get_features(player2).engagement
+        ) / 2.0
     
     def _calculate_match_history_factor(self, player1: Player, player2: Player) -> float:
         """Calculate match history factor."""
@@ -568,77 +951,53 @@ class TennisMatchingAlgorithm:
         
         return 0.0
     
+    def _build_match_history_lookup(self, guild_id: str) -> Dict[frozenset, float]:
+        """Load a guild's completed matches once as a pair -> history factor map.
+        
+        Uses the same quality cut-offs as _calculate_match_history_factor.
+        
+        Args:
+            guild_id: Discord server ID
+            
+        Returns:
+            Dict[frozenset, float]: Match history factor keyed by user ID pair
+        """
+        lookup: Dict[frozenset, float] = {}
+        completed = self.match_dao.get_matches_by_status(guild_id, "completed", limit=10000)
+        for match in completed:
+            if not match.match_quality_score:
+                continue
+            quality = float(match.match_quality_score)
+            if quality > 7:
+                factor = 1.0
+            elif quality > 5:
+                factor = 0.5
+            else:
+                continue
+            for i, user_a in enumerate(match.players):
+                for user_b in match.players[i + 1:]:
+                    pair = frozenset((user_a, user_b))
+                    lookup[pair] = max(lookup.get(pair, 0.0), factor)
+        return lookup
+    
     def _calculate_group_compatibility(self, players: List[Player], 
-                                     schedules: List[Schedule]) -> Dict[str, Any]:
+                                     schedules: List[Schedule]) -> GroupScore:
         """Calculate compatibility for a group of players (doubles)."""
         if len(players) != 4 or len(schedules) != 4:
-            return {'overall_score': 0.0, 'reasons': ['Invalid group size']}
+            return GroupScore(0.0, 0.0)
         
         # Calculate pairwise compatibilities
         compatibilities = []
         for i in range(len(players)):
             for j in range(i + 1, len(players)):
-                compat = self._calculate_compatibility(
+                compat = self._score_pair(
                     players[i], players[j], schedules[i], schedules[j]
                 )
                 compatibilities.append(compat)
         
-        # Average the compatibility scores
-        avg_score = sum(c['overall_score'] for c in compatibilities) / len(compatibilities)
-        
-        # Collect reasons
-        reasons = []
-        if avg_score > 0.6:
-            reasons.append("Good overall group compatibility")
-        if any(c['ntrp_compatibility'] > 0.8 for c in compatibilities):
-            reasons.append("Balanced skill levels")
-        
-        return {
-            'overall_score': avg_score,
-            'reasons': reasons
-        }
-    
-    def _find_best_court(self, player1: Player, player2: Player,
-                        schedule1: Schedule, schedule2: Schedule) -> Optional[Court]:
-        """Find the best court for a match."""
-        # Get preferred locations
-        player1_locations = player1.preferences.get('locations', [])
-        player2_locations = player2.preferences.get('locations', [])
-        
-        # Find common locations
-        common_locations = set(player1_locations) & set(player2_locations)
-        
-        if common_locations:
-            # Get the first common location
-            court_id = list(common_locations)[0]
-            return self.court_dao.get_court(court_id)
-        
-        # If no common locations, get any available court
-        courts = self.court_dao.list_courts()
-        if courts:
-            return courts[0]
-        
-        return None
-    
-    def _find_best_court_for_group(self, players: List[Player], 
-                                  schedules: List[Schedule]) -> Optional[Court]:
-        """Find the best court for a group match."""
-        # Get all preferred locations
-        all_locations = set()
-        for player in players:
-            all_locations.update(player.preferences.get('locations', []))
-        
-        if all_locations:
-            # Get the first available location
-            court_id = list(all_locations)[0]
-            return self.court_dao.get_court(court_id)
-        
-        # Fallback to any available court
-        courts = self.court_dao.list_courts()
-        if courts:
-            return courts[0]
-        
-        return None
+        # Average the compatibility scores; reasons come from GroupScore.details
+        avg_score = sum(c.overall_score for c in compatibilities) / len(compatibilities)
+        return GroupScore(avg_score, max(c.factors[0] for c in compatibilities))
     
     def _find_optimal_match_time(self, schedule1: Schedule, schedule2: Schedule) -> Tuple[int, int]:
         """Find the optimal match time within the overlapping schedules."""
@@ -723,6 +1082,24 @@ class TennisMatchingAlgorithm:
         
         return groups
     
+    def _get_eligible_candidates(self, guild_id: str, player: Player,
+                                 all_players: Dict[str, Player]) -> Set[str]:
+        """Refresh the guild's candidate index and get the player's eligible candidates.
+        
+        Args:
+            guild_id: Discord server ID
+            player: The searching player
+            all_players: Candidate players keyed by user ID
+            
+        Returns:
+            Set[str]: User IDs that pass the NTRP and gender hard constraints
+        """
+        index = CandidateIndex.for_guild(guild_id)
+        index.max_ntrp_diff = self._scoring_profile(guild_id).ntrp_thresholds['poor']
+        index.upsert_many(all_players.values())
+        index.upsert(player)
+        return index.eligible_user_ids(player)
+    
     def _get_players_for_schedules(self, guild_id: str, schedules: List[Schedule]) -> Dict[str, Player]:
         """Get all players for a list of schedules."""
         players = {}
@@ -0,0 +1,204 @@
+"""
+Recurring Schedule Occurrences
+
+A recurring schedule is stored once, as a parent with a `recurrence` dict
+(daily, weekly or monthly, optionally with `days` and `until`). This module
+expands parents into their occurrences over a time window with
+dateutil.rrule, so overlap queries and matching see every occurrence rather
+than only the parent's first window.
+
+- rrule objects are built once per recurrence pattern and start time
+- occurrence times are memoized per (schedule_id, updated_at, window), with
+  the window widened to whole hours so requests a few seconds apart share
+  an entry
+- each occurrence becomes a recurring instance Schedule with a stable ID
+  (see occurrence_id), which ScheduleDAO stores as a real row the first time
+  it is updated
+"""
+
+import logging
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import rrule, DAILY, WEEKLY, MONTHLY, weekday
+
+from src.database.models.dynamodb.schedule import Schedule
+
+logger = logging.getLogger(__name__)
+
+# Windows are widened to multiples of this many seconds before memoizing
+WINDOW_ALIGNMENT = 3600
+
+# How far ahead next_occurrence looks (longer than any month)
+NEXT_OCCURRENCE_HORIZON = 32 * 24 * 3600
+
+# Separates the parent ID from the start time in occurrence IDs
+OCCURRENCE_SEPARATOR = "@"
+
+FREQUENCIES = {'daily': DAILY, 'weekly': WEEKLY, 'monthly': MONTHLY}
+
+WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6
+}
+
+Occurrence = Tuple[int, int]  # (start_time, end_time)
+
+
+def occurrence_id(parent_id: str, start_time: int) -> str:
+    """Build the ID of one occurrence of a recurring schedule."""
+    return f"{parent_id}{OCCURRENCE_SEPARATOR}{start_time}"
+
+
+def parse_occurrence_id(schedule_id: str) -> Optional[Tuple[str, int]]:
+    """Split an occurrence ID into (parent_id, start_time).
+
+    Returns:
+        Optional[Tuple[str, int]]: None if the ID is not an occurrence ID
+    """
+    parent_id, separator, start = schedule_id.rpartition(OCCURRENCE_SEPARATOR)
+    if not separator or not parent_id or not start.isdigit():
+        return None
+    return parent_id, int(start)
+
+
+def _pattern(recurrence: dict) -> Optional[Tuple[str, Tuple[int, ...], Optional[int]]]:
+    """Reduce a recurrence dict to a hashable (type, weekdays, until) key."""
+    recurrence_type = recurrence.get('type')
+    if recurrence_type not in FREQUENCIES:
+        return None
+    days = tuple(sorted({
+        WEEKDAYS[day.lower()] for day in recurrence.get('days') or []
+        if isinstance(day, str) and day.lower() in WEEKDAYS
+    }))
+    until = recurrence.get('until')
+    return recurrence_type, days, int(until) if until is not None else None
+
+
+@lru_cache(maxsize=4096)
+def _rule(pattern: Tuple[str, Tuple[int, ...], Optional[int]], start_time: int,
+          timezone_str: str) -> rrule:
+    """Build the rrule for a recurrence pattern starting at start_time."""
+    recurrence_type, days, until = pattern
+    tz = ZoneInfo(timezone_str)
+    dtstart = datetime.fromtimestamp(start_time, tz=tz)
+    options = {
+        'dtstart': dtstart,
+        'until': datetime.fromtimestamp(until, tz=tz) if until is not None else None,
+        'cache': True,
+    }
+    if recurrence_type == 'weekly' and days:
+        options['byweekday'] = [weekday(day) for day in days]
+    elif recurrence_type == 'monthly':
+        # Day 31 falls back to the last day of shorter months
+        options['bymonthday'] = tuple(range(min(dtstart.day, 28), dtstart.day + 1))
+        options['bysetpos'] = -1
+    return rrule(FREQUENCIES[recurrence_type], **options)
+
+
+@lru_cache(maxsize=20000)
+def _occurrences(schedule_key: Tuple[str, str], pattern: Tuple[str, Tuple[int, ...], Optional[int]],
+                 start_time: int, end_time: int, timezone_str: str,
+                 window_start: int, window_end: int) -> Tuple[Occurrence, ...]:
+    """Occurrences overlapping an aligned window; memoized per schedule version."""
+    tz = ZoneInfo(timezone_str)
+    duration = end_time - start_time
+    starts = _rule(pattern, start_time, timezone_str).between(
+        datetime.fromtimestamp(window_start - duration, tz=tz),
+        datetime.fromtimestamp(window_end, tz=tz),
+        inc=True
+    )
+    return tuple((int(dt.timestamp()), int(dt.timestamp()) + duration) for dt in starts)
+
+
+def occurrence_times(schedule: Schedule, window_start: int, window_end: int) -> Tuple[Occurrence, ...]:
+    """Get the (start, end) times of a schedule's occurrences overlapping a window.
+
+    Args:
+        schedule: Any schedule; non-recurring ones have a single occurrence
+        window_start: Window start (Unix timestamp)
+        window_end: Window end (Unix timestamp)
+
+    Returns:
+        Tuple[Occurrence, ...]: Occurrences in start order, inclusive of the
+            window bounds like ScheduleDAO.get_overlapping_schedules
+    """
+    pattern = _pattern(schedule.recurrence) if schedule.is_recurring_parent() else None
+    if pattern is None:
+        if schedule.start_time <= window_end and schedule.end_time >= window_start:
+            return ((schedule.start_time, schedule.end_time),)
+        return ()
+
+    aligned_start = window_start - window_start % WINDOW_ALIGNMENT
+    aligned_end = window_end - window_end % WINDOW_ALIGNMENT + WINDOW_ALIGNMENT
+    occurrences = _occurrences(
+        (schedule.schedule_id, schedule.updated_at), pattern, schedule.start_time,
+        schedule.end_time, schedule.timezone_str, aligned_start, aligned_end
+    )
+    return tuple(
+        (start, end) for start, end in occurrences
+        if start <= window_end and end >= window_start
+    )
+
+
+def make_occurrence(parent: Schedule, start_time: int, end_time: int) -> Schedule:
+    """Build the recurring instance for one occurrence of a parent schedule."""
+    return Schedule(
+        guild_id=parent.guild_id,
+        user_id=parent.user_id,
+        start_time=start_time,
+        end_time=end_time,
+        schedule_id=occurrence_id(parent.schedule_id, start_time),
+        parent_schedule_id=parent.schedule_id,
+        preference_overrides=parent.preference_overrides,
+        status=parent.status,
+        created_at=parent.created_at,
+        updated_at=parent.updated_at,
+        timezone_str=parent.timezone_str
+    )
+
+
+def expand_schedules(schedules: Iterable[Schedule], window_start: int,
+                     window_end: int) -> List[Schedule]:
+    """Replace recurring parents with their occurrences overlapping a window.
+
+    Other schedules are returned unchanged. An occurrence that already has a
+    stored instance among `schedules` (same occurrence ID) is not added
+    again, so updated instances win over the parent's pattern.
+
+    Args:
+        schedules: Schedules as loaded from the database
+        window_start: Window start (Unix timestamp)
+        window_end: Window end (Unix timestamp)
+
+    Returns:
+        List[Schedule]: Schedules with every recurring parent expanded
+    """
+    schedules = list(schedules)
+    stored_ids = {s.schedule_id for s in schedules}
+    expanded = []
+    for schedule in schedules:
+        if not schedule.is_recurring_parent():
+            expanded.append(schedule)
+            continue
+        for start, end in occurrence_times(schedule, window_start, window_end):
+            if occurrence_id(schedule.schedule_id, start) not in stored_ids:
+                expanded.append(make_occurrence(schedule, start, end))
+    return expanded
+
+
+def next_occurrence(schedule: Schedule, after: int) -> Optional[Schedule]:
+    """Get the first occurrence of a schedule that has not ended by `after`.
+
+    Returns:
+        Optional[Schedule]: The schedule itself if it is not recurring, or
+            None once a recurring schedule has no occurrences left
+    """
+    if not schedule.is_recurring_parent() or _pattern(schedule.recurrence) is None:
+        return schedule
+    occurrences = occurrence_times(schedule, after, after + NEXT_OCCURRENCE_HORIZON)
+    if not occurrences:
+        return None
+    return make_occurrence(schedule, *occurrences[0])
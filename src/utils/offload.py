@@ -0,0 +1,187 @@
+"""
+Blocking Work Offload
+
+The DAOs and the matching code are synchronous, so calling them from a
+command handler stalls the event loop, and with it the gateway heartbeat,
+for as long as they run. run_blocking moves such sections to a bounded
+ThreadPoolExecutor:
+
+- at most PER_GUILD_LIMIT sections per guild run at once, so one busy guild
+  cannot take every worker
+- queue depth and running counts are tracked per guild (see stats) and a
+  warning is logged when a guild's queue gets long
+- work waiting for a slot is dropped when the interaction it serves
+  expires, since nothing could be sent back anyway. A thread that already
+  started cannot be stopped and runs to completion, holding its slot.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+import nextcord
+
+logger = logging.getLogger(__name__)
+
+# Worker threads shared by all guilds
+MAX_WORKERS = 8
+
+# Sections one guild may run at the same time
+PER_GUILD_LIMIT = 2
+
+# Queue depth per guild above which a warning is logged
+QUEUE_WARNING_DEPTH = 10
+
+
+class InteractionExpired(Exception):
+    """Raised when an interaction expires before its offloaded work finishes."""
+
+
+class Offloader:
+    """Bounded thread pool with per-guild concurrency limits."""
+
+    def __init__(self, max_workers: int = MAX_WORKERS, per_guild_limit: int = PER_GUILD_LIMIT):
+        """Initialize the offloader.
+
+        Args:
+            max_workers: Worker threads shared by all guilds
+            per_guild_limit: Sections one guild may run at the same time
+        """
+        self.per_guild_limit = per_guild_limit
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="offload")
+        self._slots: Dict[Optional[str], asyncio.Semaphore] = {}
+        self.queued: Counter = Counter()
+        self.running: Counter = Counter()
+        self.completed: Counter = Counter()
+        self.expired: Counter = Counter()
+
+    def _slot(self, guild_id: Optional[str]) -> asyncio.Semaphore:
+        slot = self._slots.get(guild_id)
+        if slot is None:
+            slot = self._slots[guild_id] = asyncio.Semaphore(self.per_guild_limit)
+        return slot
+
+    async def run(self, guild_id: Optional[str], expires_at: Optional[datetime],
+                  func: Callable[..., Any], /, *args, **kwargs) -> Any:
+        """Run a blocking function in the pool and wait for its result.
+
+        Coroutine functions that block internally are run to completion on
+        a private event loop in the worker thread.
+
+        Args:
+            guild_id: Guild the work is for, or None for work outside a guild
+            expires_at: When the caller stops caring about the result, or None
+            func: Function to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Any: What func returned
+
+        Raises:
+            InteractionExpired: If expires_at passes before func finishes
+        """
+        slot = self._slot(guild_id)
+        loop = asyncio.get_running_loop()
+
+        self.queued[guild_id] += 1
+        if self.queued[guild_id] > QUEUE_WARNING_DEPTH:
+            logger.warning(f"{self.queued[guild_id]} blocking sections queued for guild {guild_id}")
+        try:
+            await asyncio.wait_for(slot.acquire(), self._remaining(expires_at))
+        except asyncio.TimeoutError:
+            self.expired[guild_id] += 1
+            raise InteractionExpired(f"Interaction expired before {func.__qualname__} could start")
+        finally:
+            self.queued[guild_id] -= 1
+
+        call = functools.partial(func, *args, **kwargs)
+        if asyncio.iscoroutinefunction(func):
+            call = functools.partial(asyncio.run, call())
+
+        self.running[guild_id] += 1
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self.running[guild_id] -= 1
+            slot.release()
+            raise
+
+        def on_done(_):
+            # The slot is held until the thread is really done, even if the
+            # caller gave up waiting
+            def release():
+                self.running[guild_id] -= 1
+                self.completed[guild_id] += 1
+                slot.release()
+            loop.call_soon_threadsafe(release)
+
+        future.add_done_callback(on_done)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._remaining(expires_at))
+        except asyncio.TimeoutError:
+            self.expired[guild_id] += 1
+            raise InteractionExpired(f"Interaction expired while {func.__qualname__} was running")
+
+    @staticmethod
+    def _remaining(expires_at: Optional[datetime]) -> Optional[float]:
+        if expires_at is None:
+            return None
+        return max(0.0, (expires_at - datetime.now(timezone.utc)).total_seconds())
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get queued, running, completed and expired counts per guild."""
+        guilds = set(self.queued) | set(self.running) | set(self.completed) | set(self.expired)
+        return {
+            str(guild_id): {
+                'queued': self.queued[guild_id],
+                'running': self.running[guild_id],
+                'completed': self.completed[guild_id],
+                'expired': self.expired[guild_id],
+            }
+            for guild_id in guilds
+        }
+
+    def shutdown(self):
+        """Stop accepting work; running sections are left to finish."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_offloader: Optional[Offloader] = None
+_offloader_lock = threading.Lock()
+
+
+def get_offloader() -> Offloader:
+    """Get the shared offloader, creating it on first use."""
+    global _offloader
+    with _offloader_lock:
+        if _offloader is None:
+            _offloader = Offloader()
+        return _offloader
+
+
+async def run_blocking(interaction: Optional[nextcord.Interaction], func: Callable[..., Any],
+                       /, *args, **kwargs) -> Any:
+    """Run a blocking section of a command handler off the event loop.
+
+    Args:
+        interaction: Interaction the work serves; sets the guild and the
+            expiry. None for work outside an interaction.
+        func: Function to run
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Any: What func returned
+
+    Raises:
+        InteractionExpired: If the interaction expires first
+    """
+    guild_id = str(interaction.guild_id) if interaction and interaction.guild_id else None
+    expires_at = interaction.expires_at if interaction else None
+    return await get_offloader().run(guild_id, expires_at, func, *args, **kwargs)
@@ -6,16 +6,39 @@ This module provides utilities for managing Discord roles, including:
 - Role assignment and removal
 - Role updates and transitions
 - Role verification
+
+Resolved Role objects are cached per guild and dropped when the guild's
+roles change (see invalidate_role_cache). Role changes for one member are
+applied with a single member.edit call.
 """
 
 import nextcord
 from nextcord import Member, Role
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from .config_loader import ConfigLoader
 
 logger = logging.getLogger(__name__)
 
+# Skill role keys, lowest level first
+SKILL_ROLE_KEYS = ['beginner', 'adv_beginner', 'intermediate', 'adv_intermediate', 'advanced']
+
+# Upper NTRP bound of each skill role, from constants.py
+SKILL_ROLE_BOUNDS = [
+    (2.0, 'beginner'),          # Beginner (1.0-2.0)
+    (3.0, 'adv_beginner'),      # Advanced Beginner (2.0-3.0)
+    (4.0, 'intermediate'),      # Intermediate (3.0-4.0)
+    (5.0, 'adv_intermediate'),  # Advanced Intermediate (4.0-5.0)
+]
+
+
+def skill_role_key(ntrp_rating: float) -> str:
+    """Get the skill role key for an NTRP rating."""
+    for upper_bound, role_key in SKILL_ROLE_BOUNDS:
+        if ntrp_rating <= upper_bound:
+            return role_key
+    return 'advanced'  # Advanced (5.0+)
+
 
 class RoleManager:
     """
@@ -34,10 +57,25 @@ class RoleManager:
         ```
     """
 
+    # Resolved roles per guild ID, by role key; shared by all instances
+    _role_cache: Dict[int, Dict[str, Role]] = {}
+
     def __init__(self):
         """Initialize RoleManager with configuration."""
         self.config_loader = ConfigLoader()
 
+    @classmethod
+    def invalidate_role_cache(cls, guild_id: int):
+        """
+        Forget the resolved roles of a guild.
+
+        Call when a role in the guild is created, renamed or deleted.
+
+        Args:
+            guild_id (int): The Discord guild ID
+        """
+        cls._role_cache.pop(guild_id, None)
+
     def _get_role(self, guild: nextcord.Guild, role_key: str) -> Tuple[Optional[Role], Optional[str]]:
         """
         Get a role object and its name from configuration.
@@ -51,7 +89,12 @@ class RoleManager:
         """
         try:
             role_name = self.config_loader.config['roles'][role_key]['name']
-            role = nextcord.utils.get(guild.roles, name=role_name)
+            guild_roles = self._role_cache.setdefault(guild.id, {})
+            role = guild_roles.get(role_key)
+            if role is None or role.name != role_name:
+                role = nextcord.utils.get(guild.roles, name=role_name)
+                if role is not None:
+                    guild_roles[role_key] = role
             return role, role_name
         except KeyError:
             logger.error(f"Role key '{role_key}' not found in configuration")
@@ -207,13 +250,84 @@ class RoleManager:
             logger.error(f"Error checking role: {e}", exc_info=True)
             return False
             
-    async def assign_skill_role(self, member: Member, ntrp_rating: float) -> bool:
+    async def set_roles(
+            self,
+            member: Member,
+            add: Iterable[str] = (),
+            remove: Iterable[str] = ()
+    ) -> bool:
+        """
+        Add and remove several roles with a single API call.
+
+        The member's target role set is computed locally; nothing is sent
+        when the member already has exactly the requested roles.
+
+        Args:
+            member (Member): The member to update
+            add (Iterable[str]): Role keys the member should have
+            remove (Iterable[str]): Role keys the member should not have
+
+        Returns:
+            bool: True if successful, False otherwise
+
+        Example:
+            ```python
+            success = await role_manager.set_roles(member, add=['member'], remove=['visitor'])
+            ```
+        """
+        try:
+            to_add: List[Role] = []
+            for role_key in add:
+                role, role_name = self._get_role(member.guild, role_key)
+                if not role:
+                    logger.error(f"Could not find role: {role_name}")
+                    return False
+                to_add.append(role)
+            remove_ids = {
+                role.id for role, _ in (self._get_role(member.guild, key) for key in remove) if role
+            }
+            remove_ids -= {role.id for role in to_add}
+
+            current = [role for role in member.roles if not role.is_default()]
+            target = [role for role in current if role.id not in remove_ids]
+            target += [role for role in to_add if role not in target]
+
+            if {role.id for role in target} == {role.id for role in current}:
+                logger.debug(f"Roles for {member.name} already up to date")
+                return True
+
+            await member.edit(roles=target)
+            logger.info(
+                f"Updated roles for {member.name}: "
+                f"{', '.join(role.name for role in target) or 'no roles'}"
+            )
+            return True
+
+        except nextcord.Forbidden as e:
+            logger.error(f"Permission denied updating roles for {member.name}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Error updating member roles: {e}", exc_info=True)
+            return False
+
+    async def assign_skill_role(
+            self,
+            member: Member,
+            ntrp_rating: float,
+            add: Iterable[str] = (),
+            remove: Iterable[str] = ()
+    ) -> bool:
         """
         Assign appropriate skill level role based on NTRP rating.
+
+        Other skill roles are removed in the same API call, along with any
+        extra role changes passed in `add` and `remove`.
         
         Args:
             member (Member): The Discord member
             ntrp_rating (float): The player's NTRP rating
+            add (Iterable[str]): Other role keys to add in the same call
+            remove (Iterable[str]): Other role keys to remove in the same call
             
         Returns:
             bool: True if assignment was successful, False otherwise
@@ -224,28 +338,42 @@ class RoleManager:
             ```
         """
         try:
-            # Remove any existing skill roles
-            for role_key in ['beginner', 'adv_beginner', 'intermediate', 'adv_intermediate', 'advanced']:
-                await self.remove_role(member, role_key)
-            
-            # Assign new role based on NTRP rating ranges from constants.py
-            if ntrp_rating <= 2.0:  # Beginner (1.0-2.0)
-                await self.add_role(member, 'beginner')
-                logger.info(f"Assigned Beginner role to {member.name} (NTRP: {ntrp_rating})")
-            elif ntrp_rating <= 3.0:  # Advanced Beginner (2.0-3.0)
-                await self.add_role(member, 'adv_beginner')
-                logger.info(f"Assigned Advanced Beginner role to {member.name} (NTRP: {ntrp_rating})")
-            elif ntrp_rating <= 4.0:  # Intermediate (3.0-4.0)
-                await self.add_role(member, 'intermediate')
-                logger.info(f"Assigned Intermediate role to {member.name} (NTRP: {ntrp_rating})")
-            elif ntrp_rating <= 5.0:  # Advanced Intermediate (4.0-5.0)
-                await self.add_role(member, 'adv_intermediate')
-                logger.info(f"Assigned Advanced Intermediate role to {member.name} (NTRP: {ntrp_rating})")
-            else:  # Advanced (5.0+)
-                await self.add_role(member, 'advanced')
-                logger.info(f"Assigned Advanced role to {member.name} (NTRP: {ntrp_rating})")
-                
-            return True
+            role_key = skill_role_key(ntrp_rating)
+            success = await self.set_roles(
+                member,
+                add=[role_key, *add],
+                remove=[key for key in SKILL_ROLE_KEYS if key != role_key] + list(remove)
+            )
+            if success:
+                logger.info(f"Assigned {role_key} role to {member.name} (NTRP: {ntrp_rating})")
+            return success
         except Exception as e:
             logger.error(f"Error assigning skill role: {e}", exc_info=True)
             return False
+
+    async def promote_to_member(self, member: Member, ntrp_rating: float) -> Tuple[bool, bool]:
+        """
+        Promote a visitor to member and assign their skill level role.
+
+        Both changes normally go out in one API call. If the skill role
+        cannot be assigned (e.g. it was deleted from the guild), the
+        promotion is applied on its own.
+
+        Args:
+            member (Member): The Discord member
+            ntrp_rating (float): The player's NTRP rating
+
+        Returns:
+            Tuple[bool, bool]: Whether the member was promoted, and whether
+                the skill role was assigned
+
+        Example:
+            ```python
+            promoted, skill_assigned = await role_manager.promote_to_member(member, 3.5)
+            ```
+        """
+        if await self.assign_skill_role(member, ntrp_rating, add=['member'], remove=['visitor']):
+            return True, True
+
+        logger.warning(f"Promoting {member.name} to member without a skill level role")
+        return await self.set_roles(member, add=['member'], remove=['visitor']), False
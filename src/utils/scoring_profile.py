@@ -0,0 +1,156 @@
+"""
+Guild Scoring Profiles
+
+Matching weights, NTRP thresholds and score cut-offs are read per guild from
+the `matching` section of guild_config.yaml, so operators can tune matching
+by editing the config and reloading it instead of deploying. Each guild's
+settings are validated and compiled once into a ScoringProfile that holds
+flat scoring functions with the numbers already bound.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.config_loader import ConfigLoader
+from src.utils import match_scoring
+
+logger = logging.getLogger(__name__)
+
+# Defaults used for anything guild_config.yaml does not set
+DEFAULT_WEIGHTS = {
+    'ntrp_compatibility': 0.25,
+    'skill_preference': 0.20,
+    'gender_compatibility': 0.15,
+    'location_compatibility': 0.15,
+    'time_overlap': 0.15,
+    'engagement_bonus': 0.05,
+    'match_history': 0.05
+}
+
+DEFAULT_NTRP_THRESHOLDS = {
+    'excellent': 0.5,  # Within 0.5 rating
+    'good': 1.0,       # Within 1.0 rating
+    'acceptable': 1.5,  # Within 1.5 rating
+    'poor': 2.0        # Within 2.0 rating
+}
+
+DEFAULT_MIN_SINGLES_SCORE = 0.3
+DEFAULT_MIN_DOUBLES_SCORE = 0.25
+
+
+def _numbers(section: str, values: Any, defaults: Dict[str, float]) -> Dict[str, float]:
+    """Overlay configured numbers on defaults, ignoring invalid entries."""
+    merged = dict(defaults)
+    if not isinstance(values, dict):
+        return merged
+    for key, value in values.items():
+        if key not in defaults:
+            logger.warning(f"Unknown matching setting {section}.{key} ignored")
+        elif isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+            logger.warning(f"Invalid matching setting {section}.{key}={value!r}, using {defaults[key]}")
+        else:
+            merged[key] = float(value)
+    return merged
+
+
+class ScoringProfile:
+    """Compiled matching settings for one guild."""
+
+    _registry: Dict[Optional[str], 'ScoringProfile'] = {}
+    _registry_lock = threading.Lock()
+    # Bumped on every reload so caches keyed on it stop matching old profiles
+    _generation = 0
+
+    def __init__(self, weights: Optional[Dict[str, float]] = None,
+                 ntrp_thresholds: Optional[Dict[str, float]] = None,
+                 min_singles_score: float = DEFAULT_MIN_SINGLES_SCORE,
+                 min_doubles_score: float = DEFAULT_MIN_DOUBLES_SCORE,
+                 version: int = 0):
+        """Compile a scoring profile.
+
+        Args:
+            weights: Factor weights (default: DEFAULT_WEIGHTS)
+            ntrp_thresholds: NTRP difference thresholds (default: DEFAULT_NTRP_THRESHOLDS)
+            min_singles_score: Singles candidates must score above this
+            min_doubles_score: Doubles candidates must score above this
+            version: Config generation the profile was compiled from
+        """
+        self.weights = dict(weights or DEFAULT_WEIGHTS)
+        self.ntrp_thresholds = dict(ntrp_thresholds or DEFAULT_NTRP_THRESHOLDS)
+        self.min_singles_score = min_singles_score
+        self.min_doubles_score = min_doubles_score
+        self.version = version
+
+        self.weight_vector: Tuple[float, ...] = tuple(
+            self.weights[factor] for factor in match_scoring.FACTORS
+        )
+        self.weighted_score = match_scoring.compile_weighted_score(self.weight_vector)
+        # The pair scoring rule used inline and by the pool workers
+        self.score_pair = match_scoring.compile_scorer(self.weight_vector, self.ntrp_thresholds)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], version: int = 0) -> 'ScoringProfile':
+        """Build a profile from a `matching` config section.
+
+        Missing or invalid values fall back to the defaults, so a typo in the
+        config never stops matching.
+
+        Args:
+            config: Matching settings as returned by ConfigLoader.get_matching_config
+            version: Config generation the settings come from
+
+        Returns:
+            ScoringProfile: The compiled profile
+        """
+        thresholds = _numbers('ntrp_thresholds', config.get('ntrp_thresholds'), DEFAULT_NTRP_THRESHOLDS)
+        if list(thresholds.values()) != sorted(thresholds.values()):
+            logger.warning("ntrp_thresholds must increase from excellent to poor, using defaults")
+            thresholds = dict(DEFAULT_NTRP_THRESHOLDS)
+
+        cut_offs = _numbers('cut_offs', {
+            key: config[key] for key in ('min_singles_score', 'min_doubles_score') if key in config
+        }, {
+            'min_singles_score': DEFAULT_MIN_SINGLES_SCORE,
+            'min_doubles_score': DEFAULT_MIN_DOUBLES_SCORE
+        })
+
+        return cls(
+            weights=_numbers('weights', config.get('weights'), DEFAULT_WEIGHTS),
+            ntrp_thresholds=thresholds,
+            min_singles_score=cut_offs['min_singles_score'],
+            min_doubles_score=cut_offs['min_doubles_score'],
+            version=version
+        )
+
+    @classmethod
+    def for_guild(cls, guild_id: Optional[str]) -> 'ScoringProfile':
+        """Get the compiled profile for a guild, compiling it on first use.
+
+        Args:
+            guild_id: Discord server ID, or None for the defaults
+
+        Returns:
+            ScoringProfile: The guild's profile
+        """
+        guild_id = str(guild_id) if guild_id is not None else None
+        with cls._registry_lock:
+            profile = cls._registry.get(guild_id)
+            if profile is None:
+                try:
+                    config = ConfigLoader().get_matching_config(guild_id)
+                except Exception as e:
+                    logger.error(f"Error loading matching config for guild {guild_id}: {e}",
+                                 exc_info=True)
+                    config = {}
+                profile = cls._registry[guild_id] = cls.from_config(config, cls._generation)
+            return profile
+
+    @classmethod
+    def reload(cls):
+        """Re-read guild_config.yaml and recompile profiles on next use."""
+        ConfigLoader().reload()
+        with cls._registry_lock:
+            cls._registry.clear()
+            cls._generation += 1
+        logger.info("Matching scoring profiles reloaded")
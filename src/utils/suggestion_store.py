@@ -0,0 +1,349 @@
+"""
+Incremental Match Suggestion Store
+
+Holds precomputed pair scores per guild so `/find-matches` does not have to
+recompute the whole suggestion set on every call. The store is kept up to
+date incrementally:
+
+- a new schedule scores only the pairs touching that schedule
+- cancelled schedules drop their pairs
+- a profile or NTRP change marks the player dirty, and only the pairs
+  touching that player are re-scored on the next read
+- schedules that have ended are dropped on the next read
+- reloading the scoring profile invalidates every stored score
+
+Scoring itself lives in TennisMatchingAlgorithm; this module only keeps the
+state and answers freshness questions.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Set, List, Any, Optional, Iterable, Tuple
+
+from src.database.models.dynamodb.player import Player
+from src.database.models.dynamodb.schedule import Schedule
+
+logger = logging.getLogger(__name__)
+
+# Seeded entries older than this are recomputed from scratch
+FRESHNESS_SECONDS = 15 * 60
+
+
+class SuggestionStore:
+    """Precomputed match candidates for a single guild."""
+
+    _registry: Dict[str, 'SuggestionStore'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, guild_id: str):
+        """Initialize an empty store.
+
+        Args:
+            guild_id: Discord server ID
+        """
+        self.guild_id = str(guild_id)
+        self._lock = threading.RLock()
+        self.players: Dict[str, Player] = {}
+        self.schedules: Dict[str, Schedule] = {}
+        # schedule_id -> other schedule_id -> PairScore (singles)
+        self._singles: Dict[str, Dict[str, Any]] = {}
+        # schedule_id -> doubles candidates built for that schedule
+        self._doubles: Dict[str, List[Any]] = {}
+        # schedule_id -> overlapping schedule IDs from other users
+        self._neighbours: Dict[str, Set[str]] = {}
+        # schedule_id -> when its pairs were scored
+        self._scored_at: Dict[str, float] = {}
+        # user_id -> (schedule signature, hours_ahead, seeded_at)
+        self._seeded_users: Dict[str, Tuple[frozenset, int, float]] = {}
+        # user_id -> (hours_ahead, schedule IDs scored) for searches cut short by a deadline
+        self._partial_searches: Dict[str, Tuple[int, Set[str]]] = {}
+        self._dirty_players: Set[str] = set()
+        # Scoring profile version the stored scores were computed with
+        self.profile_version: Optional[int] = None
+        # Earliest end time of a stored schedule, so drop_ended is cheap
+        # while nothing has ended
+        self._next_end = float('inf')
+
+    @classmethod
+    def for_guild(cls, guild_id: str) -> 'SuggestionStore':
+        """Get the shared store for a guild, creating it on first use."""
+        guild_id = str(guild_id)
+        with cls._registry_lock:
+            store = cls._registry.get(guild_id)
+            if store is None:
+                store = cls._registry[guild_id] = cls(guild_id)
+            return store
+
+    @staticmethod
+    def _signature(schedules: Iterable[Schedule]) -> frozenset:
+        return frozenset((s.schedule_id, s.status) for s in schedules)
+
+    def is_user_fresh(self, user_id: str, schedules: List[Schedule], hours_ahead: int) -> bool:
+        """Check whether a user's precomputed candidates can be served.
+
+        Args:
+            user_id: Discord user ID
+            schedules: The user's current schedules
+            hours_ahead: Look-ahead window of the request
+
+        Returns:
+            bool: True if the user was seeded recently, with the same schedules
+                and at least the requested window
+        """
+        with self._lock:
+            seeded = self._seeded_users.get(user_id)
+            if seeded is None or user_id in self._dirty_players:
+                return False
+            signature, seeded_hours, seeded_at = seeded
+            return (
+                signature == self._signature(schedules)
+                and seeded_hours >= hours_ahead
+                and time.time() - seeded_at < FRESHNESS_SECONDS
+            )
+
+    def is_schedule_fresh(self, schedule_id: str) -> bool:
+        """Check whether a schedule's pairs were scored recently."""
+        with self._lock:
+            scored_at = self._scored_at.get(schedule_id)
+            return scored_at is not None and time.time() - scored_at < FRESHNESS_SECONDS
+
+    def mark_user_seeded(self, user_id: str, schedules: List[Schedule], hours_ahead: int):
+        """Record that all of a user's schedules have been scored."""
+        with self._lock:
+            self._seeded_users[user_id] = (self._signature(schedules), hours_ahead, time.time())
+            self._partial_searches.pop(user_id, None)
+
+    def mark_schedule_searched(self, user_id: str, hours_ahead: int, schedule_id: str):
+        """Record that one schedule of an unfinished search has been scored.
+
+        Args:
+            user_id: Discord user ID
+            hours_ahead: Look-ahead window of the search
+            schedule_id: Schedule whose pairs were just scored
+        """
+        with self._lock:
+            partial = self._partial_searches.get(user_id)
+            if partial is None or partial[0] != hours_ahead:
+                partial = self._partial_searches[user_id] = (hours_ahead, set())
+            partial[1].add(schedule_id)
+
+    def searched_schedules(self, user_id: str, hours_ahead: int) -> Set[str]:
+        """Get the schedules an unfinished search with this window already scored.
+
+        Schedules whose scores have gone stale since are left out, so a
+        resumed search scores them again.
+        """
+        with self._lock:
+            partial = self._partial_searches.get(user_id)
+            if partial is None or partial[0] != hours_ahead:
+                return set()
+            return {schedule_id for schedule_id in partial[1] if self.is_schedule_fresh(schedule_id)}
+
+    def add_players(self, players: Iterable[Player]):
+        """Remember the latest version of some players."""
+        with self._lock:
+            for player in players:
+                self.players[player.user_id] = player
+
+    def begin_schedule(self, schedule: Schedule, neighbours: Iterable[Schedule]):
+        """Start (re-)scoring a schedule, dropping its previous pairs.
+
+        Args:
+            schedule: Schedule about to be scored
+            neighbours: Overlapping schedules of other users
+        """
+        with self._lock:
+            self._drop_pairs(schedule.schedule_id)
+            self.schedules[schedule.schedule_id] = schedule
+            self._next_end = min(self._next_end, schedule.end_time)
+            neighbour_ids = set()
+            for other in neighbours:
+                self.schedules[other.schedule_id] = other
+                self._next_end = min(self._next_end, other.end_time)
+                neighbour_ids.add(other.schedule_id)
+                self._neighbours.setdefault(other.schedule_id, set()).add(schedule.schedule_id)
+            self._neighbours[schedule.schedule_id] = neighbour_ids
+            self._scored_at[schedule.schedule_id] = time.time()
+
+            # Keep the owner's seeded signature current so their entry stays fresh
+            seeded = self._seeded_users.get(schedule.user_id)
+            if seeded is not None:
+                signature = frozenset(
+                    entry for entry in seeded[0] if entry[0] != schedule.schedule_id
+                ) | {(schedule.schedule_id, schedule.status)}
+                self._seeded_users[schedule.user_id] = (signature, seeded[1], seeded[2])
+
+    def set_pair(self, schedule_id: str, other_id: str, compatibility: Optional[Any]):
+        """Store (or clear, when compatibility is None) a singles pair."""
+        with self._lock:
+            if compatibility is None:
+                self._singles.get(schedule_id, {}).pop(other_id, None)
+                self._singles.get(other_id, {}).pop(schedule_id, None)
+            else:
+                self._singles.setdefault(schedule_id, {})[other_id] = compatibility
+                self._singles.setdefault(other_id, {})[schedule_id] = compatibility
+
+    def add_doubles(self, schedule_id: str, candidate: Any):
+        """Store a doubles candidate built for a schedule."""
+        with self._lock:
+            self._doubles.setdefault(schedule_id, []).append(candidate)
+
+    def pairs_for(self, schedule_id: str) -> List[Tuple[Schedule, Any]]:
+        """Get the stored singles pairs of a schedule.
+
+        Returns:
+            List[Tuple[Schedule, Any]]: (other schedule, PairScore) pairs
+        """
+        with self._lock:
+            return [
+                (self.schedules[other_id], compatibility)
+                for other_id, compatibility in self._singles.get(schedule_id, {}).items()
+                if other_id in self.schedules
+            ]
+
+    def doubles_for(self, schedule_id: str) -> List[Any]:
+        """Get the stored doubles candidates of a schedule."""
+        with self._lock:
+            return list(self._doubles.get(schedule_id, ()))
+
+    def drop_doubles_with_player(self, user_id: str):
+        """Drop every stored doubles candidate that includes a player."""
+        with self._lock:
+            self._drop_doubles(lambda candidate: any(
+                p.user_id == user_id for p in candidate.players
+            ))
+
+    def neighbours_of(self, schedule_id: str) -> List[Schedule]:
+        """Get the overlapping schedules recorded for a schedule."""
+        with self._lock:
+            return [
+                self.schedules[other_id]
+                for other_id in self._neighbours.get(schedule_id, ())
+                if other_id in self.schedules
+            ]
+
+    def schedules_for_user(self, user_id: str) -> List[Schedule]:
+        """Get the stored schedules of a user."""
+        with self._lock:
+            return [s for s in self.schedules.values() if s.user_id == user_id]
+
+    def remove_schedule(self, schedule_id: str):
+        """Drop a cancelled schedule and every pair touching it.
+
+        Args:
+            schedule_id: Schedule ID
+        """
+        with self._lock:
+            self._forget_schedule(schedule_id)
+            self._drop_doubles(lambda candidate: any(
+                s.schedule_id == schedule_id for s in candidate.schedules
+            ))
+
+    def drop_ended(self, now: float) -> int:
+        """Drop schedules (and occurrences) that ended before a time.
+
+        Args:
+            now: Current Unix timestamp
+
+        Returns:
+            int: Number of schedules dropped
+        """
+        with self._lock:
+            if now <= self._next_end:
+                return 0
+            ended = {
+                schedule_id for schedule_id, schedule in self.schedules.items()
+                if schedule.end_time < now
+            }
+            for schedule_id in ended:
+                self._forget_schedule(schedule_id)
+            if ended:
+                self._drop_doubles(lambda candidate: any(
+                    s.schedule_id in ended for s in candidate.schedules
+                ))
+                for _, searched in self._partial_searches.values():
+                    searched.difference_update(ended)
+            self._next_end = min(
+                (schedule.end_time for schedule in self.schedules.values()), default=float('inf')
+            )
+            if ended:
+                logger.debug(f"Dropped {len(ended)} ended schedule(s) from guild {self.guild_id}")
+            return len(ended)
+
+    def sync_profile_version(self, version: int) -> bool:
+        """Forget every stored score if the scoring profile changed since.
+
+        Players and schedules are kept; only the scores are recomputed.
+
+        Args:
+            version: Current scoring profile version of the guild
+
+        Returns:
+            bool: True if the stored scores were dropped
+        """
+        with self._lock:
+            if version == self.profile_version:
+                return False
+            stale = self.profile_version is not None
+            self.profile_version = version
+            self._singles.clear()
+            self._doubles.clear()
+            self._scored_at.clear()
+            self._seeded_users.clear()
+            self._partial_searches.clear()
+            if stale:
+                logger.info(f"Scoring profile changed, dropped stored scores for guild {self.guild_id}")
+            return stale
+
+    def remove_user_schedules_in_range(self, user_id: str, start_time: int, end_time: int) -> int:
+        """Drop a user's stored schedules that start within a time range.
+
+        Mirrors ScheduleDAO.cancel_user_schedules_in_time_range.
+
+        Returns:
+            int: Number of schedules dropped
+        """
+        with self._lock:
+            schedule_ids = [
+                s.schedule_id for s in self.schedules.values()
+                if s.user_id == user_id and start_time <= s.start_time <= end_time
+            ]
+            for schedule_id in schedule_ids:
+                self.remove_schedule(schedule_id)
+            return len(schedule_ids)
+
+    def mark_player_dirty(self, user_id: str):
+        """Flag a player whose profile changed so their pairs get re-scored.
+
+        Args:
+            user_id: Discord user ID
+        """
+        with self._lock:
+            self._dirty_players.add(str(user_id))
+
+    def pop_dirty_players(self) -> Set[str]:
+        """Take the set of players waiting to be re-scored."""
+        with self._lock:
+            dirty, self._dirty_players = self._dirty_players, set()
+            return dirty
+
+    def _drop_doubles(self, predicate):
+        for owner_id, candidates in list(self._doubles.items()):
+            kept = [c for c in candidates if not predicate(c)]
+            if kept:
+                self._doubles[owner_id] = kept
+            else:
+                del self._doubles[owner_id]
+
+    def _forget_schedule(self, schedule_id: str):
+        self._drop_pairs(schedule_id)
+        self.schedules.pop(schedule_id, None)
+        self._scored_at.pop(schedule_id, None)
+        for other_id in self._neighbours.pop(schedule_id, set()):
+            self._neighbours.get(other_id, set()).discard(schedule_id)
+
+    def _drop_pairs(self, schedule_id: str):
+        for other_id in self._singles.pop(schedule_id, {}):
+            self._singles.get(other_id, {}).pop(schedule_id, None)
+        self._doubles.pop(schedule_id, None)
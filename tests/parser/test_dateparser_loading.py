@@ -0,0 +1,44 @@
+"""Tests for loading dateparser lazily."""
+
+import sys
+import os
+import subprocess
+
+# Add the project root directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.cogs.user.commands.schedule.parser import nlp_parser
+from src.cogs.user.commands.schedule.parser.nlp_parser import TimeParser, warm_up_dateparser
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+
+def test_importing_the_parser_does_not_import_dateparser():
+    code = (
+        "import sys\n"
+        "import src.cogs.user.commands.schedule.parser.nlp_parser\n"
+        "print('dateparser' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+
+def test_date_parser_is_reused_until_the_day_changes(monkeypatch):
+    created = []
+    make_parser = nlp_parser._date_data_parser
+    monkeypatch.setattr(nlp_parser, '_date_data_parser', lambda settings: created.append(settings) or make_parser(settings))
+    parser = TimeParser()
+
+    assert parser._parse_date("tomorrow") is not None
+    assert parser._parse_date("in 3 days") is not None
+    assert len(created) == 1
+
+    parser._day = None
+    parser._start_day(parser.settings['RELATIVE_BASE'])
+    parser._parse_date("tomorrow")
+    assert len(created) == 2
+
+
+def test_warm_up_parses_without_raising():
+    warm_up_dateparser()
@@ -0,0 +1,51 @@
+"""Tests for the dateparser-free fast path of the time parser."""
+
+import sys
+import os
+
+import pytest
+
+# Add the project root directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.cogs.user.commands.schedule.parser import nlp_parser
+from src.cogs.user.commands.schedule.parser.nlp_parser import TimeParser, get_parse_cache, get_parse_path_counts
+
+FAST_PATH_PHRASES = [
+    "today 11pm-11:30pm",
+    "tomorrow 6-8pm",
+    "saturday 9-11am",
+    "next friday evening",
+    "next week tuesday 3pm to 5pm",
+    "every saturday 9-11am",
+    "tomorow 3-5pm",
+]
+
+
+@pytest.mark.parametrize("phrase", FAST_PATH_PHRASES)
+def test_fast_path_matches_layered_path(phrase, monkeypatch):
+    parser = TimeParser()
+    layered = TimeParser()
+    monkeypatch.setattr(layered, '_parse_fast_path', lambda tokens: None)
+
+    get_parse_cache().clear()
+    fast_before = get_parse_path_counts()['fast']
+    expected = layered.parse_time_description(phrase)
+    get_parse_cache().clear()
+    with monkeypatch.context() as patch:
+        patch.setattr(nlp_parser, '_date_data_parser', lambda settings: pytest.fail("dateparser called"))
+        result = parser.parse_time_description(phrase)
+
+    assert result == expected
+    assert get_parse_path_counts()['fast'] == fast_before + 1
+
+
+def test_other_phrasings_fall_through():
+    parser = TimeParser()
+    get_parse_cache().clear()
+    layered_before = get_parse_path_counts()['layered']
+
+    for phrase in ("next two weeks 3-5pm", "tomorrow", "tomorrow 4pm", "monday tuesday 4-6pm"):
+        parser.parse_time_description(phrase)
+
+    assert get_parse_path_counts()['layered'] == layered_before + 4
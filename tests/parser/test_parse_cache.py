@@ -0,0 +1,56 @@
+"""Tests for the day-bucketed cache of parsed time descriptions."""
+
+import sys
+import os
+from datetime import timedelta
+
+# Add the project root directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.cogs.user.commands.schedule.parser.nlp_parser import ParseCache, TimeParser, get_parse_cache
+
+
+def test_repeated_phrases_are_served_from_cache(monkeypatch):
+    parser = TimeParser()
+    cache = get_parse_cache()
+    cache.clear()
+    calls = []
+    parse_times = parser._parse_times
+    monkeypatch.setattr(parser, '_parse_times', lambda text: calls.append(text) or parse_times(text))
+
+    first = parser.parse_time_description("next week tuesday 3-5pm")
+    second = parser.parse_time_description("  Next Week  TUESDAY 3-5pm")
+
+    assert first == second
+    assert first[2] == ""
+    assert calls == ["next week tuesday 3-5pm"]
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_entries_expire_at_midnight():
+    cache = ParseCache(maxsize=2)
+    cache.put("a", 1, expires_at=100.0)
+    cache.put("b", 2, expires_at=200.0)
+
+    assert cache.get("a", now=99.0) == 1
+    assert cache.get("a", now=100.0) is None
+    assert cache.purge_expired(now=250.0) == 1
+    assert len(cache) == 0
+    assert cache.stats()['expired'] == 2
+
+    cache.put("c", 3, expires_at=300.0)
+    cache.put("d", 4, expires_at=300.0)
+    cache.put("e", 5, expires_at=300.0)
+    assert cache.get("c", now=0.0) is None
+
+
+def test_new_day_refreshes_relative_base():
+    parser = TimeParser()
+    started = parser.settings['RELATIVE_BASE']
+    parser._day = parser._day - timedelta(days=1)
+
+    parser.parse_time_description("tomorrow 3-5pm")
+
+    assert parser.settings['RELATIVE_BASE'] > started
+    assert parser._day_ends_at > parser.settings['RELATIVE_BASE'].timestamp()
+    assert parser._day_ends_at - parser.settings['RELATIVE_BASE'].timestamp() <= 25 * 3600
@@ -0,0 +1,62 @@
+"""Tests for the single-pass time description tokenizer."""
+
+import sys
+import os
+
+# Add the project root directory to the path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.cogs.user.commands.schedule.parser.nlp_parser import (
+    PART_OF_DAY, RANGE, RECURRENCE, RELATIVE, TIME, WEEKDAY, WORD, TimeParser, join_tokens, tokenize
+)
+
+
+def kinds(text):
+    return [(token.kind, token.value) for token in tokenize(text) if token.kind != RANGE]
+
+
+def test_tokens_are_classified():
+    assert kinds("next week Tuesday evening") == [(RELATIVE, ('week_day', 'tuesday')), (PART_OF_DAY, 'evening')]
+    assert kinds("every saturday 9am") == [(RECURRENCE, 'saturday'), (TIME, '9am')]
+    assert kinds("next 2 weeks") == [(RELATIVE, ('weeks', '2'))]
+    assert kinds("this weekend friday") == [(RELATIVE, ('weekend', None)), (WEEKDAY, 'friday')]
+    assert kinds("nxt monday") == [(WORD, None), (WEEKDAY, 'monday')]
+
+
+def test_time_ranges_are_found_anywhere():
+    tokens = tokenize("rest of the week 11pm to 11:30pm")
+    time_range = next(token for token in tokens if token.kind == RANGE).value
+    assert time_range.group('start_hour', 'start_meridiem', 'end_hour', 'end_min') == ('11', 'pm', '11', '30')
+
+    tokens = tokenize("today4-6pm")
+    assert [token.kind for token in tokens] == [WORD, RANGE]
+    assert join_tokens([token for token in tokens if token.kind != RANGE]) == "today"
+    assert join_tokens(tokenize("  tomorrow  3 - 5 pm ")) == "tomorrow  3 - 5 pm"
+
+
+def test_recurrence_comes_from_tokens():
+    parser = TimeParser()
+
+    assert parser._extract_recurrence_pattern("every day 9-10am") == ('daily', 'day')
+    assert parser._extract_recurrence_pattern("every Monday 4-6pm") == ('weekly', 'monday')
+    assert parser._extract_recurrence_pattern("every week 4-6pm") == ('weekly', 'week')
+    assert parser._extract_recurrence_pattern("every month") == ('monthly', 'month')
+    assert parser._extract_recurrence_pattern("next monday 2-4pm") is None
+
+
+def test_typos_are_corrected_per_word(monkeypatch):
+    from src.cogs.user.commands.schedule.parser import nlp_parser
+    nlp_parser._word_corrections.clear()
+    lookups = []
+    extract_one = nlp_parser.process.extractOne
+    monkeypatch.setattr(nlp_parser.process, 'extractOne', lambda word, *args, **kwargs: lookups.append(word) or extract_one(word, *args, **kwargs))
+    parser = TimeParser()
+
+    assert parser._apply_fuzzy_correction("Tomorow 3-5pm") == "tomorrow 3-5pm"
+    assert parser._apply_fuzzy_correction("evry wensday tomorow") == "evry wednesday tomorrow"
+    # Run-together phrases are left for suggest_correction to split
+    assert parser._apply_fuzzy_correction("nextwednesday") == "nextwednesday"
+    assert parser._apply_fuzzy_correction("next monday afternoon") == "next monday afternoon"
+    assert parser._apply_fuzzy_correction("tomorow next tuesday") == "tomorrow next tuesday"
+    # Known words skip the lookup, and unknown ones are looked up once
+    assert lookups == ["tomorow", "evry", "wensday", "nextwednesday", "next"]
@@ -0,0 +1,46 @@
+"""Tests for guild-wide batch matchmaking."""
+
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.batch_matching import BatchMatchmaker
+from tests.test_matching_topk import build_algorithm, FakeMatchDAO, GUILD_ID
+
+
+class HistoryMatchDAO(FakeMatchDAO):
+    def get_matches_by_status(self, guild_id, status, limit=50):
+        return []
+
+
+def test_plan_uses_each_schedule_once():
+    algorithm, _, _ = build_algorithm(num_players=21)
+    algorithm.match_dao = HistoryMatchDAO()
+    schedules = algorithm.schedule_dao.schedules
+    start = min(s.start_time for s in schedules)
+    end = max(s.end_time for s in schedules)
+
+    plan = BatchMatchmaker(algorithm).build_plan(GUILD_ID, start, end)
+
+    used = [s.schedule_id for suggestion in plan.suggestions for s in suggestion.schedules]
+    assert len(used) == len(set(used))
+    assert len(used) + len(plan.unmatched_schedule_ids) == len(schedules)
+    assert plan.singles
+
+
+def test_augmenting_path_beats_greedy():
+    algorithm, _, _ = build_algorithm(num_players=2)
+    matchmaker = BatchMatchmaker(algorithm)
+    # Greedy takes the heaviest edge 1-2 and strands 0 and 3; 0-1 + 2-3 is heavier
+    weights = [
+        {1: 0.6},
+        {0: 0.6, 2: 0.7},
+        {1: 0.7, 3: 0.6},
+        {2: 0.6},
+    ]
+
+    mate = matchmaker._approximate_max_weight_matching(4, weights)
+
+    assert mate == [1, 0, 3, 2]
@@ -0,0 +1,57 @@
+"""Smoke tests for the matching benchmark suite."""
+
+import sys
+import os
+import json
+from datetime import datetime, timezone
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from benchmarks import run_matching, run_parser
+from benchmarks.synthetic_guild import generate_guild
+from src.utils import match_pool
+
+
+def test_generator_is_deterministic():
+    base_time = datetime(2030, 1, 7, 9, tzinfo=timezone.utc)
+
+    first = generate_guild(50, seed=7, base_time=base_time)
+    second = generate_guild(50, seed=7, base_time=base_time)
+
+    assert first.summary() == second.summary()
+    assert [p.to_dict() for p in first.players] == [p.to_dict() for p in second.players]
+    assert [s.schedule_id for s in first.schedules] == [s.schedule_id for s in second.schedules]
+
+
+def test_runner_reports_every_scenario(tmp_path, monkeypatch):
+    monkeypatch.setattr(match_pool, 'POOL_MIN_PAIRS', match_pool.POOL_MIN_PAIRS)
+    output = tmp_path / 'results.json'
+
+    run_matching.main(['--scales', '40', '--requests', '3', '--no-pool', '--output', str(output)])
+
+    report = json.loads(output.read_text())
+    scenarios = report['results'][0]['scenarios']
+    assert set(scenarios) == {
+        'find_matches_for_player', 'find_matches_for_player_warm',
+        'find_matches_for_schedule', 'doubles_search'
+    }
+    assert scenarios['find_matches_for_player']['dao_calls_per_request']['total'] > 0
+
+
+def test_parser_runner_reports_latency(tmp_path):
+    output = tmp_path / 'parser.json'
+
+    run_parser.main(['--rounds', '2', '--output', str(output)])
+
+    report = json.loads(output.read_text())
+    assert report['parse_cold']['calls'] == 2 * report['phrases']
+    assert report['parse_fast_path']['calls'] + report['parse_layered']['calls'] == 2 * report['phrases']
+    assert 0 < report['fast_path_fraction'] < 1
+    assert 0 < report['parsed'] < report['phrases']
+    # Phrases miss once, then hit
+    cache = report['cache']
+    assert cache['hits'] + cache['misses'] == 2 * report['phrases']
+    assert 0 < cache['hit_rate'] <= 0.5
+    assert report['tokenize']['p50_ms'] > 0
+    assert report['fuzzy_correction']['calls'] == 2 * report['phrases']
@@ -0,0 +1,88 @@
+"""Tests for the candidate pre-filter index."""
+
+import sys
+import os
+from decimal import Decimal
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.models.dynamodb.player import Player
+from src.utils.candidate_index import CandidateIndex
+
+
+def make_player(user_id, ntrp, gender='male', gender_pref='none', locations=None):
+    return Player(
+        guild_id='test-guild',
+        user_id=user_id,
+        username=user_id,
+        dob='01/01/1990',
+        gender=gender,
+        ntrp_rating=Decimal(ntrp),
+        knows_ntrp=True,
+        interests=['matches'],
+        preferences={
+            'locations': locations or [],
+            'skill_levels': ['any'],
+            'gender': gender_pref
+        }
+    )
+
+
+def test_prunes_ntrp_gap_above_two():
+    index = CandidateIndex('test-guild')
+    seeker = make_player('seeker', '3.0')
+    index.upsert_many([
+        seeker,
+        make_player('close', '3.5'),
+        make_player('edge', '5.0'),      # diff 2.0, still scores
+        make_player('too_high', '5.5'),  # diff 2.5, zero NTRP score
+        make_player('too_low', '0.5'),
+    ])
+
+    assert index.eligible_user_ids(seeker) == {'close', 'edge'}
+
+
+def test_threshold_off_the_bucket_grid_is_checked_per_rating():
+    index = CandidateIndex('test-guild')
+    index.max_ntrp_diff = 1.2
+    seeker = make_player('seeker', '3.0')
+    index.upsert_many([
+        seeker,
+        make_player('within', '4.0'),
+        make_player('edge', '4.1'),      # diff 1.1, checked per rating
+        make_player('too_high', '4.4'),  # same bucket as 'within', diff 1.4
+        make_player('too_low', '1.7'),
+    ])
+
+    assert index.eligible_user_ids(seeker) == {'within', 'edge'}
+
+
+def test_prunes_failed_gender_preferences():
+    index = CandidateIndex('test-guild')
+    seeker = make_player('seeker', '3.5', gender='female', gender_pref=['female'])
+    index.upsert_many([
+        seeker,
+        make_player('woman', '3.5', gender='female', gender_pref=['female']),
+        make_player('open', '3.5', gender='male', gender_pref='none'),
+        make_player('mismatch', '3.5', gender='male', gender_pref=['male']),
+    ])
+
+    assert index.eligible_user_ids(seeker) == {'woman', 'open'}
+    assert not index.is_compatible('seeker', 'mismatch')
+
+
+def test_upsert_moves_player_between_buckets():
+    index = CandidateIndex('test-guild')
+    seeker = make_player('seeker', '3.0', locations=['kits-beach'])
+    other = make_player('other', '5.5', locations=['kits-beach'])
+    index.upsert_many([seeker, other])
+    assert 'other' not in index.eligible_user_ids(seeker)
+
+    other.ntrp_rating = Decimal('4.0')
+    other.updated_at = '2030-01-01T00:00:00+00:00'
+    index.upsert(other)
+
+    assert 'other' in index.eligible_user_ids(seeker)
+    assert index.shares_location('seeker', 'other')
+    assert len(index) == 2
@@ -0,0 +1,51 @@
+"""Tests for routing stateless components by custom_id."""
+
+import sys
+import os
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.component_router import (
+    ComponentRoute, StatelessView, component_handler, custom_id, dispatch_component, parse_custom_id
+)
+
+
+class FakeInteraction:
+    def __init__(self, custom_id, values=None):
+        self.data = {'custom_id': custom_id, 'values': values or []}
+
+
+def test_custom_id_round_trip():
+    value = custom_id("match_winner", 123456789012345678, "a" * 36, "987654321098765432")
+
+    assert len(value) <= 100
+    assert parse_custom_id(value) == ComponentRoute(
+        "match_winner", "123456789012345678", "a" * 36, ("987654321098765432",)
+    )
+    assert parse_custom_id("confirm_match") is None
+    assert parse_custom_id(None) is None
+    with pytest.raises(ValueError):
+        custom_id("action", 1, "x" * 100)
+
+
+async def test_stateless_views_are_not_stored():
+    view = StatelessView()
+
+    assert view.timeout is None
+    assert view.prevent_update is False
+
+
+async def test_dispatch_calls_the_registered_handler():
+    calls = []
+
+    @component_handler("test_action")
+    async def handle(interaction, route):
+        calls.append((route.guild_id, route.match_id, interaction.data['values']))
+
+    assert await dispatch_component(FakeInteraction(custom_id("test_action", 1, "m1"), ["u1"]))
+    assert not await dispatch_component(FakeInteraction("next_match"))
+    assert not await dispatch_component(FakeInteraction(custom_id("unknown_action", 1, "m1")))
+    assert calls == [("1", "m1", ["u1"])]
@@ -0,0 +1,84 @@
+"""Tests for in-memory court assignment."""
+
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.models.dynamodb.court import Court
+from src.database.models.dynamodb.match import Match
+from src.utils.court_assignment import CourtAssigner
+from tests.test_candidate_index import make_player
+
+START = 1_900_000_800
+END = START + 5400
+
+
+def make_court(court_id, number_of_courts):
+    return Court(
+        name=court_id, location=court_id, surface_type='Hard',
+        number_of_courts=number_of_courts, is_indoor=False, amenities=[],
+        google_maps_link='', court_id=court_id
+    )
+
+
+class CatalogCourtDAO:
+    def __init__(self, courts):
+        self.courts = courts
+        self.calls = 0
+
+    def list_courts(self):
+        self.calls += 1
+        return self.courts
+
+
+class BookedMatchDAO:
+    def __init__(self, matches):
+        self.matches = matches
+        self.calls = 0
+
+    def get_matches_by_court(self, court_id, start_time=None, end_time=None):
+        self.calls += 1
+        return [m for m in self.matches if m.court_id == court_id]
+
+
+def build_assigner(matches=()):
+    courts = [make_court('kits-beach', 1), make_court('qe-park', 2)]
+    return CourtAssigner(CatalogCourtDAO(courts), BookedMatchDAO(list(matches)))
+
+
+def test_prefers_court_most_players_want():
+    assigner = build_assigner()
+    players = [
+        make_player('a', '3.5', locations=['kits-beach', 'qe-park']),
+        make_player('b', '3.5', locations=['qe-park']),
+    ]
+
+    court = assigner.session(START, END).assign(players, START, END)
+
+    assert court.court_id == 'qe-park'
+
+
+def test_skips_fully_booked_court():
+    booked = Match(
+        guild_id='test-guild', court_id='kits-beach', start_time=START - 1800,
+        end_time=START + 3600, players=['x', 'y'], status='scheduled'
+    )
+    assigner = build_assigner([booked])
+    players = [make_player('a', '3.5', locations=['kits-beach'])]
+
+    court = assigner.session(START, END).assign(players, START, END)
+
+    assert court.court_id == 'qe-park'
+
+
+def test_reservations_respect_number_of_courts():
+    assigner = build_assigner()
+    session = assigner.session(START, END)
+    players = [make_player('a', '3.5', locations=['qe-park'])]
+
+    assigned = [session.assign(players, START, END, reserve=True) for _ in range(4)]
+
+    assert [c.court_id if c else None for c in assigned] == ['qe-park', 'qe-park', 'kits-beach', None]
+    assert assigner.court_dao.calls == 1
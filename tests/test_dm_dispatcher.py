@@ -0,0 +1,86 @@
+"""Tests for the direct message dispatcher."""
+
+import sys
+import os
+import asyncio
+
+import nextcord
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import dm_dispatcher
+from src.utils.dm_dispatcher import DMDispatcher
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+        self.reason = "error"
+
+
+class FakeUser:
+    def __init__(self, user_id, failures=None, delay=0.05):
+        self.id = user_id
+        self.failures = list(failures or [])
+        self.delay = delay
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            raise self.failures.pop(0)
+        self.sent.append(kwargs)
+
+
+class FakeClient:
+    def __init__(self, cached, remote=()):
+        self.cached = {u.id: u for u in cached}
+        self.remote = {u.id: u for u in remote}
+        self.fetches = 0
+
+    def get_user(self, user_id):
+        return self.cached.get(user_id)
+
+    async def fetch_user(self, user_id):
+        self.fetches += 1
+        return self.remote[user_id]
+
+
+async def test_recipients_are_messaged_concurrently():
+    users = [FakeUser(i) for i in (1, 2, 3)]
+    dispatcher = DMDispatcher(FakeClient(users))
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = await dispatcher.send_many(["1", "2", "3"], view_factory=object)
+
+    assert loop.time() - started < 0.1
+    assert [r.sent for r in results] == [True, True, True]
+    # Each message gets its own view
+    assert len({id(u.sent[0]['view']) for u in users}) == 3
+
+
+async def test_uncached_users_are_fetched_once():
+    remote = FakeUser(7, delay=0)
+    client = FakeClient([], [remote])
+    dispatcher = DMDispatcher(client)
+
+    await dispatcher.send("7")
+    await dispatcher.send("7")
+
+    assert client.fetches == 1
+    assert len(remote.sent) == 2
+
+
+async def test_transient_failures_are_retried_and_reported(monkeypatch):
+    monkeypatch.setattr(dm_dispatcher, "RETRY_BASE_DELAY", 0)
+    flaky = FakeUser(1, failures=[nextcord.HTTPException(FakeResponse(503), "unavailable")], delay=0)
+    closed = FakeUser(2, failures=[nextcord.Forbidden(FakeResponse(403), "Cannot send messages")], delay=0)
+    dispatcher = DMDispatcher(FakeClient([flaky, closed]))
+
+    results = await dispatcher.send_many(["1", "2"])
+
+    assert (results[0].sent, results[0].attempts) == (True, 2)
+    assert (results[1].sent, results[1].attempts) == (False, 1)
+    assert "Cannot send messages" in results[1].error
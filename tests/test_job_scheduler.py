@@ -0,0 +1,152 @@
+"""Tests for the persistent background job scheduler."""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import job_scheduler
+from src.utils.job_scheduler import JobScheduler
+
+
+class MemoryJobDAO:
+    def __init__(self):
+        self.rows = {}
+
+    def save_job(self, job):
+        self.rows[(job.guild_id, job.job_id)] = job.to_dict()
+        return job
+
+    def delete_job(self, guild_id, job_id):
+        self.rows.pop((guild_id, job_id), None)
+        return True
+
+    def get_all_jobs(self):
+        from src.database.models.dynamodb.scheduled_job import ScheduledJob
+        return [ScheduledJob.from_dict(row) for row in self.rows.values()]
+
+
+async def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.01)
+
+
+async def test_stored_jobs_run_after_restart():
+    dao = MemoryJobDAO()
+    runs = []
+
+    async def remind(client, job):
+        runs.append(job.payload['match_id'])
+
+    first = JobScheduler(None, job_dao=dao)
+    first.register("match_reminder", remind)
+    await first.start()
+    await first.schedule("match_reminder", "1", int(time.time()) + 3600,
+                         job_id="match_reminder:m1", payload={'match_id': "m1"})
+    await first.stop()
+    assert runs == []
+
+    # Pretend the bot was down until the job came due
+    dao.rows[("1", "match_reminder:m1")]['run_at'] = int(time.time()) - 5
+    second = JobScheduler(None, job_dao=dao)
+    second.register("match_reminder", remind)
+    await second.start()
+    try:
+        await wait_for(lambda: not dao.rows)
+    finally:
+        await second.stop()
+
+    assert runs == ["m1"]
+    assert second.stats()["match_reminder"]['succeeded'] == 1
+
+
+async def test_rescheduling_replaces_the_pending_job():
+    dao = MemoryJobDAO()
+    runs = []
+
+    async def expire(client, job):
+        runs.append(job.payload['attempt'])
+
+    scheduler = JobScheduler(None, job_dao=dao)
+    scheduler.register("match_expiry", expire)
+    await scheduler.start()
+    try:
+        await scheduler.schedule("match_expiry", "1", int(time.time()) + 3600,
+                                 job_id="match_expiry:m1", payload={'attempt': 1})
+        await scheduler.schedule("match_expiry", "1", int(time.time()),
+                                 job_id="match_expiry:m1", payload={'attempt': 2})
+        await wait_for(lambda: not dao.rows)
+        await asyncio.sleep(0.05)
+    finally:
+        await scheduler.stop()
+
+    assert runs == [2]
+
+
+async def test_periodic_jobs_repeat_and_failures_are_retried(monkeypatch):
+    monkeypatch.setattr(job_scheduler, "RETRY_BASE_DELAY", 0)
+    dao = MemoryJobDAO()
+    refreshes = []
+    failures = []
+
+    async def refresh(client, job):
+        refreshes.append(job.run_at)
+        return int(time.time()) if len(refreshes) < 3 else None
+
+    async def broken(client, job):
+        failures.append(job.attempts)
+        raise RuntimeError("boom")
+
+    scheduler = JobScheduler(None, job_dao=dao)
+    scheduler.register("dashboard_refresh", refresh, concurrency=1)
+    scheduler.register("materialize_recurring", broken, concurrency=1)
+    await scheduler.start()
+    try:
+        await scheduler.schedule("dashboard_refresh", "1", int(time.time()))
+        await scheduler.schedule("materialize_recurring", "1", int(time.time()))
+        await wait_for(lambda: not dao.rows)
+    finally:
+        await scheduler.stop()
+
+    assert len(refreshes) == 3
+    assert failures == [0, 1, 2]
+    stats = scheduler.stats()
+    assert stats["dashboard_refresh"]['succeeded'] == 3
+    assert stats["materialize_recurring"]['retried'] == 2
+    assert stats["materialize_recurring"]['failed'] == 1
+
+
+async def test_due_job_waiting_for_a_slot_can_be_cancelled():
+    dao = MemoryJobDAO()
+    release = asyncio.Event()
+    runs = []
+
+    async def remind(client, job):
+        runs.append(job.payload['match_id'])
+        await release.wait()
+
+    scheduler = JobScheduler(None, job_dao=dao)
+    scheduler.register("match_reminder", remind, concurrency=1)
+    await scheduler.start()
+    try:
+        await scheduler.schedule("match_reminder", "1", int(time.time()),
+                                 job_id="match_reminder:m1", payload={'match_id': "m1"})
+        await wait_for(lambda: runs)
+        await scheduler.schedule("match_reminder", "1", int(time.time()),
+                                 job_id="match_reminder:m2", payload={'match_id': "m2"})
+        # m2 is due and taken off the heap, but waits for m1's slot
+        await wait_for(lambda: not scheduler._heap)
+
+        assert await scheduler.cancel("1", "match_reminder:m2")
+        release.set()
+        await wait_for(lambda: not dao.rows)
+        await asyncio.sleep(0.05)
+    finally:
+        await scheduler.stop()
+
+    assert runs == ["m1"]
@@ -0,0 +1,72 @@
+"""Tests for the event loop lag monitor."""
+
+import sys
+import os
+import asyncio
+import time
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.loop_monitor import LoopMonitor, set_current_handler
+
+
+def blocking_section():
+    time.sleep(0.3)
+
+
+async def test_stalls_are_attributed_to_the_running_handler():
+    monitor = LoopMonitor(asyncio.get_running_loop(), interval=0.02, threshold=0.1)
+    monitor.start()
+
+    async def handler():
+        set_current_handler("/find-matches")
+        blocking_section()
+
+    try:
+        await asyncio.sleep(0.05)
+        await asyncio.create_task(handler())
+        await asyncio.sleep(0.1)
+    finally:
+        monitor.stop()
+
+    report = monitor.report()
+    assert report[0]['label'] == "/find-matches"
+    assert report[0]['count'] == 1
+    assert report[0]['max'] >= 0.2
+    assert "blocking_section" in [frame.name for frame in report[0]['stack']]
+
+
+async def test_monitor_keeps_recording_after_a_stall():
+    monitor = LoopMonitor(asyncio.get_running_loop(), interval=0.02, threshold=0.1)
+    monitor.start()
+
+    async def handler():
+        set_current_handler("/schedule")
+        blocking_section()
+
+    try:
+        for _ in range(2):
+            await asyncio.sleep(0.05)
+            await asyncio.create_task(handler())
+        await asyncio.sleep(0.1)
+    finally:
+        monitor.stop()
+
+    report = monitor.report()
+    assert report[0]['label'] == "/schedule"
+    assert report[0]['count'] == 2
+    assert "".join(report[0]['stack'].format())
+
+
+async def test_short_pauses_are_not_recorded():
+    monitor = LoopMonitor(asyncio.get_running_loop(), interval=0.02, threshold=0.2)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.05)
+        time.sleep(0.05)
+        await asyncio.sleep(0.1)
+    finally:
+        monitor.stop()
+
+    assert monitor.report() == []
@@ -0,0 +1,73 @@
+"""Tests for pooled match scoring."""
+
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import match_pool, match_scoring
+from src.utils.scoring_profile import ScoringProfile
+from src.utils.suggestion_store import SuggestionStore
+from tests.test_matching_topk import build_algorithm, GUILD_ID
+
+
+def find_scores():
+    SuggestionStore._registry.clear()
+    algorithm, _, _ = build_algorithm(num_players=40)
+    suggestions = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    return [(s.match_type, round(s.overall_score, 9)) for s in suggestions]
+
+
+def test_threshold_picks_inline_for_small_jobs():
+    assert not match_pool.should_use_pool(1, 100)
+    assert match_pool.should_use_pool(4, match_pool.POOL_MIN_PAIRS // 4)
+
+
+def test_pooled_scores_match_inline(monkeypatch):
+    inline = find_scores()
+
+    monkeypatch.setattr(match_pool, 'POOL_MIN_PAIRS', 1)
+    monkeypatch.setattr(match_pool, 'CHUNK_SIZE', 10)
+    assert match_pool.warm_up_pool(max_workers=2) == 2
+    try:
+        pooled = find_scores()
+    finally:
+        match_pool.shutdown_pool()
+
+    assert pooled == inline
+
+
+def test_inline_and_pooled_pair_scores_are_identical():
+    algorithm, _, _ = build_algorithm(num_players=24)
+    players = algorithm.player_dao.players
+    schedules = algorithm.schedule_dao.schedules
+    seeker, seeker_schedule = players['player0'], schedules[0]
+    others = schedules[1:]
+    history = {s.user_id: (i % 3) / 2 for i, s in enumerate(others)}
+    profile = ScoringProfile.for_guild(GUILD_ID)
+
+    inline = {}
+    for schedule in others:
+        scored = algorithm._score_pair(
+            seeker, players[schedule.user_id], seeker_schedule, schedule,
+            min_score=profile.min_singles_score, match_history=history[schedule.user_id]
+        )
+        if scored:
+            inline[schedule.schedule_id] = (scored.overall_score, scored.factors)
+
+    assert match_pool.warm_up_pool(max_workers=2) == 2
+    try:
+        results = match_pool.score_in_pool(
+            algorithm._get_features(seeker),
+            [match_scoring.schedule_record(seeker_schedule)],
+            {s.user_id: algorithm._get_features(players[s.user_id]) for s in others},
+            [match_scoring.schedule_record(s) for s in others],
+            profile.weight_vector, profile.ntrp_thresholds, history,
+            min_score=profile.min_singles_score
+        )
+    finally:
+        match_pool.shutdown_pool()
+
+    assert inline
+    assert {other_id: (score, factors) for score, _, other_id, factors in results} == inline
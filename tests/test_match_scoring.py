@@ -0,0 +1,35 @@
+"""Tests for the compact match scoring records."""
+
+import sys
+import os
+import pickle
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import match_scoring
+from tests.test_candidate_index import make_player
+
+
+def test_features_keep_preference_semantics():
+    open_player = match_scoring.features_for(make_player('open', '3.5', gender_pref='none'))
+    woman = match_scoring.features_for(
+        make_player('woman', '3.5', gender='female', gender_pref=['female'], locations=['kits'])
+    )
+    man = match_scoring.features_for(
+        make_player('man', '4.5', gender='male', gender_pref=['male'], locations=['stanley'])
+    )
+
+    assert match_scoring.gender_score(open_player, man) == 1.0
+    assert match_scoring.gender_score(woman, man) == 0.0
+    assert match_scoring.location_score(woman, man) == 0.0
+    assert match_scoring.location_score(woman, open_player) == 0.5
+    # make_player prefers 'any' skill level, worth 0.5 per side
+    assert match_scoring.skill_preference_score(woman, man) == 0.5
+
+
+def test_features_are_compact_and_picklable():
+    features = match_scoring.features_for(make_player('p', '4.0', locations=['kits']))
+
+    assert not hasattr(features, '__dict__')
+    assert pickle.loads(pickle.dumps(features)) == features
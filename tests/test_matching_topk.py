@@ -0,0 +1,190 @@
+"""Tests for top-k candidate selection in the tennis matching algorithm."""
+
+import sys
+import os
+from datetime import datetime
+from decimal import Decimal
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.models.dynamodb.player import Player
+from src.database.models.dynamodb.schedule import Schedule
+from src.database.models.dynamodb.court import Court
+from src.utils.matching_algorithm import TennisMatchingAlgorithm, _TopK
+
+GUILD_ID = 'test-guild'
+
+
+class FakePlayerDAO:
+    def __init__(self, players):
+        self.players = {p.user_id: p for p in players}
+
+    def get_player(self, guild_id, user_id):
+        return self.players.get(user_id)
+
+
+class FakeScheduleDAO:
+    def __init__(self, schedules):
+        self.schedules = schedules
+
+    def get_user_schedules(self, guild_id, user_id):
+        return [s for s in self.schedules if s.user_id == user_id]
+
+    def get_schedule(self, guild_id, schedule_id):
+        return next((s for s in self.schedules if s.schedule_id == schedule_id), None)
+
+    def get_overlapping_schedules(self, guild_id, start_time, end_time, exclude_user_id=None):
+        return [
+            s for s in self.schedules
+            if s.user_id != exclude_user_id and s.start_time < end_time and s.end_time > start_time
+        ]
+
+
+class FakeCourtDAO:
+    def __init__(self):
+        self.calls = 0
+        self.court = Court(
+            name='Kits Beach', location='Kitsilano', surface_type='Hard',
+            number_of_courts=4, is_indoor=False, amenities=[],
+            google_maps_link='', court_id='kits-beach'
+        )
+
+    def get_court(self, court_id):
+        self.calls += 1
+        return self.court
+
+    def list_courts(self):
+        self.calls += 1
+        return [self.court]
+
+
+class FakeMatchDAO:
+    def __init__(self):
+        self.status_calls = 0
+        self.history_calls = 0
+
+    def get_existing_match_status(self, guild_id, player_ids, start_time, end_time):
+        self.status_calls += 1
+        return None
+
+    def get_player_matches(self, guild_id, user_id, status=None):
+        self.history_calls += 1
+        return []
+
+    def get_matches_by_court(self, court_id, start_time=None, end_time=None):
+        return []
+
+    def get_matches_by_status(self, guild_id, status, limit=50):
+        return []
+
+
+def build_algorithm(num_players=30):
+    """Build an algorithm over one searching player and many overlapping players."""
+    start = int(datetime.now().timestamp()) + 3600
+    players = []
+    schedules = []
+    for i in range(num_players):
+        players.append(Player(
+            guild_id=GUILD_ID,
+            user_id=f'player{i}',
+            username=f'Player {i}',
+            dob='01/01/1990',
+            gender='female' if i % 2 else 'male',
+            ntrp_rating=Decimal('3.0') + Decimal(i % 6) / 2,
+            knows_ntrp=True,
+            interests=['matches'],
+            preferences={
+                'locations': ['kits-beach'],
+                'skill_levels': ['similar'],
+                'gender': 'none'
+            }
+        ))
+        schedules.append(Schedule(
+            guild_id=GUILD_ID,
+            user_id=f'player{i}',
+            start_time=start + (i % 4) * 900,
+            end_time=start + 7200,
+            timezone_str='America/Vancouver'
+        ))
+
+    court_dao = FakeCourtDAO()
+    match_dao = FakeMatchDAO()
+    algorithm = TennisMatchingAlgorithm(
+        FakePlayerDAO(players), FakeScheduleDAO(schedules), court_dao, match_dao
+    )
+    return algorithm, court_dao, match_dao
+
+
+def test_top_k_keeps_highest_scores_in_order():
+    top = _TopK(3)
+    for score, item in [(0.5, 'a'), (0.9, 'b'), (0.1, 'c'), (0.7, 'd'), (0.9, 'e')]:
+        top.push(score, item)
+
+    assert top.ranked() == ['b', 'e', 'd']
+    assert top.floor == 0.7
+
+
+def test_find_matches_for_player_returns_ranked_top_k():
+    algorithm, _, _ = build_algorithm()
+
+    suggestions = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+
+    assert 0 < len(suggestions) <= algorithm.max_suggestions
+    scores = [s.overall_score for s in suggestions]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_enrichment_only_runs_for_selected_candidates():
+    algorithm, court_dao, match_dao = build_algorithm()
+
+    suggestions = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+
+    assert match_dao.status_calls <= len(suggestions)
+    assert court_dao.calls <= len(suggestions)
+
+
+def test_pair_scores_follow_profile_updates():
+    algorithm, _, _ = build_algorithm(num_players=2)
+    player0 = algorithm.player_dao.players['player0']
+    player1 = algorithm.player_dao.players['player1']
+    schedule0, schedule1 = algorithm.schedule_dao.schedules
+
+    first = algorithm._score_pair(player0, player1, schedule0, schedule1)
+    assert algorithm._score_pair(player1, player0, schedule1, schedule0) == first
+
+    player1.ntrp_rating = Decimal('6.0')
+    player1.updated_at = '2030-01-01T00:00:00+00:00'
+    updated = algorithm._score_pair(player0, player1, schedule0, schedule1)
+
+    assert updated.factors[0] == 0.0
+    assert updated.overall_score < first.overall_score
+
+
+def test_static_pair_factors_follow_profile_version():
+    algorithm, _, _ = build_algorithm(num_players=2)
+    player0 = algorithm.player_dao.players['player0']
+    player1 = algorithm.player_dao.players['player1']
+
+    first = algorithm._get_static_pair_factors(player0, player1)
+    assert algorithm._get_static_pair_factors(player1, player0) is first
+
+    player1.ntrp_rating = Decimal('6.0')
+    player1.updated_at = '2030-01-01T00:00:00+00:00'
+    updated = algorithm._get_static_pair_factors(player0, player1)
+
+    assert updated[0] == 0.0
+    assert updated is not first
+
+
+def test_reasons_are_built_when_first_read():
+    algorithm, _, _ = build_algorithm()
+
+    suggestions = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    singles = next(s for s in suggestions if s.match_type == 'singles')
+
+    assert 'compatibility_details' not in vars(singles)
+    expected = algorithm._calculate_compatibility(*singles.players, *singles.schedules)
+    assert singles.reasons == expected['reasons']
+    assert singles.compatibility_details['ntrp_compatibility'] == expected['ntrp_compatibility']
+    assert singles.compatibility_details['overall_score'] == singles.overall_score
@@ -0,0 +1,104 @@
+"""Tests for recurring schedule occurrence expansion."""
+
+import sys
+import os
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.models.dynamodb.schedule import Schedule
+from src.utils import occurrences
+from src.utils.occurrences import expand_schedules, occurrence_id, occurrence_times
+from src.utils.suggestion_store import SuggestionStore
+from tests.test_matching_topk import build_algorithm, GUILD_ID
+
+TZ = ZoneInfo('America/Vancouver')
+
+
+def recurring(start: datetime, recurrence: dict, user_id: str = 'player0') -> Schedule:
+    start_time = int(start.timestamp())
+    return Schedule(
+        guild_id=GUILD_ID, user_id=user_id, start_time=start_time, end_time=start_time + 7200,
+        recurrence=recurrence, timezone_str='America/Vancouver'
+    )
+
+
+def local_starts(schedule, window_start, window_end):
+    return [
+        datetime.fromtimestamp(start, TZ).strftime('%Y-%m-%d %H:%M')
+        for start, _ in occurrence_times(schedule, window_start, window_end)
+    ]
+
+
+def test_weekly_days_keep_local_time_across_dst():
+    schedule = recurring(datetime(2026, 3, 2, 18, tzinfo=TZ), {'type': 'weekly', 'days': ['monday', 'thursday']})
+
+    starts = local_starts(schedule, schedule.start_time, schedule.start_time + 14 * 86400)
+
+    assert starts == [
+        '2026-03-02 18:00', '2026-03-05 18:00', '2026-03-09 18:00',
+        '2026-03-12 18:00', '2026-03-16 18:00'
+    ]
+
+
+def test_monthly_falls_back_to_end_of_short_months_and_stops_at_until():
+    start = datetime(2026, 1, 31, 18, tzinfo=TZ)
+    until = int(datetime(2026, 4, 1, tzinfo=TZ).timestamp())
+    schedule = recurring(start, {'type': 'monthly', 'until': until})
+
+    starts = local_starts(schedule, schedule.start_time, schedule.start_time + 365 * 86400)
+
+    assert starts == ['2026-01-31 18:00', '2026-02-28 18:00', '2026-03-31 18:00']
+
+
+def test_expansion_is_memoized_per_schedule_version():
+    schedule = recurring(datetime(2026, 3, 2, 18, tzinfo=TZ), {'type': 'daily'})
+    occurrences._occurrences.cache_clear()
+
+    occurrence_times(schedule, schedule.start_time + 10, schedule.start_time + 86400)
+    occurrence_times(schedule, schedule.start_time + 20, schedule.start_time + 86400 + 30)
+    assert occurrences._occurrences.cache_info().hits == 1
+
+    schedule.updated_at = '2030-01-01T00:00:00+00:00'
+    occurrence_times(schedule, schedule.start_time + 20, schedule.start_time + 86400 + 30)
+    assert occurrences._occurrences.cache_info().misses == 2
+
+
+def test_stored_instances_replace_generated_occurrences():
+    schedule = recurring(datetime(2026, 3, 2, 18, tzinfo=TZ), {'type': 'daily'})
+    second = schedule.start_time + 86400
+    stored = Schedule(
+        guild_id=GUILD_ID, user_id='player0', start_time=second, end_time=second + 7200,
+        schedule_id=occurrence_id(schedule.schedule_id, second),
+        parent_schedule_id=schedule.schedule_id, status='matched', timezone_str='America/Vancouver'
+    )
+
+    expanded = expand_schedules([schedule, stored], schedule.start_time, schedule.start_time + 2 * 86400)
+
+    assert [s.schedule_id for s in expanded] == [
+        occurrence_id(schedule.schedule_id, schedule.start_time),
+        occurrence_id(schedule.schedule_id, second + 86400),
+        stored.schedule_id,
+    ]
+    assert all(s.parent_schedule_id == schedule.schedule_id for s in expanded)
+
+
+def test_recurring_schedule_that_started_last_week_is_matched():
+    SuggestionStore._registry.clear()
+    algorithm, _, _ = build_algorithm(num_players=12)
+    dao = algorithm.schedule_dao
+    # Move player0's schedule a week back and make it repeat daily
+    current = dao.schedules[0]
+    dao.schedules[0] = Schedule(
+        guild_id=GUILD_ID, user_id='player0', start_time=current.start_time - 7 * 86400,
+        end_time=current.end_time - 7 * 86400, recurrence={'type': 'daily'},
+        timezone_str='America/Vancouver'
+    )
+
+    suggestions = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+
+    assert suggestions
+    assert all(s.schedules[0].start_time == current.start_time for s in suggestions)
+    assert all(s.schedules[0].parent_schedule_id == dao.schedules[0].schedule_id for s in suggestions)
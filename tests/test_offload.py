@@ -0,0 +1,66 @@
+"""Tests for the blocking work offloader."""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.offload import Offloader, InteractionExpired
+
+
+async def test_per_guild_limit_is_respected():
+    offloader = Offloader(max_workers=4, per_guild_limit=2)
+    lock = threading.Lock()
+    active = {'now': 0, 'peak': 0}
+
+    def work():
+        with lock:
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+        time.sleep(0.05)
+        with lock:
+            active['now'] -= 1
+
+    await asyncio.gather(*(offloader.run("guild", None, work) for _ in range(6)))
+
+    assert active['peak'] == 2
+    assert offloader.stats()["guild"] == {'queued': 0, 'running': 0, 'completed': 6, 'expired': 0}
+    offloader.shutdown()
+
+
+async def test_coroutine_functions_run_in_worker():
+    offloader = Offloader()
+
+    async def work(value):
+        return value, threading.current_thread().name
+
+    value, thread_name = await offloader.run("guild", None, work, 3)
+
+    assert value == 3
+    assert thread_name.startswith("offload")
+    offloader.shutdown()
+
+
+async def test_expired_interaction_drops_queued_work():
+    offloader = Offloader(max_workers=2, per_guild_limit=1)
+    started = []
+    release = threading.Event()
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=0.1)
+
+    blocker = asyncio.ensure_future(offloader.run("guild", None, release.wait))
+    await asyncio.sleep(0.01)
+    with pytest.raises(InteractionExpired):
+        await offloader.run("guild", expires_at, started.append, 1)
+    release.set()
+    await blocker
+
+    assert started == []
+    assert offloader.stats()["guild"]['expired'] == 1
+    offloader.shutdown()
@@ -0,0 +1,91 @@
+"""Tests for single-call role reconciliation."""
+
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils.config_loader import ConfigLoader
+from src.utils.role_manager import RoleManager, skill_role_key
+
+
+class FakeRole:
+    def __init__(self, role_id, name):
+        self.id = role_id
+        self.name = name
+
+    def is_default(self):
+        return self.name == "@everyone"
+
+    def __eq__(self, other):
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self):
+        return self.id
+
+
+class FakeGuild:
+    def __init__(self, roles):
+        self.id = 1
+        self.roles = roles
+
+
+class FakeMember:
+    def __init__(self, guild, roles):
+        self.guild = guild
+        self.name = "player"
+        self.roles = roles
+        self.edits = []
+
+    async def edit(self, roles):
+        self.edits.append(roles)
+        self.roles = [self.guild.roles[0], *roles]
+
+
+def make_guild():
+    names = ConfigLoader().config['roles']
+    roles = [FakeRole(0, "@everyone")] + [
+        FakeRole(i, names[key]['name'])
+        for i, key in enumerate(['visitor', 'member', 'beginner', 'adv_beginner',
+                                 'intermediate', 'adv_intermediate', 'advanced'], 1)
+    ]
+    RoleManager.invalidate_role_cache(1)
+    return FakeGuild(roles), {role.name: role for role in roles}
+
+
+def test_skill_role_key_boundaries():
+    assert [skill_role_key(r) for r in (1.5, 2.0, 2.5, 4.0, 4.5, 5.5)] == [
+        'beginner', 'beginner', 'adv_beginner', 'intermediate', 'adv_intermediate', 'advanced'
+    ]
+
+
+async def test_profile_creation_is_one_edit():
+    guild, by_name = make_guild()
+    visitor = by_name['Court Visitor']
+    member = FakeMember(guild, [guild.roles[0], visitor, by_name['🌱 Beginner']])
+
+    assert await RoleManager().assign_skill_role(member, 3.5, add=['member'], remove=['visitor'])
+
+    assert len(member.edits) == 1
+    assert {role.name for role in member.edits[0]} == {'Club Member', '🎯 Intermediate'}
+
+
+async def test_unchanged_roles_make_no_call():
+    guild, by_name = make_guild()
+    member = FakeMember(guild, [guild.roles[0], by_name['Club Member'], by_name['🎯 Intermediate']])
+
+    assert await RoleManager().assign_skill_role(member, 3.5)
+
+    assert member.edits == []
+
+
+async def test_missing_skill_role_does_not_block_promotion():
+    guild, by_name = make_guild()
+    guild.roles.remove(by_name['🎯 Intermediate'])
+    member = FakeMember(guild, [guild.roles[0], by_name['Court Visitor']])
+
+    promoted, skill_assigned = await RoleManager().promote_to_member(member, 3.5)
+
+    assert promoted and not skill_assigned
+    assert {role.name for role in member.roles[1:]} == {'Club Member'}
@@ -0,0 +1,48 @@
+"""Tests for guild-configurable scoring profiles."""
+
+import sys
+import os
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.utils import match_scoring
+from src.utils.config_loader import ConfigLoader
+from src.utils.scoring_profile import ScoringProfile, DEFAULT_WEIGHTS
+from tests.test_candidate_index import make_player
+
+
+def test_guild_overrides_are_merged_and_validated(monkeypatch):
+    monkeypatch.setattr(ConfigLoader(), '_config', {
+        'matching': {
+            'weights': dict(DEFAULT_WEIGHTS),
+            'min_singles_score': 0.3,
+            'guild_overrides': {
+                123: {'weights': {'location_compatibility': 0.4, 'time_overlap': 'high'},
+                      'min_singles_score': 0.5}
+            }
+        }
+    })
+
+    profile = ScoringProfile.from_config(ConfigLoader().get_matching_config('123'))
+    default = ScoringProfile.from_config(ConfigLoader().get_matching_config('456'))
+
+    assert profile.weights['location_compatibility'] == 0.4
+    assert profile.weights['time_overlap'] == DEFAULT_WEIGHTS['time_overlap']
+    assert profile.min_singles_score == 0.5
+    assert default.weights == DEFAULT_WEIGHTS
+    assert default.min_singles_score == 0.3
+
+
+def test_compiled_scorer_rejects_early_without_changing_scores():
+    profile = ScoringProfile()
+    seeker = match_scoring.features_for(make_player('seeker', '3.0', gender_pref=['male'], locations=['kits']))
+    close = match_scoring.features_for(make_player('close', '3.5', locations=['kits']))
+    far = match_scoring.features_for(
+        make_player('far', '5.5', gender='female', gender_pref=['female'], locations=['stanley'])
+    )
+
+    score, factors = profile.score_pair(seeker, close, 0, 3600, 0, 3600, 0.0, 0.3)
+    assert score == profile.weighted_score(*factors)
+    assert profile.score_pair(seeker, far, 0, 3600, 0, 3600, 0.0, 0.3) is None
+    assert profile.score_pair(seeker, close, 0, 3600, 0, 3600, 0.0, 0.99) is None
@@ -0,0 +1,92 @@
+"""Tests for plan-and-apply server setup."""
+
+import sys
+import os
+
+from nextcord import Colour
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.cogs.admin.setup.channels import ChannelSetup
+from src.cogs.admin.setup.roles import RoleSetup
+from src.utils.config_loader import ConfigLoader
+
+
+class FakeRole:
+    def __init__(self, role_id, name, position, colour=None, permissions=None):
+        self.id = role_id
+        self.name = name
+        self.position = position
+        self.colour = colour
+        self.permissions = permissions
+
+    def __eq__(self, other):
+        return isinstance(other, FakeRole) and other.id == self.id
+
+    def __hash__(self):
+        return self.id
+
+
+class FakeChannel:
+    def __init__(self, name, topic, overwrites):
+        self.name = name
+        self.topic = topic
+        self.overwrites = overwrites
+
+
+class FakeCategory:
+    def __init__(self, name, channels=()):
+        self.name = name
+        self.channels = list(channels)
+
+
+class FakeGuild:
+    def __init__(self, roles, categories=()):
+        self.default_role = FakeRole(0, "@everyone", 0)
+        self.roles = [self.default_role, *roles]
+        self.categories = list(categories)
+        self.bot_role = FakeRole(99, "TennisMeetups", 20)
+        self.me = type("Me", (), {"roles": [self.bot_role], "top_role": self.bot_role})()
+
+
+def configured_roles(setup):
+    return [
+        FakeRole(i, config['name'], config['position'] + 1, Colour(config['color']),
+                 setup._role_permissions(role_id))
+        for i, (role_id, config) in enumerate(ConfigLoader().config['roles'].items(), 1)
+    ]
+
+
+def test_configured_guild_needs_no_changes():
+    role_setup, channel_setup = RoleSetup(None), ChannelSetup(None)
+    guild = FakeGuild(configured_roles(role_setup))
+
+    categories = {}
+    for config in ConfigLoader().config['channels'].values():
+        category = categories.setdefault(config['category'], FakeCategory(config['category']))
+        category.channels.append(FakeChannel(
+            config['name'], config['topic'],
+            channel_setup._channel_overwrites(guild, config['access_roles'])
+        ))
+    guild.categories = list(categories.values())
+
+    assert role_setup.plan_roles(guild, guild.bot_role).operations == []
+    assert channel_setup.plan_channels(guild).operations == []
+
+
+def test_changes_are_planned_in_dependency_order():
+    role_setup, channel_setup = RoleSetup(None), ChannelSetup(None)
+    roles = configured_roles(role_setup)
+    roles[0].colour = Colour(0)
+    guild = FakeGuild(roles[:-1])
+
+    role_plan = role_setup.plan_roles(guild, guild.bot_role)
+    descriptions = [[op.description for op in phase] for phase in role_plan.phases]
+    assert descriptions[0] == [f"Updated {roles[0].name} role settings", f"Created {roles[-1].name} role"]
+    assert descriptions[1] == [f"Positioned {roles[-1].name} below the bot's role"]
+
+    channel_plan = channel_setup.plan_channels(guild)
+    assert len(channel_plan.phases) == 2
+    assert all(op.description.endswith("category") for op in channel_plan.phases[0])
+    assert len(channel_plan.phases[1]) == len(ConfigLoader().config['channels'])
@@ -0,0 +1,173 @@
+"""Tests for the incremental match suggestion store."""
+
+import sys
+import os
+import time
+from decimal import Decimal
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from src.database.models.dynamodb.schedule import Schedule
+from src.utils.scoring_profile import ScoringProfile
+from src.utils.suggestion_store import SuggestionStore
+from tests.test_matching_topk import build_algorithm, GUILD_ID
+
+
+class CountingScheduleDAO:
+    def __init__(self, inner):
+        self.inner = inner
+        self.overlap_calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    def get_overlapping_schedules(self, *args, **kwargs):
+        self.overlap_calls += 1
+        return self.inner.get_overlapping_schedules(*args, **kwargs)
+
+
+def build():
+    SuggestionStore._registry.clear()
+    algorithm, _, _ = build_algorithm(num_players=12)
+    algorithm.schedule_dao = CountingScheduleDAO(algorithm.schedule_dao)
+    return algorithm
+
+
+def test_second_request_reads_precomputed_results():
+    algorithm = build()
+
+    first = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    calls = algorithm.schedule_dao.overlap_calls
+    second = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+
+    assert algorithm.schedule_dao.overlap_calls == calls
+    assert [s.overall_score for s in first] == [s.overall_score for s in second]
+
+
+def test_new_schedule_is_added_to_existing_entries():
+    algorithm = build()
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    existing = algorithm.schedule_dao.schedules[1]
+    newcomer = Schedule(
+        guild_id=GUILD_ID, user_id='player1', start_time=existing.start_time,
+        end_time=existing.end_time, timezone_str='America/Vancouver'
+    )
+    algorithm.schedule_dao.schedules.append(newcomer)
+
+    algorithm.on_schedule_created(GUILD_ID, newcomer)
+
+    store = SuggestionStore.for_guild(GUILD_ID)
+    player0_schedule = algorithm.schedule_dao.schedules[0]
+    paired = {other.schedule_id for other, _ in store.pairs_for(player0_schedule.schedule_id)}
+    assert newcomer.schedule_id in paired
+
+
+def test_profile_change_rescores_only_that_player():
+    algorithm = build()
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    store = SuggestionStore.for_guild(GUILD_ID)
+    player0_schedule = algorithm.schedule_dao.schedules[0]
+    assert any(other.user_id == 'player1' for other, _ in store.pairs_for(player0_schedule.schedule_id))
+
+    # Rating moves far out of range, so the pair is dropped
+    algorithm.player_dao.players['player1'].ntrp_rating = Decimal('7.0')
+    algorithm.player_dao.players['player1'].updated_at = '2030-01-01T00:00:00+00:00'
+    store.mark_player_dirty('player1')
+    calls = algorithm.schedule_dao.overlap_calls
+
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+
+    assert algorithm.schedule_dao.overlap_calls == calls
+    assert not any(other.user_id == 'player1' for other, _ in store.pairs_for(player0_schedule.schedule_id))
+
+
+def test_cancelled_schedules_are_dropped():
+    algorithm = build()
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    store = SuggestionStore.for_guild(GUILD_ID)
+    cancelled = algorithm.schedule_dao.schedules[1]
+
+    algorithm.on_schedules_cancelled(GUILD_ID, 'player1', cancelled.start_time, cancelled.start_time)
+
+    player0_schedule = algorithm.schedule_dao.schedules[0]
+    paired = {other.schedule_id for other, _ in store.pairs_for(player0_schedule.schedule_id)}
+    assert cancelled.schedule_id not in paired
+
+
+def add_later_days(algorithm, days):
+    """Repeat every player's schedule on the following days."""
+    for day in range(1, days + 1):
+        for schedule in list(algorithm.schedule_dao.inner.schedules[:12]):
+            algorithm.schedule_dao.schedules.append(Schedule(
+                guild_id=GUILD_ID, user_id=schedule.user_id,
+                start_time=schedule.start_time + day * 86400,
+                end_time=schedule.end_time + day * 86400, timezone_str='America/Vancouver'
+            ))
+
+
+def test_expired_deadline_scores_soonest_schedule_and_resumes():
+    algorithm = build()
+    add_later_days(algorithm, 2)
+    player0_schedules = algorithm.schedule_dao.get_user_schedules(GUILD_ID, 'player0')
+
+    first = algorithm.find_matches_for_player(GUILD_ID, 'player0', deadline=time.monotonic() - 1)
+
+    assert first.more_available
+    assert first
+    assert {s.schedules[0].schedule_id for s in first} == {player0_schedules[0].schedule_id}
+
+    second = algorithm.find_matches_for_player(GUILD_ID, 'player0', deadline=time.monotonic() - 1)
+    assert second.more_available
+    searched = {s.schedules[0].schedule_id for s in second}
+    assert player0_schedules[1].schedule_id in searched
+    assert player0_schedules[2].schedule_id not in searched
+
+    third = algorithm.find_matches_for_player(GUILD_ID, 'player0', deadline=time.monotonic() - 1)
+    assert not third.more_available
+
+    SuggestionStore._registry.clear()
+    unbounded = algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    assert not unbounded.more_available
+    assert [s.overall_score for s in third] == [s.overall_score for s in unbounded]
+
+
+def test_generous_deadline_finishes_the_search():
+    algorithm = build()
+    add_later_days(algorithm, 2)
+
+    result = algorithm.find_matches_for_player(GUILD_ID, 'player0', deadline=time.monotonic() + 60)
+
+    assert not result.more_available
+    store = SuggestionStore.for_guild(GUILD_ID)
+    schedules = algorithm.schedule_dao.get_user_schedules(GUILD_ID, 'player0')
+    assert store.is_user_fresh('player0', schedules, 168)
+
+
+def test_ended_schedules_are_dropped_on_the_next_read(monkeypatch):
+    algorithm = build()
+    ended = algorithm.schedule_dao.schedules[1]
+    ended.end_time = ended.start_time + 1800
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    store = SuggestionStore.for_guild(GUILD_ID)
+    player0_schedule = algorithm.schedule_dao.schedules[0]
+    assert ended.schedule_id in {other.schedule_id for other, _ in store.pairs_for(player0_schedule.schedule_id)}
+
+    # The next read after the short schedule is over
+    monkeypatch.setattr(time, 'time', lambda: ended.end_time + 1)
+    assert algorithm._open_store(GUILD_ID) is store
+
+    assert ended.schedule_id not in store.schedules
+    assert ended.schedule_id not in {other.schedule_id for other, _ in store.pairs_for(player0_schedule.schedule_id)}
+    assert all(ended not in candidate.schedules for candidate in store.doubles_for(player0_schedule.schedule_id))
+
+
+def test_profile_reload_rescores_stored_pairs():
+    algorithm = build()
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+    calls = algorithm.schedule_dao.overlap_calls
+
+    ScoringProfile.reload()
+    algorithm.find_matches_for_player(GUILD_ID, 'player0')
+
+    assert algorithm.schedule_dao.overlap_calls == calls + 1